@@ -9,13 +9,15 @@ from .distribution.stats import (
     DistributionStats,
     TestPercentages,
 )
+from .legacy_hooks import (
+    pytest_runtest_makereport,
+    pytest_runtest_protocol,
+)
 from .plugin import (
     pytest_addoption,
     pytest_collection_finish,
     pytest_collection_modifyitems,
     pytest_configure,
-    pytest_runtest_makereport,
-    pytest_runtest_protocol,
     pytest_terminal_summary,
 )
 from .reporting import TestSizeReport
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pytest_test_categories.adapters.audit_hook import AuditHookEnforcer
 from pytest_test_categories.adapters.database import DatabasePatchingBlocker
 from pytest_test_categories.adapters.fake_database import FakeDatabaseBlocker
 from pytest_test_categories.adapters.fake_filesystem import FakeFilesystemBlocker
@@ -19,9 +20,14 @@ from pytest_test_categories.adapters.pytest_adapter import (
     TerminalReporterAdapter,
 )
 from pytest_test_categories.adapters.sleep import SleepPatchingBlocker
+from pytest_test_categories.adapters.stream import (
+    StreamWarningAdapter,
+    StreamWriterAdapter,
+)
 from pytest_test_categories.adapters.threading import ThreadPatchingMonitor
 
 __all__ = [
+    'AuditHookEnforcer',
     'DatabasePatchingBlocker',
     'FakeDatabaseBlocker',
     'FakeFilesystemBlocker',
@@ -35,6 +41,8 @@ __all__ = [
     'PytestWarningAdapter',
     'SleepPatchingBlocker',
     'SocketPatchingNetworkBlocker',
+    'StreamWarningAdapter',
+    'StreamWriterAdapter',
     'SubprocessPatchingBlocker',
     'TerminalReporterAdapter',
     'ThreadPatchingMonitor',
@@ -0,0 +1,583 @@
+"""Production enforcement engine using CPython audit hooks (PEP 578).
+
+This module provides an alternative to the monkeypatching blockers. Instead of
+replacing module attributes such as socket.socket or builtins.open, it registers
+a single sys.addaudithook callback and maps the interpreter's audit events onto
+the existing violation exceptions and the violation callback.
+
+Because audit events are raised by the interpreter itself, this engine also sees
+calls that bypass the patched attributes:
+- io.open, os.open, os.scandir and other os-level filesystem calls
+- references captured at import time (e.g. from socket import socket)
+- os.posix_spawn, os.exec*, os.spawn* and os.fork
+- C extensions that go through the audited CPython APIs
+
+Audited Events:
+- Network: socket.connect, socket.getaddrinfo
+- Filesystem: open, os.remove, os.rmdir, os.mkdir, os.rename, os.scandir,
+  shutil.copyfile, shutil.copytree, shutil.move, shutil.rmtree
+- Process: subprocess.Popen, os.system, os.posix_spawn, os.exec, os.spawn, os.fork
+- Database: sqlite3.connect
+- Sleep: time.sleep (Python 3.12+)
+
+Not audited by CPython (and therefore not covered by this engine):
+- time.sleep before Python 3.12, see TIME_SLEEP_AUDITED
+- asyncio.sleep, which only schedules a timer on the event loop
+- os.listdir, which the import system calls for every sys.path entry
+- Optional database drivers that do not go through sqlite3 or sockets
+
+Audit hooks cannot be removed once added, so the hook is registered at most once
+per process and dispatches to whichever enforcer is currently active. While no
+enforcer is active, or the active test size allows everything, the hook returns
+after a single dict lookup.
+
+Example:
+    >>> enforcer = AuditHookEnforcer()
+    >>> enforcer.install()
+    >>> try:
+    ...     enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+    ...     os.open('/etc/hosts', os.O_RDONLY)  # Raises FilesystemAccessViolationError
+    ... finally:
+    ...     enforcer.deactivate()
+
+See Also:
+    - SocketPatchingNetworkBlocker: The patching engine's network adapter
+    - FilesystemPatchingBlocker: The patching engine's filesystem adapter
+    - PEP 578: https://peps.python.org/pep-0578/
+
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+from pytest_test_categories.adapters.base import SlottedBlocker
+from pytest_test_categories.exceptions import (
+    DatabaseViolationError,
+    FilesystemAccessViolationError,
+    NetworkAccessViolationError,
+    SleepViolationError,
+    SubprocessViolationError,
+)
+from pytest_test_categories.ports.database import is_coverage_data_file
+from pytest_test_categories.ports.filesystem import FilesystemOperation
+from pytest_test_categories.ports.network import (
+    BlockerState,
+    EnforcementMode,
+    is_localhost,
+)
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    AuditHandler = Callable[['AuditHookEnforcer', tuple[Any, ...]], None]
+
+# Code of the import system. Imports inside a test raise the same audit events
+# as the test's own file access, so accesses are told apart by the calling frames.
+_IMPORTLIB_DIR = Path(importlib.__file__).parent
+_IMPORT_SYSTEM_FILES = frozenset(
+    {
+        '<frozen importlib._bootstrap>',
+        '<frozen importlib._bootstrap_external>',
+        '<frozen zipimport>',
+        str(_IMPORTLIB_DIR / '_bootstrap.py'),
+        str(_IMPORTLIB_DIR / '_bootstrap_external.py'),
+    }
+)
+_BYTECODE_CACHE_DIR = '__pycache__'
+_BYTECODE_SUFFIX = '.pyc'
+
+# Operations that leave the filesystem unchanged
+_READ_ONLY_OPERATIONS = frozenset({FilesystemOperation.READ, FilesystemOperation.LIST})
+
+# CPython raises the time.sleep audit event from 3.12 onwards
+TIME_SLEEP_AUDITED = sys.version_info >= (3, 12)
+
+# Minimum length of an (host, port) socket address tuple
+_INET_ADDRESS_LENGTH = 2
+
+_hook_registered = False
+_active_enforcer: AuditHookEnforcer | None = None
+_active_handlers: dict[str, AuditHandler] = {}
+_reentrancy_guard = threading.local()
+
+
+def _audit_hook(event: str, args: tuple[Any, ...]) -> None:
+    """Dispatch an audit event to the active enforcer's handler, if any.
+
+    This runs for every audit event raised anywhere in the process, so the
+    common case (no handler for this event) must stay a single dict lookup.
+
+    Args:
+        event: The audit event name.
+        args: The audit event arguments.
+
+    """
+    handler = _active_handlers.get(event)
+    if handler is None:
+        return
+    enforcer = _active_enforcer
+    if enforcer is None or getattr(_reentrancy_guard, 'busy', False):
+        return
+    _reentrancy_guard.busy = True
+    try:
+        handler(enforcer, args)
+    finally:
+        _reentrancy_guard.busy = False
+
+
+def _to_text(value: object) -> str:
+    """Convert a str, bytes or path-like audit argument to text."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bytes):
+        return os.fsdecode(value)
+    if isinstance(value, os.PathLike):
+        return os.fsdecode(os.fspath(value))
+    return str(value)
+
+
+def _in_import_system() -> bool:
+    """Return True if the current audit event was raised while the import system runs.
+
+    This walks the calling frames, so it is only called for accesses that
+    would otherwise be reported.
+    """
+    frame = sys._getframe(1)  # noqa: SLF001
+    while frame is not None:
+        if frame.f_code.co_filename in _IMPORT_SYSTEM_FILES:
+            return True
+        frame = frame.f_back
+    return False
+
+
+def _is_bytecode_cache(path: str) -> bool:
+    """Return True if the path is a __pycache__ directory or a .pyc file (or its temporary file) in one."""
+    cache_path = Path(path)
+    if cache_path.name == _BYTECODE_CACHE_DIR:
+        return True
+    if _BYTECODE_SUFFIX not in cache_path.name:
+        return False
+    prefix = sys.pycache_prefix
+    return cache_path.parent.name == _BYTECODE_CACHE_DIR or (prefix is not None and path.startswith(prefix))
+
+
+def _is_interpreter_access(path: str, operation: FilesystemOperation) -> bool:
+    """Return True if the import system or coverage.py, rather than the test, accesses the path.
+
+    The import system may read any file, such as the modules a test imports.
+    The only writes it is exempted for are its bytecode cache: creating a
+    __pycache__ directory and the atomic write and rename of a .pyc file.
+    Any other access, including a test reading a .py file itself, is
+    enforced.
+
+    Args:
+        path: The path being accessed.
+        operation: The filesystem operation on the path.
+
+    Returns:
+        True if the access is exempt from enforcement.
+
+    """
+    if is_coverage_data_file(path):
+        return True
+    if operation not in _READ_ONLY_OPERATIONS and not _is_bytecode_cache(path):
+        return False
+    return _in_import_system()
+
+
+def _operation_from_open(mode: object, flags: object) -> FilesystemOperation:
+    """Determine the filesystem operation from the open event's mode or flags.
+
+    Args:
+        mode: The mode string from open(), or None for os.open().
+        flags: The os.O_* flags passed to the underlying open call.
+
+    Returns:
+        The corresponding FilesystemOperation.
+
+    """
+    if isinstance(mode, str):
+        if 'x' in mode:
+            return FilesystemOperation.CREATE
+        is_write = 'w' in mode or 'a' in mode or '+' in mode
+        return FilesystemOperation.WRITE if is_write else FilesystemOperation.READ
+    if not isinstance(flags, int):
+        return FilesystemOperation.READ
+    if flags & os.O_CREAT and flags & os.O_EXCL:
+        return FilesystemOperation.CREATE
+    if flags & (os.O_WRONLY | os.O_RDWR | os.O_APPEND | os.O_TRUNC):
+        return FilesystemOperation.WRITE
+    # O_CREAT alone creates a missing file even when opening it read-only
+    return FilesystemOperation.CREATE if flags & os.O_CREAT else FilesystemOperation.READ
+
+
+def _split_command(args: object) -> tuple[str, tuple[str, ...]]:
+    """Split a process argument vector into command and arguments.
+
+    Args:
+        args: A command string, path, or sequence of arguments.
+
+    Returns:
+        Tuple of (command, args).
+
+    """
+    if isinstance(args, (list, tuple)) and args:
+        return _to_text(args[0]), tuple(_to_text(a) for a in args[1:])
+    return _to_text(args), ()
+
+
+def _on_open(enforcer: AuditHookEnforcer, args: tuple[Any, ...]) -> None:
+    """Handle the open event: (path, mode, flags)."""
+    path = args[0]
+    if path is None or isinstance(path, int):
+        return
+    path_text = _to_text(path)
+    operation = _operation_from_open(args[1], args[2])
+    if _is_interpreter_access(path_text, operation):
+        return
+    enforcer.on_filesystem_violation(Path(path_text), operation)
+
+
+def _make_path_handler(operation: FilesystemOperation) -> AuditHandler:
+    """Create a handler for events whose first argument is the affected path.
+
+    Args:
+        operation: The filesystem operation the event represents.
+
+    Returns:
+        An audit handler reporting the operation on the event's path.
+
+    """
+
+    def on_path_event(enforcer: AuditHookEnforcer, args: tuple[Any, ...]) -> None:
+        path = args[0] if args else None
+        if path is None or isinstance(path, int):
+            return
+        path_text = _to_text(path)
+        if _is_interpreter_access(path_text, operation):
+            return
+        enforcer.on_filesystem_violation(Path(path_text), operation)
+
+    return on_path_event
+
+
+def _on_socket_connect(enforcer: AuditHookEnforcer, args: tuple[Any, ...]) -> None:
+    """Handle the socket.connect event: (socket, address)."""
+    address = args[1]
+    if isinstance(address, tuple) and len(address) >= _INET_ADDRESS_LENGTH:
+        enforcer.on_network_access(_to_text(address[0]), address[1])
+
+
+def _on_socket_getaddrinfo(enforcer: AuditHookEnforcer, args: tuple[Any, ...]) -> None:
+    """Handle the socket.getaddrinfo event: (host, port, family, type, protocol)."""
+    host = args[0]
+    if host is None:
+        return
+    port = args[1]
+    enforcer.on_network_access(_to_text(host), port if isinstance(port, int) else 0)
+
+
+def _on_subprocess_popen(enforcer: AuditHookEnforcer, args: tuple[Any, ...]) -> None:
+    """Handle the subprocess.Popen event: (executable, args, cwd, env)."""
+    command, command_args = _split_command(args[1])
+    enforcer.on_process_violation(command, command_args, 'subprocess.Popen')
+
+
+def _on_os_system(enforcer: AuditHookEnforcer, args: tuple[Any, ...]) -> None:
+    """Handle the os.system event: (command,)."""
+    enforcer.on_process_violation(_to_text(args[0]), (), 'os.system')
+
+
+def _make_exec_handler(method: str, argv_index: int) -> AuditHandler:
+    """Create a handler for exec/spawn style events carrying an argument vector.
+
+    Args:
+        method: The spawn method name reported in violations.
+        argv_index: Position of the argument vector in the event arguments.
+
+    Returns:
+        An audit handler reporting the spawned command.
+
+    """
+
+    def on_exec_event(enforcer: AuditHookEnforcer, args: tuple[Any, ...]) -> None:
+        command, command_args = _split_command(args[argv_index])
+        enforcer.on_process_violation(command, command_args, method)
+
+    return on_exec_event
+
+
+def _on_os_fork(enforcer: AuditHookEnforcer, args: tuple[Any, ...]) -> None:  # noqa: ARG001
+    """Handle the os.fork event, raised by multiprocessing's fork start method."""
+    enforcer.on_process_violation('fork', (), 'os.fork')
+
+
+def _on_sqlite3_connect(enforcer: AuditHookEnforcer, args: tuple[Any, ...]) -> None:
+    """Handle the sqlite3.connect event: (database,)."""
+    database = _to_text(args[0])
+    if is_coverage_data_file(database):
+        return
+    enforcer.on_database_violation('sqlite3', database)
+
+
+def _on_time_sleep(enforcer: AuditHookEnforcer, args: tuple[Any, ...]) -> None:
+    """Handle the time.sleep event: (secs,)."""
+    enforcer.on_sleep_violation('time.sleep', float(args[0]))
+
+
+_NETWORK_HANDLERS: dict[str, AuditHandler] = {
+    'socket.connect': _on_socket_connect,
+    'socket.getaddrinfo': _on_socket_getaddrinfo,
+}
+
+# Small tests: no network, filesystem, subprocess, database or sleep
+_SMALL_HANDLERS: dict[str, AuditHandler] = {
+    **_NETWORK_HANDLERS,
+    'open': _on_open,
+    'os.remove': _make_path_handler(FilesystemOperation.DELETE),
+    'os.rmdir': _make_path_handler(FilesystemOperation.DELETE),
+    'os.mkdir': _make_path_handler(FilesystemOperation.CREATE),
+    'os.rename': _make_path_handler(FilesystemOperation.MODIFY),
+    'os.scandir': _make_path_handler(FilesystemOperation.LIST),
+    'shutil.copyfile': _make_path_handler(FilesystemOperation.READ),
+    'shutil.copytree': _make_path_handler(FilesystemOperation.READ),
+    'shutil.move': _make_path_handler(FilesystemOperation.READ),
+    'shutil.rmtree': _make_path_handler(FilesystemOperation.DELETE),
+    'subprocess.Popen': _on_subprocess_popen,
+    'os.system': _on_os_system,
+    'os.posix_spawn': _make_exec_handler('os.posix_spawn', 1),
+    'os.exec': _make_exec_handler('os.exec', 1),
+    'os.spawn': _make_exec_handler('os.spawn', 2),
+    'os.fork': _on_os_fork,
+    'sqlite3.connect': _on_sqlite3_connect,
+    'time.sleep': _on_time_sleep,
+}
+
+# Handlers per test size; sizes without an entry allow everything
+_HANDLERS_BY_SIZE: dict[TestSize, dict[str, AuditHandler]] = {
+    TestSize.SMALL: _SMALL_HANDLERS,
+    TestSize.MEDIUM: _NETWORK_HANDLERS,
+}
+
+
+class AuditHookEnforcer(SlottedBlocker):
+    """Enforces test size resource rules through a single process-wide audit hook.
+
+    The enforcer does not modify any module attributes. install() registers the
+    audit hook (once per process) and activate() points it at this enforcer and
+    the event handlers for the current test size. Violations are reported
+    through violation_callback and raise the same exceptions as the patching
+    blockers in STRICT mode.
+
+    Rules applied:
+    - SMALL: Block network, filesystem, subprocess, database and sleep
+    - MEDIUM: Allow localhost network only
+    - LARGE/XLARGE: Allow everything (no handlers, fast path)
+
+    Attributes:
+        state: Current enforcer state (INACTIVE or ACTIVE).
+        violation_callback: Optional callback invoked when violations occur.
+        current_test_size: The test size set during activation.
+        current_enforcement_mode: The enforcement mode set during activation.
+        current_test_nodeid: The pytest node ID of the current test.
+
+    Example:
+        >>> enforcer = AuditHookEnforcer()
+        >>> enforcer.install()
+        >>> enforcer.activate(TestSize.MEDIUM, EnforcementMode.WARN)
+        >>> enforcer.deactivate()
+
+    """
+
+    # Subject used in contract messages ('Enforcer must be ACTIVE to ...')
+    _contract_subject = 'Enforcer'
+
+    __slots__ = ('_previous',)
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the enforcer, with no replaced enforcer stored yet."""
+        super().__init__(**kwargs)
+        # Enforcers nest when pytester runs a session inside a test
+        self._previous: tuple[AuditHookEnforcer | None, dict[str, AuditHandler]] | None = None
+
+    def install(self) -> None:
+        """Register the process-wide audit hook if it is not registered yet.
+
+        Audit hooks cannot be removed, so this is guarded to run at most once
+        per process even when several pytest sessions run in-process.
+
+        """
+        global _hook_registered  # noqa: PLW0603
+        if _hook_registered:
+            return
+        sys.addaudithook(_audit_hook)
+        _hook_registered = True
+
+    @property
+    def is_installed(self) -> bool:
+        """Return True if the process-wide audit hook has been registered."""
+        return _hook_registered
+
+    @property
+    def is_active(self) -> bool:
+        """Return True if the enforcer is active for the current test."""
+        return self.state == BlockerState.ACTIVE
+
+    def _do_activate(self, test_size: TestSize, enforcement_mode: EnforcementMode) -> None:
+        """Route audit events to this enforcer using the rules for test_size.
+
+        Args:
+            test_size: The size category of the current test.
+            enforcement_mode: How to handle violations.
+
+        """
+        global _active_enforcer, _active_handlers  # noqa: PLW0603
+        self.current_test_size = test_size
+        self.current_enforcement_mode = enforcement_mode
+        self._previous = (_active_enforcer, _active_handlers)
+        handlers = _HANDLERS_BY_SIZE.get(test_size, {})
+        if enforcement_mode == EnforcementMode.OFF:
+            handlers = {}
+        _active_enforcer = self
+        _active_handlers = handlers
+
+    def _do_deactivate(self) -> None:
+        """Stop routing audit events to this enforcer, restoring the previous one."""
+        global _active_enforcer, _active_handlers
+        previous = self._previous
+        _active_enforcer, _active_handlers = previous if previous is not None else (None, {})
+        self._previous = None
+        self.current_test_size = None
+        self.current_enforcement_mode = None
+
+    def reset(self) -> None:
+        """Reset enforcer to initial state.
+
+        This is safe to call regardless of current state.
+
+        """
+        if self.is_active:
+            self.deactivate()
+        super().reset()
+
+    def on_network_access(self, host: str, port: int) -> None:
+        """Report a connection attempt unless the current test size allows it.
+
+        Args:
+            host: The target hostname or IP address.
+            port: The target port number.
+
+        Raises:
+            NetworkAccessViolationError: If enforcement mode is STRICT.
+
+        """
+        if self.current_test_size == TestSize.MEDIUM and is_localhost(host):
+            return
+        self._record('network', f'Attempted network connection to {host}:{port}')
+        if self.current_enforcement_mode == EnforcementMode.STRICT:
+            raise NetworkAccessViolationError(
+                test_size=self.current_test_size,  # type: ignore[arg-type]
+                test_nodeid=self.current_test_nodeid,
+                host=host,
+                port=port,
+            )
+
+    def on_filesystem_violation(self, path: Path, operation: FilesystemOperation) -> None:
+        """Report a filesystem access.
+
+        Args:
+            path: The attempted path.
+            operation: The attempted operation type.
+
+        Raises:
+            FilesystemAccessViolationError: If enforcement mode is STRICT.
+
+        """
+        self._record('filesystem', f'Attempted {operation.value} on filesystem path: {path}')
+        if self.current_enforcement_mode == EnforcementMode.STRICT:
+            raise FilesystemAccessViolationError(
+                test_size=self.current_test_size,  # type: ignore[arg-type]
+                test_nodeid=self.current_test_nodeid,
+                path=path,
+                operation=operation,
+            )
+
+    def on_process_violation(self, command: str, args: tuple[str, ...], method: str) -> None:
+        """Report a process spawn.
+
+        Args:
+            command: The attempted command.
+            args: The attempted arguments.
+            method: The spawn method used.
+
+        Raises:
+            SubprocessViolationError: If enforcement mode is STRICT.
+
+        """
+        args_str = ' '.join(args) if args else ''
+        self._record('process', f'Attempted subprocess via {method}: {command} {args_str}'.strip())
+        if self.current_enforcement_mode == EnforcementMode.STRICT:
+            raise SubprocessViolationError(
+                test_size=self.current_test_size,  # type: ignore[arg-type]
+                test_nodeid=self.current_test_nodeid,
+                command=command,
+                command_args=args,
+                method=method,
+            )
+
+    def on_database_violation(self, library: str, connection_string: str) -> None:
+        """Report a database connection.
+
+        Args:
+            library: The database library name.
+            connection_string: The connection string or database path.
+
+        Raises:
+            DatabaseViolationError: If enforcement mode is STRICT.
+
+        """
+        self._record('database', f'Attempted {library} connection: {connection_string}')
+        if self.current_enforcement_mode == EnforcementMode.STRICT:
+            raise DatabaseViolationError(
+                test_size=self.current_test_size,  # type: ignore[arg-type]
+                test_nodeid=self.current_test_nodeid,
+                library=library,
+                connection_string=connection_string,
+            )
+
+    def on_sleep_violation(self, function: str, duration: float) -> None:
+        """Report a sleep call.
+
+        Args:
+            function: The sleep function name.
+            duration: The sleep duration in seconds.
+
+        Raises:
+            SleepViolationError: If enforcement mode is STRICT.
+
+        """
+        self._record('sleep', f'Attempted {function} for {duration:.3f}s')
+        if self.current_enforcement_mode == EnforcementMode.STRICT:
+            raise SleepViolationError(
+                test_size=self.current_test_size,  # type: ignore[arg-type]
+                test_nodeid=self.current_test_nodeid,
+                function=function,
+                duration=duration,
+            )
+
+    def _record(self, violation_type: str, details: str) -> None:
+        """Record a violation via the callback if one is set."""
+        callback = self.violation_callback
+        if callback is not None and callable(callback):
+            is_strict = self.current_enforcement_mode == EnforcementMode.STRICT
+            callback(violation_type, self.current_test_nodeid, details, failed=is_strict)
@@ -0,0 +1,152 @@
+"""Slotted base class for the production blocker adapters.
+
+The blocker ports (NetworkBlockerPort, ProcessBlockerPort, ...) are pydantic
+models whose activate()/deactivate() template methods carry icontract guards.
+That suits test doubles, but the production adapters are activated and
+deactivated for every test, so they derive from this plain slotted class
+instead and keep the same public interface and state machine. Each adapter
+is registered as a virtual subclass of its port, so isinstance() checks
+against the port still hold.
+
+The INACTIVE/ACTIVE preconditions and the argument type checks are only
+evaluated while debug contracts are enabled (see pytest_test_categories.contracts).
+They then raise the same icontract.ViolationError as the ports. Without
+them, activating an ACTIVE blocker again does nothing, so its patches are
+never stacked.
+
+See Also:
+    - ports/network.py and the other blocker ports: the interfaces implemented here
+    - contracts.py: the debug switch
+
+"""
+
+from __future__ import annotations
+
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import TYPE_CHECKING
+
+from pytest_test_categories.contracts import (
+    debug_contracts_enabled,
+    require_instance,
+    require_state,
+)
+from pytest_test_categories.ports.network import (
+    BlockerState,
+    EnforcementMode,
+)
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class SlottedBlocker(ABC):
+    """State machine shared by the production blocker adapters.
+
+    Subclasses implement _do_activate() and _do_deactivate() exactly as they
+    would for a port, and wrap their check/violation methods with
+    _require_active() so the port's preconditions hold in debug mode.
+
+    Attributes:
+        state: Current blocker state (INACTIVE or ACTIVE).
+        violation_callback: Optional callable recording violations for the summary.
+        current_test_size: The test size set during activation.
+        current_enforcement_mode: The enforcement mode set during activation.
+        current_test_nodeid: The pytest node ID of the current test.
+
+    """
+
+    __slots__ = (
+        'current_enforcement_mode',
+        'current_test_nodeid',
+        'current_test_size',
+        'state',
+        'violation_callback',
+    )
+
+    # Subject used in contract messages ('Blocker must be ACTIVE to ...')
+    _contract_subject = 'Blocker'
+
+    def __init__(
+        self,
+        *,
+        state: BlockerState = BlockerState.INACTIVE,
+        violation_callback: Callable[..., object] | None = None,
+        current_test_size: TestSize | None = None,
+        current_enforcement_mode: EnforcementMode | None = None,
+        current_test_nodeid: str = '',
+    ) -> None:
+        """Initialize the blocker in the given state."""
+        self.state = state
+        self.violation_callback = violation_callback
+        self.current_test_size = current_test_size
+        self.current_enforcement_mode = current_enforcement_mode
+        self.current_test_nodeid = current_test_nodeid
+
+    def __repr__(self) -> str:
+        """Return a short representation showing the state and current test size."""
+        return f'{type(self).__name__}(state={self.state!r}, current_test_size={self.current_test_size!r})'
+
+    def activate(self, test_size: TestSize, enforcement_mode: EnforcementMode) -> None:
+        """Activate the blocker for a test.
+
+        Args:
+            test_size: The size category of the current test.
+            enforcement_mode: How to handle violations.
+
+        Raises:
+            icontract.ViolationError: In debug mode, if the blocker is not INACTIVE.
+
+        """
+        if debug_contracts_enabled():
+            self._check_activation(test_size, enforcement_mode)
+        elif self.state is BlockerState.ACTIVE:
+            return
+        self._do_activate(test_size, enforcement_mode)
+        self.state = BlockerState.ACTIVE
+
+    def deactivate(self) -> None:
+        """Deactivate the blocker, restoring normal behavior.
+
+        Raises:
+            icontract.ViolationError: In debug mode, if the blocker is not ACTIVE.
+
+        """
+        if debug_contracts_enabled():
+            require_state(self.state, BlockerState.ACTIVE, f'{self._contract_subject} must be ACTIVE to deactivate')
+        self._do_deactivate()
+        self.state = BlockerState.INACTIVE
+
+    def reset(self) -> None:
+        """Reset the blocker to its initial INACTIVE state."""
+        self.state = BlockerState.INACTIVE
+        self.current_test_size = None
+        self.current_enforcement_mode = None
+        self.current_test_nodeid = ''
+
+    @abstractmethod
+    def _do_activate(self, test_size: TestSize, enforcement_mode: EnforcementMode) -> None:
+        """Perform adapter-specific activation logic."""
+
+    @abstractmethod
+    def _do_deactivate(self) -> None:
+        """Perform adapter-specific deactivation logic."""
+
+    def _check_activation(self, test_size: TestSize, enforcement_mode: EnforcementMode) -> None:
+        """Check the activation precondition and argument types (debug mode only)."""
+        require_state(self.state, BlockerState.INACTIVE, f'{self._contract_subject} must be INACTIVE to activate')
+        require_instance(test_size, TestSize, 'test_size')
+        require_instance(enforcement_mode, EnforcementMode, 'enforcement_mode')
+
+    def _require_active(self, action: str) -> None:
+        """Check that the blocker is ACTIVE before an operation (debug mode only).
+
+        Args:
+            action: What the caller is about to do, used in the contract message.
+
+        """
+        if debug_contracts_enabled():
+            require_state(self.state, BlockerState.ACTIVE, f'{self._contract_subject} must be ACTIVE to {action}')
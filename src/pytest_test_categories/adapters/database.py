@@ -43,8 +43,7 @@ from typing import (
     Any,
 )
 
-from pydantic import Field
-
+from pytest_test_categories.adapters.base import SlottedBlocker
 from pytest_test_categories.adapters.database_optional_libraries import (
     patch_optional_libraries,
     restore_optional_libraries,
@@ -61,7 +60,8 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 
-class DatabasePatchingBlocker(DatabaseBlockerPort):
+@DatabaseBlockerPort.register
+class DatabasePatchingBlocker(SlottedBlocker):
     """Production adapter that patches database connection functions to block access.
 
     This adapter intercepts database access by patching:
@@ -70,8 +70,17 @@ class DatabasePatchingBlocker(DatabaseBlockerPort):
 
     The patching is reversible - deactivate() restores the original functions.
 
+    In session patch mode the wrappers are installed once via install() and stay
+    in place until uninstall(). activate() and deactivate() then only flip the
+    current test size and enforcement mode. Optional libraries are patched at
+    install time, so only those importable when the session starts are covered.
+
+    It implements the DatabaseBlockerPort interface as a slotted plain class so
+    per-test activation skips pydantic and icontract; the port's contracts are
+    checked only with debug contracts enabled.
+
     Attributes:
-        state: Current blocker state (inherited from DatabaseBlockerPort).
+        state: Current blocker state (INACTIVE or ACTIVE).
         current_test_size: The test size set during activation.
         current_enforcement_mode: The enforcement mode set during activation.
         current_test_nodeid: The pytest node ID of the current test.
@@ -90,21 +99,61 @@ class DatabasePatchingBlocker(DatabaseBlockerPort):
 
     """
 
-    current_test_size: TestSize | None = Field(default=None, description='Test size')
-    current_enforcement_mode: EnforcementMode | None = Field(default=None, description='Enforcement mode')
-    current_test_nodeid: str = Field(default='', description='Test node ID')
-
-    def model_post_init(self, context: object, /) -> None:  # noqa: ARG002
-        """Initialize post-Pydantic setup, storing references to original functions."""
-        object.__setattr__(self, '_original_sqlite3_connect', None)
+    __slots__ = (
+        '_installed',
+        '_original_psycopg2_connect',
+        '_original_psycopg_connect',
+        '_original_pymongo_client',
+        '_original_pymysql_connect',
+        '_original_redis_redis',
+        '_original_redis_strict',
+        '_original_sqlalchemy_engine',
+        '_original_sqlite3_connect',
+    )
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the blocker, with no original functions stored yet."""
+        super().__init__(**kwargs)
+        self._original_sqlite3_connect: Any = None
         # Placeholders for optional libraries
-        object.__setattr__(self, '_original_psycopg2_connect', None)
-        object.__setattr__(self, '_original_psycopg_connect', None)
-        object.__setattr__(self, '_original_pymysql_connect', None)
-        object.__setattr__(self, '_original_pymongo_client', None)
-        object.__setattr__(self, '_original_redis_redis', None)
-        object.__setattr__(self, '_original_redis_strict', None)
-        object.__setattr__(self, '_original_sqlalchemy_engine', None)
+        self._original_psycopg2_connect: Any = None
+        self._original_psycopg_connect: Any = None
+        self._original_pymysql_connect: Any = None
+        self._original_pymongo_client: Any = None
+        self._original_redis_redis: Any = None
+        self._original_redis_strict: Any = None
+        self._original_sqlalchemy_engine: Any = None
+        self._installed = False
+
+    @property
+    def is_installed(self) -> bool:
+        """Return True if the database wrappers are installed for the whole session."""
+        return self._installed
+
+    def install(self) -> None:
+        """Install the database connection wrappers once for the whole session.
+
+        After installation, activate() and deactivate() no longer patch or
+        restore anything. While no test size is set the wrappers allow every
+        connection, so code running between tests is unaffected.
+
+        This is safe to call more than once.
+
+        """
+        if self.is_installed:
+            return
+        self._install_patches()
+        self._installed = True
+
+    def uninstall(self) -> None:
+        """Remove the session-wide database wrappers installed by install().
+
+        This is safe to call regardless of current state.
+
+        """
+        self._restore_patches()
+        self._original_sqlite3_connect = None
+        self._installed = False
 
     def _do_activate(
         self,
@@ -124,27 +173,69 @@ class DatabasePatchingBlocker(DatabaseBlockerPort):
         self.current_test_size = test_size
         self.current_enforcement_mode = enforcement_mode
 
-        # Always patch sqlite3 (standard library)
-        object.__setattr__(self, '_original_sqlite3_connect', sqlite3.connect)
-        sqlite3.connect = self._create_patched_sqlite3_connect()  # type: ignore[method-assign]
-
-        # Optionally patch other libraries if installed
-        self._patch_optional_libraries()
+        # In session patch mode the wrappers are already in place
+        if not self.is_installed:
+            self._install_patches()
 
     def _do_deactivate(self) -> None:
         """Restore the original database connection functions.
 
         Restores all original connection functions that were saved during activation.
+        In session patch mode the wrappers stay installed and only the current
+        test size is cleared, which lets every connection through.
 
         """
+        if self.is_installed:
+            self.current_test_size = None
+            self.current_enforcement_mode = None
+            return
+        self._restore_patches()
+
+    def _install_patches(self) -> None:
+        """Store the original connection functions and install the wrappers."""
+        # Always patch sqlite3 (standard library)
+        self._original_sqlite3_connect = sqlite3.connect
+        sqlite3.connect = self._create_patched_sqlite3_connect()  # type: ignore[method-assign]
+
+        # Optionally patch other libraries if installed
+        self._patch_optional_libraries()
+
+    def _restore_patches(self) -> None:
+        """Restore the original connection functions if they were stored."""
         # Restore sqlite3
-        original_sqlite3 = object.__getattribute__(self, '_original_sqlite3_connect')
+        original_sqlite3 = self._original_sqlite3_connect
         if original_sqlite3 is not None:
             sqlite3.connect = original_sqlite3  # type: ignore[method-assign]
 
         # Restore optional libraries
         self._restore_optional_libraries()
 
+    def check_connection_allowed(self, library: str, connection_string: str) -> bool:
+        """Check if a database connection is allowed for the current test.
+
+        Args:
+            library: The database library name (e.g., 'sqlite3').
+            connection_string: The connection string or database path.
+
+        Returns:
+            True if the connection is allowed, False if it should be blocked.
+
+        """
+        self._require_active('check connections')
+        return self._do_check_connection_allowed(library, connection_string)
+
+    def on_violation(self, library: str, connection_string: str, test_nodeid: str) -> None:
+        """Handle a database violation according to the enforcement mode.
+
+        Args:
+            library: The database library name.
+            connection_string: The connection string or database path.
+            test_nodeid: The pytest node ID of the violating test.
+
+        """
+        self._require_active('handle violations')
+        self._do_on_violation(library, connection_string, test_nodeid)
+
     def _do_check_connection_allowed(self, library: str, connection_string: str) -> bool:  # noqa: ARG002
         """Check if database connection is allowed by test size rules.
 
@@ -210,19 +301,9 @@ class DatabasePatchingBlocker(DatabaseBlockerPort):
         This is safe to call regardless of current state.
 
         """
-        # Restore sqlite3
-        original_sqlite3 = object.__getattribute__(self, '_original_sqlite3_connect')
-        if original_sqlite3 is not None:
-            sqlite3.connect = original_sqlite3  # type: ignore[method-assign]
-            object.__setattr__(self, '_original_sqlite3_connect', None)
-
-        # Restore optional libraries
-        self._restore_optional_libraries()
+        self.uninstall()
 
         super().reset()
-        self.current_test_size = None
-        self.current_enforcement_mode = None
-        self.current_test_nodeid = ''
 
     def _create_patched_sqlite3_connect(self) -> Callable[..., sqlite3.Connection]:
         """Create a wrapper for sqlite3.connect that intercepts connections.
@@ -232,7 +313,7 @@ class DatabasePatchingBlocker(DatabaseBlockerPort):
 
         """
         blocker = self
-        original_connect = object.__getattribute__(self, '_original_sqlite3_connect')
+        original_connect = self._original_sqlite3_connect
 
         def patched_connect(
             database: str,
@@ -254,8 +335,8 @@ class DatabasePatchingBlocker(DatabaseBlockerPort):
                     and enforcement mode is STRICT.
 
             """
-            if not blocker._do_check_connection_allowed('sqlite3', database):  # noqa: SLF001
-                blocker._do_on_violation('sqlite3', database, blocker.current_test_nodeid)  # noqa: SLF001
+            if not blocker._do_check_connection_allowed('sqlite3', database):
+                blocker._do_on_violation('sqlite3', database, blocker.current_test_nodeid)
 
             return original_connect(database, *args, **kwargs)
 
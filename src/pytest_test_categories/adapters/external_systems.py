@@ -39,9 +39,12 @@ from __future__ import annotations
 
 import sys
 import warnings
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
 
-from pydantic import Field
-
+from pytest_test_categories.adapters.base import SlottedBlocker
 from pytest_test_categories.ports.external_systems import (
     EXTERNAL_SYSTEM_PACKAGES,
     ExternalSystemsDetectorPort,
@@ -50,7 +53,9 @@ from pytest_test_categories.ports.network import (
     BlockerState,
     EnforcementMode,
 )
-from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from pytest_test_categories.types import TestSize
 
 
 class ExternalSystemsWarning(UserWarning):
@@ -72,15 +77,19 @@ class ExternalSystemsWarning(UserWarning):
     """
 
 
-class ExternalSystemsDetector(ExternalSystemsDetectorPort):
+@ExternalSystemsDetectorPort.register
+class ExternalSystemsDetector(SlottedBlocker):
     """Production adapter that inspects sys.modules to detect external systems.
 
     This adapter detects external system usage by comparing sys.modules
     before and after test execution. When external system packages are
     detected in medium tests, it emits a warning.
 
+    It implements the ExternalSystemsDetectorPort interface as a slotted plain
+    class; the port's contracts are checked only with debug contracts enabled.
+
     Attributes:
-        state: Current detector state (inherited from ExternalSystemsDetectorPort).
+        state: Current detector state (INACTIVE or ACTIVE).
         current_test_size: The test size set during activation.
         current_enforcement_mode: The enforcement mode set during activation.
         current_test_nodeid: The pytest node ID of the current test.
@@ -97,13 +106,15 @@ class ExternalSystemsDetector(ExternalSystemsDetectorPort):
 
     """
 
-    current_test_size: TestSize | None = Field(default=None, description='Test size')
-    current_enforcement_mode: EnforcementMode | None = Field(default=None, description='Enforcement mode')
-    current_test_nodeid: str = Field(default='', description='Test node ID')
+    # Subject used in contract messages, matching ExternalSystemsDetectorPort
+    _contract_subject = 'Detector'
 
-    def model_post_init(self, context: object, /) -> None:  # noqa: ARG002
-        """Initialize post-Pydantic setup, storing reference to modules snapshot."""
-        object.__setattr__(self, '_modules_snapshot', set())
+    __slots__ = ('_modules_snapshot',)
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the detector with an empty modules snapshot."""
+        super().__init__(**kwargs)
+        self._modules_snapshot: set[str] = set()
 
     def _do_activate(
         self,
@@ -120,11 +131,32 @@ class ExternalSystemsDetector(ExternalSystemsDetectorPort):
         self.current_test_size = test_size
         self.current_enforcement_mode = enforcement_mode
         # Snapshot current modules to detect new imports during test
-        object.__setattr__(self, '_modules_snapshot', set(sys.modules.keys()))
+        self._modules_snapshot = set(sys.modules.keys())
 
     def _do_deactivate(self) -> None:
         """Clear the modules snapshot."""
-        object.__setattr__(self, '_modules_snapshot', set())
+        self._modules_snapshot = set()
+
+    def check_external_systems_detected(self) -> set[str]:
+        """Return the external system packages imported since activation.
+
+        Returns:
+            The set of detected external system package names.
+
+        """
+        self._require_active('check')
+        return self._do_check_external_systems_detected()
+
+    def on_external_systems_detected(self, packages: set[str], test_nodeid: str) -> None:
+        """Handle external system usage detected in a medium test.
+
+        Args:
+            packages: The detected external system package names.
+            test_nodeid: The pytest node ID of the test.
+
+        """
+        self._require_active('handle detections')
+        self._do_on_external_systems_detected(packages, test_nodeid)
 
     def _do_check_external_systems_detected(self) -> set[str]:
         """Check sys.modules for external system packages.
@@ -136,7 +168,7 @@ class ExternalSystemsDetector(ExternalSystemsDetectorPort):
             Set of detected external system package names.
 
         """
-        snapshot: set[str] = object.__getattribute__(self, '_modules_snapshot')
+        snapshot: set[str] = self._modules_snapshot
         current_modules = set(sys.modules.keys())
 
         # Find newly imported modules since activation
@@ -191,11 +223,8 @@ class ExternalSystemsDetector(ExternalSystemsDetectorPort):
         This is safe to call regardless of current state.
 
         """
-        object.__setattr__(self, '_modules_snapshot', set())
+        self._modules_snapshot = set()
         super().reset()
-        self.current_test_size = None
-        self.current_enforcement_mode = None
-        self.current_test_nodeid = ''
 
     @property
     def is_active(self) -> bool:
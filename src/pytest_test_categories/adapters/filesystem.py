@@ -44,14 +44,17 @@ from typing import (
     Any,
 )
 
-from pydantic import Field
-
+from pytest_test_categories.adapters.base import SlottedBlocker
+from pytest_test_categories.contracts import debug_contracts_enabled
 from pytest_test_categories.exceptions import FilesystemAccessViolationError
 from pytest_test_categories.ports.filesystem import (
     FilesystemBlockerPort,
     FilesystemOperation,
 )
-from pytest_test_categories.ports.network import EnforcementMode
+from pytest_test_categories.ports.network import (
+    BlockerState,
+    EnforcementMode,
+)
 from pytest_test_categories.types import TestSize
 
 if TYPE_CHECKING:
@@ -92,7 +95,8 @@ class _OriginalFunctions:
         self.shutil_rmtree: Callable[..., None] | None = None
 
 
-class FilesystemPatchingBlocker(FilesystemBlockerPort):
+@FilesystemBlockerPort.register
+class FilesystemPatchingBlocker(SlottedBlocker):
     """Production adapter that patches filesystem operations to block access.
 
     This adapter intercepts filesystem access by patching:
@@ -103,8 +107,16 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
 
     The patching is reversible - deactivate() restores the original functions.
 
+    In session patch mode the wrappers are installed once via install() and stay
+    in place until uninstall(). activate() and deactivate() then only flip the
+    current test size, enforcement mode, and allowed paths.
+
+    It implements the FilesystemBlockerPort interface as a slotted plain class so
+    per-test activation skips pydantic and icontract; the port's contracts are
+    checked only with debug contracts enabled.
+
     Attributes:
-        state: Current blocker state (inherited from FilesystemBlockerPort).
+        state: Current blocker state (INACTIVE or ACTIVE).
         current_test_size: The test size set during activation.
         current_enforcement_mode: The enforcement mode set during activation.
         current_allowed_paths: The allowed paths set during activation.
@@ -124,16 +136,69 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
 
     """
 
-    current_test_size: TestSize | None = Field(default=None, description='Test size')
-    current_enforcement_mode: EnforcementMode | None = Field(default=None, description='Enforcement mode')
-    current_allowed_paths: frozenset[Path] = Field(default_factory=frozenset, description='Allowed paths')
-    current_test_nodeid: str = Field(default='', description='Test node ID')
+    __slots__ = ('_installed', '_originals', 'current_allowed_paths')
+
+    def __init__(self, *, current_allowed_paths: frozenset[Path] = frozenset(), **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the blocker, with no original functions stored yet."""
+        super().__init__(**kwargs)
+        self.current_allowed_paths = current_allowed_paths
+        self._originals = _OriginalFunctions()
+        self._installed = False
+
+    @property
+    def is_installed(self) -> bool:
+        """Return True if the filesystem wrappers are installed for the whole session."""
+        return self._installed
+
+    def install(self) -> None:
+        """Install the filesystem wrappers once for the whole session.
+
+        After installation, activate() and deactivate() no longer patch or
+        restore anything. While no test size is set the wrappers allow every
+        operation, so pytest's own file I/O between tests is unaffected.
+
+        This is safe to call more than once.
+
+        """
+        if self.is_installed:
+            return
+        self._patch_all_functions()
+        self._installed = True
+
+    def uninstall(self) -> None:
+        """Remove the session-wide filesystem wrappers installed by install().
+
+        This is safe to call regardless of current state.
+
+        """
+        self._restore_all_functions()
+        self._installed = False
+
+    def activate(
+        self,
+        test_size: TestSize,
+        enforcement_mode: EnforcementMode,
+        allowed_paths: frozenset[Path],
+    ) -> None:
+        """Activate filesystem blocking for a test.
+
+        Args:
+            test_size: The size category of the current test.
+            enforcement_mode: How to handle violations.
+            allowed_paths: Paths that are always allowed.
 
-    def model_post_init(self, context: object, /) -> None:  # noqa: ARG002
-        """Initialize post-Pydantic setup, storing reference to original functions."""
-        object.__setattr__(self, '_originals', _OriginalFunctions())
+        Raises:
+            icontract.ViolationError: In debug mode, if the blocker is not INACTIVE.
 
-    def _do_activate(
+        """
+        if debug_contracts_enabled():
+            self._check_activation(test_size, enforcement_mode)
+        elif self.state is BlockerState.ACTIVE:
+            return
+        self._do_activate(test_size, enforcement_mode, allowed_paths)
+        self.state = BlockerState.ACTIVE
+
+    def _do_activate(  # type: ignore[override]
         self,
         test_size: TestSize,
         enforcement_mode: EnforcementMode,
@@ -154,7 +219,28 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
         self.current_enforcement_mode = enforcement_mode
         self.current_allowed_paths = allowed_paths
 
-        originals: _OriginalFunctions = object.__getattribute__(self, '_originals')
+        # In session patch mode the wrappers are already in place
+        if not self.is_installed:
+            self._patch_all_functions()
+
+    def _do_deactivate(self) -> None:
+        """Restore the original filesystem functions.
+
+        Restores all patched functions to their original implementations.
+        In session patch mode the wrappers stay installed and only the current
+        test size is cleared, which lets every operation through.
+
+        """
+        if self.is_installed:
+            self.current_test_size = None
+            self.current_enforcement_mode = None
+            self.current_allowed_paths = frozenset()
+            return
+        self._restore_all_functions()
+
+    def _patch_all_functions(self) -> None:
+        """Store the original filesystem functions and install the wrappers."""
+        originals: _OriginalFunctions = self._originals
 
         # Store and patch builtins.open
         originals.open = builtins.open
@@ -169,13 +255,31 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
         # Store and patch shutil functions
         self._patch_shutil_functions(originals)
 
-    def _do_deactivate(self) -> None:
-        """Restore the original filesystem functions.
+    def check_access_allowed(self, path: Path, operation: FilesystemOperation) -> bool:
+        """Check if a filesystem operation is allowed for the current test.
 
-        Restores all patched functions to their original implementations.
+        Args:
+            path: The target path.
+            operation: The type of operation being attempted.
+
+        Returns:
+            True if the operation is allowed, False if it should be blocked.
 
         """
-        self._restore_all_functions()
+        self._require_active('check access')
+        return self._do_check_access_allowed(path, operation)
+
+    def on_violation(self, path: Path, operation: FilesystemOperation, test_nodeid: str) -> None:
+        """Handle a filesystem access violation according to the enforcement mode.
+
+        Args:
+            path: The attempted path.
+            operation: The attempted operation.
+            test_nodeid: The pytest node ID of the violating test.
+
+        """
+        self._require_active('handle violations')
+        self._do_on_violation(path, operation, test_nodeid)
 
     def _do_check_access_allowed(self, path: Path, operation: FilesystemOperation) -> bool:  # noqa: ARG002
         """Check if filesystem access to path is allowed by test size rules.
@@ -243,17 +347,14 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
         This is safe to call regardless of current state.
 
         """
-        self._restore_all_functions()
+        self.uninstall()
 
         super().reset()
-        self.current_test_size = None
-        self.current_enforcement_mode = None
         self.current_allowed_paths = frozenset()
-        self.current_test_nodeid = ''
 
     def _restore_all_functions(self) -> None:
         """Restore all patched functions to their original implementations."""
-        originals: _OriginalFunctions = object.__getattribute__(self, '_originals')
+        originals: _OriginalFunctions = self._originals
 
         # Restore builtins.open
         if originals.open is not None:
@@ -451,8 +552,8 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
 
         def patched_method(self_path: Path, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
             path = Path(self_path)
-            if not blocker._do_check_access_allowed(path, operation):  # noqa: SLF001
-                blocker._do_on_violation(path, operation, blocker.current_test_nodeid)  # noqa: SLF001
+            if not blocker._do_check_access_allowed(path, operation):
+                blocker._do_on_violation(path, operation, blocker.current_test_nodeid)
             return original(self_path, *args, **kwargs)
 
         return patched_method
@@ -479,9 +580,9 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
             **kwargs: Any,  # noqa: ANN401
         ) -> OpenReturnType:
             path = Path(self_path)
-            operation = blocker._determine_operation_from_mode(mode)  # noqa: SLF001
-            if not blocker._do_check_access_allowed(path, operation):  # noqa: SLF001
-                blocker._do_on_violation(path, operation, blocker.current_test_nodeid)  # noqa: SLF001
+            operation = blocker._determine_operation_from_mode(mode)
+            if not blocker._do_check_access_allowed(path, operation):
+                blocker._do_on_violation(path, operation, blocker.current_test_nodeid)
             return original(self_path, mode, *args, **kwargs)
 
         return patched_open
@@ -505,8 +606,8 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
 
         def patched_func(path: str | Path, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
             path_obj = Path(path) if isinstance(path, str) else path
-            if not blocker._do_check_access_allowed(path_obj, operation):  # noqa: SLF001
-                blocker._do_on_violation(path_obj, operation, blocker.current_test_nodeid)  # noqa: SLF001
+            if not blocker._do_check_access_allowed(path_obj, operation):
+                blocker._do_on_violation(path_obj, operation, blocker.current_test_nodeid)
             return original(path, *args, **kwargs)
 
         return patched_func
@@ -528,10 +629,8 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
 
         def patched_rename(src: str | Path, dst: str | Path, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
             src_path = Path(src) if isinstance(src, str) else src
-            if not blocker._do_check_access_allowed(src_path, FilesystemOperation.MODIFY):  # noqa: SLF001
-                blocker._do_on_violation(  # noqa: SLF001
-                    src_path, FilesystemOperation.MODIFY, blocker.current_test_nodeid
-                )
+            if not blocker._do_check_access_allowed(src_path, FilesystemOperation.MODIFY):
+                blocker._do_on_violation(src_path, FilesystemOperation.MODIFY, blocker.current_test_nodeid)
             return original(src, dst, *args, **kwargs)
 
         return patched_rename
@@ -553,10 +652,8 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
 
         def patched_copy(src: str | Path, dst: str | Path, *args: Any, **kwargs: Any) -> str:  # noqa: ANN401
             src_path = Path(src) if isinstance(src, str) else src
-            if not blocker._do_check_access_allowed(src_path, FilesystemOperation.READ):  # noqa: SLF001
-                blocker._do_on_violation(  # noqa: SLF001
-                    src_path, FilesystemOperation.READ, blocker.current_test_nodeid
-                )
+            if not blocker._do_check_access_allowed(src_path, FilesystemOperation.READ):
+                blocker._do_on_violation(src_path, FilesystemOperation.READ, blocker.current_test_nodeid)
             return original(src, dst, *args, **kwargs)
 
         return patched_copy
@@ -578,10 +675,8 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
 
         def patched_rmtree(path: str | Path, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
             path_obj = Path(path) if isinstance(path, str) else path
-            if not blocker._do_check_access_allowed(path_obj, FilesystemOperation.DELETE):  # noqa: SLF001
-                blocker._do_on_violation(  # noqa: SLF001
-                    path_obj, FilesystemOperation.DELETE, blocker.current_test_nodeid
-                )
+            if not blocker._do_check_access_allowed(path_obj, FilesystemOperation.DELETE):
+                blocker._do_on_violation(path_obj, FilesystemOperation.DELETE, blocker.current_test_nodeid)
             return original(path, *args, **kwargs)
 
         return patched_rmtree
@@ -594,7 +689,7 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
 
         """
         blocker = self
-        originals: _OriginalFunctions = object.__getattribute__(self, '_originals')
+        originals: _OriginalFunctions = self._originals
         original_open = originals.open
         if original_open is None:
             msg = 'original_open should be set during activation'
@@ -623,10 +718,10 @@ class FilesystemPatchingBlocker(FilesystemBlockerPort):
 
             """
             path = Path(file) if isinstance(file, str) else file
-            operation = blocker._determine_operation_from_mode(mode)  # noqa: SLF001
+            operation = blocker._determine_operation_from_mode(mode)
 
-            if not blocker._do_check_access_allowed(path, operation):  # noqa: SLF001
-                blocker._do_on_violation(path, operation, blocker.current_test_nodeid)  # noqa: SLF001
+            if not blocker._do_check_access_allowed(path, operation):
+                blocker._do_on_violation(path, operation, blocker.current_test_nodeid)
 
             return original_open(file, mode, *args, **kwargs)
 
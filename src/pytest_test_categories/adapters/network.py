@@ -27,9 +27,9 @@ See Also:
 from __future__ import annotations
 
 import socket
+from typing import Any
 
-from pydantic import Field
-
+from pytest_test_categories.adapters.base import SlottedBlocker
 from pytest_test_categories.exceptions import NetworkAccessViolationError
 from pytest_test_categories.ports.network import (
     EnforcementMode,
@@ -39,7 +39,8 @@ from pytest_test_categories.ports.network import (
 from pytest_test_categories.types import TestSize
 
 
-class SocketPatchingNetworkBlocker(NetworkBlockerPort):
+@NetworkBlockerPort.register
+class SocketPatchingNetworkBlocker(SlottedBlocker):
     """Production adapter that patches socket.socket to block network access.
 
     This adapter intercepts socket connections by replacing socket.socket with
@@ -47,8 +48,16 @@ class SocketPatchingNetworkBlocker(NetworkBlockerPort):
 
     The patching is reversible - deactivate() restores the original socket class.
 
+    It implements the NetworkBlockerPort interface as a slotted plain class so
+    per-test activation skips pydantic and icontract; the port's contracts are
+    checked only with debug contracts enabled.
+
+    In session patch mode the wrapper is installed once via install() and stays
+    in place until uninstall(). activate() and deactivate() then only flip the
+    current test size and enforcement mode, which the wrapper reads on each call.
+
     Attributes:
-        state: Current blocker state (inherited from NetworkBlockerPort).
+        state: Current blocker state (INACTIVE or ACTIVE).
         current_test_size: The test size set during activation.
         current_enforcement_mode: The enforcement mode set during activation.
         current_test_nodeid: The pytest node ID of the current test.
@@ -67,15 +76,47 @@ class SocketPatchingNetworkBlocker(NetworkBlockerPort):
 
     """
 
-    current_test_size: TestSize | None = Field(default=None, description='Test size')
-    current_enforcement_mode: EnforcementMode | None = Field(default=None, description='Enforcement mode')
-    current_test_nodeid: str = Field(default='', description='Test node ID')
+    __slots__ = ('_installed', '_original_socket_class', '_wrapper_classes')
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the blocker, with no original socket class stored yet."""
+        super().__init__(**kwargs)
+        # Store the original socket class so we can always restore it
+        # even if patched multiple times
+        self._original_socket_class: type | None = None
+        self._installed = False
+        # Wrapper classes keyed by the socket class they wrap, built once and reused
+        self._wrapper_classes: dict[type, type] = {}
+
+    @property
+    def is_installed(self) -> bool:
+        """Return True if the socket wrapper is installed for the whole session."""
+        return self._installed
+
+    def install(self) -> None:
+        """Install the socket wrapper once for the whole session.
 
-    def model_post_init(self, context: object, /) -> None:  # noqa: ARG002
-        """Initialize post-Pydantic setup, storing reference to original socket."""
-        # Store the original socket class as a private attribute (not a Pydantic field)
-        # This ensures we can always restore it even if patched multiple times
-        object.__setattr__(self, '_original_socket_class', None)
+        After installation, activate() and deactivate() no longer touch
+        socket.socket. While no test size is set the wrapper allows every
+        connection, so code outside a test is unaffected.
+
+        This is safe to call more than once.
+
+        """
+        if self.is_installed:
+            return
+        self._patch_socket()
+        self._installed = True
+
+    def uninstall(self) -> None:
+        """Remove the session-wide socket wrapper installed by install().
+
+        This is safe to call regardless of current state.
+
+        """
+        self._restore_socket()
+        self._original_socket_class = None
+        self._installed = False
 
     def _do_activate(self, test_size: TestSize, enforcement_mode: EnforcementMode) -> None:
         """Install socket wrapper to intercept connection attempts.
@@ -91,24 +132,61 @@ class SocketPatchingNetworkBlocker(NetworkBlockerPort):
         self.current_test_size = test_size
         self.current_enforcement_mode = enforcement_mode
 
-        # Store original socket class before patching
-        object.__setattr__(self, '_original_socket_class', socket.socket)
-
-        # Create and install the patched socket class
-        socket.socket = self._create_patched_socket_class()  # type: ignore[misc,assignment]
+        # In session patch mode the wrapper is already in place
+        if not self.is_installed:
+            self._patch_socket()
 
     def _do_deactivate(self) -> None:
         """Restore the original socket.socket class.
 
         Restores the original socket.socket class that was saved during
-        activation.
+        activation. In session patch mode the wrapper stays installed and only
+        the current test size is cleared, which lets every connection through.
 
         """
-        # Restore original socket class
-        original = object.__getattribute__(self, '_original_socket_class')
+        if self.is_installed:
+            self.current_test_size = None
+            self.current_enforcement_mode = None
+            return
+        self._restore_socket()
+
+    def _patch_socket(self) -> None:
+        """Store the original socket class and install the patched one."""
+        self._original_socket_class = socket.socket
+        socket.socket = self._get_patched_socket_class()  # type: ignore[misc,assignment]
+
+    def _restore_socket(self) -> None:
+        """Restore the original socket class if one was stored."""
+        original = self._original_socket_class
         if original is not None:
             socket.socket = original  # type: ignore[misc]
 
+    def check_connection_allowed(self, host: str, port: int) -> bool:
+        """Check if a connection to host:port is allowed for the current test.
+
+        Args:
+            host: The target hostname or IP address.
+            port: The target port number.
+
+        Returns:
+            True if the connection is allowed, False if it should be blocked.
+
+        """
+        self._require_active('check connections')
+        return self._do_check_connection_allowed(host, port)
+
+    def on_violation(self, host: str, port: int, test_nodeid: str) -> None:
+        """Handle a network access violation according to the enforcement mode.
+
+        Args:
+            host: The attempted destination host.
+            port: The attempted destination port.
+            test_nodeid: The pytest node ID of the violating test.
+
+        """
+        self._require_active('handle violations')
+        self._do_on_violation(host, port, test_nodeid)
+
     def _do_check_connection_allowed(self, host: str, port: int) -> bool:  # noqa: ARG002
         """Check if connection to host:port is allowed by test size rules.
 
@@ -163,7 +241,7 @@ class SocketPatchingNetworkBlocker(NetworkBlockerPort):
                 callback('network', test_nodeid, details, failed=is_strict)
 
         if is_strict:
-            # test_size is guaranteed to be set when ACTIVE (checked by icontract)
+            # test_size is always set while the blocker is ACTIVE
             raise NetworkAccessViolationError(
                 test_size=self.current_test_size,  # type: ignore[arg-type]
                 test_nodeid=test_nodeid,
@@ -178,15 +256,28 @@ class SocketPatchingNetworkBlocker(NetworkBlockerPort):
 
         """
         # Restore original socket if we have one stored
-        original = object.__getattribute__(self, '_original_socket_class')
-        if original is not None:
-            socket.socket = original  # type: ignore[misc]
-            object.__setattr__(self, '_original_socket_class', None)
+        self.uninstall()
 
         super().reset()
-        self.current_test_size = None
-        self.current_enforcement_mode = None
-        self.current_test_nodeid = ''
+
+    def _get_patched_socket_class(self) -> type:
+        """Return the cached socket wrapper for the stored original class.
+
+        The wrapper reads the blocker's current state through its closure, so
+        a single class per original socket class serves every activation.
+        Sockets created in different tests therefore share one class.
+
+        Returns:
+            The BlockingSocket subclass of the stored original socket class.
+
+        """
+        original_socket = self._original_socket_class
+        wrapper_classes: dict[type, type] = self._wrapper_classes
+        wrapper = wrapper_classes.get(original_socket)
+        if wrapper is None:
+            wrapper = self._create_patched_socket_class()
+            wrapper_classes[original_socket] = wrapper
+        return wrapper
 
     def _create_patched_socket_class(self) -> type:
         """Create a socket class that intercepts connections.
@@ -196,7 +287,7 @@ class SocketPatchingNetworkBlocker(NetworkBlockerPort):
 
         """
         blocker = self
-        original_socket = object.__getattribute__(self, '_original_socket_class')
+        original_socket = self._original_socket_class
 
         class BlockingSocket(original_socket):  # type: ignore[valid-type,misc]
             """Socket wrapper that enforces network blocking rules."""
@@ -217,10 +308,8 @@ class SocketPatchingNetworkBlocker(NetworkBlockerPort):
                     host, port = address[0], address[1]
 
                     # Check if connection is allowed (accessing parent via closure)
-                    if not blocker._do_check_connection_allowed(host, port):  # noqa: SLF001
-                        blocker._do_on_violation(  # noqa: SLF001
-                            host, port, blocker.current_test_nodeid
-                        )
+                    if not blocker._do_check_connection_allowed(host, port):
+                        blocker._do_on_violation(host, port, blocker.current_test_nodeid)
 
                 # If we get here, either:
                 # 1. Connection is allowed
@@ -247,10 +336,8 @@ class SocketPatchingNetworkBlocker(NetworkBlockerPort):
                     host, port = address[0], address[1]
 
                     # Check if connection is allowed (accessing parent via closure)
-                    if not blocker._do_check_connection_allowed(host, port):  # noqa: SLF001
-                        blocker._do_on_violation(  # noqa: SLF001
-                            host, port, blocker.current_test_nodeid
-                        )
+                    if not blocker._do_check_connection_allowed(host, port):
+                        blocker._do_on_violation(host, port, blocker.current_test_nodeid)
 
                 # If we get here, proceed with the actual connection
                 return super().connect_ex(address)  # type: ignore[no-any-return]
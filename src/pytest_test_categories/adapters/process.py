@@ -47,8 +47,7 @@ from typing import (
     Any,
 )
 
-from pydantic import Field
-
+from pytest_test_categories.adapters.base import SlottedBlocker
 from pytest_test_categories.exceptions import SubprocessViolationError
 from pytest_test_categories.ports.network import EnforcementMode
 from pytest_test_categories.ports.process import ProcessBlockerPort
@@ -58,7 +57,8 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 
-class SubprocessPatchingBlocker(ProcessBlockerPort):
+@ProcessBlockerPort.register
+class SubprocessPatchingBlocker(SlottedBlocker):
     """Production adapter that patches subprocess/os to block process spawning.
 
     This adapter intercepts process spawning by patching:
@@ -71,8 +71,16 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
 
     The patching is reversible - deactivate() restores the original functions.
 
+    In session patch mode the wrappers are installed once via install() and stay
+    in place until uninstall(). activate() and deactivate() then only flip the
+    current test size and enforcement mode.
+
+    It implements the ProcessBlockerPort interface as a slotted plain class so
+    per-test activation skips pydantic and icontract; the port's contracts are
+    checked only with debug contracts enabled.
+
     Attributes:
-        state: Current blocker state (inherited from ProcessBlockerPort).
+        state: Current blocker state (INACTIVE or ACTIVE).
         current_test_size: The test size set during activation.
         current_enforcement_mode: The enforcement mode set during activation.
         current_test_nodeid: The pytest node ID of the current test.
@@ -91,20 +99,72 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
 
     """
 
-    current_test_size: TestSize | None = Field(default=None, description='Test size')
-    current_enforcement_mode: EnforcementMode | None = Field(default=None, description='Enforcement mode')
-    current_test_nodeid: str = Field(default='', description='Test node ID')
-
-    def model_post_init(self, context: object, /) -> None:  # noqa: ARG002
-        """Initialize post-Pydantic setup, storing references to original functions."""
-        object.__setattr__(self, '_original_popen', None)
-        object.__setattr__(self, '_original_run', None)
-        object.__setattr__(self, '_original_call', None)
-        object.__setattr__(self, '_original_check_call', None)
-        object.__setattr__(self, '_original_check_output', None)
-        object.__setattr__(self, '_original_os_system', None)
-        object.__setattr__(self, '_original_os_popen', None)
-        object.__setattr__(self, '_original_mp_process', None)
+    __slots__ = (
+        '_installed',
+        '_original_call',
+        '_original_check_call',
+        '_original_check_output',
+        '_original_mp_process',
+        '_original_os_popen',
+        '_original_os_system',
+        '_original_popen',
+        '_original_run',
+        '_wrapper_classes',
+    )
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the blocker, with no original functions stored yet."""
+        super().__init__(**kwargs)
+        self._original_popen: Any = None
+        self._original_run: Any = None
+        self._original_call: Any = None
+        self._original_check_call: Any = None
+        self._original_check_output: Any = None
+        self._original_os_system: Any = None
+        self._original_os_popen: Any = None
+        self._original_mp_process: Any = None
+        self._installed = False
+        # Wrapper classes keyed by the class they wrap, built once and reused
+        self._wrapper_classes: dict[type, type] = {}
+
+    @property
+    def is_installed(self) -> bool:
+        """Return True if the process wrappers are installed for the whole session."""
+        return self._installed
+
+    def install(self) -> None:
+        """Install the subprocess/os wrappers once for the whole session.
+
+        After installation, activate() and deactivate() no longer patch or
+        restore anything. While no test size is set the wrappers allow every
+        spawn, so code running between tests is unaffected.
+
+        This is safe to call more than once.
+
+        """
+        if self.is_installed:
+            return
+        self._install_patches()
+        self._installed = True
+
+    def uninstall(self) -> None:
+        """Remove the session-wide process wrappers installed by install().
+
+        This is safe to call regardless of current state.
+
+        """
+        self._restore_originals()
+
+        # Clear stored references
+        self._original_popen = None
+        self._original_run = None
+        self._original_call = None
+        self._original_check_call = None
+        self._original_check_output = None
+        self._original_os_system = None
+        self._original_os_popen = None
+        self._original_mp_process = None
+        self._installed = False
 
     def _do_activate(self, test_size: TestSize, enforcement_mode: EnforcementMode) -> None:
         """Install subprocess/os wrappers to intercept process spawns.
@@ -120,68 +180,115 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
         self.current_test_size = test_size
         self.current_enforcement_mode = enforcement_mode
 
+        # In session patch mode the wrappers are already in place
+        if not self.is_installed:
+            self._install_patches()
+
+    def _install_patches(self) -> None:
+        """Store the original subprocess/os functions and install the wrappers."""
         # Store originals
-        object.__setattr__(self, '_original_popen', subprocess.Popen)
-        object.__setattr__(self, '_original_run', subprocess.run)
-        object.__setattr__(self, '_original_call', subprocess.call)
-        object.__setattr__(self, '_original_check_call', subprocess.check_call)
-        object.__setattr__(self, '_original_check_output', subprocess.check_output)
-        object.__setattr__(self, '_original_os_system', os.system)
-        object.__setattr__(self, '_original_os_popen', os.popen)
-        object.__setattr__(self, '_original_mp_process', multiprocessing.Process)
+        self._original_popen = subprocess.Popen
+        self._original_run = subprocess.run
+        self._original_call = subprocess.call
+        self._original_check_call = subprocess.check_call
+        self._original_check_output = subprocess.check_output
+        self._original_os_system = os.system
+        self._original_os_popen = os.popen
+        self._original_mp_process = multiprocessing.Process
 
         # Install patches
-        subprocess.Popen = self._create_patched_popen()  # type: ignore[misc,assignment]
+        subprocess.Popen = self._get_wrapper_class('_original_popen', self._create_patched_popen)  # type: ignore[misc]
         subprocess.run = self._create_patched_run()
         subprocess.call = self._create_patched_call()
         subprocess.check_call = self._create_patched_check_call()
         subprocess.check_output = self._create_patched_check_output()  # type: ignore[assignment]
         os.system = self._create_patched_os_system()  # type: ignore[assignment]
         os.popen = self._create_patched_os_popen()
-        multiprocessing.Process = self._create_patched_mp_process()  # type: ignore[misc,assignment]
+        multiprocessing.Process = self._get_wrapper_class(  # type: ignore[misc]
+            '_original_mp_process', self._create_patched_mp_process
+        )
 
     def _do_deactivate(self) -> None:
         """Restore the original subprocess/os functions.
 
         Restores all the original functions that were saved during activation.
+        In session patch mode the wrappers stay installed and only the current
+        test size is cleared, which lets every spawn through.
 
         """
+        if self.is_installed:
+            self.current_test_size = None
+            self.current_enforcement_mode = None
+            return
         self._restore_originals()
 
     def _restore_originals(self) -> None:
         """Restore all original functions from stored references."""
-        original_popen = object.__getattribute__(self, '_original_popen')
+        original_popen = self._original_popen
         if original_popen is not None:
             subprocess.Popen = original_popen  # type: ignore[misc]
 
-        original_run = object.__getattribute__(self, '_original_run')
+        original_run = self._original_run
         if original_run is not None:
             subprocess.run = original_run
 
-        original_call = object.__getattribute__(self, '_original_call')
+        original_call = self._original_call
         if original_call is not None:
             subprocess.call = original_call
 
-        original_check_call = object.__getattribute__(self, '_original_check_call')
+        original_check_call = self._original_check_call
         if original_check_call is not None:
             subprocess.check_call = original_check_call
 
-        original_check_output = object.__getattribute__(self, '_original_check_output')
+        original_check_output = self._original_check_output
         if original_check_output is not None:
             subprocess.check_output = original_check_output
 
-        original_os_system = object.__getattribute__(self, '_original_os_system')
+        original_os_system = self._original_os_system
         if original_os_system is not None:
             os.system = original_os_system
 
-        original_os_popen = object.__getattribute__(self, '_original_os_popen')
+        original_os_popen = self._original_os_popen
         if original_os_popen is not None:
             os.popen = original_os_popen
 
-        original_mp_process = object.__getattribute__(self, '_original_mp_process')
+        original_mp_process = self._original_mp_process
         if original_mp_process is not None:
             multiprocessing.Process = original_mp_process  # type: ignore[misc]
 
+    def check_spawn_allowed(self, command: str, args: tuple[str, ...]) -> bool:
+        """Check if a process spawn is allowed for the current test.
+
+        Args:
+            command: The command being executed.
+            args: The command arguments.
+
+        Returns:
+            True if the spawn is allowed, False if it should be blocked.
+
+        """
+        self._require_active('check spawns')
+        return self._do_check_spawn_allowed(command, args)
+
+    def on_violation(
+        self,
+        command: str,
+        args: tuple[str, ...],
+        test_nodeid: str,
+        method: str,
+    ) -> None:
+        """Handle a process spawn violation according to the enforcement mode.
+
+        Args:
+            command: The command that was attempted.
+            args: The command arguments.
+            test_nodeid: The pytest node ID of the violating test.
+            method: The spawn method used (e.g., 'subprocess.run').
+
+        """
+        self._require_active('handle violations')
+        self._do_on_violation(command, args, test_nodeid, method)
+
     def _do_check_spawn_allowed(self, command: str, args: tuple[str, ...]) -> bool:  # noqa: ARG002
         """Check if process spawn is allowed by test size rules.
 
@@ -248,22 +355,31 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
         This is safe to call regardless of current state.
 
         """
-        self._restore_originals()
-
-        # Clear stored references
-        object.__setattr__(self, '_original_popen', None)
-        object.__setattr__(self, '_original_run', None)
-        object.__setattr__(self, '_original_call', None)
-        object.__setattr__(self, '_original_check_call', None)
-        object.__setattr__(self, '_original_check_output', None)
-        object.__setattr__(self, '_original_os_system', None)
-        object.__setattr__(self, '_original_os_popen', None)
-        object.__setattr__(self, '_original_mp_process', None)
+        self.uninstall()
 
         super().reset()
-        self.current_test_size = None
-        self.current_enforcement_mode = None
-        self.current_test_nodeid = ''
+
+    def _get_wrapper_class(self, original_attr: str, factory: Callable[[], type]) -> type:
+        """Return the cached wrapper for the original class stored in original_attr.
+
+        Wrapper classes read the blocker's current state through their closure,
+        so one class per original class serves every activation.
+
+        Args:
+            original_attr: Name of the private attribute holding the original class.
+            factory: Builds the wrapper class when it is not cached yet.
+
+        Returns:
+            The wrapper subclass of the stored original class.
+
+        """
+        original = getattr(self, original_attr)
+        wrapper_classes: dict[type, type] = self._wrapper_classes
+        wrapper = wrapper_classes.get(original)
+        if wrapper is None:
+            wrapper = factory()
+            wrapper_classes[original] = wrapper
+        return wrapper
 
     def _extract_command_and_args(self, args_input: Any) -> tuple[str, tuple[str, ...]]:  # noqa: ANN401
         """Extract command and args from various input formats.
@@ -289,7 +405,7 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
 
         """
         blocker = self
-        original_popen = object.__getattribute__(self, '_original_popen')
+        original_popen = self._original_popen
 
         class BlockingPopen(original_popen):  # type: ignore[valid-type,misc]
             """Popen wrapper that enforces process blocking rules."""
@@ -301,12 +417,10 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
                 **kwargs: Any,  # noqa: ANN401
             ) -> None:
                 """Check permissions then delegate to actual Popen."""
-                command, cmd_args = blocker._extract_command_and_args(args)  # noqa: SLF001
+                command, cmd_args = blocker._extract_command_and_args(args)
 
-                if not blocker._do_check_spawn_allowed(command, cmd_args):  # noqa: SLF001
-                    blocker._do_on_violation(  # noqa: SLF001
-                        command, cmd_args, blocker.current_test_nodeid, 'subprocess.Popen'
-                    )
+                if not blocker._do_check_spawn_allowed(command, cmd_args):
+                    blocker._do_on_violation(command, cmd_args, blocker.current_test_nodeid, 'subprocess.Popen')
 
                 super().__init__(args, *pargs, **kwargs)
 
@@ -320,7 +434,7 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
 
         """
         blocker = self
-        original_run = object.__getattribute__(self, '_original_run')
+        original_run = self._original_run
 
         def patched_run(
             args: Any,  # noqa: ANN401
@@ -328,12 +442,10 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
             **kwargs: Any,  # noqa: ANN401
         ) -> subprocess.CompletedProcess[Any]:
             """Check permissions then delegate to actual run."""
-            command, cmd_args = blocker._extract_command_and_args(args)  # noqa: SLF001
+            command, cmd_args = blocker._extract_command_and_args(args)
 
-            if not blocker._do_check_spawn_allowed(command, cmd_args):  # noqa: SLF001
-                blocker._do_on_violation(  # noqa: SLF001
-                    command, cmd_args, blocker.current_test_nodeid, 'subprocess.run'
-                )
+            if not blocker._do_check_spawn_allowed(command, cmd_args):
+                blocker._do_on_violation(command, cmd_args, blocker.current_test_nodeid, 'subprocess.run')
 
             return original_run(args, *pargs, **kwargs)  # type: ignore[no-any-return]
 
@@ -347,7 +459,7 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
 
         """
         blocker = self
-        original_call = object.__getattribute__(self, '_original_call')
+        original_call = self._original_call
 
         def patched_call(
             args: Any,  # noqa: ANN401
@@ -355,12 +467,10 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
             **kwargs: Any,  # noqa: ANN401
         ) -> int:
             """Check permissions then delegate to actual call."""
-            command, cmd_args = blocker._extract_command_and_args(args)  # noqa: SLF001
+            command, cmd_args = blocker._extract_command_and_args(args)
 
-            if not blocker._do_check_spawn_allowed(command, cmd_args):  # noqa: SLF001
-                blocker._do_on_violation(  # noqa: SLF001
-                    command, cmd_args, blocker.current_test_nodeid, 'subprocess.call'
-                )
+            if not blocker._do_check_spawn_allowed(command, cmd_args):
+                blocker._do_on_violation(command, cmd_args, blocker.current_test_nodeid, 'subprocess.call')
 
             return original_call(args, *pargs, **kwargs)  # type: ignore[no-any-return]
 
@@ -374,7 +484,7 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
 
         """
         blocker = self
-        original_check_call = object.__getattribute__(self, '_original_check_call')
+        original_check_call = self._original_check_call
 
         def patched_check_call(
             args: Any,  # noqa: ANN401
@@ -382,12 +492,10 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
             **kwargs: Any,  # noqa: ANN401
         ) -> int:
             """Check permissions then delegate to actual check_call."""
-            command, cmd_args = blocker._extract_command_and_args(args)  # noqa: SLF001
+            command, cmd_args = blocker._extract_command_and_args(args)
 
-            if not blocker._do_check_spawn_allowed(command, cmd_args):  # noqa: SLF001
-                blocker._do_on_violation(  # noqa: SLF001
-                    command, cmd_args, blocker.current_test_nodeid, 'subprocess.check_call'
-                )
+            if not blocker._do_check_spawn_allowed(command, cmd_args):
+                blocker._do_on_violation(command, cmd_args, blocker.current_test_nodeid, 'subprocess.check_call')
 
             return original_check_call(args, *pargs, **kwargs)  # type: ignore[no-any-return]
 
@@ -401,7 +509,7 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
 
         """
         blocker = self
-        original_check_output = object.__getattribute__(self, '_original_check_output')
+        original_check_output = self._original_check_output
 
         def patched_check_output(
             args: Any,  # noqa: ANN401
@@ -409,12 +517,10 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
             **kwargs: Any,  # noqa: ANN401
         ) -> bytes:
             """Check permissions then delegate to actual check_output."""
-            command, cmd_args = blocker._extract_command_and_args(args)  # noqa: SLF001
+            command, cmd_args = blocker._extract_command_and_args(args)
 
-            if not blocker._do_check_spawn_allowed(command, cmd_args):  # noqa: SLF001
-                blocker._do_on_violation(  # noqa: SLF001
-                    command, cmd_args, blocker.current_test_nodeid, 'subprocess.check_output'
-                )
+            if not blocker._do_check_spawn_allowed(command, cmd_args):
+                blocker._do_on_violation(command, cmd_args, blocker.current_test_nodeid, 'subprocess.check_output')
 
             return original_check_output(args, *pargs, **kwargs)  # type: ignore[no-any-return]
 
@@ -428,14 +534,12 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
 
         """
         blocker = self
-        original_os_system = object.__getattribute__(self, '_original_os_system')
+        original_os_system = self._original_os_system
 
         def patched_os_system(command: str) -> int:
             """Check permissions then delegate to actual os.system."""
-            if not blocker._do_check_spawn_allowed(command, ()):  # noqa: SLF001
-                blocker._do_on_violation(  # noqa: SLF001
-                    command, (), blocker.current_test_nodeid, 'os.system'
-                )
+            if not blocker._do_check_spawn_allowed(command, ()):
+                blocker._do_on_violation(command, (), blocker.current_test_nodeid, 'os.system')
 
             return original_os_system(command)  # type: ignore[no-any-return]
 
@@ -449,7 +553,7 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
 
         """
         blocker = self
-        original_os_popen = object.__getattribute__(self, '_original_os_popen')
+        original_os_popen = self._original_os_popen
 
         def patched_os_popen(
             cmd: str,
@@ -457,10 +561,8 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
             **kwargs: Any,  # noqa: ANN401
         ) -> Any:  # noqa: ANN401
             """Check permissions then delegate to actual os.popen."""
-            if not blocker._do_check_spawn_allowed(cmd, ()):  # noqa: SLF001
-                blocker._do_on_violation(  # noqa: SLF001
-                    cmd, (), blocker.current_test_nodeid, 'os.popen'
-                )
+            if not blocker._do_check_spawn_allowed(cmd, ()):
+                blocker._do_on_violation(cmd, (), blocker.current_test_nodeid, 'os.popen')
 
             return original_os_popen(cmd, *pargs, **kwargs)
 
@@ -474,7 +576,7 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
 
         """
         blocker = self
-        original_mp_process = object.__getattribute__(self, '_original_mp_process')
+        original_mp_process = self._original_mp_process
 
         class BlockingProcess(original_mp_process):  # type: ignore[valid-type,misc]
             """Process wrapper that enforces process blocking rules."""
@@ -484,10 +586,8 @@ class SubprocessPatchingBlocker(ProcessBlockerPort):
                 target = getattr(self, '_target', None) or getattr(self, 'target', None)
                 target_name = getattr(target, '__name__', str(target)) if target else 'Process'
 
-                if not blocker._do_check_spawn_allowed(target_name, ()):  # noqa: SLF001
-                    blocker._do_on_violation(  # noqa: SLF001
-                        target_name, (), blocker.current_test_nodeid, 'multiprocessing.Process'
-                    )
+                if not blocker._do_check_spawn_allowed(target_name, ()):
+                    blocker._do_on_violation(target_name, (), blocker.current_test_nodeid, 'multiprocessing.Process')
 
                 super().start()
 
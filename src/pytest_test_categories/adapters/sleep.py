@@ -40,8 +40,7 @@ from typing import (
     Any,
 )
 
-from pydantic import Field
-
+from pytest_test_categories.adapters.base import SlottedBlocker
 from pytest_test_categories.exceptions import SleepViolationError
 from pytest_test_categories.ports.network import EnforcementMode
 from pytest_test_categories.ports.sleep import SleepBlockerPort
@@ -51,7 +50,8 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine
 
 
-class SleepPatchingBlocker(SleepBlockerPort):
+@SleepBlockerPort.register
+class SleepPatchingBlocker(SlottedBlocker):
     """Production adapter that patches time.sleep and asyncio.sleep to block sleep calls.
 
     This adapter intercepts sleep calls by patching:
@@ -60,8 +60,16 @@ class SleepPatchingBlocker(SleepBlockerPort):
 
     The patching is reversible - deactivate() restores the original functions.
 
+    In session patch mode the wrappers are installed once via install() and stay
+    in place until uninstall(). activate() and deactivate() then only flip the
+    current test size and enforcement mode.
+
+    It implements the SleepBlockerPort interface as a slotted plain class so
+    per-test activation skips pydantic and icontract; the port's contracts are
+    checked only with debug contracts enabled.
+
     Attributes:
-        state: Current blocker state (inherited from SleepBlockerPort).
+        state: Current blocker state (INACTIVE or ACTIVE).
         current_test_size: The test size set during activation.
         current_enforcement_mode: The enforcement mode set during activation.
         current_test_nodeid: The pytest node ID of the current test.
@@ -80,14 +88,47 @@ class SleepPatchingBlocker(SleepBlockerPort):
 
     """
 
-    current_test_size: TestSize | None = Field(default=None, description='Test size')
-    current_enforcement_mode: EnforcementMode | None = Field(default=None, description='Enforcement mode')
-    current_test_nodeid: str = Field(default='', description='Test node ID')
+    __slots__ = ('_installed', '_original_asyncio_sleep', '_original_time_sleep')
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the blocker, with no original functions stored yet."""
+        super().__init__(**kwargs)
+        self._original_time_sleep: Any = None
+        self._original_asyncio_sleep: Any = None
+        self._installed = False
+
+    @property
+    def is_installed(self) -> bool:
+        """Return True if the sleep wrappers are installed for the whole session."""
+        return self._installed
+
+    def install(self) -> None:
+        """Install the sleep wrappers once for the whole session.
+
+        After installation, activate() and deactivate() no longer patch or
+        restore anything. While no test size is set the wrappers allow every
+        sleep, so code running between tests is unaffected.
+
+        This is safe to call more than once.
+
+        """
+        if self.is_installed:
+            return
+        self._install_patches()
+        self._installed = True
+
+    def uninstall(self) -> None:
+        """Remove the session-wide sleep wrappers installed by install().
+
+        This is safe to call regardless of current state.
+
+        """
+        self._restore_originals()
 
-    def model_post_init(self, context: object, /) -> None:  # noqa: ARG002
-        """Initialize post-Pydantic setup, storing references to original functions."""
-        object.__setattr__(self, '_original_time_sleep', None)
-        object.__setattr__(self, '_original_asyncio_sleep', None)
+        # Clear stored references
+        self._original_time_sleep = None
+        self._original_asyncio_sleep = None
+        self._installed = False
 
     def _do_activate(
         self,
@@ -107,9 +148,15 @@ class SleepPatchingBlocker(SleepBlockerPort):
         self.current_test_size = test_size
         self.current_enforcement_mode = enforcement_mode
 
+        # In session patch mode the wrappers are already in place
+        if not self.is_installed:
+            self._install_patches()
+
+    def _install_patches(self) -> None:
+        """Store the original sleep functions and install the wrappers."""
         # Store originals
-        object.__setattr__(self, '_original_time_sleep', time.sleep)
-        object.__setattr__(self, '_original_asyncio_sleep', asyncio.sleep)
+        self._original_time_sleep = time.sleep
+        self._original_asyncio_sleep = asyncio.sleep
 
         # Install patches
         time.sleep = self._create_patched_time_sleep()
@@ -119,20 +166,52 @@ class SleepPatchingBlocker(SleepBlockerPort):
         """Restore the original sleep functions.
 
         Restores all original functions that were saved during activation.
+        In session patch mode the wrappers stay installed and only the current
+        test size is cleared, which lets every sleep through.
 
         """
+        if self.is_installed:
+            self.current_test_size = None
+            self.current_enforcement_mode = None
+            return
         self._restore_originals()
 
     def _restore_originals(self) -> None:
         """Restore all original functions from stored references."""
-        original_time_sleep = object.__getattribute__(self, '_original_time_sleep')
+        original_time_sleep = self._original_time_sleep
         if original_time_sleep is not None:
             time.sleep = original_time_sleep
 
-        original_asyncio_sleep = object.__getattribute__(self, '_original_asyncio_sleep')
+        original_asyncio_sleep = self._original_asyncio_sleep
         if original_asyncio_sleep is not None:
             asyncio.sleep = original_asyncio_sleep
 
+    def check_sleep_allowed(self, function: str, duration: float) -> bool:
+        """Check if a sleep call is allowed for the current test.
+
+        Args:
+            function: The sleep function name (e.g., 'time.sleep').
+            duration: The sleep duration in seconds.
+
+        Returns:
+            True if the sleep is allowed, False if it should be blocked.
+
+        """
+        self._require_active('check sleep')
+        return self._do_check_sleep_allowed(function, duration)
+
+    def on_violation(self, function: str, duration: float, test_nodeid: str) -> None:
+        """Handle a sleep violation according to the enforcement mode.
+
+        Args:
+            function: The sleep function name.
+            duration: The sleep duration in seconds.
+            test_nodeid: The pytest node ID of the violating test.
+
+        """
+        self._require_active('handle violations')
+        self._do_on_violation(function, duration, test_nodeid)
+
     def _do_check_sleep_allowed(self, function: str, duration: float) -> bool:  # noqa: ARG002
         """Check if sleep call is allowed by test size rules.
 
@@ -195,16 +274,9 @@ class SleepPatchingBlocker(SleepBlockerPort):
         This is safe to call regardless of current state.
 
         """
-        self._restore_originals()
-
-        # Clear stored references
-        object.__setattr__(self, '_original_time_sleep', None)
-        object.__setattr__(self, '_original_asyncio_sleep', None)
+        self.uninstall()
 
         super().reset()
-        self.current_test_size = None
-        self.current_enforcement_mode = None
-        self.current_test_nodeid = ''
 
     def _create_patched_time_sleep(self) -> Callable[[float], None]:
         """Create a wrapper for time.sleep that intercepts sleep calls.
@@ -214,7 +286,7 @@ class SleepPatchingBlocker(SleepBlockerPort):
 
         """
         blocker = self
-        original_sleep = object.__getattribute__(self, '_original_time_sleep')
+        original_sleep = self._original_time_sleep
 
         def patched_sleep(seconds: float) -> None:
             """Check sleep permissions before delegating to actual sleep.
@@ -227,14 +299,14 @@ class SleepPatchingBlocker(SleepBlockerPort):
                     and enforcement mode is STRICT.
 
             """
-            if not blocker._do_check_sleep_allowed('time.sleep', seconds):  # noqa: SLF001
-                blocker._do_on_violation('time.sleep', seconds, blocker.current_test_nodeid)  # noqa: SLF001
+            if not blocker._do_check_sleep_allowed('time.sleep', seconds):
+                blocker._do_on_violation('time.sleep', seconds, blocker.current_test_nodeid)
 
             original_sleep(seconds)
 
         return patched_sleep
 
-    def _create_patched_asyncio_sleep(self) -> Callable[[float], Coroutine[Any, Any, None]]:
+    def _create_patched_asyncio_sleep(self) -> Callable[..., Coroutine[Any, Any, Any]]:
         """Create a wrapper for asyncio.sleep that intercepts sleep calls.
 
         Returns:
@@ -242,22 +314,26 @@ class SleepPatchingBlocker(SleepBlockerPort):
 
         """
         blocker = self
-        original_sleep = object.__getattribute__(self, '_original_asyncio_sleep')
+        original_sleep = self._original_asyncio_sleep
 
-        async def patched_sleep(delay: float) -> None:
+        async def patched_sleep(delay: float, result: Any = None) -> Any:  # noqa: ANN401
             """Check sleep permissions before delegating to actual sleep.
 
             Args:
                 delay: The sleep duration in seconds.
+                result: Value returned when the sleep completes, as with asyncio.sleep.
+
+            Returns:
+                The result argument.
 
             Raises:
                 SleepViolationError: If sleep is not allowed
                     and enforcement mode is STRICT.
 
             """
-            if not blocker._do_check_sleep_allowed('asyncio.sleep', delay):  # noqa: SLF001
-                blocker._do_on_violation('asyncio.sleep', delay, blocker.current_test_nodeid)  # noqa: SLF001
+            if not blocker._do_check_sleep_allowed('asyncio.sleep', delay):
+                blocker._do_on_violation('asyncio.sleep', delay, blocker.current_test_nodeid)
 
-            await original_sleep(delay)
+            return await original_sleep(delay, result)
 
         return patched_sleep
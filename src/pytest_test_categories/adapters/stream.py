@@ -0,0 +1,96 @@
+"""Text stream adapters for the command-line tools.
+
+The pytest-test-categories command runs outside pytest, so it has no
+terminal reporter or pytest warnings. These adapters implement the output
+writer and warning system ports on plain text streams, so the command can
+reuse the reporting and validation services.
+"""
+
+from __future__ import annotations
+
+from typing import TextIO
+
+from pytest_test_categories.types import (
+    OutputWriterPort,
+    WarningSystemPort,
+)
+
+# Width of section headers and separators, matching pytest's default terminal width
+STREAM_WIDTH = 80
+
+
+class StreamWriterAdapter(OutputWriterPort):
+    """Production adapter that writes report output to a text stream.
+
+    Section headers and separators are formatted like pytest's, so the
+    command's output reads the same as the plugin's terminal summary.
+
+    Args:
+        stream: The stream to write to, such as sys.stdout.
+
+    Example:
+        >>> writer = StreamWriterAdapter(sys.stdout)
+        >>> writer.write_line('Total tests: 10')
+        Total tests: 10
+
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        """Initialize the adapter for a stream."""
+        self._stream = stream
+
+    def write_section(self, title: str, sep: str = '=') -> None:
+        """Write a section header with the title centered in separators.
+
+        Args:
+            title: The section title to display.
+            sep: The separator character to use (default: '=').
+
+        """
+        self._stream.write(f' {title} '.center(STREAM_WIDTH, sep) + '\n')
+
+    def write_line(self, message: str, **kwargs: object) -> None:  # noqa: ARG002 - streams have no styling
+        """Write a single line of text.
+
+        Args:
+            message: The message to write.
+            **kwargs: Styling arguments, ignored on plain streams.
+
+        """
+        self._stream.write(f'{message}\n')
+
+    def write_separator(self, sep: str = '-') -> None:
+        """Write a separator line.
+
+        Args:
+            sep: The separator character to use (default: '-').
+
+        """
+        self._stream.write(sep * STREAM_WIDTH + '\n')
+
+
+class StreamWarningAdapter(WarningSystemPort):
+    """Production adapter that writes warnings to a text stream.
+
+    Args:
+        stream: The stream to write to, such as sys.stderr.
+
+    Example:
+        >>> StreamWarningAdapter(sys.stdout).warn('Too few small tests')
+        warning: Too few small tests
+
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        """Initialize the adapter for a stream."""
+        self._stream = stream
+
+    def warn(self, message: str, category: type[Warning] | None = None) -> None:  # noqa: ARG002 - no warning filters
+        """Write a warning line.
+
+        Args:
+            message: The warning message to write.
+            category: The warning category, ignored outside the warnings module.
+
+        """
+        self._stream.write(f'warning: {message}\n')
@@ -34,15 +34,22 @@ from __future__ import annotations
 import concurrent.futures
 import threading
 import warnings
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
 
-from pydantic import Field
-
+from pytest_test_categories.adapters.base import SlottedBlocker
 from pytest_test_categories.ports.network import EnforcementMode
 from pytest_test_categories.ports.threading import ThreadMonitorPort
 from pytest_test_categories.types import TestSize
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
-class ThreadPatchingMonitor(ThreadMonitorPort):
+@ThreadMonitorPort.register
+class ThreadPatchingMonitor(SlottedBlocker):
     """Production adapter that patches threading modules to monitor thread creation.
 
     This adapter intercepts thread creation by replacing threading.Thread and
@@ -50,8 +57,16 @@ class ThreadPatchingMonitor(ThreadMonitorPort):
 
     The patching is reversible - deactivate() restores the original classes.
 
+    In session patch mode the wrappers are installed once via install() and stay
+    in place until uninstall(). activate() and deactivate() then only flip the
+    current test size and enforcement mode, so is_monitoring is False between tests.
+
+    It implements the ThreadMonitorPort interface as a slotted plain class so
+    per-test activation skips pydantic and icontract; the port's contracts are
+    checked only with debug contracts enabled.
+
     Attributes:
-        state: Current monitor state (inherited from ThreadMonitorPort).
+        state: Current monitor state (INACTIVE or ACTIVE).
         current_test_size: The test size set during activation.
         current_enforcement_mode: The enforcement mode set during activation.
         current_test_nodeid: The pytest node ID of the current test.
@@ -70,15 +85,57 @@ class ThreadPatchingMonitor(ThreadMonitorPort):
 
     """
 
-    current_test_size: TestSize | None = Field(default=None, description='Test size')
-    current_enforcement_mode: EnforcementMode | None = Field(default=None, description='Enforcement mode')
-    current_test_nodeid: str = Field(default='', description='Test node ID')
+    # Subject used in contract messages, matching ThreadMonitorPort
+    _contract_subject = 'Monitor'
+
+    __slots__ = (
+        '_installed',
+        '_original_process_pool_executor',
+        '_original_thread_class',
+        '_original_thread_pool_executor',
+        '_wrapper_classes',
+    )
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the monitor, with no original classes stored yet."""
+        super().__init__(**kwargs)
+        self._original_thread_class: Any = None
+        self._original_thread_pool_executor: Any = None
+        self._original_process_pool_executor: Any = None
+        self._installed = False
+        # Wrapper classes keyed by the class they wrap, built once and reused
+        self._wrapper_classes: dict[type, type] = {}
+
+    @property
+    def is_installed(self) -> bool:
+        """Return True if the threading wrappers are installed for the whole session."""
+        return self._installed
+
+    def install(self) -> None:
+        """Install the threading wrappers once for the whole session.
+
+        After installation, activate() and deactivate() no longer patch or
+        restore anything. Threads created outside a small test are not reported.
 
-    def model_post_init(self, context: object, /) -> None:  # noqa: ARG002
-        """Initialize post-Pydantic setup, storing reference to original classes."""
-        object.__setattr__(self, '_original_thread_class', None)
-        object.__setattr__(self, '_original_thread_pool_executor', None)
-        object.__setattr__(self, '_original_process_pool_executor', None)
+        This is safe to call more than once.
+
+        """
+        if self.is_installed:
+            return
+        self._install_patches()
+        self._installed = True
+
+    def uninstall(self) -> None:
+        """Remove the session-wide threading wrappers installed by install().
+
+        This is safe to call regardless of current state.
+
+        """
+        self._restore_originals()
+        self._original_thread_class = None
+        self._original_thread_pool_executor = None
+        self._original_process_pool_executor = None
+        self._installed = False
 
     @property
     def is_monitoring(self) -> bool:
@@ -112,32 +169,65 @@ class ThreadPatchingMonitor(ThreadMonitorPort):
         self.current_test_size = test_size
         self.current_enforcement_mode = enforcement_mode
 
-        object.__setattr__(self, '_original_thread_class', threading.Thread)
-        object.__setattr__(self, '_original_thread_pool_executor', concurrent.futures.ThreadPoolExecutor)
-        object.__setattr__(self, '_original_process_pool_executor', concurrent.futures.ProcessPoolExecutor)
-
-        threading.Thread = self._create_patched_thread_class()  # type: ignore[misc,assignment]
-        concurrent.futures.ThreadPoolExecutor = self._create_patched_thread_pool_executor()  # type: ignore[misc,assignment]
-        concurrent.futures.ProcessPoolExecutor = self._create_patched_process_pool_executor()  # type: ignore[misc,assignment]
+        # In session patch mode the wrappers are already in place
+        if not self.is_installed:
+            self._install_patches()
 
     def _do_deactivate(self) -> None:
         """Restore the original threading classes.
 
         Restores all original classes that were saved during activation.
+        In session patch mode the wrappers stay installed and only the current
+        test size is cleared, which stops monitoring until the next activation.
 
         """
-        original_thread = object.__getattribute__(self, '_original_thread_class')
+        if self.is_installed:
+            self.current_test_size = None
+            self.current_enforcement_mode = None
+            return
+        self._restore_originals()
+
+    def _install_patches(self) -> None:
+        """Store the original threading classes and install the wrappers."""
+        self._original_thread_class = threading.Thread
+        self._original_thread_pool_executor = concurrent.futures.ThreadPoolExecutor
+        self._original_process_pool_executor = concurrent.futures.ProcessPoolExecutor
+
+        threading.Thread = self._get_wrapper_class(  # type: ignore[misc]
+            '_original_thread_class', self._create_patched_thread_class
+        )
+        concurrent.futures.ThreadPoolExecutor = self._get_wrapper_class(  # type: ignore[misc]
+            '_original_thread_pool_executor', self._create_patched_thread_pool_executor
+        )
+        concurrent.futures.ProcessPoolExecutor = self._get_wrapper_class(  # type: ignore[misc]
+            '_original_process_pool_executor', self._create_patched_process_pool_executor
+        )
+
+    def _restore_originals(self) -> None:
+        """Restore all original classes from stored references."""
+        original_thread = self._original_thread_class
         if original_thread is not None:
             threading.Thread = original_thread  # type: ignore[misc]
 
-        original_executor = object.__getattribute__(self, '_original_thread_pool_executor')
+        original_executor = self._original_thread_pool_executor
         if original_executor is not None:
             concurrent.futures.ThreadPoolExecutor = original_executor  # type: ignore[misc]
 
-        original_process_executor = object.__getattribute__(self, '_original_process_pool_executor')
+        original_process_executor = self._original_process_pool_executor
         if original_process_executor is not None:
             concurrent.futures.ProcessPoolExecutor = original_process_executor  # type: ignore[misc]
 
+    def on_thread_creation(self, thread_type: str, test_nodeid: str) -> None:
+        """Handle a thread creation in the current test.
+
+        Args:
+            thread_type: The type of thread being created.
+            test_nodeid: The pytest node ID of the test creating the thread.
+
+        """
+        self._require_active('handle thread creation')
+        self._do_on_thread_creation(thread_type, test_nodeid)
+
     def _do_on_thread_creation(self, thread_type: str, test_nodeid: str) -> None:
         """Emit a pytest warning for thread creation in small tests.
 
@@ -160,25 +250,31 @@ class ThreadPatchingMonitor(ThreadMonitorPort):
         This is safe to call regardless of current state.
 
         """
-        original_thread = object.__getattribute__(self, '_original_thread_class')
-        if original_thread is not None:
-            threading.Thread = original_thread  # type: ignore[misc]
-            object.__setattr__(self, '_original_thread_class', None)
+        self.uninstall()
 
-        original_executor = object.__getattribute__(self, '_original_thread_pool_executor')
-        if original_executor is not None:
-            concurrent.futures.ThreadPoolExecutor = original_executor  # type: ignore[misc]
-            object.__setattr__(self, '_original_thread_pool_executor', None)
+        super().reset()
 
-        original_process_executor = object.__getattribute__(self, '_original_process_pool_executor')
-        if original_process_executor is not None:
-            concurrent.futures.ProcessPoolExecutor = original_process_executor  # type: ignore[misc]
-            object.__setattr__(self, '_original_process_pool_executor', None)
+    def _get_wrapper_class(self, original_attr: str, factory: Callable[[], type]) -> type:
+        """Return the cached wrapper for the original class stored in original_attr.
 
-        super().reset()
-        self.current_test_size = None
-        self.current_enforcement_mode = None
-        self.current_test_nodeid = ''
+        Wrapper classes read the monitor's current state through their closure,
+        so one class per original class serves every activation.
+
+        Args:
+            original_attr: Name of the private attribute holding the original class.
+            factory: Builds the wrapper class when it is not cached yet.
+
+        Returns:
+            The wrapper subclass of the stored original class.
+
+        """
+        original = getattr(self, original_attr)
+        wrapper_classes: dict[type, type] = self._wrapper_classes
+        wrapper = wrapper_classes.get(original)
+        if wrapper is None:
+            wrapper = factory()
+            wrapper_classes[original] = wrapper
+        return wrapper
 
     def _create_patched_thread_class(self) -> type:
         """Create a Thread class that emits warnings on creation.
@@ -194,7 +290,7 @@ class ThreadPatchingMonitor(ThreadMonitorPort):
 
         """
         monitor = self
-        original_thread = object.__getattribute__(self, '_original_thread_class')
+        original_thread = self._original_thread_class
 
         class MonitoringThread(original_thread):  # type: ignore[valid-type,misc]
             """Thread wrapper that emits warnings for small tests."""
@@ -202,7 +298,7 @@ class ThreadPatchingMonitor(ThreadMonitorPort):
             def __init__(self, *args: object, **kwargs: object) -> None:
                 """Initialize thread and emit warning if monitoring small tests."""
                 if monitor.is_monitoring:
-                    monitor._do_on_thread_creation('threading.Thread', monitor.current_test_nodeid)  # noqa: SLF001
+                    monitor._do_on_thread_creation('threading.Thread', monitor.current_test_nodeid)
                 original_thread.__init__(self, *args, **kwargs)
 
         return MonitoringThread
@@ -215,7 +311,7 @@ class ThreadPatchingMonitor(ThreadMonitorPort):
 
         """
         monitor = self
-        original_executor = object.__getattribute__(self, '_original_thread_pool_executor')
+        original_executor = self._original_thread_pool_executor
 
         class MonitoringThreadPoolExecutor(original_executor):  # type: ignore[valid-type,misc]
             """ThreadPoolExecutor wrapper that emits warnings for small tests."""
@@ -223,9 +319,7 @@ class ThreadPatchingMonitor(ThreadMonitorPort):
             def __init__(self, *args: object, **kwargs: object) -> None:
                 """Initialize executor and emit warning if monitoring small tests."""
                 if monitor.is_monitoring:
-                    monitor._do_on_thread_creation(  # noqa: SLF001
-                        'concurrent.futures.ThreadPoolExecutor', monitor.current_test_nodeid
-                    )
+                    monitor._do_on_thread_creation('concurrent.futures.ThreadPoolExecutor', monitor.current_test_nodeid)
                 super().__init__(*args, **kwargs)
 
         return MonitoringThreadPoolExecutor
@@ -238,7 +332,7 @@ class ThreadPatchingMonitor(ThreadMonitorPort):
 
         """
         monitor = self
-        original_executor = object.__getattribute__(self, '_original_process_pool_executor')
+        original_executor = self._original_process_pool_executor
 
         class MonitoringProcessPoolExecutor(original_executor):  # type: ignore[valid-type,misc]
             """ProcessPoolExecutor wrapper that emits warnings for small tests."""
@@ -246,7 +340,7 @@ class ThreadPatchingMonitor(ThreadMonitorPort):
             def __init__(self, *args: object, **kwargs: object) -> None:
                 """Initialize executor and emit warning if monitoring small tests."""
                 if monitor.is_monitoring:
-                    monitor._do_on_thread_creation(  # noqa: SLF001
+                    monitor._do_on_thread_creation(
                         'concurrent.futures.ProcessPoolExecutor', monitor.current_test_nodeid
                     )
                 super().__init__(*args, **kwargs)
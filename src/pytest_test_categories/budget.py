@@ -0,0 +1,133 @@
+"""Time-budgeted test selection: run the most valuable tests that fit in N seconds.
+
+Pre-push hooks and pull request smoke jobs want "as much as fits in 120
+seconds" rather than the whole suite. With --test-categories-budget=SECONDS
+each collected test gets:
+
+- A cost: its expected duration from the duration history, or its size's
+  time limit when it has no history (or 1 second when it is unsized)
+- A value: higher for small tests, and multiplied for tests that failed in
+  the last run and for tests in files changed since the last budgeted run
+
+The selection is the greedy solution to the 0/1 knapsack problem: tests are
+taken in order of value per second, skipping any that no longer fit, so it
+stays O(n log n). The rest are deselected before any fixture runs.
+
+Example:
+    >>> select_within_budget([0.5, 30.0, 0.5, 2.0], [2.0, 1.0, 2.0, 20.0], budget=3.0)
+    [True, False, True, True]
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+)
+
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__ = [
+    'BUDGET_CACHE_KEY',
+    'BudgetSelection',
+    'budget_value',
+    'select_within_budget',
+]
+
+# Value of a test by size; small tests are fast, hermetic and the most likely to be worth running
+_SIZE_VALUES: dict[TestSize | None, float] = {
+    None: 1.0,
+    TestSize.SMALL: 2.0,
+    TestSize.MEDIUM: 1.0,
+    TestSize.LARGE: 0.5,
+    TestSize.XLARGE: 0.5,
+}
+
+# How many times more a test is worth when it failed last run or its file changed
+FAILED_VALUE_FACTOR = 10.0
+CHANGED_VALUE_FACTOR = 4.0
+
+# Floor on a test's cost, so tests recorded as taking no time do not divide by zero
+MIN_COST = 0.001
+
+# Cache key holding when the last budgeted session started, to find changed test files
+BUDGET_CACHE_KEY = 'test_categories/budget_last_run'
+
+
+class BudgetSelection(BaseModel):
+    """The outcome of selecting tests within a time budget.
+
+    Attributes:
+        budget: The time budget in seconds.
+        collected: How many tests were eligible for selection.
+        selected: How many tests were selected.
+        expected_duration: The selected tests' total expected duration in seconds.
+        recently_failed: How many selected tests failed in the last run.
+        recently_changed: How many selected tests are in files changed since the last budgeted run.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    budget: float = Field(gt=0.0)
+    collected: int = Field(ge=0)
+    selected: int = Field(ge=0)
+    expected_duration: float = Field(ge=0.0)
+    recently_failed: int = Field(default=0, ge=0)
+    recently_changed: int = Field(default=0, ge=0)
+
+    @property
+    def deselected(self) -> int:
+        """How many tests did not fit in the budget."""
+        return self.collected - self.selected
+
+
+def budget_value(size: TestSize | None, *, failed: bool = False, changed: bool = False) -> float:
+    """Get how valuable it is to run a test within a budget.
+
+    Args:
+        size: The test's size, or None for an unsized test.
+        failed: Whether the test failed in the last run.
+        changed: Whether the test's file changed since the last budgeted run.
+
+    Returns:
+        The test's value; only its ratio to other tests' values matters.
+
+    """
+    value = _SIZE_VALUES[size]
+    if failed:
+        value *= FAILED_VALUE_FACTOR
+    if changed:
+        value *= CHANGED_VALUE_FACTOR
+    return value
+
+
+def select_within_budget(costs: Sequence[float], values: Sequence[float], budget: float) -> list[bool]:
+    """Select the tests with the most value that fit in a time budget.
+
+    Args:
+        costs: Each test's expected duration in seconds.
+        values: Each test's value, from budget_value.
+        budget: The time budget in seconds.
+
+    Returns:
+        Whether each test is selected. Tests with the same value per second
+        are taken in collection order.
+
+    """
+    by_density = sorted(range(len(costs)), key=lambda position: -values[position] / max(costs[position], MIN_COST))
+    selected = [False] * len(costs)
+    remaining = budget
+    for position in by_density:
+        cost = costs[position]
+        if cost <= remaining:
+            selected[position] = True
+            remaining -= cost
+    return selected
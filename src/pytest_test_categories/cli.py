@@ -0,0 +1,414 @@
+"""The pytest-test-categories command.
+
+The command reads the project's pytest settings (python_files,
+python_classes, python_functions, norecursedirs, testpaths, cache_dir and
+the test_categories distribution targets) from pyproject.toml or pytest.ini
+in the nearest directory that has one.
+
+Subcommands:
+    index: Check the test size distribution from a static index of the test
+        files, without importing any test code (see static_index).
+    convert: Rebuild the --test-size-report=json report from a
+        --test-size-report=jsonl report (see jsonl_report).
+    report merge: Merge the json or jsonl reports of a sharded run into one
+        json report (see shard_reports).
+    report top: List the slowest tests of each size across the shards.
+    report validate: Check the merged distribution against the configured
+        targets, and list the tests over their time limit or baseline.
+
+Example:
+    $ pytest-test-categories index
+    $ pytest-test-categories index tests/unit --distribution-enforcement=warn
+    $ pytest-test-categories convert report.jsonl.gz --output report.json
+    $ pytest-test-categories report merge shards/*.json --output report.json
+    $ pytest-test-categories report top shards/*.json -n 20
+    $ pytest-test-categories report validate shards/*.json
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import configparser
+import sys
+import time
+import tomllib
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    TextIO,
+)
+
+import pytest
+
+from pytest_test_categories.adapters.stream import (
+    StreamWarningAdapter,
+    StreamWriterAdapter,
+)
+from pytest_test_categories.distribution.config import (
+    DEFAULT_DISTRIBUTION_CONFIG,
+    DistributionConfig,
+)
+from pytest_test_categories.distribution.stats import DistributionStats
+from pytest_test_categories.duration_history import HISTORY_CACHE_DIR
+from pytest_test_categories.formatting import pluralize_test
+from pytest_test_categories.jsonl_report import read_jsonl_report
+from pytest_test_categories.ports.network import EnforcementMode
+from pytest_test_categories.services.distribution_validation import (
+    DistributionValidationService,
+    DistributionViolationError,
+)
+from pytest_test_categories.services.test_reporting import TestReportingService
+from pytest_test_categories.shard_reports import ShardMerge
+from pytest_test_categories.static_index import (
+    INDEX_FILE_NAME,
+    CollectionRules,
+    StaticIndexCache,
+    build_index,
+    find_test_files,
+)
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__ = ['main']
+
+_INI_FILES = ('pyproject.toml', 'pytest.ini')
+
+
+def main(argv: Sequence[str] | None = None, stdout: TextIO | None = None, stderr: TextIO | None = None) -> int:
+    """Run the pytest-test-categories command.
+
+    Args:
+        argv: The command-line arguments, without the program name; defaults to sys.argv.
+        stdout: The stream for the report; defaults to sys.stdout.
+        stderr: The stream for warnings and errors; defaults to sys.stderr.
+
+    Returns:
+        The exit code: 0 on success, 1 if the distribution or time limit check failed,
+        4 for invalid arguments or configuration.
+
+    """
+    args = _build_parser().parse_args(argv)
+    out = stdout if stdout is not None else sys.stdout
+    err = stderr if stderr is not None else sys.stderr
+    try:
+        return int(args.handler(args, out, err))
+    except ValueError as e:
+        err.write(f'error: {e}\n')
+        return int(pytest.ExitCode.USAGE_ERROR)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the command and its subcommands."""
+    parser = argparse.ArgumentParser(prog='pytest-test-categories', description='Tools for pytest-test-categories.')
+    subcommands = parser.add_subparsers(title='commands', required=True)
+
+    index = subcommands.add_parser(
+        'index',
+        help='Check the test size distribution without importing test code.',
+        description='Index test sizes with ast and check the distribution against the configured targets.',
+    )
+    index.add_argument('paths', nargs='*', type=Path, help='Test files or directories (default: testpaths).')
+    index.add_argument(
+        '--distribution-enforcement',
+        choices=[mode.value for mode in EnforcementMode],
+        default=None,
+        help='How to treat a distribution outside the targets (default: the ini setting, or strict).',
+    )
+    index.add_argument(
+        '-j', '--jobs', type=int, default=None, help='Processes that parse changed files (default: one per CPU).'
+    )
+    index.add_argument('--no-cache', action='store_true', help='Parse every file instead of using the cached index.')
+    index.set_defaults(handler=_run_index)
+
+    convert = subcommands.add_parser(
+        'convert',
+        help='Convert a jsonl test size report to the json format.',
+        description='Rebuild the --test-size-report=json report from a --test-size-report=jsonl report.',
+    )
+    convert.add_argument('report', type=Path, help='The jsonl report; a name ending in .gz is read as gzip.')
+    convert.add_argument('-o', '--output', type=Path, default=None, help='File for the json report (default: stdout).')
+    convert.set_defaults(handler=_run_convert)
+
+    report = subcommands.add_parser(
+        'report',
+        help='Merge and analyze the test size reports of a sharded run.',
+        description='Merge the json or jsonl test size reports of a sharded run, one shard at a time.',
+    )
+    report_commands = report.add_subparsers(title='report commands', required=True)
+    shards = argparse.ArgumentParser(add_help=False)
+    shards.add_argument('shards', nargs='+', type=Path, help='The shard reports; a name ending in .gz is read as gzip.')
+
+    merge = report_commands.add_parser(
+        'merge',
+        parents=[shards],
+        help='Merge the shard reports into one json report.',
+        description='Merge the shard reports into one json report.',
+    )
+    merge.add_argument('-o', '--output', type=Path, default=None, help='File for the json report (default: stdout).')
+    merge.set_defaults(handler=_run_report_merge)
+
+    top = report_commands.add_parser(
+        'top',
+        parents=[shards],
+        help='List the slowest tests of each size.',
+        description='List the slowest tests of each size across the shards.',
+    )
+    top.add_argument('-n', '--count', type=int, default=10, help='Tests to list for each size (default: 10).')
+    top.set_defaults(handler=_run_report_top)
+
+    validate = report_commands.add_parser(
+        'validate',
+        parents=[shards],
+        help='Check the merged distribution and time limits.',
+        description=(
+            'Check the merged distribution against the configured targets, and fail if any test was over '
+            'its time limit or performance baseline.'
+        ),
+    )
+    validate.add_argument(
+        '--distribution-enforcement',
+        choices=[mode.value for mode in EnforcementMode],
+        default=None,
+        help='How to treat a distribution outside the targets (default: the ini setting, or strict).',
+    )
+    validate.set_defaults(handler=_run_report_validate)
+    return parser
+
+
+def _run_index(args: argparse.Namespace, out: TextIO, err: TextIO) -> int:
+    """Index the test files and check the distribution."""
+    started = time.perf_counter()
+    rootdir = _find_rootdir(Path.cwd())
+    ini = _load_ini(rootdir)
+    rules = _collection_rules(ini)
+    paths = [path.resolve() for path in args.paths] or [
+        (rootdir / path).resolve() for path in _ini_list(ini.get('testpaths')) or ('.',)
+    ]
+    cache = None
+    if not args.no_cache:
+        cache_root = rootdir / str(ini.get('cache_dir', '.pytest_cache'))
+        cache = StaticIndexCache(cache_root / 'd' / HISTORY_CACHE_DIR / INDEX_FILE_NAME)
+        _ensure_cache_root(cache_root)
+
+    index = build_index(find_test_files(paths, rules), rules, cache, args.jobs)
+    counts = index.counts()
+    stats = DistributionStats.update_counts({size: count for size, count in counts.items() if size is not None})
+
+    writer = StreamWriterAdapter(out)
+    TestReportingService().write_distribution_summary(stats, writer)
+    tests = sum(counts.values())
+    elapsed = time.perf_counter() - started
+    writer.write_line(
+        f'Indexed {tests} {pluralize_test(tests)} in {len(index.files)} files '
+        f'({index.parsed} parsed, {len(index.files) - index.parsed} cached) in {elapsed:.2f}s'
+    )
+    if counts[None]:
+        writer.write_line(f'{counts[None]} {pluralize_test(counts[None])} without a size marker')
+
+    warnings = StreamWarningAdapter(err)
+    for path, error in index.errors.items():
+        warnings.warn(f'{path} could not be parsed: {error}')
+    if index.approximate:
+        warnings.warn(
+            f'parametrize values in {len(index.approximate)} files are not literals; those tests were counted once'
+        )
+
+    mode = EnforcementMode(
+        args.distribution_enforcement or ini.get('test_categories_distribution_enforcement') or 'strict'
+    )
+    try:
+        DistributionValidationService().validate_distribution(stats, warnings, mode, _distribution_config(ini))
+    except DistributionViolationError as e:
+        err.write(f'{e}\n')
+        return int(pytest.ExitCode.TESTS_FAILED)
+    return int(pytest.ExitCode.OK)
+
+
+def _run_convert(args: argparse.Namespace, out: TextIO, err: TextIO) -> int:  # noqa: ARG001
+    """Convert a jsonl report to the json format."""
+    try:
+        report = read_jsonl_report(args.report)
+    except OSError as e:
+        msg = f'{args.report}: {e.strerror or e}'
+        raise ValueError(msg) from e
+    json_output = report.model_dump_json(indent=2)
+    if args.output is None:
+        out.write(json_output + '\n')
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json_output)
+    return int(pytest.ExitCode.OK)
+
+
+def _merge_shards(paths: Sequence[Path]) -> ShardMerge:
+    """Merge the shard reports, one at a time."""
+    merge = ShardMerge()
+    for path in paths:
+        merge.add_shard(path)
+    return merge
+
+
+def _run_report_merge(args: argparse.Namespace, out: TextIO, err: TextIO) -> int:  # noqa: ARG001
+    """Merge the shard reports into one json report."""
+    json_output = _merge_shards(args.shards).to_json_report().model_dump_json(indent=2)
+    if args.output is None:
+        out.write(json_output + '\n')
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json_output)
+    return int(pytest.ExitCode.OK)
+
+
+def _run_report_top(args: argparse.Namespace, out: TextIO, err: TextIO) -> int:  # noqa: ARG001
+    """List the slowest tests of each size."""
+    if args.count < 1:
+        msg = f'--count must be at least 1, got {args.count}'
+        raise ValueError(msg)
+    merge = _merge_shards(args.shards)
+    writer = StreamWriterAdapter(out)
+    writer.write_section('Slowest Tests by Size')
+    for size in (*TestSize, None):
+        slowest = merge.slowest(size, args.count)
+        if slowest:
+            writer.write_line(f'    {size.name.capitalize() if size is not None else "Unsized"}:')
+            for nodeid, duration in slowest:
+                writer.write_line(f'      {duration:8.2f}s  {nodeid}')
+    writer.write_separator('=')
+    return int(pytest.ExitCode.OK)
+
+
+def _run_report_validate(args: argparse.Namespace, out: TextIO, err: TextIO) -> int:
+    """Check the merged distribution and list the tests over their time limit or baseline."""
+    ini = _load_ini(_find_rootdir(Path.cwd()))
+    merge = _merge_shards(args.shards)
+    stats = merge.distribution_stats()
+
+    writer = StreamWriterAdapter(out)
+    TestReportingService().write_distribution_summary(stats, writer)
+    tests = merge.report.get_total_tests()
+    writer.write_line(f'Merged {tests} {pluralize_test(tests)} from {merge.shards} shard reports')
+    time_violations = 0
+    for violation, limit in (('timing', 'time limit'), ('baseline', 'performance baseline')):
+        nodeids = merge.time_violations(violation)
+        time_violations += len(nodeids)
+        if nodeids:
+            writer.write_line(f'Tests over their {limit}: {len(nodeids)}')
+            for nodeid in nodeids:
+                writer.write_line(f'    {nodeid}')
+
+    mode = EnforcementMode(
+        args.distribution_enforcement or ini.get('test_categories_distribution_enforcement') or 'strict'
+    )
+    try:
+        DistributionValidationService().validate_distribution(
+            stats, StreamWarningAdapter(err), mode, _distribution_config(ini)
+        )
+    except DistributionViolationError as e:
+        err.write(f'{e}\n')
+        return int(pytest.ExitCode.TESTS_FAILED)
+    if time_violations:
+        return int(pytest.ExitCode.TESTS_FAILED)
+    return int(pytest.ExitCode.OK)
+
+
+def _find_rootdir(start: Path) -> Path:
+    """Find the nearest directory with a pytest configuration file, or the start directory."""
+    for directory in (start, *start.parents):
+        if any((directory / name).is_file() for name in _INI_FILES):
+            return directory
+    return start
+
+
+def _load_ini(rootdir: Path) -> dict[str, object]:
+    """Read the pytest settings from pyproject.toml or pytest.ini.
+
+    Raises:
+        ValueError: If the configuration file cannot be parsed.
+
+    """
+    pyproject = rootdir / 'pyproject.toml'
+    if pyproject.is_file():
+        try:
+            data = tomllib.loads(pyproject.read_text(encoding='utf-8'))
+        except tomllib.TOMLDecodeError as e:
+            msg = f'{pyproject}: {e}'
+            raise ValueError(msg) from e
+        ini_options = data.get('tool', {}).get('pytest', {}).get('ini_options')
+        if isinstance(ini_options, dict):
+            return ini_options
+    pytest_ini = rootdir / 'pytest.ini'
+    if pytest_ini.is_file():
+        parser = configparser.ConfigParser()
+        try:
+            parser.read(pytest_ini, encoding='utf-8')
+        except configparser.Error as e:
+            msg = f'{pytest_ini}: {e}'
+            raise ValueError(msg) from e
+        if parser.has_section('pytest'):
+            return dict(parser.items('pytest'))
+    return {}
+
+
+def _ini_list(value: object) -> tuple[str, ...]:
+    """Read a list setting, written either as a TOML array or as whitespace-separated words."""
+    if isinstance(value, list):
+        return tuple(str(element) for element in value)
+    if isinstance(value, str):
+        return tuple(value.split())
+    return ()
+
+
+def _collection_rules(ini: dict[str, object]) -> CollectionRules:
+    """Get the collection rules from the pytest settings, with pytest's defaults."""
+    defaults = CollectionRules()
+    return CollectionRules(
+        python_files=_ini_list(ini.get('python_files')) or defaults.python_files,
+        python_classes=_ini_list(ini.get('python_classes')) or defaults.python_classes,
+        python_functions=_ini_list(ini.get('python_functions')) or defaults.python_functions,
+        norecursedirs=_ini_list(ini.get('norecursedirs')) or defaults.norecursedirs,
+    )
+
+
+def _distribution_config(ini: dict[str, object]) -> DistributionConfig:
+    """Get the distribution targets from the pytest settings, like the plugin's ini options.
+
+    Raises:
+        ValueError: If a target or the tolerance is not a number.
+
+    """
+    targets = DEFAULT_DISTRIBUTION_CONFIG.model_dump()
+    for category in ('small', 'medium', 'large'):
+        value = ini.get(f'test_categories_{category}_target')
+        if value is not None and str(value).strip():
+            targets[f'{category}_target'] = _ini_float(f'test_categories_{category}_target', value)
+    tolerance = ini.get('test_categories_tolerance')
+    if tolerance is not None and str(tolerance).strip():
+        tolerance_value = _ini_float('test_categories_tolerance', tolerance)
+        for category in ('small', 'medium', 'large'):
+            targets[f'{category}_tolerance'] = tolerance_value
+    return DistributionConfig(**targets)
+
+
+def _ini_float(name: str, value: object) -> float:
+    """Read a number setting.
+
+    Raises:
+        ValueError: If the setting is not a number.
+
+    """
+    try:
+        return float(str(value))
+    except ValueError:
+        msg = f'{name} must be a number, got {value!r}'
+        raise ValueError(msg) from None
+
+
+def _ensure_cache_root(cache_root: Path) -> None:
+    """Create the pytest cache directory, keeping it out of version control as pytest does."""
+    if cache_root.is_dir():
+        return
+    cache_root.mkdir(parents=True)
+    (cache_root / '.gitignore').write_text('# Created by pytest-test-categories automatically.\n*\n', encoding='utf-8')
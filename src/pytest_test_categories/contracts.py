@@ -0,0 +1,89 @@
+"""Debug switch for runtime contract and type checks.
+
+The ports in this package guard their state machines with icontract
+preconditions and postconditions. The production adapters that run on every
+test (WallTimer and the resource blockers) are slotted plain classes instead,
+so the per-test hot path pays neither pydantic attribute handling nor contract
+evaluation.
+
+Their state-machine and argument checks are still available for debugging:
+they run only while debug contracts are enabled, either through the
+``--test-categories-debug-contracts`` option or by setting the
+``PYTEST_TEST_CATEGORIES_DEBUG_CONTRACTS`` environment variable to a true value.
+A failed check raises the same ``icontract.ViolationError`` the ports raise.
+
+Example:
+    >>> enable_debug_contracts()
+    >>> require_state(TimerState.READY, TimerState.RUNNING, 'Timer must be in RUNNING state to stop')
+    Traceback (most recent call last):
+        ...
+    icontract.errors.ViolationError: Timer must be in RUNNING state to stop: state was ready
+
+"""
+
+from __future__ import annotations
+
+import os
+
+from icontract import ViolationError
+
+DEBUG_CONTRACTS_ENV_VAR = 'PYTEST_TEST_CATEGORIES_DEBUG_CONTRACTS'
+
+_TRUE_VALUES = frozenset({'1', 'true', 'yes', 'on'})
+
+_debug_contracts = os.environ.get(DEBUG_CONTRACTS_ENV_VAR, '').strip().lower() in _TRUE_VALUES
+
+
+def debug_contracts_enabled() -> bool:
+    """Return True if runtime contract and type checks are enabled."""
+    return _debug_contracts
+
+
+def enable_debug_contracts(*, enabled: bool = True) -> bool:
+    """Turn runtime contract and type checks on or off.
+
+    Args:
+        enabled: Whether the checks should run.
+
+    Returns:
+        The previous setting, so callers can restore it.
+
+    """
+    global _debug_contracts  # noqa: PLW0603
+    previous = _debug_contracts
+    _debug_contracts = enabled
+    return previous
+
+
+def require_state(actual: object, expected: object, description: str) -> None:
+    """Check a state-machine precondition the way the ports' icontract guards do.
+
+    Args:
+        actual: The current state of the object.
+        expected: The state the operation requires.
+        description: The contract description, matching the port's message.
+
+    Raises:
+        ViolationError: If actual is not the expected state.
+
+    """
+    if actual != expected:
+        msg = f'{description}: state was {actual}'
+        raise ViolationError(msg)
+
+
+def require_instance(value: object, expected_type: type, name: str) -> None:
+    """Check an argument type, standing in for pydantic field validation.
+
+    Args:
+        value: The value to check.
+        expected_type: The type the value must be an instance of.
+        name: The argument name used in the error message.
+
+    Raises:
+        TypeError: If value is not an instance of expected_type.
+
+    """
+    if not isinstance(value, expected_type):
+        msg = f'{name} must be {expected_type.__name__}, got {type(value).__name__}'
+        raise TypeError(msg)
@@ -0,0 +1,366 @@
+"""Persistent per-test duration history across sessions.
+
+Durations are otherwise forgotten when a session ends. With history enabled,
+the plugin keeps rolling statistics for every test in a sqlite database under
+.pytest_cache and uses them to:
+
+- flag tests whose duration regresses beyond a factor of their own history
+- optionally derive a per-test baseline, enforced like a marker's timeout=
+
+The per-test hot path only appends the duration to an in-memory list. The
+statistics are folded and written in a single transaction when the session
+finishes. With pytest-xdist each worker writes the rows of the tests it ran.
+
+The run count, average and percentiles are stored as columns and are all a
+session loads. Each test's recent durations are stored as an array('d')
+buffer, read only when the test's row is updated.
+
+Example:
+    >>> stats = DurationStats().updated((0.10, 0.12, 0.11, 0.10, 0.13), array('d'))
+    >>> stats.run_count
+    5
+    >>> is_regression(stats, 0.5, factor=2.0)
+    True
+    >>> is_regression(stats, 0.12, factor=2.0)
+    False
+
+"""
+
+from __future__ import annotations
+
+import math
+import sqlite3
+from array import array
+from contextlib import closing
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pytest_test_categories.timing import TIME_LIMITS
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Mapping,
+        Sequence,
+    )
+    from pathlib import Path
+
+__all__ = [
+    'DEFAULT_REGRESSION_FACTOR',
+    'EWMA_ALPHA',
+    'HISTORY_CACHE_DIR',
+    'HISTORY_FILE_NAME',
+    'HISTORY_WINDOW',
+    'MIN_HISTORY_RUNS',
+    'MIN_REGRESSION_SECONDS',
+    'DurationHistory',
+    'DurationRecorder',
+    'DurationRegressionWarning',
+    'DurationStats',
+    'derive_baseline',
+    'expected_duration',
+    'is_regression',
+]
+
+# Directory and file of the history database under .pytest_cache
+HISTORY_CACHE_DIR = 'test_categories'
+HISTORY_FILE_NAME = 'durations.sqlite3'
+
+# Weight of the newest duration in the exponentially weighted moving average
+EWMA_ALPHA = 0.2
+
+# Number of recent durations kept per test for the percentiles
+HISTORY_WINDOW = 100
+
+# Runs needed before a test's history is used to flag regressions or derive baselines
+MIN_HISTORY_RUNS = 5
+
+# Slowdowns smaller than this are timer noise, whatever the factor
+MIN_REGRESSION_SECONDS = 0.05
+
+# Default factor of a test's average duration that counts as a regression
+DEFAULT_REGRESSION_FACTOR = 2.0
+
+# Tests whose stored rows are read per query when their durations are folded in
+_READ_CHUNK = 500
+
+
+class DurationRegressionWarning(UserWarning):
+    """Warning category for a test that ran much slower than its history."""
+
+
+@dataclass(frozen=True, slots=True)
+class DurationStats:
+    """Rolling duration statistics for one test.
+
+    The percentiles are taken over the test's most recent durations (at most
+    HISTORY_WINDOW), which the history stores alongside the statistics.
+
+    Attributes:
+        run_count: Number of recorded runs.
+        ewma: Exponentially weighted moving average of the durations, in seconds.
+        p50: Median of the recent durations, or 0.0 with none.
+        p95: 95th percentile of the recent durations, or 0.0 with none.
+
+    """
+
+    run_count: int = 0
+    ewma: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+
+    def updated(self, durations: Iterable[float], samples: array[float]) -> DurationStats:
+        """Return the statistics with more runs folded in.
+
+        Args:
+            durations: The new runs' durations in seconds, oldest first.
+            samples: The test's recent durations, oldest first. The new
+                durations are appended to it and the oldest dropped beyond
+                HISTORY_WINDOW.
+
+        Returns:
+            The updated statistics.
+
+        """
+        run_count, ewma = self.run_count, self.ewma
+        for duration in durations:
+            ewma = duration if run_count == 0 else EWMA_ALPHA * duration + (1 - EWMA_ALPHA) * ewma
+            run_count += 1
+            samples.append(duration)
+        del samples[:-HISTORY_WINDOW]
+        return DurationStats(run_count, ewma, *_percentiles(samples))
+
+
+def _percentiles(samples: array[float]) -> tuple[float, float]:
+    """Nearest-rank p50 and p95 of the recent durations, or zeros with none."""
+    if not samples:
+        return 0.0, 0.0
+    ordered = sorted(samples)
+    count = len(ordered)
+    return ordered[max(1, math.ceil(count * 0.50)) - 1], ordered[max(1, math.ceil(count * 0.95)) - 1]
+
+
+def is_regression(stats: DurationStats | None, duration: float, factor: float) -> bool:
+    """Check whether a duration regresses beyond a factor of the test's history.
+
+    Args:
+        stats: The test's statistics before this run, if any.
+        duration: The run's duration in seconds.
+        factor: How many times the average duration counts as a regression.
+
+    Returns:
+        True if the test has enough history and ran more than factor times,
+        and at least MIN_REGRESSION_SECONDS, slower than its average.
+
+    """
+    if stats is None or stats.run_count < MIN_HISTORY_RUNS:
+        return False
+    return duration > factor * stats.ewma and duration - stats.ewma >= MIN_REGRESSION_SECONDS
+
+
+def derive_baseline(stats: DurationStats | None, factor: float, category_limit: float) -> float | None:
+    """Derive a per-test time baseline from the test's history.
+
+    The baseline is factor times the test's 95th percentile duration (but at
+    least MIN_REGRESSION_SECONDS above it), capped at its size's time limit.
+
+    Args:
+        stats: The test's statistics, if any.
+        factor: Multiplier applied to the 95th percentile.
+        category_limit: The time limit of the test's size.
+
+    Returns:
+        The baseline in seconds, or None if the test has too little history.
+
+    """
+    if stats is None or stats.run_count < MIN_HISTORY_RUNS:
+        return None
+    return min(category_limit, max(stats.p95 * factor, stats.p95 + MIN_REGRESSION_SECONDS))
+
+
+def expected_duration(stats: DurationStats | None, size: TestSize | None) -> float:
+    """Get how long a test is expected to take, for scheduling and sharding.
+
+    Args:
+        stats: The test's statistics, if any.
+        size: The test's size, or None for an unsized test.
+
+    Returns:
+        The test's average recorded duration, or its size's time limit
+        (the small limit for unsized tests) if it has no history.
+
+    Example:
+        >>> expected_duration(None, TestSize.LARGE)
+        900.0
+        >>> expected_duration(DurationStats(run_count=1, ewma=0.25, p50=0.25, p95=0.25), TestSize.LARGE)
+        0.25
+
+    """
+    if stats is not None and stats.run_count:
+        return stats.ewma
+    return TIME_LIMITS[size or TestSize.SMALL].limit
+
+
+class DurationHistory:
+    """Duration statistics stored in a sqlite database.
+
+    Args:
+        path: Path of the database file; created on first save.
+
+    """
+
+    __slots__ = ('path',)
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the store for a database file."""
+        self.path = path
+
+    def __repr__(self) -> str:
+        """Return a representation showing the database path."""
+        return f'DurationHistory(path={self.path!r})'
+
+    def load(self) -> dict[str, DurationStats]:
+        """Load the statistics of every recorded test, without their recent durations.
+
+        Returns:
+            Statistics by test node ID; empty if the database does not exist yet.
+
+        """
+        if not self.path.exists():
+            return {}
+        with closing(self._connect()) as connection:
+            rows = connection.execute('SELECT nodeid, run_count, ewma, p50, p95 FROM durations')
+            return {nodeid: DurationStats(run_count, ewma, p50, p95) for nodeid, run_count, ewma, p50, p95 in rows}
+
+    def update(self, durations: Mapping[str, Sequence[float]]) -> dict[str, DurationStats]:
+        """Fold new durations into the given tests' statistics in one transaction.
+
+        Only these tests' recent durations are read from the database.
+
+        Args:
+            durations: Each test's new durations in seconds, oldest first, by node ID.
+
+        Returns:
+            The updated statistics by test node ID.
+
+        """
+        if not durations:
+            return {}
+        updated: dict[str, DurationStats] = {}
+        rows: list[tuple[str, int, float, float, float, bytes]] = []
+        with closing(self._connect()) as connection, connection:
+            # Hold the write lock from the read on, so concurrent xdist workers do not lose each other's runs
+            connection.execute('BEGIN IMMEDIATE')
+            stored = _read_rows(connection, list(durations))
+            for nodeid, new in durations.items():
+                stats, samples = stored.get(nodeid, (DurationStats(), array('d')))
+                updated[nodeid] = stats = stats.updated(new, samples)
+                rows.append((nodeid, stats.run_count, stats.ewma, stats.p50, stats.p95, samples.tobytes()))
+            connection.executemany(
+                'INSERT OR REPLACE INTO durations (nodeid, run_count, ewma, p50, p95, samples) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                rows,
+            )
+        return updated
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the table if needed."""
+        # xdist workers save at the same time; wait for each other's transactions
+        connection = sqlite3.connect(self.path, timeout=30.0)
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS durations (nodeid TEXT PRIMARY KEY, run_count INTEGER NOT NULL, '
+            'ewma REAL NOT NULL, p50 REAL NOT NULL, p95 REAL NOT NULL, samples BLOB NOT NULL)'
+        )
+        if not _has_percentile_columns(connection):
+            _add_percentile_columns(connection)
+        return connection
+
+
+def _read_rows(connection: sqlite3.Connection, nodeids: list[str]) -> dict[str, tuple[DurationStats, array[float]]]:
+    """Read the stored statistics and recent durations of the given tests."""
+    stored: dict[str, tuple[DurationStats, array[float]]] = {}
+    for start in range(0, len(nodeids), _READ_CHUNK):
+        chunk = nodeids[start : start + _READ_CHUNK]
+        placeholders = ', '.join('?' * len(chunk))
+        rows = connection.execute(
+            f'SELECT nodeid, run_count, ewma, p50, p95, samples FROM durations WHERE nodeid IN ({placeholders})',  # noqa: S608
+            chunk,
+        )
+        for nodeid, run_count, ewma, p50, p95, samples in rows:
+            stored[nodeid] = (DurationStats(run_count, ewma, p50, p95), _unpack(samples))
+    return stored
+
+
+def _has_percentile_columns(connection: sqlite3.Connection) -> bool:
+    """Check whether the durations table stores the percentiles as columns."""
+    return 'p95' in {row[1] for row in connection.execute('PRAGMA table_info(durations)')}
+
+
+def _add_percentile_columns(connection: sqlite3.Connection) -> None:
+    """Add the percentile columns to a database written before they were stored, and fill them in."""
+    with connection:
+        connection.execute('BEGIN IMMEDIATE')
+        # Another process may have added them while this one waited for the lock
+        if _has_percentile_columns(connection):
+            return
+        connection.execute('ALTER TABLE durations ADD COLUMN p50 REAL NOT NULL DEFAULT 0.0')
+        connection.execute('ALTER TABLE durations ADD COLUMN p95 REAL NOT NULL DEFAULT 0.0')
+        rows = connection.execute('SELECT nodeid, samples FROM durations').fetchall()
+        connection.executemany(
+            'UPDATE durations SET p50 = ?, p95 = ? WHERE nodeid = ?',
+            [(*_percentiles(_unpack(samples)), nodeid) for nodeid, samples in rows],
+        )
+
+
+def _unpack(samples: bytes) -> array[float]:
+    """Unpack durations stored as an array('d') buffer."""
+    buffer = array('d')
+    buffer.frombytes(samples)
+    return buffer
+
+
+class DurationRecorder:
+    """Buffers the session's durations and folds them into the history.
+
+    Args:
+        history: The store the statistics were loaded from and are saved to.
+        stats: The statistics loaded at the start of the session.
+
+    """
+
+    __slots__ = ('_history', '_pending', 'stats')
+
+    def __init__(self, history: DurationHistory, stats: dict[str, DurationStats]) -> None:
+        """Initialize the recorder with the loaded statistics."""
+        self._history = history
+        self._pending: list[tuple[str, float]] = []
+        self.stats = stats
+
+    def __len__(self) -> int:
+        """Return the number of durations waiting to be written."""
+        return len(self._pending)
+
+    def __repr__(self) -> str:
+        """Return a representation showing the known and pending counts."""
+        return f'DurationRecorder(tests={len(self.stats)}, pending={len(self._pending)})'
+
+    def record(self, nodeid: str, duration: float) -> None:
+        """Buffer one test's duration.
+
+        Args:
+            nodeid: The test's node ID.
+            duration: The call-phase duration in seconds.
+
+        """
+        self._pending.append((nodeid, duration))
+
+    def flush(self) -> None:
+        """Fold the buffered durations into the history in one transaction, and update the statistics."""
+        if not self._pending:
+            return
+        durations: dict[str, list[float]] = {}
+        for nodeid, duration in self._pending:
+            durations.setdefault(nodeid, []).append(duration)
+        self._pending.clear()
+        self.stats.update(self._history.update(durations))
@@ -0,0 +1,141 @@
+"""Precomputed resource enforcement plans for each test size.
+
+The enforcement mode, engine and blocker instances do not change during a
+session, so the blockers a test needs depend only on its size profile. The
+plugin compiles one immutable EnforcementPlan per case at configure time, and
+pytest_runtest_call runs the plan for each test:
+
+- activate every step in order, passing the test's node ID
+- run the test
+- run the post-call checks (e.g. external systems detection)
+- deactivate every step in reverse order, in a single finally block
+
+Each step is an (activate, deactivate) pair of closures bound to a blocker and
+its activation arguments, so running a plan does no option lookups, blocker
+lookups or context manager bookkeeping.
+
+Example:
+    >>> small_plan = EnforcementPlan(steps=(blocker_step(sleep_blocker, TestSize.SMALL, EnforcementMode.STRICT),))
+    >>> plans = EnforcementPlans(small=small_plan)
+    >>> plans.for_profile(SizeProfile(size=TestSize.SMALL)) is small_plan
+    True
+    >>> plans.for_profile(SizeProfile(size=TestSize.LARGE)) is NO_ENFORCEMENT
+    True
+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pytest_test_categories.ports.network import BlockerState
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_test_categories.adapters.base import SlottedBlocker
+    from pytest_test_categories.adapters.external_systems import ExternalSystemsDetector
+    from pytest_test_categories.services.test_discovery import SizeProfile
+
+
+@dataclass(frozen=True)
+class EnforcementPlan:
+    """The ordered blocker activations for one kind of test.
+
+    Attributes:
+        steps: (activate, deactivate) pairs. Each activate takes the test's node ID;
+            steps are activated in order and deactivated in reverse.
+        post_call_checks: Checks run with the test's node ID after the test body,
+            while the blockers are still active.
+
+    """
+
+    steps: tuple[tuple[Callable[[str], None], Callable[[], None]], ...] = ()
+    post_call_checks: tuple[Callable[[str], None], ...] = ()
+
+
+# Plan for tests without restrictions (large, xlarge, unsized, or enforcement off)
+NO_ENFORCEMENT = EnforcementPlan()
+
+
+@dataclass(frozen=True)
+class EnforcementPlans:
+    """The enforcement plans compiled for a session.
+
+    Attributes:
+        small: Plan for small tests.
+        medium: Plan for medium tests.
+        medium_external_systems_allowed: Plan for medium tests marked allow_external_systems=True.
+
+    """
+
+    small: EnforcementPlan = NO_ENFORCEMENT
+    medium: EnforcementPlan = NO_ENFORCEMENT
+    medium_external_systems_allowed: EnforcementPlan = NO_ENFORCEMENT
+
+    def for_profile(self, profile: SizeProfile) -> EnforcementPlan:
+        """Select the plan for a test.
+
+        Args:
+            profile: The test's size profile.
+
+        Returns:
+            The plan to run, NO_ENFORCEMENT for large, xlarge and unsized tests.
+
+        """
+        test_size = profile.size
+        if test_size is TestSize.SMALL:
+            return self.small
+        if test_size is TestSize.MEDIUM:
+            return self.medium_external_systems_allowed if profile.allow_external_systems else self.medium
+        return NO_ENFORCEMENT
+
+
+# Plans for a session with enforcement off
+NO_ENFORCEMENT_PLANS = EnforcementPlans()
+
+
+def blocker_step(blocker: SlottedBlocker, *activation_args: object) -> tuple[Callable[[str], None], Callable[[], None]]:
+    """Build the (activate, deactivate) pair for a blocker.
+
+    Args:
+        blocker: The blocker to activate for each test.
+        *activation_args: Arguments for blocker.activate() (test size, enforcement mode, ...).
+
+    Returns:
+        A step that sets the test's node ID and activates the blocker, and
+        deactivates it only if it is still active.
+
+    """
+
+    def activate(nodeid: str) -> None:
+        blocker.current_test_nodeid = nodeid
+        blocker.activate(*activation_args)
+
+    def deactivate() -> None:
+        if blocker.state is BlockerState.ACTIVE:
+            blocker.deactivate()
+
+    return activate, deactivate
+
+
+def external_systems_check(detector: ExternalSystemsDetector) -> Callable[[str], None]:
+    """Build the post-call check reporting external systems imported by a medium test.
+
+    Args:
+        detector: The external systems detector activated by the plan.
+
+    Returns:
+        A check that reports any detected external systems for the test.
+
+    """
+
+    def check(nodeid: str) -> None:
+        if detector.is_active:
+            detected = detector.check_external_systems_detected()
+            if detected:
+                detector.on_external_systems_detected(detected, nodeid)
+
+    return check
@@ -0,0 +1,60 @@
+"""Feature sub-plugins registered by pytest_configure as the session needs them.
+
+Each sub-plugin carries the per-test hooks of one feature. A feature that is
+turned off is never registered, so its hooks add nothing to each test.
+
+- TimingPlugin: test timing and time limits (always registered)
+- EnforcementPlugin: resource blocking (--test-categories-enforcement warn/strict)
+- DurationHistoryPlugin: duration history and regression warnings (--test-categories-history)
+- ReportingPlugin: the test size report (--test-size-report)
+- JsonlReportPlugin: streaming the test size report as JSON Lines (--test-size-report=jsonl)
+- MetricsPlugin: the Prometheus textfile of the session (--test-categories-metrics-file)
+- TracePlugin: the Trace Event Format timeline of every test (--test-categories-trace)
+- SuggestionPlugin: auto-categorization suggestions (--test-categories-suggest)
+- TimeoutWatchdogPlugin: interrupting tests past their time limit (--test-categories-enforce-timeout)
+- TieredExecutionPlugin: tiered fail-fast execution (--test-categories-tiered)
+- ShardingPlugin: running one duration-balanced shard of the suite (--test-categories-shard)
+- TimeBudgetPlugin: time-budgeted test selection (--test-categories-budget)
+- SizePruningPlugin: running only some sizes, pruning other test files (--test-categories-sizes)
+- XdistAggregationPlugin: merging worker results (pytest-xdist sessions)
+- SpillPlugin: spilling worker results and recovering crashed workers' (pytest-xdist sessions)
+- CategorySchedulingPlugin: longest-expected-first xdist scheduling (--test-categories-schedule)
+"""
+
+from __future__ import annotations
+
+from pytest_test_categories.features.budget import TimeBudgetPlugin
+from pytest_test_categories.features.enforcement import EnforcementPlugin
+from pytest_test_categories.features.history import DurationHistoryPlugin
+from pytest_test_categories.features.jsonl_report import JsonlReportPlugin
+from pytest_test_categories.features.metrics import MetricsPlugin
+from pytest_test_categories.features.pruning import SizePruningPlugin
+from pytest_test_categories.features.reporting import ReportingPlugin
+from pytest_test_categories.features.scheduling import CategorySchedulingPlugin
+from pytest_test_categories.features.sharding import ShardingPlugin
+from pytest_test_categories.features.spill import SpillPlugin
+from pytest_test_categories.features.suggestion import SuggestionPlugin
+from pytest_test_categories.features.tiered import TieredExecutionPlugin
+from pytest_test_categories.features.timing import TimingPlugin
+from pytest_test_categories.features.trace import TracePlugin
+from pytest_test_categories.features.watchdog import TimeoutWatchdogPlugin
+from pytest_test_categories.features.xdist import XdistAggregationPlugin
+
+__all__ = [
+    'CategorySchedulingPlugin',
+    'DurationHistoryPlugin',
+    'EnforcementPlugin',
+    'JsonlReportPlugin',
+    'MetricsPlugin',
+    'ReportingPlugin',
+    'ShardingPlugin',
+    'SizePruningPlugin',
+    'SpillPlugin',
+    'SuggestionPlugin',
+    'TieredExecutionPlugin',
+    'TimeBudgetPlugin',
+    'TimeoutWatchdogPlugin',
+    'TimingPlugin',
+    'TracePlugin',
+    'XdistAggregationPlugin',
+]
@@ -0,0 +1,161 @@
+"""Time budget sub-plugin: keeps the most valuable tests that fit in the budget.
+
+pytest_configure registers this sub-plugin only when --test-categories-budget
+is set.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from pytest_test_categories.adapters.pytest_adapter import TerminalReporterAdapter
+from pytest_test_categories.budget import (
+    BUDGET_CACHE_KEY,
+    BudgetSelection,
+    budget_value,
+    select_within_budget,
+)
+from pytest_test_categories.duration_history import (
+    HISTORY_CACHE_DIR,
+    HISTORY_FILE_NAME,
+    DurationHistory,
+    expected_duration,
+)
+from pytest_test_categories.item_stash import (
+    ensure_discovery_service,
+    get_size_profile,
+)
+from pytest_test_categories.xdist_compat import (
+    WORKEROUTPUT_BUDGET_KEY,
+    is_xdist_worker,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from pytest_test_categories.duration_history import (
+        DurationRecorder,
+        DurationStats,
+    )
+    from pytest_test_categories.types import PluginState
+
+
+class TimeBudgetPlugin:
+    """Deselects the tests that do not fit in the time budget.
+
+    Recently failed tests come from the cache plugin's last-failed list, and
+    changed files are test files modified since the last budgeted session
+    started. With pytest-xdist every worker makes the same selection, and the
+    controller reports the first worker's.
+
+    Args:
+        session_state: The plugin state for the session.
+        budget: The time budget in seconds.
+
+    """
+
+    def __init__(self, session_state: PluginState, budget: float) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._session_state = session_state
+        self._budget = budget
+        self._started = time.time()
+
+    # trylast so the budget applies to the tests left after -k, -m and sharding
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config: pytest.Config, items: list[pytest.Item]) -> None:
+        """Deselect the tests that do not fit in the budget."""
+        discovery_service = ensure_discovery_service(self._session_state)
+        history = self._load_stats(config)
+        cache = getattr(config, 'cache', None)
+        last_failed: Mapping[str, object] = cache.get('cache/lastfailed', {}) if cache is not None else {}
+        last_run = cache.get(BUDGET_CACHE_KEY, None) if cache is not None else None
+        changed = _changed_since({item.path for item in items}, last_run)
+
+        costs: list[float] = []
+        values: list[float] = []
+        for item in items:
+            size = get_size_profile(item, discovery_service).size
+            costs.append(expected_duration(history.get(item.nodeid), size))
+            values.append(budget_value(size, failed=item.nodeid in last_failed, changed=item.path in changed))
+        selected = select_within_budget(costs, values, self._budget)
+
+        kept = [item for item, keep in zip(items, selected, strict=True) if keep]
+        self._session_state.budget_selection = BudgetSelection(
+            budget=self._budget,
+            collected=len(items),
+            selected=len(kept),
+            expected_duration=sum(cost for cost, keep in zip(costs, selected, strict=True) if keep),
+            recently_failed=sum(item.nodeid in last_failed for item in kept),
+            recently_changed=sum(item.path in changed for item in kept),
+        )
+        deselected = [item for item, keep in zip(items, selected, strict=True) if not keep]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = kept
+
+    @pytest.hookimpl
+    def pytest_terminal_summary(self, terminalreporter: pytest.TerminalReporter) -> None:
+        """Summarize the tests selected within the budget."""
+        selection = cast('BudgetSelection | None', self._session_state.budget_selection)
+        if selection is None:
+            return
+        writer = TerminalReporterAdapter(terminalreporter)
+        writer.write_section('Time Budget Summary', sep='=')
+        writer.write_line(
+            f'Selected {selection.selected} of {selection.collected} tests, expected to take '
+            f'{selection.expected_duration:.1f}s of the {selection.budget:g}s budget'
+        )
+        writer.write_line(f'  Recently failed: {selection.recently_failed}')
+        writer.write_line(f'  In changed files: {selection.recently_changed}')
+        writer.write_line(f'  Deselected: {selection.deselected}')
+        writer.write_separator(sep='=')
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Send the selection to the xdist controller, or record when this session started."""
+        if is_xdist_worker():
+            workeroutput = getattr(session.config, 'workeroutput', None)
+            selection = cast('BudgetSelection | None', self._session_state.budget_selection)
+            if workeroutput is not None and selection is not None:
+                workeroutput[WORKEROUTPUT_BUDGET_KEY] = selection.model_dump()
+            return
+        cache = getattr(session.config, 'cache', None)
+        if cache is not None:
+            cache.set(BUDGET_CACHE_KEY, self._started)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object) -> None:
+        """Take the selection from the first worker that finishes.
+
+        Every worker collects the same tests and makes the same selection.
+        """
+        data = getattr(node, 'workeroutput', {}).get(WORKEROUTPUT_BUDGET_KEY)
+        if data is not None and self._session_state.budget_selection is None:
+            self._session_state.budget_selection = BudgetSelection.model_validate(data)
+
+    def _load_stats(self, config: pytest.Config) -> Mapping[str, DurationStats]:
+        """Get the duration history, whether or not this session records it."""
+        if self._session_state.duration_recorder is not None:
+            return cast('DurationRecorder', self._session_state.duration_recorder).stats
+        cache = getattr(config, 'cache', None)
+        if cache is None:
+            return {}
+        return DurationHistory(cache.mkdir(HISTORY_CACHE_DIR) / HISTORY_FILE_NAME).load()
+
+
+def _changed_since(paths: set[Path], last_run: object) -> set[Path]:
+    """Find the test files modified after the last budgeted session started."""
+    if not isinstance(last_run, int | float):
+        return set()
+    changed: set[Path] = set()
+    for path in paths:
+        try:
+            if path.stat().st_mtime > last_run:
+                changed.add(path)
+        except OSError:
+            continue
+    return changed
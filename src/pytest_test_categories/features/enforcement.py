@@ -0,0 +1,94 @@
+"""Enforcement sub-plugin: blocks resources based on test size.
+
+pytest_configure registers this sub-plugin only when the enforcement mode is
+warn or strict, so sessions with enforcement off do not wrap pytest_runtest_call.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.item_stash import (
+    ensure_discovery_service,
+    get_size_profile,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from pytest_test_categories.enforcement_plan import EnforcementPlans
+    from pytest_test_categories.types import PluginState
+
+
+class EnforcementPlugin:
+    """Runs the precomputed enforcement plan around each test body.
+
+    Args:
+        plans: The enforcement plans compiled for the session.
+        session_state: The plugin state for the session.
+
+    """
+
+    def __init__(self, plans: EnforcementPlans, session_state: PluginState) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._plans = plans
+        self._session_state = session_state
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Generator[None, None, None]:
+        """Block resources based on test size during execution and monitor threading.
+
+        Network access (based on Google's test size definitions):
+        - Small tests: All network blocked (BLOCK_ALL)
+        - Medium tests: Localhost only (LOCALHOST_ONLY)
+        - Large/XLarge tests: Full network access (ALLOW_ALL)
+
+        Filesystem and process isolation (small tests only):
+        - Small tests: Filesystem access blocked (no escape hatches)
+        - Small tests: Subprocess spawning blocked
+        - Small tests: Database connections blocked
+        - Small tests: Thread creation warnings emitted
+
+        External systems detection (medium tests only):
+        - Medium tests: Warn if testcontainers/docker imported (unless suppressed)
+        - Suppressed via @pytest.mark.medium(allow_external_systems=True)
+
+        With --test-categories-engine=audit, network, filesystem, process, database
+        and sleep rules are enforced by a single audit hook instead of patching.
+
+        Note: Thread monitoring WARNS instead of blocking because many libraries
+        use threading internally. Blocking would break legitimate test infrastructure.
+
+        The blockers to activate for each kind of test are compiled once into
+        EnforcementPlans at configure time, so this hook only selects a plan
+        and runs its steps, deactivating every active blocker in a single
+        finally block even if the test raises.
+
+        Args:
+            item: The test item being executed.
+
+        Yields:
+            Control to pytest to run the test.
+
+        """
+        profile = get_size_profile(item, ensure_discovery_service(self._session_state))
+        plan = self._plans.for_profile(profile)
+
+        # Large, XLarge, and unsized tests have no restrictions
+        if not plan.steps:
+            yield
+            return
+
+        nodeid = item.nodeid
+        try:
+            for activate, _ in plan.steps:
+                activate(nodeid)
+            yield
+            for check in plan.post_call_checks:
+                check(nodeid)
+        finally:
+            # Deactivate in reverse order; steps that never activated are skipped
+            for _, deactivate in reversed(plan.steps):
+                deactivate()
@@ -0,0 +1,104 @@
+"""Duration history sub-plugin: records durations and flags regressions.
+
+pytest_configure registers this sub-plugin only when --test-categories-history
+(or --test-categories-derive-baselines) is set and the cache plugin is active.
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.duration_history import (
+    HISTORY_CACHE_DIR,
+    HISTORY_FILE_NAME,
+    DurationHistory,
+    DurationRecorder,
+    DurationRegressionWarning,
+    is_regression,
+)
+from pytest_test_categories.item_stash import get_call_duration
+from pytest_test_categories.xdist_compat import is_xdist_controller
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from pytest_test_categories.types import PluginState
+
+
+class DurationHistoryPlugin:
+    """Buffers each passing test's duration and writes the history at session end.
+
+    The history is loaded when the session starts, before collection, so
+    derived baselines can be applied to the collected tests. The xdist
+    controller neither runs nor collects tests, so it does not load it; its
+    workers record the durations. A test that ran
+    more than regression_factor times slower than its average is flagged with
+    a DurationRegressionWarning.
+
+    Args:
+        session_state: The plugin state for the session.
+        regression_factor: How many times its average duration counts as a regression.
+
+    """
+
+    def __init__(self, session_state: PluginState, regression_factor: float) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._session_state = session_state
+        self._regression_factor = regression_factor
+        self._recorder: DurationRecorder | None = None
+
+    @pytest.hookimpl
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        """Load the duration history from .pytest_cache."""
+        cache = session.config.cache
+        if cache is None or is_xdist_controller(session.config):
+            return
+        history = DurationHistory(cache.mkdir(HISTORY_CACHE_DIR) / HISTORY_FILE_NAME)
+        self._recorder = DurationRecorder(history, history.load())
+        self._session_state.duration_recorder = self._recorder
+
+    # tryfirst wraps the timing sub-plugin, so the outcome includes time limit failures
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, None, None]:
+        """Record the call-phase duration of a passing test.
+
+        Args:
+            item: The test item that ran.
+            call: The call information for the phase being reported.
+
+        Yields:
+            Control to pytest to generate the report.
+
+        """
+        outcome = yield
+        recorder = self._recorder
+        if call.when != 'call' or recorder is None:
+            return
+
+        report = outcome.get_result()  # type: ignore[attr-defined]
+        duration = get_call_duration(item, report)
+        if not report.passed or duration is None:
+            return
+
+        nodeid = item.nodeid
+        stats = recorder.stats.get(nodeid)
+        if stats is not None and is_regression(stats, duration, self._regression_factor):
+            # Attribute the warning to the test's definition rather than to pluggy
+            path, lineno, _ = item.location
+            warnings.warn_explicit(
+                f'{nodeid} took {duration:.2f}s, {duration / stats.ewma:.1f}x its average of '
+                f'{stats.ewma:.2f}s over {stats.run_count} runs',
+                DurationRegressionWarning,
+                filename=path,
+                lineno=(lineno or 0) + 1,
+            )
+        recorder.record(nodeid, duration)
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self) -> None:
+        """Write the session's durations to the history in one transaction."""
+        if self._recorder is not None:
+            self._recorder.flush()
@@ -0,0 +1,78 @@
+"""JSON Lines report sub-plugin: streams the test size report as tests finish.
+
+pytest_configure registers this sub-plugin, after the reporting sub-plugin,
+only when --test-size-report=jsonl is set, and never on xdist workers: the
+controller's report holds every worker's tests.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    cast,
+)
+
+import pytest
+
+from pytest_test_categories.adapters.pytest_adapter import PytestConfigAdapter
+from pytest_test_categories.jsonl_report import JsonlReportWriter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_test_categories.budget import BudgetSelection
+    from pytest_test_categories.reporting import TestSizeReport
+    from pytest_test_categories.violation_tracking import ViolationTracker
+
+
+class JsonlReportPlugin:
+    """Writes each test's record when it has torn down, and the summary when the session finishes.
+
+    The record is written from pytest_runtest_logreport rather than
+    pytest_runtest_makereport, so under xdist the controller writes it once
+    the test's reports have arrived from the worker that ran it.
+
+    Args:
+        config: The pytest configuration object.
+        test_report: The report being built for the session.
+        path: Path of the report file; a name ending in .gz is gzip-compressed.
+        plugin_version: The plugin version written in the summary record.
+
+    """
+
+    def __init__(self, config: pytest.Config, test_report: TestSizeReport, path: Path, plugin_version: str) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._config_adapter = PytestConfigAdapter(config)
+        self._test_report = test_report
+        self._path = path
+        self._plugin_version = plugin_version
+        self._writer: JsonlReportWriter | None = None
+
+    @pytest.hookimpl
+    def pytest_sessionstart(self) -> None:
+        """Open the report file."""
+        self._writer = JsonlReportWriter(self._path)
+
+    # trylast so the reporting and xdist aggregation sub-plugins have recorded the test
+    @pytest.hookimpl(trylast=True)
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Write the test's record once it has torn down, or its worker crashed while running it."""
+        if self._writer is not None and report.when in ('teardown', '???'):
+            self._writer.write_test(self._test_report, report.nodeid)
+
+    # trylast so crashed xdist workers' spilled results have been recovered
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self) -> None:
+        """Write the summary record and close the report file."""
+        if self._writer is None:
+            return
+        session_state = self._config_adapter.get_plugin_state()
+        self._writer.write_summary(
+            self._test_report,
+            self._config_adapter.get_distribution_stats(),
+            self._plugin_version,
+            violation_tracker=cast('ViolationTracker | None', session_state.violation_tracker),
+            budget_selection=cast('BudgetSelection | None', session_state.budget_selection),
+        )
+        self._writer.close()
+        self._writer = None
@@ -0,0 +1,113 @@
+"""Metrics sub-plugin: writes the session's Prometheus textfile.
+
+pytest_configure registers this sub-plugin only when
+--test-categories-metrics-file is set.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from pytest_test_categories.adapters.pytest_adapter import PytestConfigAdapter
+from pytest_test_categories.item_stash import (
+    ensure_discovery_service,
+    get_call_duration,
+    get_size_profile,
+)
+from pytest_test_categories.metrics import write_metrics_file
+from pytest_test_categories.violation_tracking import ViolationType
+from pytest_test_categories.xdist_compat import (
+    WORKEROUTPUT_METRICS_KEY,
+    is_xdist_worker_session,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from pytest_test_categories.metrics import SessionMetrics
+    from pytest_test_categories.violation_tracking import ViolationTracker
+
+
+class MetricsPlugin:
+    """Observes each test's call phase and writes the metrics file when the session finishes.
+
+    Each test's time in hooks outside its setup, call and teardown phases is
+    added to the 'runtest' overhead, and the core plugin adds its collection
+    work to the 'collection' overhead. Under pytest-xdist the workers observe
+    the tests they run and send their metrics to the controller, which writes
+    the file.
+
+    Args:
+        config: The pytest configuration object.
+        metrics: The metrics being accumulated for the session.
+        path: Path of the metrics file.
+
+    """
+
+    def __init__(self, config: pytest.Config, metrics: SessionMetrics, path: Path) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._config_adapter = PytestConfigAdapter(config)
+        self._session_state = self._config_adapter.get_plugin_state()
+        self._metrics = metrics
+        self._path = path
+        self._is_worker = is_xdist_worker_session(config)
+        # Seconds the running test spent in its setup, call and teardown phases
+        self._phase_seconds = 0.0
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_protocol(self) -> Generator[None, None, None]:
+        """Add the test's time outside its phases to the runtest overhead."""
+        self._phase_seconds = 0.0
+        started = time.perf_counter()
+        yield
+        self._metrics.add_overhead('runtest', time.perf_counter() - started - self._phase_seconds)
+
+    # tryfirst wraps the timing sub-plugin, so the outcome includes time limit failures
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, None, None]:
+        """Observe the call phase's size, outcome and duration.
+
+        Args:
+            item: The test item that ran.
+            call: The call information for the phase being reported.
+
+        Yields:
+            Control to pytest to generate the report.
+
+        """
+        outcome = yield
+        report = outcome.get_result()  # type: ignore[attr-defined]
+        self._phase_seconds += report.duration
+        if call.when != 'call':
+            return
+        duration = get_call_duration(item, report)
+        if duration is not None:
+            profile = get_size_profile(item, ensure_discovery_service(self._session_state))
+            self._metrics.observe(profile.size, report.outcome, duration, profile.timeout)
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Send the metrics to the xdist controller, or write the metrics file."""
+        if self._is_worker:
+            workeroutput = getattr(session.config, 'workeroutput', None)
+            if workeroutput is not None:
+                workeroutput[WORKEROUTPUT_METRICS_KEY] = self._metrics.to_dict()
+            return
+        violation_tracker = cast('ViolationTracker | None', self._session_state.violation_tracker)
+        hermeticity = (
+            {violation_type: violation_tracker.count_by_type(violation_type) for violation_type in ViolationType}
+            if violation_tracker is not None
+            else {}
+        )
+        write_metrics_file(self._path, self._metrics.render(self._config_adapter.get_distribution_stats(), hermeticity))
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object) -> None:
+        """Add a worker's metrics to the controller's when it shuts down."""
+        data = getattr(node, 'workeroutput', {}).get(WORKEROUTPUT_METRICS_KEY)
+        if isinstance(data, dict):
+            self._metrics.merge(data)
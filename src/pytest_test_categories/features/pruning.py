@@ -0,0 +1,202 @@
+"""Size pruning sub-plugin: runs only the requested sizes, skipping files that hold none.
+
+pytest_configure registers this sub-plugin only when --test-categories-sizes
+is set.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import (
+    TYPE_CHECKING,
+    cast,
+)
+
+import pytest
+
+from pytest_test_categories.adapters.pytest_adapter import (
+    PytestConfigAdapter,
+    TerminalReporterAdapter,
+)
+from pytest_test_categories.duration_history import HISTORY_CACHE_DIR
+from pytest_test_categories.item_stash import (
+    ensure_discovery_service,
+    get_size_profile,
+)
+from pytest_test_categories.pruning import (
+    IndexedFile,
+    PruningSummary,
+    SizeIndex,
+    is_excluded,
+)
+from pytest_test_categories.static_index import CollectionRules
+from pytest_test_categories.types import TestSize
+from pytest_test_categories.xdist_compat import (
+    WORKEROUTPUT_PRUNING_KEY,
+    is_xdist_worker,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from pytest_test_categories.types import PluginState
+
+
+class SizePruningPlugin:
+    """Deselects tests of other sizes and skips collecting files that only hold those.
+
+    Each test file is looked up in the SizeIndex before it is collected, and
+    every collected file's tests are recorded in it for the next session. The
+    index lives in .pytest_cache, so without the cache plugin the tests of
+    other sizes are still deselected but no file is pruned. Pruned files'
+    tests still count towards the test distribution, so distribution checks
+    agree with a full run.
+
+    Args:
+        session_state: The plugin state for the session.
+        sizes: The sizes that run.
+
+    """
+
+    def __init__(self, session_state: PluginState, sizes: frozenset[TestSize]) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._session_state = session_state
+        self._sizes = sizes
+        self._index: SizeIndex | None = None
+        self._pruned: dict[Path, IndexedFile] = {}
+        self._collect_seconds: dict[Path, float] = {}
+        self._collected: list[pytest.Item] = []
+        self._deselected = 0
+
+    @pytest.hookimpl
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        """Load the size index from .pytest_cache."""
+        cache = getattr(session.config, 'cache', None)
+        if cache is None:
+            return
+        config = session.config
+        rules = CollectionRules(
+            python_files=tuple(config.getini('python_files')),
+            python_classes=tuple(config.getini('python_classes')),
+            python_functions=tuple(config.getini('python_functions')),
+        )
+        self._index = SizeIndex(cache.mkdir(HISTORY_CACHE_DIR), rules)
+
+    @pytest.hookimpl
+    def pytest_ignore_collect(self, collection_path: Path) -> bool | None:
+        """Skip a test file when its index proves it holds no tests of the requested sizes."""
+        if self._index is None or not self._index.is_test_file(collection_path):
+            return None
+        found = self._index.lookup(collection_path)
+        if found is None or not is_excluded(found, self._sizes):
+            return None
+        self._pruned[collection_path] = found
+        return True
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_make_collect_report(self, collector: pytest.Collector) -> Generator[None, None, None]:
+        """Time collecting each test module, which includes importing it."""
+        if not isinstance(collector, pytest.Module):
+            yield
+            return
+        started = time.perf_counter()
+        yield
+        self._collect_seconds[collector.path] = time.perf_counter() - started
+
+    @pytest.hookimpl
+    def pytest_itemcollected(self, item: pytest.Item) -> None:
+        """Keep every collected test, to record its size once collection is done."""
+        self._collected.append(item)
+
+    # A plain hookimpl deselects alongside -m, before sharding and the time budget
+    @pytest.hookimpl
+    def pytest_collection_modifyitems(self, config: pytest.Config, items: list[pytest.Item]) -> None:
+        """Deselect the collected tests of other sizes."""
+        discovery_service = ensure_discovery_service(self._session_state)
+        selected = [get_size_profile(item, discovery_service).size in self._sizes for item in items]
+        deselected = [item for item, keep in zip(items, selected, strict=True) if not keep]
+        self._deselected = len(deselected)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item, keep in zip(items, selected, strict=True) if keep]
+
+    # tryfirst so the pruned tests are counted before the distribution is validated
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_finish(self, session: pytest.Session) -> None:
+        """Record the size of every collected test, and count the pruned files' tests.
+
+        The sizes are recorded for all collected tests, including those that
+        -k, -m or sharding deselected.
+        """
+        if self._index is not None:
+            discovery_service = ensure_discovery_service(self._session_state)
+            counts: dict[Path, Counter[TestSize | None]] = {path: Counter() for path in self._collect_seconds}
+            for item in self._collected:
+                if item.path in counts:
+                    counts[item.path][get_size_profile(item, discovery_service).size] += 1
+            for path, file_counts in counts.items():
+                self._index.record(path, file_counts, self._collect_seconds[path])
+        self._collected.clear()
+
+        self._add_pruned_counts(session.config)
+        self._session_state.pruning_summary = PruningSummary(
+            sizes=tuple(size.marker_name for size in TestSize if size in self._sizes),
+            files=len(self._collect_seconds) + len(self._pruned),
+            pruned_files=len(self._pruned),
+            pruned_tests=sum(sum(found.index.counts.values()) for found in self._pruned.values()),
+            time_saved=sum(found.collect_seconds or 0.0 for found in self._pruned.values()),
+            deselected=self._deselected,
+        )
+
+    @pytest.hookimpl
+    def pytest_terminal_summary(self, terminalreporter: pytest.TerminalReporter) -> None:
+        """Summarize the pruned test files."""
+        summary = cast('PruningSummary | None', self._session_state.pruning_summary)
+        if summary is None:
+            return
+        writer = TerminalReporterAdapter(terminalreporter)
+        writer.write_section('Size Pruning Summary', sep='=')
+        writer.write_line(
+            f'Pruned {summary.pruned_files} of {summary.files} test files without importing them, '
+            f'running only {", ".join(summary.sizes)} tests'
+        )
+        writer.write_line(f'  Tests in pruned files: {summary.pruned_tests}')
+        writer.write_line(f'  Collection time saved: about {summary.time_saved:.1f}s')
+        writer.write_line(f'  Deselected in collected files: {summary.deselected}')
+        writer.write_separator(sep='=')
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Write the size index, and send the summary to the xdist controller."""
+        if self._index is not None:
+            self._index.save()
+        if is_xdist_worker():
+            workeroutput = getattr(session.config, 'workeroutput', None)
+            summary = cast('PruningSummary | None', self._session_state.pruning_summary)
+            if workeroutput is not None and summary is not None:
+                workeroutput[WORKEROUTPUT_PRUNING_KEY] = summary.model_dump()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object) -> None:
+        """Take the summary from the first worker that finishes.
+
+        Every worker collects the same tests and prunes the same files.
+        """
+        data = getattr(node, 'workeroutput', {}).get(WORKEROUTPUT_PRUNING_KEY)
+        if data is not None and self._session_state.pruning_summary is None:
+            self._session_state.pruning_summary = PruningSummary.model_validate(data)
+
+    def _add_pruned_counts(self, config: pytest.Config) -> None:
+        """Add the pruned files' tests to the test distribution counted from the collected tests."""
+        if not self._pruned:
+            return
+        pruned: Counter[TestSize | None] = Counter()
+        for found in self._pruned.values():
+            pruned.update(found.index.counts)
+        config_adapter = PytestConfigAdapter(config)
+        stats = config_adapter.get_distribution_stats()
+        config_adapter.set_distribution_stats(
+            stats.update_counts({size: getattr(stats.counts, size.marker_name) + pruned[size] for size in TestSize})
+        )
@@ -0,0 +1,95 @@
+"""Reporting sub-plugin: records each test in the test size report.
+
+pytest_configure registers this sub-plugin only when --test-size-report is set.
+The report itself is written by the core plugin's pytest_terminal_summary.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.item_stash import (
+    ensure_discovery_service,
+    get_call_duration,
+    get_size_profile,
+)
+from pytest_test_categories.services.test_reporting import TestReportingService
+from pytest_test_categories.xdist_compat import (
+    REPORT_DATA_ATTR,
+    serialize_test_result,
+    serialize_test_size,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from pytest_test_categories.reporting import TestSizeReport
+    from pytest_test_categories.types import PluginState
+
+
+class ReportingPlugin:
+    """Adds each test to the report and records its outcome and duration.
+
+    On an xdist worker the report is built by the controller instead: the
+    size is attached to each test's setup report and the outcome and duration
+    to its call report (see XdistAggregationPlugin).
+
+    Args:
+        test_report: The report being built for the session.
+        session_state: The plugin state for the session.
+        is_worker: Whether the session runs on an xdist worker (see is_xdist_worker_session).
+
+    """
+
+    def __init__(self, test_report: TestSizeReport, session_state: PluginState, *, is_worker: bool = False) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._test_report = test_report
+        self._session_state = session_state
+        self._reporting_service = TestReportingService()
+        self._is_worker = is_worker
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item: pytest.Item) -> None:
+        """Add the test to the report before it runs."""
+        if self._is_worker:
+            return
+        test_size = get_size_profile(item, ensure_discovery_service(self._session_state)).size
+        self._reporting_service.add_test_to_report(self._test_report, item.nodeid, test_size)
+
+    # tryfirst wraps the timing sub-plugin, so the outcome includes time limit failures
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, None, None]:
+        """Record the call-phase outcome and duration in the report.
+
+        Args:
+            item: The test item that ran.
+            call: The call information for the phase being reported.
+
+        Yields:
+            Control to pytest to generate the report.
+
+        """
+        outcome = yield
+        if self._is_worker:
+            self._attach_to_report(item, call, outcome.get_result())  # type: ignore[attr-defined]
+            return
+        if call.when != 'call':
+            return
+
+        report = outcome.get_result()  # type: ignore[attr-defined]
+        self._reporting_service.update_test_result(
+            self._test_report,
+            item.nodeid,
+            report.outcome,
+            get_call_duration(item, report),
+        )
+
+    def _attach_to_report(self, item: pytest.Item, call: pytest.CallInfo[None], report: pytest.TestReport) -> None:
+        """Attach the test's size to its setup report, and its result to its call report."""
+        if call.when == 'setup':
+            test_size = get_size_profile(item, ensure_discovery_service(self._session_state)).size
+            setattr(report, REPORT_DATA_ATTR, serialize_test_size(test_size))
+        elif call.when == 'call':
+            setattr(report, REPORT_DATA_ATTR, serialize_test_result(report.outcome, get_call_duration(item, report)))
@@ -0,0 +1,78 @@
+"""Scheduling sub-plugin: dispatches xdist tests longest-expected-first.
+
+pytest_configure registers this sub-plugin only on the xdist controller when
+--test-categories-schedule is set.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from pytest_test_categories.duration_history import (
+    HISTORY_CACHE_DIR,
+    HISTORY_FILE_NAME,
+    DurationHistory,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pytest_test_categories.duration_history import (
+        DurationRecorder,
+        DurationStats,
+    )
+    from pytest_test_categories.types import PluginState
+
+# xdist modes that CategoryScheduling replaces; the others group tests in ways it must not break
+SCHEDULED_DIST_MODES = frozenset({'load'})
+
+
+class CategorySchedulingPlugin:
+    """Provides the size-aware scheduler when xdist asks for one.
+
+    Args:
+        session_state: The plugin state for the session.
+        tiered: Whether the tests run one size tier at a time.
+
+    """
+
+    def __init__(self, session_state: PluginState, *, tiered: bool = False) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._session_state = session_state
+        self._tiered = tiered
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config: pytest.Config, log: object) -> object | None:
+        """Create the size-aware scheduler in place of xdist's load scheduling.
+
+        Args:
+            config: The pytest configuration object.
+            log: The xdist log producer.
+
+        Returns:
+            The scheduler, or None to leave an explicit --dist mode to xdist.
+
+        """
+        if config.getvalue('dist') not in SCHEDULED_DIST_MODES:
+            return None
+
+        # Imported here because it imports pytest-xdist
+        from pytest_test_categories.xdist_scheduler import CategoryScheduling  # noqa: PLC0415
+
+        return CategoryScheduling(
+            config,
+            log,  # type: ignore[arg-type]
+            self._load_stats(config),
+            tiered=self._tiered,
+        )
+
+    def _load_stats(self, config: pytest.Config) -> Mapping[str, DurationStats]:
+        """Get the duration history, whether or not this session records it."""
+        if self._session_state.duration_recorder is not None:
+            return cast('DurationRecorder', self._session_state.duration_recorder).stats
+        cache = getattr(config, 'cache', None)
+        if cache is None:
+            return {}
+        return DurationHistory(cache.mkdir(HISTORY_CACHE_DIR) / HISTORY_FILE_NAME).load()
@@ -0,0 +1,75 @@
+"""Sharding sub-plugin: runs one duration-balanced shard of the selected tests.
+
+pytest_configure registers this sub-plugin only when --test-categories-shard
+is set.
+
+Every shard must compute the same assignment, so it is balanced only on data
+all machines share: the collected node IDs, their sizes, and the history file
+given with --test-categories-shard-history. The local .pytest_cache history
+differs between CI machines and is never used.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.duration_history import (
+    DurationHistory,
+    expected_duration,
+)
+from pytest_test_categories.item_stash import (
+    ensure_discovery_service,
+    get_size_profile,
+)
+from pytest_test_categories.sharding import assign_shards
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_test_categories.types import PluginState
+
+
+class ShardingPlugin:
+    """Deselects the tests assigned to other shards.
+
+    The distribution counts are taken over the whole suite before this runs,
+    so distribution checks agree across shards, but the shards balance only
+    the tests that are left to run.
+
+    Args:
+        session_state: The plugin state for the session.
+        shard: The 0-based index of this shard and the shard count.
+        history_path: The duration history database shared by every shard, or
+            None to expect each test to take its size's time limit.
+
+    """
+
+    def __init__(
+        self,
+        session_state: PluginState,
+        shard: tuple[int, int],
+        history_path: Path | None = None,
+    ) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._session_state = session_state
+        self._shard = shard
+        self._history_path = history_path
+
+    # trylast so the shards split the tests left after -k, -m and --test-categories-sizes
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config: pytest.Config, items: list[pytest.Item]) -> None:
+        """Deselect the tests assigned to other shards."""
+        discovery_service = ensure_discovery_service(self._session_state)
+        history = DurationHistory(self._history_path).load() if self._history_path is not None else {}
+        sizes = [get_size_profile(item, discovery_service).size for item in items]
+        expected = [expected_duration(history.get(item.nodeid), size) for item, size in zip(items, sizes, strict=True)]
+        index, count = self._shard
+        assignment = assign_shards([item.nodeid for item in items], sizes, expected, count)
+
+        selected = [item for item, assigned in zip(items, assignment, strict=True) if assigned == index]
+        deselected = [item for item, assigned in zip(items, assignment, strict=True) if assigned != index]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
@@ -0,0 +1,187 @@
+"""Spill sub-plugin: backs up xdist worker results in spill files and recovers them.
+
+pytest_configure registers this sub-plugin on xdist workers and in sessions
+where pytest-xdist is loaded, alongside the xdist aggregation sub-plugin.
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from pytest_test_categories.adapters.pytest_adapter import (
+    PytestConfigAdapter,
+    TerminalReporterAdapter,
+)
+from pytest_test_categories.distribution.stats import (
+    DistributionStats,
+    TestCounts,
+)
+from pytest_test_categories.spill import (
+    SPILL_DIR_NAME,
+    SpillWriter,
+    merge_spill,
+    read_spill,
+    spill_path,
+)
+from pytest_test_categories.violation_tracking import ViolationType
+from pytest_test_categories.xdist_compat import (
+    WORKERINPUT_SPILL_DIR_KEY,
+    WORKEROUTPUT_DISTRIBUTION_KEY,
+    is_xdist_controller,
+    is_xdist_worker_session,
+    serialize_distribution_counts,
+)
+
+if TYPE_CHECKING:
+    from pytest_test_categories.suggestion import SuggestionCollector
+    from pytest_test_categories.types import PluginState
+    from pytest_test_categories.violation_tracking import ViolationTracker
+
+
+class SpillPlugin:
+    """Spills each worker's results as it goes, so the controller can recover a crashed worker's.
+
+    Workers append their distribution counts once collected, then a record
+    for each test with violations or, in suggest mode, for every test. The
+    controller merges a worker's spill file only if the worker went down
+    without sending its output.
+
+    Args:
+        config: The pytest configuration object.
+        flush_interval: Seconds a worker buffers records for before writing them out.
+
+    """
+
+    def __init__(self, config: pytest.Config, flush_interval: float) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._config_adapter = PytestConfigAdapter(config)
+        self._session_state: PluginState = self._config_adapter.get_plugin_state()
+        self._flush_interval = flush_interval
+        self._writer: SpillWriter | None = None
+        self._spilled_violations = dict.fromkeys(ViolationType, 0)
+        self._spill_dir: Path | None = None
+        self._owns_spill_dir = False
+        self._recovered: dict[str, int] = {}
+
+    @pytest.hookimpl
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        """Open the worker's spill file, or create the controller's spill directory."""
+        config = session.config
+        if is_xdist_worker_session(config):
+            workerinput = cast('dict[str, object]', config.workerinput)  # type: ignore[attr-defined]
+            directory = workerinput.get(WORKERINPUT_SPILL_DIR_KEY)
+            if isinstance(directory, str):
+                self._writer = SpillWriter(
+                    spill_path(Path(directory), str(workerinput['workerid'])), self._flush_interval
+                )
+        elif is_xdist_controller(config):
+            tmp_path_factory = getattr(config, '_tmp_path_factory', None)
+            if tmp_path_factory is not None:
+                self._spill_dir = tmp_path_factory.getbasetemp() / SPILL_DIR_NAME
+                self._spill_dir.mkdir(exist_ok=True)
+            else:
+                self._spill_dir = Path(tempfile.mkdtemp(prefix='pytest-test-categories-'))
+                self._owns_spill_dir = True
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node: object) -> None:
+        """Tell a worker the controller is starting where to spill."""
+        if self._spill_dir is not None:
+            node.workerinput[WORKERINPUT_SPILL_DIR_KEY] = str(self._spill_dir)  # type: ignore[attr-defined]
+
+    @pytest.hookimpl
+    def pytest_collection_finish(self) -> None:
+        """Spill the worker's distribution counts as soon as it has collected."""
+        if self._writer is None:
+            return
+        stats = self._config_adapter.get_distribution_stats()
+        self._writer.append({'counts': serialize_distribution_counts(stats.counts)})
+        self._writer.flush()
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Buffer a record of the test once it has torn down, if it has anything to recover."""
+        if self._writer is None or report.when != 'teardown':
+            return
+        record = self._test_record(report.nodeid)
+        if record:
+            record['test'] = report.nodeid
+            self._writer.append(record)
+
+    def _test_record(self, nodeid: str) -> dict[str, object]:
+        """Get the violations recorded since the last test, and the test's suggestion observations."""
+        record: dict[str, object] = {}
+        tracker = cast('ViolationTracker', self._session_state.violation_tracker)
+        if tracker.total_violations > sum(self._spilled_violations.values()):
+            violations = []
+            for violation_type, spilled in self._spilled_violations.items():
+                new = tracker.get_violations_by_type(violation_type, start=spilled)
+                violations.extend(
+                    [violation.violation_type.value, violation.details, violation.failed] for violation in new
+                )
+                self._spilled_violations[violation_type] = spilled + len(new)
+            record['violations'] = violations
+
+        collector = cast('SuggestionCollector | None', self._session_state.suggestion_collector)
+        if collector is not None:
+            size = collector.get_current_size(nodeid)
+            record['size'] = size.value if size is not None else None
+            record['duration'] = collector.get_execution_time(nodeid)
+            observations = collector.get_observations(nodeid)
+            if observations:
+                record['observations'] = [[found.resource_type.value, found.details] for found in observations]
+        return record
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self) -> None:
+        """Write out the worker's last records, or remove a spill directory the controller made."""
+        if self._writer is not None:
+            self._writer.close()
+        if self._owns_spill_dir and self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object) -> None:
+        """Recover the spilled results of a worker that went down without sending its output."""
+        if self._spill_dir is None:
+            return
+        worker_id = getattr(node, 'workerinput', {}).get('workerid')
+        if worker_id is None:
+            return
+        path = spill_path(self._spill_dir, worker_id)
+        if WORKEROUTPUT_DISTRIBUTION_KEY not in getattr(node, 'workeroutput', {}):
+            self._recover(worker_id, path)
+        path.unlink(missing_ok=True)
+
+    def _recover(self, worker_id: str, path: Path) -> None:
+        """Merge a crashed worker's spill file into the controller's state."""
+        recovery = merge_spill(
+            read_spill(path),
+            cast('ViolationTracker | None', self._session_state.violation_tracker),
+            cast('SuggestionCollector | None', self._session_state.suggestion_collector),
+        )
+        # Every worker collects the whole suite, so only take the counts if no worker sent any
+        stats = self._config_adapter.get_distribution_stats()
+        if recovery.counts is not None and stats.counts == TestCounts():
+            self._config_adapter.set_distribution_stats(DistributionStats(counts=TestCounts(**recovery.counts)))
+        self._recovered[worker_id] = recovery.tests
+
+    # trylast puts the section after the summaries that include the recovered results
+    @pytest.hookimpl(trylast=True)
+    def pytest_terminal_summary(self, terminalreporter: pytest.TerminalReporter) -> None:
+        """Report which crashed workers' results were recovered."""
+        if not self._recovered:
+            return
+        writer = TerminalReporterAdapter(terminalreporter)
+        writer.write_section('xdist Worker Recovery', sep='=')
+        for worker_id, tests in sorted(self._recovered.items()):
+            record_word = 'record' if tests == 1 else 'records'
+            writer.write_line(
+                f'{worker_id} went down before sending its results; recovered {tests} spilled test {record_word}'
+            )
+        writer.write_separator(sep='=')
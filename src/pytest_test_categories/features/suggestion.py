@@ -0,0 +1,53 @@
+"""Suggestion sub-plugin: records execution times for auto-categorization.
+
+pytest_configure registers this sub-plugin only when --test-categories-suggest
+is set. Current sizes are recorded at collection and the suggestions are written
+by the core plugin's pytest_terminal_summary.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.item_stash import get_call_duration
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from pytest_test_categories.suggestion import SuggestionCollector
+
+
+class SuggestionPlugin:
+    """Records each test's call-phase duration in the suggestion collector.
+
+    Args:
+        suggestion_collector: The collector gathering observations for the session.
+
+    """
+
+    def __init__(self, suggestion_collector: SuggestionCollector) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._suggestion_collector = suggestion_collector
+
+    # tryfirst wraps the timing sub-plugin, which stores the call duration
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, None, None]:
+        """Record the call-phase duration for the test.
+
+        Args:
+            item: The test item that ran.
+            call: The call information for the phase being reported.
+
+        Yields:
+            Control to pytest to generate the report.
+
+        """
+        outcome = yield
+        if call.when != 'call':
+            return
+
+        duration = get_call_duration(item, outcome.get_result())  # type: ignore[attr-defined]
+        if duration is not None:
+            self._suggestion_collector.record_execution_time(item.nodeid, duration)
@@ -0,0 +1,143 @@
+"""Tiered execution sub-plugin: runs the cheapest tier first and stops at a failing one.
+
+pytest_configure registers this sub-plugin only when --test-categories-tiered
+is set.
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from pytest_test_categories.adapters.pytest_adapter import TerminalReporterAdapter
+from pytest_test_categories.duration_history import expected_duration
+from pytest_test_categories.item_stash import (
+    ensure_discovery_service,
+    get_size_profile,
+)
+from pytest_test_categories.tiers import (
+    TIERED_SKIP_REASON,
+    TierBarrier,
+    tier_name,
+    tier_of,
+    tiered_order,
+)
+from pytest_test_categories.xdist_compat import (
+    WORKERINPUT_TIER_BARRIER_KEY,
+    is_xdist_controller,
+    is_xdist_worker,
+    size_from_nodeid,
+)
+
+if TYPE_CHECKING:
+    from pytest_test_categories.duration_history import DurationRecorder
+    from pytest_test_categories.types import PluginState
+
+
+class TieredExecutionPlugin:
+    """Orders the tests by tier and skips the tiers after the first failing one.
+
+    Args:
+        session_state: The plugin state for the session.
+
+    """
+
+    def __init__(self, session_state: PluginState) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._session_state = session_state
+        self._failed_tier: int | None = None
+        self._barrier: TierBarrier | None = None
+        self._barrier_dir: Path | None = None
+        self._skipped: Counter[int] = Counter()
+
+    @pytest.hookimpl
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        """Set up the barrier shared by the xdist controller and its workers."""
+        config = session.config
+        if is_xdist_worker():
+            path = getattr(config, 'workerinput', {}).get(WORKERINPUT_TIER_BARRIER_KEY)
+            if path is not None:
+                self._barrier = TierBarrier(Path(path))
+        elif is_xdist_controller(config):
+            self._barrier_dir = Path(tempfile.mkdtemp(prefix='pytest-test-categories-'))
+            self._barrier = TierBarrier(self._barrier_dir / 'failed-tier')
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node: object) -> None:
+        """Pass the barrier file to a worker the controller is starting."""
+        if self._barrier is not None:
+            node.workerinput[WORKERINPUT_TIER_BARRIER_KEY] = str(self._barrier.path)  # type: ignore[attr-defined]
+
+    # trylast so the tiers are the final order after other plugins reorder or deselect
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items: list[pytest.Item]) -> None:
+        """Order the tests by tier, shortest expected first within each tier."""
+        discovery_service = ensure_discovery_service(self._session_state)
+        recorder = cast('DurationRecorder | None', self._session_state.duration_recorder)
+        history = recorder.stats if recorder is not None else {}
+        sizes = [get_size_profile(item, discovery_service).size for item in items]
+        expected = [expected_duration(history.get(item.nodeid), size) for item, size in zip(items, sizes, strict=True)]
+        items[:] = [items[position] for position in tiered_order(sizes, expected)]
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item: pytest.Item) -> None:
+        """Skip the test if a test in a cheaper tier has failed.
+
+        Raises:
+            pytest.skip.Exception: If a cheaper tier has failed.
+
+        """
+        tier = tier_of(get_size_profile(item, ensure_discovery_service(self._session_state)).size)
+        if tier == 0:
+            return
+        if self._failed_tier is None and self._barrier is not None:
+            self._failed_tier = self._barrier.read()
+        if self._failed_tier is not None and self._failed_tier < tier:
+            pytest.skip(f'{TIERED_SKIP_REASON}: a {tier_name(self._failed_tier)} test failed')
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Record failed tiers and count the tests skipped because of them.
+
+        On the xdist controller this sees every worker's reports and shares
+        the first failed tier with the workers.
+        """
+        if report.failed:
+            tier = tier_of(size_from_nodeid(report.nodeid))
+            if self._failed_tier is None or tier < self._failed_tier:
+                self._failed_tier = tier
+                if self._barrier is not None and not is_xdist_worker():
+                    self._barrier.write(tier)
+        elif report.skipped and report.when == 'setup' and _skipped_by_tier(report):
+            self._skipped[tier_of(size_from_nodeid(report.nodeid))] += 1
+
+    @pytest.hookimpl
+    def pytest_terminal_summary(self, terminalreporter: pytest.TerminalReporter) -> None:
+        """Summarize which tier failed and how many tests were skipped after it."""
+        if self._failed_tier is None or not self._skipped:
+            return
+        writer = TerminalReporterAdapter(terminalreporter)
+        writer.write_section('Tiered Execution Summary', sep='=')
+        writer.write_line(f'The {tier_name(self._failed_tier)} tier failed, so the later tiers were skipped:')
+        for tier, count in sorted(self._skipped.items()):
+            test_word = 'test' if count == 1 else 'tests'
+            writer.write_line(f'  {tier_name(tier).capitalize()}: {count} {test_word} skipped')
+        writer.write_separator(sep='=')
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self) -> None:
+        """Remove the controller's barrier file."""
+        if self._barrier_dir is not None:
+            shutil.rmtree(self._barrier_dir, ignore_errors=True)
+            self._barrier_dir = None
+
+
+def _skipped_by_tier(report: pytest.TestReport) -> bool:
+    """Check whether a setup skip came from tiered execution."""
+    longrepr = report.longrepr
+    return isinstance(longrepr, tuple) and TIERED_SKIP_REASON in str(longrepr[2])
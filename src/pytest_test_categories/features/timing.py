@@ -0,0 +1,134 @@
+"""Timing sub-plugin: times each test and enforces its size's time limit.
+
+Time limits are part of the test size definitions, so pytest_configure
+registers this sub-plugin for every session.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.item_stash import (
+    TIMING_ORDINAL_KEY,
+    ensure_discovery_service,
+    get_size_profile,
+    get_timing_store,
+    store_call_duration,
+)
+from pytest_test_categories.services.timing_validation import TimingValidationService
+from pytest_test_categories.timing import (
+    PerformanceBaselineViolationError,
+    TimingViolationError,
+)
+from pytest_test_categories.types import TimerState
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from pytest_test_categories.types import PluginState
+
+
+class TimingPlugin:
+    """Times tests and fails those that exceed their time limit.
+
+    Collected tests are timed in the session TimingStore; tests with an
+    injected timer (or a custom timer_factory) use timer objects in
+    PluginState.timers. The call-phase duration, which is the report's
+    duration for tests timed in the store, is stored in the item's stash for
+    the reporting and suggestion sub-plugins.
+
+    Args:
+        session_state: The plugin state for the session.
+
+    """
+
+    def __init__(self, session_state: PluginState) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._session_state = session_state
+        self._timing_service = TimingValidationService()
+        # The running test, if it is timed in the TimingStore rather than with a timer object
+        self._store_timed_item: pytest.Item | None = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item: pytest.Item) -> Generator[None, None, None]:
+        """Track test timing during execution."""
+        session_state = self._session_state
+
+        # Time collected tests in the array-backed store unless a timer was injected
+        timing_store = get_timing_store(item, session_state)
+        if timing_store is not None:
+            ordinal = item.stash[TIMING_ORDINAL_KEY]
+            self._store_timed_item = item
+            try:
+                timing_store.start(ordinal)
+                yield  # Let the test run
+            finally:
+                timing_store.stop(ordinal)
+                self._store_timed_item = None
+            return
+
+        # Create and start timer for this test
+        if item.nodeid not in session_state.timers:
+            # Type narrowing: timer_factory is guaranteed to be set in pytest_configure
+            if session_state.timer_factory is None:
+                msg = 'timer_factory must be initialized in pytest_configure'
+                raise RuntimeError(msg)
+            timer = session_state.timer_factory(state=TimerState.READY)
+            session_state.timers[item.nodeid] = timer
+        else:
+            timer = session_state.timers[item.nodeid]
+
+        try:
+            timer.start()
+            yield  # Let the test run
+        finally:
+            # Ensure timer is always stopped, even if test fails
+            if timer.state == TimerState.RUNNING:
+                timer.stop()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, None, None]:
+        """Validate the call-phase duration against the test's time limit.
+
+        Args:
+            item: The test item that ran.
+            call: The call information for the phase being reported.
+
+        Yields:
+            Control to pytest to generate the report.
+
+        """
+        # Only the call phase is timed
+        if call.when != 'call':
+            yield
+            return
+
+        outcome = yield
+        report = outcome.get_result()  # type: ignore[attr-defined]
+        session_state = self._session_state
+        profile = get_size_profile(item, ensure_discovery_service(session_state))
+
+        # Get duration once for validation and for the reporting and suggestion sub-plugins.
+        # The TimingStore stops a test after its report is made, so the report has its call duration.
+        store_timed = self._store_timed_item is item
+        timer = None if store_timed else session_state.timers.get(item.nodeid)
+        duration = self._timing_service.get_test_duration(
+            timer,
+            report.duration if hasattr(report, 'duration') else None,
+        )
+        store_call_duration(item, duration)
+
+        # Validate timing if test has a size marker
+        if profile.size and duration is not None:
+            try:
+                # Check for custom timeout baseline from marker
+                self._timing_service.validate_timing_with_baseline(profile.size, duration, profile.timeout, item.nodeid)
+            except (PerformanceBaselineViolationError, TimingViolationError, ValueError) as e:
+                report.longrepr = str(e)
+                report.outcome = 'failed'
+
+        # Drop the finished test's timer so the timers dict does not grow for the session
+        if not store_timed:
+            self._timing_service.cleanup_timer(session_state.timers, item.nodeid)
@@ -0,0 +1,154 @@
+"""Trace sub-plugin: records each test's timeline for the Trace Event Format file.
+
+pytest_configure registers this sub-plugin only when --test-categories-trace
+is set.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from pytest_test_categories.item_stash import (
+    TIMING_ORDINAL_KEY,
+    ensure_discovery_service,
+    get_call_duration,
+    get_size_profile,
+    get_timing_store,
+)
+from pytest_test_categories.timing import time_violation
+from pytest_test_categories.trace_events import (
+    TraceRecorder,
+    violation_flag,
+    write_trace,
+)
+from pytest_test_categories.violation_tracking import ViolationType
+from pytest_test_categories.xdist_compat import (
+    WORKEROUTPUT_TRACE_KEY,
+    is_xdist_worker_session,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from pytest_test_categories.types import PluginState
+    from pytest_test_categories.violation_tracking import ViolationTracker
+
+# Track of the tests run without xdist workers
+MAIN_TRACK = 'main'
+
+_HERMETICITY_FLAGS = {
+    violation_type: violation_flag(f'hermeticity:{violation_type.value}') for violation_type in ViolationType
+}
+
+
+class TracePlugin:
+    """Records a span for each test and its phases, and writes the trace when the session finishes.
+
+    The test's span is the start and end the timing sub-plugin recorded in
+    the session TimingStore. Each phase's span ends when pytest makes its
+    report and lasts the phase's duration, on the same perf_counter_ns()
+    clock. Under pytest-xdist each worker sends its spans to the controller,
+    which writes them as one track per worker.
+
+    Args:
+        config: The pytest configuration object.
+        session_state: The plugin state for the session.
+        path: Path of the trace file.
+
+    """
+
+    def __init__(self, config: pytest.Config, session_state: PluginState, path: Path) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._session_state = session_state
+        self._path = path
+        self._is_worker = is_xdist_worker_session(config)
+        self._recorder = TraceRecorder()
+        self._tracks = {MAIN_TRACK: self._recorder}
+        # Violations of each type flagged so far, so a phase is flagged with the ones recorded during it
+        self._flagged_violations = dict.fromkeys(ViolationType, 0)
+        # Outcome and violation flags of the running test's phases
+        self._test_outcome = 'passed'
+        self._test_flags = 0
+
+    # tryfirst wraps the timing sub-plugin, so the test has been stopped in the TimingStore
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_protocol(self, item: pytest.Item) -> Generator[None, None, None]:
+        """Record the span of the whole test."""
+        self._test_outcome = 'passed'
+        self._test_flags = 0
+        started = time.perf_counter_ns()
+        yield
+        timing_store = get_timing_store(item, self._session_state)
+        span = timing_store.span(item.stash[TIMING_ORDINAL_KEY]) if timing_store is not None else None
+        start_ns, end_ns = span if span is not None else (started, time.perf_counter_ns())
+        size = get_size_profile(item, ensure_discovery_service(self._session_state)).size
+        self._recorder.add_span(
+            item.nodeid, 'test', start_ns, end_ns - start_ns, size, self._test_outcome, self._test_flags
+        )
+
+    # tryfirst wraps the timing sub-plugin, so the outcome includes time limit failures
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, None, None]:
+        """Record the span of the phase being reported.
+
+        Args:
+            item: The test item that ran.
+            call: The call information for the phase being reported.
+
+        Yields:
+            Control to pytest to generate the report.
+
+        """
+        end_ns = time.perf_counter_ns()
+        outcome = yield
+        report = outcome.get_result()  # type: ignore[attr-defined]
+        profile = get_size_profile(item, ensure_discovery_service(self._session_state))
+        flags = self._new_violation_flags()
+        if call.when == 'call' and profile.size is not None:
+            duration = get_call_duration(item, report)
+            violation = time_violation(profile.size, duration, profile.timeout) if duration is not None else None
+            if violation is not None:
+                flags |= violation_flag(violation)
+        duration_ns = round(call.duration * 1e9)
+        self._recorder.add_span(
+            item.nodeid, call.when, end_ns - duration_ns, duration_ns, profile.size, report.outcome, flags
+        )
+        self._test_flags |= flags
+        if report.outcome != 'passed' and self._test_outcome != 'failed':
+            self._test_outcome = report.outcome
+
+    def _new_violation_flags(self) -> int:
+        """Get the flags of the hermeticity violations recorded since the last phase."""
+        tracker = cast('ViolationTracker | None', self._session_state.violation_tracker)
+        if tracker is None or tracker.total_violations == sum(self._flagged_violations.values()):
+            return 0
+        flags = 0
+        for violation_type, flagged in self._flagged_violations.items():
+            count = tracker.count_by_type(violation_type)
+            if count > flagged:
+                flags |= _HERMETICITY_FLAGS[violation_type]
+                self._flagged_violations[violation_type] = count
+        return flags
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Send the spans to the xdist controller, or write the trace file."""
+        if self._is_worker:
+            workeroutput = getattr(session.config, 'workeroutput', None)
+            if workeroutput is not None:
+                workeroutput[WORKEROUTPUT_TRACE_KEY] = self._recorder.to_dict()
+            return
+        write_trace(self._path, self._tracks)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object) -> None:
+        """Add a worker's spans to the controller as the worker's track."""
+        worker_id = getattr(node, 'workerinput', {}).get('workerid')
+        data = getattr(node, 'workeroutput', {}).get(WORKEROUTPUT_TRACE_KEY)
+        if isinstance(worker_id, str) and isinstance(data, dict):
+            recorder = self._tracks.setdefault(worker_id, TraceRecorder())
+            recorder.merge(data)
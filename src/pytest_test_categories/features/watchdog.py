@@ -0,0 +1,126 @@
+"""Timeout watchdog sub-plugin: interrupts tests once they exceed their time limit.
+
+pytest_configure registers this sub-plugin only when
+--test-categories-enforce-timeout (or the test_categories_enforce_timeout ini
+option) is set.
+"""
+
+from __future__ import annotations
+
+import time
+import traceback
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.item_stash import (
+    ensure_discovery_service,
+    get_size_profile,
+)
+from pytest_test_categories.timing import (
+    TIME_LIMITS,
+    PerformanceBaselineViolationError,
+    TimingViolationError,
+)
+from pytest_test_categories.watchdog import TimeoutWatchdog
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from pytest_test_categories.types import (
+        PluginState,
+        TestSize,
+    )
+
+
+class TimeoutWatchdogPlugin:
+    """Arms a watchdog with each sized test's time limit while its test function runs.
+
+    The limit is the marker's timeout= baseline if set, otherwise the size's
+    limit from TIME_LIMITS. When the watchdog fires, the test fails with the
+    same TimingViolationError (or PerformanceBaselineViolationError for a
+    baseline) the timing sub-plugin reports after the fact, and the stack at
+    the interruption point is added to the report.
+
+    The watchdog covers only the test function, inside pytest_pyfunc_call, so
+    it cannot fire in another plugin's pytest_runtest_call code, such as the
+    enforcement sub-plugin's cleanup of its blockers. Items that are not
+    Python test functions are not interrupted.
+
+    Args:
+        session_state: The plugin state for the session.
+
+    """
+
+    def __init__(self, session_state: PluginState) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._session_state = session_state
+        self._watchdog = TimeoutWatchdog()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_pyfunc_call(self, pyfuncitem: pytest.Function) -> Generator[None, None, None]:
+        """Interrupt the test function if it runs past its time limit.
+
+        Args:
+            pyfuncitem: The test function being called.
+
+        Yields:
+            Control to pytest to call the test function.
+
+        """
+        profile = get_size_profile(pyfuncitem, ensure_discovery_service(self._session_state))
+        test_size, baseline = profile.size, profile.timeout
+        if test_size is None:
+            yield
+            return
+
+        watchdog = self._watchdog
+        limit = baseline if baseline is not None else TIME_LIMITS[test_size].limit
+        start = time.perf_counter()
+        watchdog.arm(limit, lambda: _timeout_error(test_size, baseline, pyfuncitem.nodeid, time.perf_counter() - start))
+        try:
+            outcome = yield
+        finally:
+            watchdog.cancel()
+
+        if watchdog.fired:
+            stack = ''.join(_test_frames(watchdog.stack).format())
+            pyfuncitem.add_report_section('call', 'timeout watchdog', f'Test interrupted at:\n{stack}')
+            outcome.force_exception(watchdog.error)  # type: ignore[attr-defined]
+
+
+def _timeout_error(test_size: TestSize, baseline: float | None, nodeid: str, elapsed: float) -> Exception:
+    """Build the error for a test interrupted by the watchdog.
+
+    Args:
+        test_size: The test's size category.
+        baseline: The marker's timeout= baseline, if any.
+        nodeid: The test's node ID.
+        elapsed: Seconds since the test function was called.
+
+    Returns:
+        The timing violation for the test's limit.
+
+    """
+    category_limit = TIME_LIMITS[test_size].limit
+    if baseline is not None:
+        return PerformanceBaselineViolationError(test_size, nodeid, baseline, category_limit, elapsed)
+    return TimingViolationError(test_size, nodeid, category_limit, elapsed)
+
+
+def _test_frames(stack: traceback.StackSummary) -> traceback.StackSummary:
+    """Drop the pytest frames that lead up to the test function.
+
+    Args:
+        stack: The stack at the interruption point, outermost frame first.
+
+    Returns:
+        The frames from the test function inwards, or the whole stack if the
+        test function's caller is not found.
+
+    """
+    # The innermost caller wins when pytest runs nested sessions (e.g. pytester)
+    for index in range(len(stack) - 1, -1, -1):
+        if stack[index].name == 'pytest_pyfunc_call':
+            return traceback.StackSummary.from_list(stack[index + 1 :])
+    return stack
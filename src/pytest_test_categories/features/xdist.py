@@ -0,0 +1,169 @@
+"""xdist aggregation sub-plugin: merges worker results on the controller.
+
+pytest_configure registers this sub-plugin only on xdist workers and in
+sessions where pytest-xdist is loaded.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from pytest_test_categories.adapters.pytest_adapter import PytestConfigAdapter
+from pytest_test_categories.distribution.stats import (
+    DistributionStats,
+    TestCounts,
+)
+from pytest_test_categories.xdist_compat import (
+    REPORT_DATA_ATTR,
+    WORKEROUTPUT_DISTRIBUTION_KEY,
+    WORKEROUTPUT_SUGGESTIONS_KEY,
+    WORKEROUTPUT_VIOLATIONS_KEY,
+    deserialize_distribution_counts,
+    is_xdist_worker,
+    is_xdist_worker_session,
+    merge_suggestions,
+    merge_test_data,
+    merge_violations,
+    serialize_distribution_counts,
+    serialize_suggestions,
+    serialize_test_result,
+    serialize_violations,
+)
+
+if TYPE_CHECKING:
+    from pytest_test_categories.reporting import TestSizeReport
+    from pytest_test_categories.suggestion import SuggestionCollector
+    from pytest_test_categories.violation_tracking import ViolationTracker
+
+
+class XdistAggregationPlugin:
+    """Sends worker stats to the controller and aggregates them there.
+
+    Test sizes and results travel with each test's reports, so the
+    controller's size report grows as tests finish and keeps every test a
+    crashed worker reported. The distribution counts, hermeticity violations
+    and suggestion observations are sent when a worker finishes, so the
+    controller's summaries match a serial run.
+
+    Args:
+        config: The pytest configuration object.
+
+    """
+
+    def __init__(self, config: pytest.Config) -> None:
+        """Initialize the sub-plugin for a session."""
+        self._config_adapter = PytestConfigAdapter(config)
+        self._is_worker = is_xdist_worker_session(config)
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Add the size or result a worker attached to a test report to the controller's size report.
+
+        Args:
+            report: A test report, deserialized from a worker.
+
+        """
+        if self._is_worker:
+            return
+        test_report = self._config_adapter.get_plugin_state().test_size_report
+        if test_report is None:
+            return
+        data = getattr(report, REPORT_DATA_ATTR, None)
+        # xdist reports the test a crashed worker was running with when='???' and no data of ours
+        if data is None and report.when == '???':
+            data = serialize_test_result(report.outcome, None)
+        if data is not None:
+            merge_test_data(cast('TestSizeReport', test_report), report.nodeid, data)
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Send distribution stats, violations and suggestions to controller when running as xdist worker.
+
+        When running with pytest-xdist, workers collect and run tests but the terminal
+        summary is displayed by the controller. This hook sends the worker's stats back
+        to the controller via the workeroutput mechanism.
+
+        Args:
+            session: The pytest session object.
+
+        """
+        if not is_xdist_worker():
+            return
+
+        # Check for workeroutput (only present on workers)
+        workeroutput = getattr(session.config, 'workeroutput', None)
+        if workeroutput is None:
+            return
+
+        stats = self._config_adapter.get_distribution_stats()
+
+        # Serialize and send distribution counts
+        if stats is not None:
+            workeroutput[WORKEROUTPUT_DISTRIBUTION_KEY] = serialize_distribution_counts(stats.counts)
+
+        session_state = self._config_adapter.get_plugin_state()
+        violation_tracker = cast('ViolationTracker | None', session_state.violation_tracker)
+        if violation_tracker is not None and violation_tracker.has_violations:
+            workeroutput[WORKEROUTPUT_VIOLATIONS_KEY] = serialize_violations(violation_tracker)
+        suggestion_collector = cast('SuggestionCollector | None', session_state.suggestion_collector)
+        if suggestion_collector is not None:
+            workeroutput[WORKEROUTPUT_SUGGESTIONS_KEY] = serialize_suggestions(suggestion_collector)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: object) -> None:
+        """Aggregate distribution stats, violations and suggestions from a worker when it shuts down.
+
+        This xdist hook is called on the controller when a worker node completes.
+        We use it to aggregate the distribution counts, hermeticity violations and
+        suggestion observations from all workers.
+
+        Args:
+            node: The xdist WorkerController node that shut down.
+
+        """
+        # This hook only runs on controller, but verify we're not a worker
+        if is_xdist_worker():
+            return
+
+        # Access workeroutput from the node
+        workeroutput = getattr(node, 'workeroutput', None)
+        if workeroutput is None:
+            return
+
+        # Get distribution counts from worker
+        # With xdist, each worker collects ALL tests but only runs assigned ones.
+        # The distribution counts from any worker represent the full test suite,
+        # so we only need to take the counts from the first worker (controller starts at 0).
+        worker_dist_data = workeroutput.get(WORKEROUTPUT_DISTRIBUTION_KEY)
+        if worker_dist_data is not None:
+            worker_counts = deserialize_distribution_counts(worker_dist_data)
+            current_stats = self._config_adapter.get_distribution_stats()
+
+            # Only update if controller hasn't been populated yet (counts are all 0)
+            # This ensures we use the first worker's counts and don't double-count
+            current_total = (
+                current_stats.counts.small
+                + current_stats.counts.medium
+                + current_stats.counts.large
+                + current_stats.counts.xlarge
+            )
+
+            if current_total == 0:
+                updated_stats = DistributionStats(counts=TestCounts(**worker_counts))
+                self._config_adapter.set_distribution_stats(updated_stats)
+
+        self._merge_observations(workeroutput)
+
+    def _merge_observations(self, workeroutput: dict[str, object]) -> None:
+        """Merge a worker's hermeticity violations and suggestion observations into the controller's."""
+        session_state = self._config_adapter.get_plugin_state()
+        worker_violations = workeroutput.get(WORKEROUTPUT_VIOLATIONS_KEY)
+        violation_tracker = cast('ViolationTracker | None', session_state.violation_tracker)
+        if isinstance(worker_violations, dict) and violation_tracker is not None:
+            merge_violations(violation_tracker, worker_violations)
+        worker_suggestions = workeroutput.get(WORKEROUTPUT_SUGGESTIONS_KEY)
+        suggestion_collector = cast('SuggestionCollector | None', session_state.suggestion_collector)
+        if isinstance(worker_suggestions, dict) and suggestion_collector is not None:
+            merge_suggestions(suggestion_collector, worker_suggestions)
@@ -0,0 +1,188 @@
+"""Per-item state shared by the plugin and its feature sub-plugins.
+
+pytest_collection_modifyitems resolves each collected item's size profile and
+its slot in the session TimingStore once, and stores both in the item's
+pytest.Stash; the timing sub-plugin stores the measured call-phase duration
+there too. The helpers here read and write those stash entries, so the main
+plugin module and the sub-plugins in the features package share them without
+importing each other.
+
+Example:
+    >>> store_call_duration(item, 0.25)
+    >>> get_call_duration(item, report)
+    0.25
+
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    cast,
+)
+
+import pytest
+
+from pytest_test_categories.adapters.pytest_adapter import (
+    PytestItemAdapter,
+    PytestWarningAdapter,
+)
+from pytest_test_categories.services.test_discovery import (
+    SizeProfile,
+    TestDiscoveryService,
+)
+from pytest_test_categories.timers import (
+    TimingStore,
+    WallTimer,
+)
+
+if TYPE_CHECKING:
+    from pytest_test_categories.types import PluginState
+
+__all__ = [
+    'CALL_DURATION_KEY',
+    'SIZE_PROFILE_KEY',
+    'TIMING_ORDINAL_KEY',
+    'ensure_discovery_service',
+    'get_call_duration',
+    'get_size_profile',
+    'get_timing_store',
+    'store_call_duration',
+    'store_size_profile',
+    'store_timing_ordinal',
+]
+
+# Item stash key for the size profile resolved at collection
+SIZE_PROFILE_KEY = pytest.StashKey[SizeProfile]()
+
+# Item stash key for the item's slot in the session TimingStore
+TIMING_ORDINAL_KEY = pytest.StashKey[int]()
+
+# Item stash key for the call-phase duration measured by the timing sub-plugin
+CALL_DURATION_KEY = pytest.StashKey['float | None']()
+
+
+def ensure_discovery_service(session_state: PluginState) -> TestDiscoveryService:
+    """Ensure TestDiscoveryService is initialized.
+
+    This is a helper function that creates the discovery service if it
+    doesn't exist. This should never be needed in normal operation (the
+    service is created in pytest_configure), but provides a safety net.
+
+    Args:
+        session_state: The plugin state containing the discovery service.
+
+    Returns:
+        The TestDiscoveryService instance.
+
+    """
+    if session_state.test_discovery_service is None:
+        warning_system = PytestWarningAdapter()
+        session_state.test_discovery_service = TestDiscoveryService(warning_system=warning_system)
+    return cast('TestDiscoveryService', session_state.test_discovery_service)
+
+
+def get_size_profile(item: pytest.Item, discovery_service: TestDiscoveryService) -> SizeProfile:
+    """Get the size profile resolved for an item at collection.
+
+    Falls back to resolving (and stashing) the profile when the item was not
+    seen by pytest_collection_modifyitems or has no pytest.Stash.
+
+    Args:
+        item: The test item.
+        discovery_service: Service used when the profile has to be resolved.
+
+    Returns:
+        The item's SizeProfile.
+
+    """
+    stash = getattr(item, 'stash', None)
+    if isinstance(stash, pytest.Stash):
+        profile = stash.get(SIZE_PROFILE_KEY, None)
+        if profile is not None:
+            return profile
+    profile = discovery_service.get_size_profile(PytestItemAdapter(item))
+    store_size_profile(item, profile)
+    return profile
+
+
+def store_size_profile(item: pytest.Item, profile: SizeProfile) -> None:
+    """Store an item's size profile in its stash.
+
+    Args:
+        item: The collected test item.
+        profile: The profile resolved for the item.
+
+    """
+    stash = getattr(item, 'stash', None)
+    if isinstance(stash, pytest.Stash):
+        stash[SIZE_PROFILE_KEY] = profile
+
+
+def store_timing_ordinal(item: pytest.Item, ordinal: int) -> None:
+    """Store an item's slot in the session TimingStore in its stash.
+
+    Args:
+        item: The collected test item.
+        ordinal: The item's position in the collected items.
+
+    """
+    stash = getattr(item, 'stash', None)
+    if isinstance(stash, pytest.Stash):
+        stash[TIMING_ORDINAL_KEY] = ordinal
+
+
+def get_timing_store(item: pytest.Item, session_state: PluginState) -> TimingStore | None:
+    """Get the TimingStore that times an item, if it is timed there.
+
+    Items are timed in the store when they were given an ordinal at collection,
+    the session uses the default WallTimer factory and no timer was injected
+    for the item. Otherwise they are timed with a timer from timer_factory.
+
+    Args:
+        item: The test item.
+        session_state: The plugin state for the session.
+
+    Returns:
+        The session TimingStore, or None if the item uses a timer object.
+
+    """
+    timing_store = cast('TimingStore | None', session_state.timing_store)
+    if timing_store is None or session_state.timer_factory is not WallTimer or item.nodeid in session_state.timers:
+        return None
+    stash = getattr(item, 'stash', None)
+    if not isinstance(stash, pytest.Stash) or TIMING_ORDINAL_KEY not in stash:
+        return None
+    return timing_store
+
+
+def store_call_duration(item: pytest.Item, duration: float | None) -> None:
+    """Store an item's call-phase duration in its stash.
+
+    Args:
+        item: The test item that ran.
+        duration: The measured duration in seconds, or None if unknown.
+
+    """
+    stash = getattr(item, 'stash', None)
+    if isinstance(stash, pytest.Stash):
+        stash[CALL_DURATION_KEY] = duration
+
+
+def get_call_duration(item: pytest.Item, report: pytest.TestReport) -> float | None:
+    """Get the call-phase duration stored by the timing sub-plugin.
+
+    Falls back to the report's duration when the item has no stored duration.
+
+    Args:
+        item: The test item that ran.
+        report: The call-phase report for the item.
+
+    Returns:
+        The duration in seconds, or None if unknown.
+
+    """
+    stash = getattr(item, 'stash', None)
+    if isinstance(stash, pytest.Stash) and CALL_DURATION_KEY in stash:
+        return stash[CALL_DURATION_KEY]
+    return getattr(report, 'duration', None)
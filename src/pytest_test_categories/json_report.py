@@ -12,6 +12,7 @@ The JSON output includes:
 - Timestamp in ISO 8601 format
 - Summary with distribution statistics and violations
 - Per-test details (optional)
+- The time budget selection, with --test-categories-budget
 """
 
 from __future__ import annotations
@@ -26,6 +27,7 @@ from pydantic import (
     computed_field,
 )
 
+from pytest_test_categories.budget import BudgetSelection
 from pytest_test_categories.distribution.stats import DISTRIBUTION_TARGETS
 from pytest_test_categories.types import TestSize
 from pytest_test_categories.violation_tracking import ViolationType
@@ -35,6 +37,19 @@ if TYPE_CHECKING:
     from pytest_test_categories.reporting import TestSizeReport
     from pytest_test_categories.violation_tracking import ViolationTracker
 
+__all__ = [
+    'DistributionSizeEntry',
+    'HermeticityViolationsSummary',
+    'JsonReport',
+    'JsonReportSummary',
+    'JsonTestEntry',
+    'ViolationsSummary',
+    'build_distribution',
+    'build_hermeticity_lookup',
+    'build_hermeticity_summary',
+    'get_time_violation',
+]
+
 
 class DistributionSizeEntry(BaseModel):
     """Distribution statistics for a single test size category.
@@ -116,8 +131,38 @@ class JsonTestEntry(BaseModel):
     violations: list[str]
 
 
-def _build_distribution(distribution_stats: DistributionStats) -> dict[str, DistributionSizeEntry]:
-    """Build the distribution dictionary from stats."""
+def get_time_violation(test_report: TestSizeReport, nodeid: str, size: TestSize | None) -> str | None:
+    """Get the time violation a test is reported with.
+
+    Args:
+        test_report: The TestSizeReport containing test data.
+        nodeid: The pytest node ID of the test.
+        size: The test size category, or None if unsized.
+
+    Returns:
+        'baseline' if the test exceeded its custom baseline, 'timing' if it
+        exceeded its size's time limit, or None.
+
+    """
+    if size is None:
+        return None
+    if test_report.has_baseline_violation(nodeid):
+        return 'baseline'
+    if test_report.exceeds_time_limit(nodeid, size):
+        return 'timing'
+    return None
+
+
+def build_distribution(distribution_stats: DistributionStats) -> dict[str, DistributionSizeEntry]:
+    """Build the distribution section of the report.
+
+    Args:
+        distribution_stats: The distribution counts of the session.
+
+    Returns:
+        The count, percentage and target of each size, keyed by size name.
+
+    """
     counts = distribution_stats.counts
     percentages = distribution_stats.calculate_percentages()
 
@@ -145,8 +190,16 @@ def _build_distribution(distribution_stats: DistributionStats) -> dict[str, Dist
     }
 
 
-def _build_hermeticity_lookup(violation_tracker: ViolationTracker | None) -> dict[str, list[str]]:
-    """Build per-test hermeticity violations lookup."""
+def build_hermeticity_lookup(violation_tracker: ViolationTracker | None) -> dict[str, list[str]]:
+    """Build the hermeticity violations of each test.
+
+    Args:
+        violation_tracker: The session's violation tracker, if any.
+
+    Returns:
+        The 'hermeticity:<type>' violations of each test that had any, keyed by node ID.
+
+    """
     test_hermeticity_violations: dict[str, list[str]] = {}
     if violation_tracker is not None:
         for violation_type in ViolationType:
@@ -157,8 +210,16 @@ def _build_hermeticity_lookup(violation_tracker: ViolationTracker | None) -> dic
     return test_hermeticity_violations
 
 
-def _build_hermeticity_summary(violation_tracker: ViolationTracker | None) -> HermeticityViolationsSummary:
-    """Build hermeticity violations summary."""
+def build_hermeticity_summary(violation_tracker: ViolationTracker | None) -> HermeticityViolationsSummary:
+    """Build the hermeticity violation counts of the summary.
+
+    Args:
+        violation_tracker: The session's violation tracker, if any.
+
+    Returns:
+        The violation count of each type; all zero without a tracker.
+
+    """
     if violation_tracker is None:
         return HermeticityViolationsSummary()
     return HermeticityViolationsSummary(
@@ -178,6 +239,7 @@ class JsonReport(BaseModel):
     - timestamp: When the report was generated (ISO 8601 format)
     - summary: Aggregate statistics
     - tests: Per-test details
+    - budget: The time budget selection, or None without --test-categories-budget
     """
 
     model_config = ConfigDict(frozen=True)
@@ -186,6 +248,7 @@ class JsonReport(BaseModel):
     timestamp: datetime
     summary: JsonReportSummary
     tests: list[JsonTestEntry]
+    budget: BudgetSelection | None = None
 
     @classmethod
     def from_test_size_report(
@@ -194,6 +257,7 @@ class JsonReport(BaseModel):
         distribution_stats: DistributionStats,
         version: str,
         violation_tracker: ViolationTracker | None = None,
+        budget_selection: BudgetSelection | None = None,
     ) -> JsonReport:
         """Create a JsonReport from a TestSizeReport and DistributionStats.
 
@@ -202,30 +266,32 @@ class JsonReport(BaseModel):
             distribution_stats: The DistributionStats with count data.
             version: The plugin version string.
             violation_tracker: Optional ViolationTracker with hermeticity violations.
+            budget_selection: Optional selection made within a time budget.
 
         Returns:
             A JsonReport instance ready for serialization.
 
         """
         timestamp = datetime.now(tz=UTC)
-        distribution = _build_distribution(distribution_stats)
-        test_hermeticity_violations = _build_hermeticity_lookup(violation_tracker)
+        distribution = build_distribution(distribution_stats)
+        test_hermeticity_violations = build_hermeticity_lookup(violation_tracker)
 
         timing_violations = 0
         baseline_violations = 0
         tests: list[JsonTestEntry] = []
 
         for size in TestSize:
-            for nodeid in test_report.sized_tests[size]:
+            for nodeid in test_report.get_tests(size):
                 violations: list[str] = []
-                duration = test_report.test_durations.get(nodeid)
-                outcome = test_report.test_outcomes.get(nodeid, 'unknown')
+                duration = test_report.get_duration(nodeid)
+                outcome = test_report.get_outcome(nodeid) or 'unknown'
 
-                if test_report.has_baseline_violation(nodeid):
-                    violations.append('baseline')
+                time_violation = get_time_violation(test_report, nodeid, size)
+                if time_violation == 'baseline':
+                    violations.append(time_violation)
                     baseline_violations += 1
-                elif test_report.exceeds_time_limit(nodeid, size):
-                    violations.append('timing')
+                elif time_violation == 'timing':
+                    violations.append(time_violation)
                     timing_violations += 1
 
                 violations.extend(test_hermeticity_violations.get(nodeid, []))
@@ -235,9 +301,9 @@ class JsonReport(BaseModel):
                     )
                 )
 
-        for nodeid in test_report.unsized_tests:
-            duration = test_report.test_durations.get(nodeid)
-            outcome = test_report.test_outcomes.get(nodeid, 'unknown')
+        for nodeid in test_report.get_tests(None):
+            duration = test_report.get_duration(nodeid)
+            outcome = test_report.get_outcome(nodeid) or 'unknown'
             tests.append(
                 JsonTestEntry(
                     name=nodeid,
@@ -254,8 +320,8 @@ class JsonReport(BaseModel):
             violations=ViolationsSummary(
                 timing=timing_violations,
                 baseline=baseline_violations,
-                hermeticity=_build_hermeticity_summary(violation_tracker),
+                hermeticity=build_hermeticity_summary(violation_tracker),
             ),
         )
 
-        return cls(version=version, timestamp=timestamp, summary=summary, tests=tests)
+        return cls(version=version, timestamp=timestamp, summary=summary, tests=tests, budget=budget_selection)
@@ -0,0 +1,219 @@
+"""Streaming JSON Lines test size report.
+
+With --test-size-report=jsonl the report is written while the session runs
+instead of being built in memory at the end. Each line is a compact record:
+
+- One record per test, written once the test has torn down, with the fields
+  of a JsonTestEntry; its violations are only 'timing' or 'baseline'
+- A last record with the version, timestamp, summary and budget of the JSON
+  report, and the 'hermeticity:<type>' violations of each test that had any
+
+A test that ran more than once (for example with reruns) has a record per run;
+the last one wins. A file name ending in .gz is gzip-compressed.
+
+read_jsonl_report rebuilds the JsonReport that --test-size-report=json writes:
+
+    $ pytest --test-size-report=jsonl --test-size-report-file=report.jsonl.gz
+    $ pytest-test-categories convert report.jsonl.gz --output report.json
+
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import UTC, datetime
+from typing import (
+    TYPE_CHECKING,
+    TextIO,
+)
+
+from pytest_test_categories.json_report import (
+    JsonReport,
+    JsonReportSummary,
+    JsonTestEntry,
+    ViolationsSummary,
+    build_distribution,
+    build_hermeticity_lookup,
+    build_hermeticity_summary,
+    get_time_violation,
+)
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_test_categories.budget import BudgetSelection
+    from pytest_test_categories.distribution.stats import DistributionStats
+    from pytest_test_categories.reporting import TestSizeReport
+    from pytest_test_categories.violation_tracking import ViolationTracker
+
+__all__ = [
+    'JsonlReportWriter',
+    'open_report',
+    'read_jsonl_report',
+]
+
+# Text buffer of the report file, so a test's record is written to the OS in batches
+_BUFFER_SIZE = 1 << 16
+
+# JSON string encoding, as json.dumps does it
+_encode_string = json.encoder.encode_basestring_ascii  # type: ignore[attr-defined]
+
+# Order of the tests in the JSON report: by size, then unsized
+_SIZE_ORDER = {size.value: position for position, size in enumerate(TestSize)}
+
+
+def open_report(path: Path, mode: str) -> TextIO:
+    """Open a report file as text, gzip-compressed if its name ends in .gz.
+
+    Args:
+        path: Path of the report file.
+        mode: 'r' to read or 'w' to write.
+
+    Returns:
+        The open text file.
+
+    """
+    if path.suffix == '.gz':
+        return gzip.open(path, mode + 't', encoding='utf-8', compresslevel=6)  # type: ignore[return-value]
+    return path.open(mode, encoding='utf-8', buffering=_BUFFER_SIZE)
+
+
+class JsonlReportWriter:
+    """Writes the JSON Lines test size report as tests finish.
+
+    Args:
+        path: Path of the report file; a name ending in .gz is gzip-compressed.
+
+    """
+
+    __slots__ = ('_encoder', '_file', '_time_violations', '_written', 'path')
+
+    def __init__(self, path: Path) -> None:
+        """Open the report file, creating its directory."""
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open_report(path, 'w')
+        self._encoder = json.JSONEncoder(separators=(',', ':'))
+        self._written: set[str] = set()
+        # Only tests that exceeded a time limit, so the summary counts a rerun test once
+        self._time_violations: dict[str, str] = {}
+
+    def __repr__(self) -> str:
+        """Return a representation showing the report file and how many tests were written."""
+        return f'JsonlReportWriter(path={self.path!r}, tests={len(self._written)})'
+
+    def write_test(self, test_report: TestSizeReport, nodeid: str) -> None:
+        """Write a test's record with what the report holds for it.
+
+        Args:
+            test_report: The report being built for the session.
+            nodeid: The pytest node ID of the test.
+
+        """
+        size = test_report.get_test_size(nodeid)
+        time_violation = get_time_violation(test_report, nodeid, size)
+        if time_violation is None:
+            self._time_violations.pop(nodeid, None)
+        else:
+            self._time_violations[nodeid] = time_violation
+        duration = test_report.get_duration(nodeid)
+        # Assembled directly, since a test's fields are a string, a size, a float and known violations
+        self._file.write(
+            f'{{"name":{_encode_string(nodeid)},'
+            f'"size":"{size.value if size is not None else "unsized"}",'
+            f'"duration":{"null" if duration is None else float.__repr__(duration)},'
+            f'"status":{_encode_string(test_report.get_outcome(nodeid) or "unknown")},'
+            f'"violations":{"[]" if time_violation is None else f"[{_encode_string(time_violation)}]"}}}\n'
+        )
+        self._written.add(nodeid)
+
+    def write_summary(
+        self,
+        test_report: TestSizeReport,
+        distribution_stats: DistributionStats,
+        version: str,
+        violation_tracker: ViolationTracker | None = None,
+        budget_selection: BudgetSelection | None = None,
+    ) -> None:
+        """Write the records of tests that never tore down, then the summary record.
+
+        Args:
+            test_report: The report built for the session.
+            distribution_stats: The DistributionStats with count data.
+            version: The plugin version string.
+            violation_tracker: Optional ViolationTracker with hermeticity violations.
+            budget_selection: Optional selection made within a time budget.
+
+        """
+        for tests in (*(test_report.get_tests(size) for size in TestSize), test_report.get_tests(None)):
+            for nodeid in tests:
+                if nodeid not in self._written:
+                    self.write_test(test_report, nodeid)
+
+        time_violations = list(self._time_violations.values())
+        summary = JsonReportSummary(
+            total_tests=test_report.get_total_tests(),
+            distribution=build_distribution(distribution_stats),
+            violations=ViolationsSummary(
+                timing=time_violations.count('timing'),
+                baseline=time_violations.count('baseline'),
+                hermeticity=build_hermeticity_summary(violation_tracker),
+            ),
+        )
+        report = JsonReport(
+            version=version, timestamp=datetime.now(tz=UTC), summary=summary, tests=[], budget=budget_selection
+        )
+        record = report.model_dump(mode='json', exclude={'tests'})
+        record['hermeticity'] = build_hermeticity_lookup(violation_tracker)
+        self._file.write(self._encoder.encode(record) + '\n')
+
+    def close(self) -> None:
+        """Write out what is buffered and close the report file."""
+        self._file.close()
+
+
+def read_jsonl_report(path: Path) -> JsonReport:
+    """Rebuild the JSON report from a JSON Lines report.
+
+    Args:
+        path: Path of the JSON Lines report; a name ending in .gz is read as gzip.
+
+    Returns:
+        The JsonReport --test-size-report=json would have written.
+
+    Raises:
+        ValueError: If a line is not a JSON object, or the report has no summary
+            record because the session did not finish.
+
+    """
+    tests: dict[str, dict[str, object]] = {}
+    last: dict[str, object] | None = None
+    with open_report(path, 'r') as report_file:
+        for line_number, line in enumerate(report_file, start=1):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if not isinstance(record, dict):
+                msg = f'{path}:{line_number}: not a JSON record'
+                raise ValueError(msg)  # noqa: TRY004
+            if 'summary' in record:
+                last = record
+            else:
+                # A later run of the same test replaces the record but keeps its place
+                tests[str(record.get('name'))] = record
+    if last is None:
+        msg = f'{path}: no summary record; the session did not finish'
+        raise ValueError(msg)
+
+    hermeticity = last.pop('hermeticity', None) or {}
+    entries = []
+    for record in sorted(tests.values(), key=lambda record: _SIZE_ORDER.get(str(record.get('size')), len(_SIZE_ORDER))):
+        entry = JsonTestEntry.model_validate(record)
+        extra = hermeticity.get(entry.name) if isinstance(hermeticity, dict) else None
+        if extra:
+            entry = entry.model_copy(update={'violations': [*entry.violations, *extra]})
+        entries.append(entry)
+    return JsonReport.model_validate({**last, 'tests': entries})
@@ -0,0 +1,56 @@
+"""Deprecated module-level per-test hooks.
+
+The per-test hooks moved to the timing sub-plugin, which pytest_configure
+registers for every session. These aliases keep the old package exports
+importable and forward to that sub-plugin. They live outside plugin.py so
+pytest does not register them as hooks a second time.
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING
+
+from pytest_test_categories.plugin import TIMING_PLUGIN_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    import pytest
+
+    from pytest_test_categories.features.timing import TimingPlugin
+
+
+def pytest_runtest_protocol(item: pytest.Item, nextitem: pytest.Item | None = None) -> Generator[None, None, None]:  # noqa: ARG001
+    """Track test timing during execution.
+
+    Deprecated: forwards to the timing sub-plugin's hook.
+    """
+    _warn_deprecated('pytest_runtest_protocol')
+    yield from _get_timing_plugin(item).pytest_runtest_protocol(item)
+
+
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, None, None]:
+    """Validate timing and update test reports.
+
+    Deprecated: forwards to the timing sub-plugin's hook.
+    """
+    _warn_deprecated('pytest_runtest_makereport')
+    yield from _get_timing_plugin(item).pytest_runtest_makereport(item, call)
+
+
+def _warn_deprecated(name: str) -> None:
+    warnings.warn(
+        f'pytest_test_categories.{name} is deprecated; the timing sub-plugin '
+        f'registered as {TIMING_PLUGIN_NAME!r} implements it',
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
+def _get_timing_plugin(item: pytest.Item) -> TimingPlugin:
+    plugin = item.config.pluginmanager.get_plugin(TIMING_PLUGIN_NAME)
+    if plugin is None:
+        msg = f'{TIMING_PLUGIN_NAME} must be registered in pytest_configure'
+        raise RuntimeError(msg)
+    return plugin
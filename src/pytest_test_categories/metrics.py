@@ -0,0 +1,277 @@
+"""Session metrics in the Prometheus text format.
+
+SessionMetrics accumulates the test metrics described in docs/monitoring.md
+as tests finish: a histogram of call-phase durations for each size and
+outcome, counts of the tests over their time limit or performance baseline,
+and the seconds the plugin spent on its own work. The histogram buckets are
+log-spaced, four to a decade from 1ms to 1000s, and a test adds one to a
+bucket count, so the metrics take the same memory however many tests run.
+Under pytest-xdist each worker sends its counts to the controller, which
+adds them up (see to_dict and merge).
+
+render builds the exposition, adding the collected tests' size distribution
+and the hermeticity violation counts. It is written in the Prometheus text
+format, which node_exporter's textfile collector parses, rather than
+OpenMetrics: a counter's TYPE line names its samples, _total suffix
+included, and there is no '# EOF' line. write_metrics_file replaces the
+metrics file in one rename, so the collector never reads a partly written
+file.
+
+Example:
+    >>> metrics = SessionMetrics()
+    >>> metrics.observe(TestSize.SMALL, 'passed', 0.004, None)
+    >>> metrics.observe(TestSize.SMALL, 'passed', 1.5, None)
+    >>> metrics.timing_violations['small']
+    1
+
+"""
+
+from __future__ import annotations
+
+import os
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+from pytest_test_categories.timing import time_violation
+from pytest_test_categories.types import TestSize
+from pytest_test_categories.violation_tracking import ViolationType
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from pytest_test_categories.distribution.stats import DistributionStats
+
+__all__ = ['DURATION_BUCKETS', 'SessionMetrics', 'write_metrics_file']
+
+# Upper bounds of the duration histogram buckets in seconds: 1ms to 1000s, four to a decade
+DURATION_BUCKETS: tuple[float, ...] = tuple(float(f'{10 ** (exponent / 4):.3g}') for exponent in range(-12, 13))
+
+# Size labels in the order the series are written; tests without a size marker are 'unsized'
+_SIZE_LABELS = (*(size.value for size in TestSize), 'unsized')
+
+
+def _size_label(size: TestSize | None) -> str:
+    """Get a size's label value."""
+    return size.value if size is not None else 'unsized'
+
+
+class SessionMetrics:
+    """The duration histograms, time violation counts and plugin overhead of a session.
+
+    Attributes:
+        timing_violations: Tests over their size's time limit, by size label.
+        baseline_violations: Tests over their performance baseline, by size label.
+        overhead: Seconds spent on the plugin's work, by phase.
+
+    """
+
+    __slots__ = ('_buckets', '_sums', 'baseline_violations', 'overhead', 'timing_violations')
+
+    def __init__(self) -> None:
+        """Initialize metrics with no observations."""
+        # Non-cumulative bucket counts, the last for durations over every bound
+        self._buckets: dict[tuple[str, str], array[int]] = {}
+        self._sums: dict[tuple[str, str], float] = {}
+        self.timing_violations: dict[str, int] = dict.fromkeys(_SIZE_LABELS[:-1], 0)
+        self.baseline_violations: dict[str, int] = dict.fromkeys(_SIZE_LABELS[:-1], 0)
+        self.overhead: dict[str, float] = {}
+
+    def _series(self, key: tuple[str, str]) -> array[int]:
+        """Get a series' bucket counts, adding the series if it is new."""
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            buckets = self._buckets[key] = array('q', bytes(8 * (len(DURATION_BUCKETS) + 1)))
+            self._sums[key] = 0.0
+        return buckets
+
+    def observe(self, size: TestSize | None, outcome: str, duration: float, baseline: float | None) -> None:
+        """Add a test's call phase.
+
+        A test with a baseline is checked against the baseline instead of its
+        size's time limit, as the timing sub-plugin does.
+
+        Args:
+            size: The test's size, or None if it has no size marker.
+            outcome: The outcome of the call phase, such as 'passed'.
+            duration: The call-phase duration in seconds.
+            baseline: The test's performance baseline in seconds, if it has one.
+
+        """
+        key = (_size_label(size), outcome)
+        self._series(key)[bisect_left(DURATION_BUCKETS, duration)] += 1
+        self._sums[key] += duration
+        violation = time_violation(size, duration, baseline) if size is not None else None
+        if violation == 'timing':
+            self.timing_violations[key[0]] += 1
+        elif violation == 'baseline':
+            self.baseline_violations[key[0]] += 1
+
+    def add_overhead(self, phase: str, seconds: float) -> None:
+        """Add seconds spent on the plugin's work in a phase, such as 'collection'."""
+        self.overhead[phase] = self.overhead.get(phase, 0.0) + seconds
+
+    def histogram(self, size: TestSize | None, outcome: str) -> tuple[list[int], float]:
+        """Get a series' cumulative bucket counts and duration sum.
+
+        Args:
+            size: The test size, or None for tests without a size marker.
+            outcome: The call-phase outcome.
+
+        Returns:
+            The count of durations up to each bound of DURATION_BUCKETS, then
+            the count of every duration, and the sum of the durations.
+
+        """
+        key = (_size_label(size), outcome)
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            return [0] * (len(DURATION_BUCKETS) + 1), 0.0
+        cumulative = []
+        total = 0
+        for count in buckets:
+            total += count
+            cumulative.append(total)
+        return cumulative, self._sums[key]
+
+    def to_dict(self) -> dict[str, object]:
+        """Serialize the metrics for xdist worker output.
+
+        Returns:
+            A dict of lists, str, int and float only, which execnet can send.
+
+        """
+        return {
+            'histograms': [
+                [size, outcome, buckets.tolist(), self._sums[size, outcome]]
+                for (size, outcome), buckets in self._buckets.items()
+            ],
+            'timing_violations': dict(self.timing_violations),
+            'baseline_violations': dict(self.baseline_violations),
+            'overhead': dict(self.overhead),
+        }
+
+    def merge(self, data: Mapping[str, object]) -> None:
+        """Add a worker's metrics to these.
+
+        Entries that are not of the form to_dict writes are skipped.
+
+        Args:
+            data: Metrics serialized by to_dict.
+
+        """
+        histograms = data.get('histograms')
+        for entry in histograms if isinstance(histograms, list) else ():
+            self._merge_histogram(entry)
+        for name, totals in (
+            ('timing_violations', self.timing_violations),
+            ('baseline_violations', self.baseline_violations),
+        ):
+            worker_totals = data.get(name)
+            if isinstance(worker_totals, dict):
+                for size, count in worker_totals.items():
+                    if size in totals and isinstance(count, int):
+                        totals[size] += count
+        overhead = data.get('overhead')
+        if isinstance(overhead, dict):
+            for phase, seconds in overhead.items():
+                if isinstance(phase, str) and isinstance(seconds, int | float):
+                    self.add_overhead(phase, seconds)
+
+    def _merge_histogram(self, entry: object) -> None:
+        """Add a worker's series, given as [size, outcome, bucket counts, duration sum]."""
+        if not isinstance(entry, list) or len(entry) != 4:  # noqa: PLR2004
+            return
+        size, outcome, counts, duration_sum = entry
+        if (
+            size not in _SIZE_LABELS
+            or not isinstance(outcome, str)
+            or not isinstance(counts, list)
+            or len(counts) != len(DURATION_BUCKETS) + 1
+            or not isinstance(duration_sum, int | float)
+        ):
+            return
+        buckets = self._series((size, outcome))
+        for index, count in enumerate(counts):
+            if isinstance(count, int):
+                buckets[index] += count
+        self._sums[size, outcome] += duration_sum
+
+    def render(self, stats: DistributionStats, hermeticity: Mapping[ViolationType, int]) -> str:
+        """Build the Prometheus text exposition of the session.
+
+        Args:
+            stats: The size counts of the collected tests.
+            hermeticity: Hermeticity violation counts by type.
+
+        Returns:
+            The exposition, ending with a newline.
+
+        """
+        counts = stats.counts.model_dump()
+        sized = sum(counts.values())
+        lines = [
+            '# HELP test_size_distribution Fraction of the collected sized tests of each size.',
+            '# TYPE test_size_distribution gauge',
+            *(
+                f'test_size_distribution{{size="{size}"}} {counts[size] / sized if sized else 0.0!r}'
+                for size in _SIZE_LABELS[:-1]
+            ),
+            '# HELP test_size_tests Collected tests of each size.',
+            '# TYPE test_size_tests gauge',
+            *(f'test_size_tests{{size="{size}"}} {counts[size]}' for size in _SIZE_LABELS[:-1]),
+            '# HELP test_duration_seconds Call-phase duration of tests by size and outcome.',
+            '# TYPE test_duration_seconds histogram',
+        ]
+        bounds = [repr(bound) for bound in DURATION_BUCKETS] + ['+Inf']
+        for size, outcome in sorted(self._buckets, key=lambda key: (_SIZE_LABELS.index(key[0]), key[1])):
+            labels = f'size="{size}",outcome="{outcome}"'
+            total = 0
+            for bound, count in zip(bounds, self._buckets[size, outcome], strict=True):
+                total += count
+                lines.append(f'test_duration_seconds_bucket{{{labels},le="{bound}"}} {total}')
+            lines.append(f'test_duration_seconds_sum{{{labels}}} {self._sums[size, outcome]!r}')
+            lines.append(f'test_duration_seconds_count{{{labels}}} {total}')
+        for name, description, totals in (
+            ('test_timing_violations_total', 'Tests over their size time limit.', self.timing_violations),
+            ('test_baseline_violations_total', 'Tests over their performance baseline.', self.baseline_violations),
+        ):
+            lines.append(f'# HELP {name} {description}')
+            lines.append(f'# TYPE {name} counter')
+            lines.extend(f'{name}{{size="{size}"}} {count}' for size, count in totals.items())
+        lines.extend(
+            (
+                '# HELP test_hermeticity_violations_total Hermeticity violations by resource type.',
+                '# TYPE test_hermeticity_violations_total counter',
+                *(
+                    f'test_hermeticity_violations_total{{type="{violation_type.value}"}} '
+                    f'{hermeticity.get(violation_type, 0)}'
+                    for violation_type in ViolationType
+                ),
+                '# HELP test_categories_overhead_seconds_total Seconds spent on the plugin work by phase.',
+                '# TYPE test_categories_overhead_seconds_total counter',
+                *(
+                    f'test_categories_overhead_seconds_total{{phase="{phase}"}} {seconds!r}'
+                    for phase, seconds in sorted(self.overhead.items())
+                ),
+            )
+        )
+        return '\n'.join(lines) + '\n'
+
+
+def write_metrics_file(path: Path, text: str) -> None:
+    """Replace a metrics file with the text in one rename.
+
+    The text is written to a hidden temporary file beside the metrics file,
+    whose name the textfile collector does not read, and then renamed over it.
+
+    Args:
+        path: Path of the metrics file; missing parent directories are created.
+        text: The exposition to write.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    temporary.write_text(text, encoding='utf-8')
+    temporary.replace(path)
@@ -0,0 +1,104 @@
+"""Session registry of test node IDs.
+
+Per-test data kept for the whole session, such as the columns of the test
+size report, is indexed by a small int instead of being keyed by the node ID
+string. The registry gives each node ID its int the first time it is seen and
+holds the one copy of the string the session keeps, so node IDs deserialized
+from xdist workers are not stored once per structure.
+
+Example:
+    >>> registry = NodeIdRegistry()
+    >>> registry.add('test_a.py::test_one'), registry.add('test_a.py::test_two')
+    (0, 1)
+    >>> registry.add('test_a.py::test_one')
+    0
+    >>> registry.nodeids[1]
+    'test_a.py::test_two'
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = ['NodeIdRegistry']
+
+
+class NodeIdRegistry:
+    """Maps each node ID to an int, assigned in the order node IDs are first added.
+
+    Attributes:
+        nodeids: The node IDs, each at the index of its int.
+
+    """
+
+    __slots__ = ('_ids', 'nodeids')
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._ids: dict[str, int] = {}
+        self.nodeids: list[str] = []
+
+    def __len__(self) -> int:
+        """Return the number of node IDs in the registry."""
+        return len(self.nodeids)
+
+    def __contains__(self, nodeid: object) -> bool:
+        """Return True if the node ID has been added."""
+        return nodeid in self._ids
+
+    def __repr__(self) -> str:
+        """Return a representation showing how many node IDs are registered."""
+        return f'NodeIdRegistry(nodeids={len(self.nodeids)})'
+
+    def add(self, nodeid: str) -> int:
+        """Get a node ID's int, assigning the next one if the node ID is new.
+
+        Args:
+            nodeid: The pytest node ID of a test.
+
+        Returns:
+            The node ID's int.
+
+        """
+        test_id = self._ids.get(nodeid)
+        if test_id is None:
+            test_id = len(self.nodeids)
+            self._ids[nodeid] = test_id
+            self.nodeids.append(nodeid)
+        return test_id
+
+    def add_all(self, nodeids: Iterable[str]) -> list[int]:
+        """Get the ints of many node IDs, assigning ints to the new ones.
+
+        Args:
+            nodeids: Pytest node IDs of tests.
+
+        Returns:
+            The int of each node ID, in order.
+
+        """
+        ids = self._ids
+        registered = self.nodeids
+        test_ids = []
+        for nodeid in nodeids:
+            test_id = ids.setdefault(nodeid, len(registered))
+            if test_id == len(registered):
+                registered.append(nodeid)
+            test_ids.append(test_id)
+        return test_ids
+
+    def get(self, nodeid: str) -> int | None:
+        """Get a node ID's int without adding it.
+
+        Args:
+            nodeid: The pytest node ID of a test.
+
+        Returns:
+            The node ID's int, or None if it has not been added.
+
+        """
+        return self._ids.get(nodeid)
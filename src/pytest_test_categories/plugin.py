@@ -9,6 +9,9 @@ The plugin's sole responsibility is:
 - Orchestrating calls to services through ports
 - Managing session lifecycle
 
+The per-test and xdist hooks live in feature sub-plugins (see the features
+package), which pytest_configure registers only when their feature is enabled.
+
 All business logic is delegated to services:
 - TestDiscoveryService: Finding test size markers
 - TimingValidationService: Validating test timing
@@ -28,8 +31,9 @@ that are easy to understand and maintain.
 from __future__ import annotations
 
 import json
+import time
 from collections import defaultdict
-from contextlib import ExitStack
+from dataclasses import replace
 from importlib.metadata import version
 from pathlib import Path
 from typing import (
@@ -39,6 +43,10 @@ from typing import (
 
 import pytest
 
+from pytest_test_categories.adapters.audit_hook import (
+    TIME_SLEEP_AUDITED,
+    AuditHookEnforcer,
+)
 from pytest_test_categories.adapters.database import DatabasePatchingBlocker
 from pytest_test_categories.adapters.external_systems import ExternalSystemsDetector
 from pytest_test_categories.adapters.filesystem import FilesystemPatchingBlocker
@@ -52,65 +60,145 @@ from pytest_test_categories.adapters.pytest_adapter import (
 )
 from pytest_test_categories.adapters.sleep import SleepPatchingBlocker
 from pytest_test_categories.adapters.threading import ThreadPatchingMonitor
+from pytest_test_categories.contracts import enable_debug_contracts
 from pytest_test_categories.distribution.config import (
     DEFAULT_DISTRIBUTION_CONFIG,
     DistributionConfig,
 )
 from pytest_test_categories.distribution.stats import (
     DistributionStats,
-    TestCounts,
+)
+from pytest_test_categories.duration_history import (
+    DEFAULT_REGRESSION_FACTOR,
+    derive_baseline,
+)
+from pytest_test_categories.enforcement_plan import (
+    NO_ENFORCEMENT_PLANS,
+    EnforcementPlan,
+    EnforcementPlans,
+    blocker_step,
+    external_systems_check,
+)
+from pytest_test_categories.features import (
+    CategorySchedulingPlugin,
+    DurationHistoryPlugin,
+    EnforcementPlugin,
+    JsonlReportPlugin,
+    MetricsPlugin,
+    ReportingPlugin,
+    ShardingPlugin,
+    SizePruningPlugin,
+    SpillPlugin,
+    SuggestionPlugin,
+    TieredExecutionPlugin,
+    TimeBudgetPlugin,
+    TimeoutWatchdogPlugin,
+    TimingPlugin,
+    TracePlugin,
+    XdistAggregationPlugin,
+)
+from pytest_test_categories.item_stash import (
+    ensure_discovery_service,
+    store_size_profile,
+    store_timing_ordinal,
 )
 from pytest_test_categories.json_report import JsonReport
+from pytest_test_categories.metrics import SessionMetrics
 from pytest_test_categories.ports.network import EnforcementMode
+from pytest_test_categories.pruning import parse_sizes
 from pytest_test_categories.services.distribution_validation import (
     DistributionValidationService,
     DistributionViolationError,
 )
 from pytest_test_categories.services.hermeticity_summary import HermeticitySummaryService
 from pytest_test_categories.services.suggestion_summary import SuggestionSummaryService
-from pytest_test_categories.services.test_discovery import TestDiscoveryService
+from pytest_test_categories.services.test_discovery import (
+    TestDiscoveryService,
+)
 from pytest_test_categories.services.test_reporting import TestReportingService
-from pytest_test_categories.services.timing_validation import TimingValidationService
+from pytest_test_categories.sharding import (
+    parse_shard,
+)
+from pytest_test_categories.spill import DEFAULT_SPILL_INTERVAL
 from pytest_test_categories.suggestion import (
     SuggestionCollector,
 )
-from pytest_test_categories.timers import WallTimer
-from pytest_test_categories.timing import (
-    PerformanceBaselineViolationError,
-    TimingViolationError,
+from pytest_test_categories.timers import (
+    TimingStore,
+    WallTimer,
 )
+from pytest_test_categories.timing import TIME_LIMITS
 from pytest_test_categories.types import (
+    EnforcementEngine,
+    PatchMode,
     TestSize,
-    TimerState,
 )
 from pytest_test_categories.violation_tracking import (
     ViolationTracker,
     ViolationType,
 )
 from pytest_test_categories.xdist_compat import (
-    WORKEROUTPUT_DISTRIBUTION_KEY,
-    WORKEROUTPUT_REPORT_KEY,
-    deserialize_distribution_counts,
     is_xdist_worker,
-    merge_report_data,
-    serialize_distribution_counts,
-    serialize_report_data,
+    is_xdist_worker_session,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
-
     import pytest_test_categories.types
     from pytest_test_categories.adapters.pytest_adapter import PytestConfigAdapter as PytestConfigAdapterType
+    from pytest_test_categories.budget import BudgetSelection
     from pytest_test_categories.distribution.stats import DistributionStats as DistributionStatsType
+    from pytest_test_categories.duration_history import (
+        DurationRecorder,
+        DurationStats,
+    )
     from pytest_test_categories.reporting import TestSizeReport
 
 # Package version for JSON report
 PLUGIN_VERSION = version('pytest-test-categories')
 
+# Plugin manager names of the feature sub-plugins
+BUDGET_PLUGIN_NAME = 'test_categories_budget'
+TIMING_PLUGIN_NAME = 'test_categories_timing'
+TRACE_PLUGIN_NAME = 'test_categories_trace'
+ENFORCEMENT_PLUGIN_NAME = 'test_categories_enforcement'
+HISTORY_PLUGIN_NAME = 'test_categories_duration_history'
+JSONL_REPORT_PLUGIN_NAME = 'test_categories_jsonl_report'
+METRICS_PLUGIN_NAME = 'test_categories_metrics'
+PRUNING_PLUGIN_NAME = 'test_categories_size_pruning'
+REPORTING_PLUGIN_NAME = 'test_categories_reporting'
+SCHEDULING_PLUGIN_NAME = 'test_categories_scheduling'
+SHARDING_PLUGIN_NAME = 'test_categories_sharding'
+SPILL_PLUGIN_NAME = 'test_categories_spill'
+SUGGESTION_PLUGIN_NAME = 'test_categories_suggestion'
+TIERED_PLUGIN_NAME = 'test_categories_tiered'
+WATCHDOG_PLUGIN_NAME = 'test_categories_timeout_watchdog'
+XDIST_AGGREGATION_PLUGIN_NAME = 'test_categories_xdist_aggregation'
+
 # Valid enforcement modes for ini option validation
 _VALID_ENFORCEMENT_MODES = {'off', 'warn', 'strict'}
 
+# Valid blocker patch modes for ini option validation
+_VALID_PATCH_MODES = {'test', 'session'}
+
+# Valid enforcement engines for ini option validation
+_VALID_ENFORCEMENT_ENGINES = {'patch', 'audit'}
+
+# Config attribute holding the session's compiled EnforcementPlans
+_ENFORCEMENT_PLANS_ATTR = '_test_categories_enforcement_plans'
+
+# Config attribute holding the debug-contracts setting to restore at unconfigure
+_PREVIOUS_DEBUG_CONTRACTS_ATTR = '_test_categories_previous_debug_contracts'
+
+# Config attributes holding blockers that support session-wide installation
+_SESSION_BLOCKER_ATTRS = (
+    '_test_categories_network_blocker',
+    '_test_categories_filesystem_blocker',
+    '_test_categories_process_blocker',
+    '_test_categories_sleep_blocker',
+    '_test_categories_database_blocker',
+    '_test_categories_thread_monitor',
+)
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add plugin-specific command-line options.
@@ -128,16 +216,33 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         '--test-size-report',
         action='store',
         default=None,
-        choices=[None, 'basic', 'detailed', 'json'],
+        choices=[None, 'basic', 'detailed', 'json', 'jsonl'],
         nargs='?',
         const='basic',
-        help='Generate a report of test sizes (basic, detailed, or json)',
+        help='Generate a report of test sizes (basic, detailed, json, or jsonl)',
     )
     group.addoption(
         '--test-size-report-file',
         action='store',
         default=None,
-        help='Output file path for JSON report (requires --test-size-report=json)',
+        help=(
+            'Output file path for JSON report (requires --test-size-report=json or jsonl; '
+            'a jsonl file ending in .gz is gzip-compressed)'
+        ),
+    )
+    group.addoption(
+        '--test-categories-metrics-file',
+        action='store',
+        default=None,
+        metavar='PATH',
+        help='Write the session metrics to this file in the Prometheus text format, for a textfile collector.',
+    )
+    group.addoption(
+        '--test-categories-trace',
+        action='store',
+        default=None,
+        metavar='PATH',
+        help='Write a timeline of every test to this file in the Trace Event Format, for Perfetto or chrome://tracing.',
     )
     group.addoption(
         '--test-categories-enforcement',
@@ -151,6 +256,156 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         help='Enforcement mode for test hermeticity: off (default), warn, or strict',
         default='off',
     )
+    group.addoption(
+        '--test-categories-patch-mode',
+        action='store',
+        default=None,
+        choices=['test', 'session'],
+        help='When resource blockers patch the stdlib: per test (default) or once per session. Overrides ini option.',
+    )
+    parser.addini(
+        'test_categories_patch_mode',
+        help='Resource blocker patch mode: test (default) patches per test, session patches once',
+        default='test',
+    )
+    group.addoption(
+        '--test-categories-engine',
+        action='store',
+        default=None,
+        choices=['patch', 'audit'],
+        help='How resource access is intercepted: patch (default) or audit (sys.addaudithook). Overrides ini option.',
+    )
+    parser.addini(
+        'test_categories_engine',
+        help='Resource enforcement engine: patch (default) monkeypatches the stdlib, audit uses CPython audit hooks',
+        default='patch',
+    )
+    group.addoption(
+        '--test-categories-enforce-timeout',
+        action='store_true',
+        default=False,
+        help='Interrupt tests as soon as they exceed their size time limit instead of failing them afterwards.',
+    )
+    parser.addini(
+        'test_categories_enforce_timeout',
+        help='Interrupt tests as soon as they exceed their size time limit (default: false)',
+        type='bool',
+        default=False,
+    )
+    group.addoption(
+        '--test-categories-history',
+        action='store_true',
+        default=False,
+        help='Keep per-test duration history in .pytest_cache and flag tests that regress against it.',
+    )
+    parser.addini(
+        'test_categories_history',
+        help='Keep per-test duration history in .pytest_cache (default: false)',
+        type='bool',
+        default=False,
+    )
+    group.addoption(
+        '--test-categories-regression-factor',
+        action='store',
+        type=float,
+        default=None,
+        help=(
+            f'Flag tests slower than this many times their average duration (default: {DEFAULT_REGRESSION_FACTOR}). '
+            'Overrides ini option.'
+        ),
+    )
+    parser.addini(
+        'test_categories_regression_factor',
+        help=f'Duration regression factor for the history (default: {DEFAULT_REGRESSION_FACTOR})',
+        default='',
+    )
+    group.addoption(
+        '--test-categories-derive-baselines',
+        action='store_true',
+        default=False,
+        help='Give tests without a timeout= baseline one derived from their duration history.',
+    )
+    parser.addini(
+        'test_categories_derive_baselines',
+        help='Derive per-test baselines from the duration history (default: false)',
+        type='bool',
+        default=False,
+    )
+    group.addoption(
+        '--test-categories-schedule',
+        action='store_true',
+        default=False,
+        help='With pytest-xdist load distribution, run the longest expected tests first and batch small tests.',
+    )
+    parser.addini(
+        'test_categories_schedule',
+        help='Schedule xdist tests longest-expected-first (default: false)',
+        type='bool',
+        default=False,
+    )
+    group.addoption(
+        '--test-categories-spill-interval',
+        action='store',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help=(
+            'Seconds xdist workers buffer results for before spilling them to disk for crash recovery '
+            f'(default: {DEFAULT_SPILL_INTERVAL}). Overrides ini option.'
+        ),
+    )
+    parser.addini(
+        'test_categories_spill_interval',
+        help=f'Seconds between xdist worker spill file writes (default: {DEFAULT_SPILL_INTERVAL})',
+        default='',
+    )
+    group.addoption(
+        '--test-categories-tiered',
+        action='store_true',
+        default=False,
+        help='Run small, medium, large and xlarge tests in turn and skip the later tiers once a tier fails.',
+    )
+    parser.addini(
+        'test_categories_tiered',
+        help='Run the tests one size tier at a time, stopping after a failing tier (default: false)',
+        type='bool',
+        default=False,
+    )
+    group.addoption(
+        '--test-categories-shard',
+        action='store',
+        default=None,
+        metavar='INDEX/COUNT',
+        help='Run only shard INDEX (1-based) of COUNT shards balanced by expected duration and size, such as 3/12.',
+    )
+    group.addoption(
+        '--test-categories-shard-history',
+        action='store',
+        default=None,
+        metavar='PATH',
+        help='Balance the shards with the duration history database at PATH, which every shard must share.',
+    )
+    group.addoption(
+        '--test-categories-budget',
+        action='store',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help='Run only the most valuable tests expected to fit in SECONDS, favoring small, failed and changed tests.',
+    )
+    group.addoption(
+        '--test-categories-sizes',
+        action='store',
+        default=None,
+        metavar='SIZES',
+        help='Run only tests of these comma-separated sizes, such as small,medium, without importing other test files.',
+    )
+    group.addoption(
+        '--test-categories-debug-contracts',
+        action='store_true',
+        default=False,
+        help='Run contract and type checks in the timer and resource blockers (slower; for debugging the plugin).',
+    )
 
     # Distribution enforcement options
     group.addoption(
@@ -272,26 +527,74 @@ def pytest_configure(config: pytest.Config) -> None:
     if config_adapter.get_option('--test-categories-suggest'):
         session_state.suggestion_collector = SuggestionCollector()
 
+    # Initialize the session metrics if a metrics file is requested
+    session_state.session_metrics = SessionMetrics() if _get_metrics_path(config) is not None else None
+
+    # Contract checks are off by default to keep the per-test hot path lean
+    if config_adapter.get_option('--test-categories-debug-contracts'):
+        setattr(config, _PREVIOUS_DEBUG_CONTRACTS_ATTR, enable_debug_contracts())
+
+    # Register the audit hook or session-wide blocker wrappers up front
+    if _get_enforcement_mode(config) != EnforcementMode.OFF:
+        _install_enforcement_engine(config)
+
+    # Compile the per-size blocker activations used by the enforcement sub-plugin
+    setattr(config, _ENFORCEMENT_PLANS_ATTR, _compile_enforcement_plans(config))
+
+    # Register only the per-test hooks the resolved settings need
+    _register_feature_plugins(config, session_state)
+
+
+@pytest.hookimpl
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove any blocker wrappers installed for the whole session.
+
+    Args:
+        config: The pytest configuration object.
+
+    """
+    _uninstall_session_blockers(config)
+    previous_debug_contracts = getattr(config, _PREVIOUS_DEBUG_CONTRACTS_ATTR, None)
+    if previous_debug_contracts is not None:
+        enable_debug_contracts(enabled=previous_debug_contracts)
+
 
 @pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
     """Count tests by size and append size labels to test IDs."""
+    started = time.perf_counter()
     config_adapter = PytestConfigAdapter(config)
     session_state = config_adapter.get_plugin_state()
-    discovery_service = _ensure_discovery_service(session_state)
+    discovery_service = ensure_discovery_service(session_state)
 
     # Get suggestion collector if in suggest mode
     suggestion_collector = cast('SuggestionCollector | None', session_state.suggestion_collector)
 
-    # Count tests by size using the discovery service
+    # Duration history for tests that get a baseline derived from it
+    history_stats: dict[str, DurationStats] | None = None
+    if session_state.duration_recorder is not None and _get_derive_baselines(config):
+        history_stats = cast('DurationRecorder', session_state.duration_recorder).stats
+        baseline_factor = _get_regression_factor(config)
+
+    # Count tests by size and resolve each item's size profile and timing slot once for the runtime hooks.
+    # This runs before sharding, so every shard counts the whole suite and distribution checks agree.
     counts: dict[TestSize, int] = defaultdict(int)
-    for item in items:
+    for ordinal, item in enumerate(items):
         item_adapter = PytestItemAdapter(item)
-        test_size = discovery_service.find_test_size(item_adapter)
+        profile = discovery_service.get_size_profile(item_adapter)
+        test_size = profile.size
         if test_size:
             counts[test_size] += 1
             # Append size label to test node ID
-            item_adapter.set_nodeid(f'{item_adapter.nodeid} {test_size.label}')
+            item_adapter.set_nodeid(f'{item_adapter.nodeid} {profile.label}')
+            if history_stats is not None and profile.timeout is None:
+                baseline = derive_baseline(
+                    history_stats.get(item.nodeid), baseline_factor, TIME_LIMITS[test_size].limit
+                )
+                if baseline is not None:
+                    profile = replace(profile, timeout=baseline)
+        store_size_profile(item, profile)
+        store_timing_ordinal(item, ordinal)
 
         # Record current size in suggestion collector (includes None for uncategorized)
         if suggestion_collector is not None:
@@ -302,6 +605,16 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
     updated_stats = current_stats.update_counts(counts=counts)
     config_adapter.set_distribution_stats(updated_stats)
 
+    # Preallocate timing slots for every collected item
+    if session_state.timing_store is None:
+        session_state.timing_store = TimingStore(len(items))
+    else:
+        cast('TimingStore', session_state.timing_store).reserve(len(items))
+
+    session_metrics = cast('SessionMetrics | None', session_state.session_metrics)
+    if session_metrics is not None:
+        session_metrics.add_overhead('collection', time.perf_counter() - started)
+
 
 @pytest.hookimpl
 def pytest_collection_finish(session: pytest.Session) -> None:
@@ -336,218 +649,6 @@ def pytest_collection_finish(session: pytest.Session) -> None:
         raise pytest.UsageError(str(e)) from e
 
 
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_protocol(item: pytest.Item, nextitem: pytest.Item | None) -> Generator[None, None, None]:  # noqa: ARG001
-    """Track test timing during execution."""
-    config_adapter = PytestConfigAdapter(item.config)
-    session_state = config_adapter.get_plugin_state()
-    discovery_service = _ensure_discovery_service(session_state)
-
-    # Add test to report if reporting is enabled
-    if session_state.test_size_report is not None:
-        item_adapter = PytestItemAdapter(item)
-        test_size = discovery_service.find_test_size(item_adapter)
-        reporting_service = TestReportingService()
-        test_report = cast('TestSizeReport', session_state.test_size_report)
-        reporting_service.add_test_to_report(test_report, item.nodeid, test_size)
-
-    # Create and start timer for this test
-    if item.nodeid not in session_state.timers:
-        # Type narrowing: timer_factory is guaranteed to be set in pytest_configure
-        if session_state.timer_factory is None:
-            msg = 'timer_factory must be initialized in pytest_configure'
-            raise RuntimeError(msg)
-        timer = session_state.timer_factory(state=TimerState.READY)
-        session_state.timers[item.nodeid] = timer
-    else:
-        timer = session_state.timers[item.nodeid]
-
-    try:
-        timer.start()
-        yield  # Let the test run
-    finally:
-        # Ensure timer is always stopped, even if test fails
-        if timer.state == TimerState.RUNNING:
-            timer.stop()
-
-
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_call(item: pytest.Item) -> Generator[None, None, None]:  # noqa: PLR0915
-    """Block resources based on test size during execution and monitor threading.
-
-    This hook enforces resource isolation based on test size and enforcement
-    configuration. When enforcement is enabled (strict or warn):
-
-    Network access (based on Google's test size definitions):
-    - Small tests: All network blocked (BLOCK_ALL)
-    - Medium tests: Localhost only (LOCALHOST_ONLY)
-    - Large/XLarge tests: Full network access (ALLOW_ALL)
-
-    Filesystem and process isolation (small tests only):
-    - Small tests: Filesystem access blocked (no escape hatches)
-    - Small tests: Subprocess spawning blocked
-    - Small tests: Database connections blocked
-    - Small tests: Thread creation warnings emitted
-
-    External systems detection (medium tests only):
-    - Medium tests: Warn if testcontainers/docker imported (unless suppressed)
-    - Suppressed via @pytest.mark.medium(allow_external_systems=True)
-
-    Note: Thread monitoring WARNS instead of blocking because many libraries
-    use threading internally. Blocking would break legitimate test infrastructure.
-
-    Uses ExitStack pattern to manage all resource blockers together,
-    ensuring proper cleanup even if exceptions occur.
-
-    Args:
-        item: The test item being executed.
-
-    Yields:
-        Control to pytest to run the test.
-
-    """
-    enforcement_mode = _get_enforcement_mode(item.config)
-
-    if enforcement_mode == EnforcementMode.OFF:
-        yield
-        return
-
-    config_adapter = PytestConfigAdapter(item.config)
-    session_state = config_adapter.get_plugin_state()
-    discovery_service = _ensure_discovery_service(session_state)
-    item_adapter = PytestItemAdapter(item)
-    test_size = discovery_service.find_test_size(item_adapter)
-
-    # Large, XLarge, and unsized tests have no restrictions
-    if test_size is None or test_size in (TestSize.LARGE, TestSize.XLARGE):
-        yield
-        return
-
-    # Use ExitStack for combined resource blocking
-    # At this point test_size is guaranteed to be SMALL or MEDIUM
-    with ExitStack() as stack:
-        # Network blocking applies to both small and medium tests
-        # - Small: BLOCK_ALL (no network)
-        # - Medium: LOCALHOST_ONLY (localhost only)
-        network_blocker = _get_network_blocker(item.config)
-        network_blocker.current_test_nodeid = item.nodeid
-        network_blocker.activate(test_size, enforcement_mode)
-        stack.callback(_safe_deactivate_network, network_blocker)
-
-        # Filesystem and process blocking only applies to small tests
-        if test_size == TestSize.SMALL:
-            # Activate filesystem blocker - blocks ALL filesystem access (no exceptions)
-            filesystem_blocker = _get_filesystem_blocker(item.config)
-            filesystem_blocker.current_test_nodeid = item.nodeid
-            filesystem_blocker.activate(test_size, enforcement_mode, frozenset())
-            stack.callback(_safe_deactivate_filesystem, filesystem_blocker)
-
-            # Activate process blocker
-            process_blocker = _get_process_blocker(item.config)
-            process_blocker.current_test_nodeid = item.nodeid
-            process_blocker.activate(test_size, enforcement_mode)
-            stack.callback(_safe_deactivate_process, process_blocker)
-
-            # Activate sleep blocker
-            sleep_blocker = _get_sleep_blocker(item.config)
-            sleep_blocker.current_test_nodeid = item.nodeid
-            sleep_blocker.activate(test_size, enforcement_mode)
-            stack.callback(_safe_deactivate_sleep, sleep_blocker)
-
-        # Activate database blocker
-        database_blocker = _get_database_blocker(item.config)
-        database_blocker.current_test_nodeid = item.nodeid
-        database_blocker.activate(test_size, enforcement_mode)
-        stack.callback(_safe_deactivate_database, database_blocker)
-
-        # Activate thread monitor (warns instead of blocking)
-        thread_monitor = _get_thread_monitor(item.config)
-        thread_monitor.current_test_nodeid = item.nodeid
-        thread_monitor.activate(test_size, enforcement_mode)
-        stack.callback(_safe_deactivate_thread_monitor, thread_monitor)
-
-        # External systems detection for MEDIUM tests only
-        # Per Google's test sizes, external systems are DISCOURAGED (not prohibited)
-        external_systems_detector: ExternalSystemsDetector | None = None
-        if test_size == TestSize.MEDIUM:
-            # Check if warning is suppressed via marker kwarg
-            marker_kwargs = item_adapter.get_marker_kwargs('medium')
-            allow_external = marker_kwargs.get('allow_external_systems', False)
-
-            if not allow_external:
-                external_systems_detector = _get_external_systems_detector(item.config)
-                external_systems_detector.current_test_nodeid = item.nodeid
-                external_systems_detector.activate(test_size, enforcement_mode)
-                stack.callback(_safe_deactivate_external_systems, external_systems_detector)
-
-        yield
-
-        # After test execution, check for external systems imports (medium tests only)
-        if external_systems_detector is not None and external_systems_detector.is_active:
-            detected = external_systems_detector.check_external_systems_detected()
-            if detected:
-                external_systems_detector.on_external_systems_detected(detected, item.nodeid)
-
-
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_makereport(item: pytest.Item) -> Generator[None, None, None]:
-    """Validate timing and update test reports.
-
-    Args:
-        item: The test item that ran.
-
-    Yields:
-        Control to pytest to generate the report.
-
-    """
-    config_adapter = PytestConfigAdapter(item.config)
-    session_state = config_adapter.get_plugin_state()
-    discovery_service = _ensure_discovery_service(session_state)
-    item_adapter = PytestItemAdapter(item)
-    test_size = discovery_service.find_test_size(item_adapter)
-
-    outcome = yield
-    report = outcome.get_result()  # type: ignore[attr-defined]
-
-    # Only process call phase reports
-    if report.when != 'call':
-        return
-
-    # Get duration once for both validation and reporting
-    timer = session_state.timers.get(item.nodeid)
-    timing_service = TimingValidationService()
-    duration = timing_service.get_test_duration(
-        timer,
-        report.duration if hasattr(report, 'duration') else None,
-    )
-
-    # Validate timing if test has a size marker
-    if test_size and duration is not None:
-        try:
-            # Check for custom timeout baseline from marker
-            custom_timeout = discovery_service.get_timeout(item_adapter)
-            timing_service.validate_timing_with_baseline(test_size, duration, custom_timeout, item.nodeid)
-        except (PerformanceBaselineViolationError, TimingViolationError, ValueError) as e:
-            report.longrepr = str(e)
-            report.outcome = 'failed'
-
-    # Update test size report if enabled
-    if session_state.test_size_report is not None:
-        test_report = cast('TestSizeReport', session_state.test_size_report)
-        TestReportingService().update_test_result(
-            test_report,
-            item.nodeid,
-            report.outcome,
-            duration,
-        )
-        timing_service.cleanup_timer(session_state.timers, item.nodeid)
-
-    # Record execution time in suggestion collector if in suggest mode
-    suggestion_collector = cast('SuggestionCollector | None', session_state.suggestion_collector)
-    if suggestion_collector is not None and duration is not None:
-        suggestion_collector.record_execution_time(item.nodeid, duration)
-
-
 @pytest.hookimpl
 def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
     """Write distribution summary, hermeticity violations, and optional size report."""
@@ -576,7 +677,8 @@ def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
             _write_json_report(test_report, stats, config_adapter, terminalreporter, violation_tracker)
         elif report_type == 'detailed':
             test_report.write_detailed_report(terminalreporter)
-        else:
+        # The jsonl report is written as tests finish, by the jsonl report sub-plugin
+        elif report_type != 'jsonl':
             test_report.write_basic_report(terminalreporter)
 
     # Write suggestion summary if in suggest mode
@@ -591,122 +693,108 @@ def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
             _write_suggestion_json_report(suggestion_collector, json_output_path)
 
 
-# =============================================================================
-# pytest-xdist Compatibility Hooks
-# =============================================================================
+def _register_feature_plugins(config: pytest.Config, session_state: pytest_test_categories.types.PluginState) -> None:
+    """Register the feature sub-plugins the session needs.
 
-
-@pytest.hookimpl
-def pytest_sessionfinish(session: pytest.Session) -> None:
-    """Send distribution stats and report data to controller when running as xdist worker.
-
-    When running with pytest-xdist, workers collect and run tests but the terminal
-    summary is displayed by the controller. This hook sends the worker's stats back
-    to the controller via the workeroutput mechanism.
+    Features that are turned off are never registered, so their per-test
+    hooks cost nothing. Timing is always registered because time limits are
+    part of the test size definitions.
 
     Args:
-        session: The pytest session object.
+        config: The pytest configuration object.
+        session_state: The plugin state for the session.
 
     """
-    if not is_xdist_worker():
-        return
-
-    # Get config and check for workeroutput (only present on workers)
-    config = session.config
-    workeroutput = getattr(config, 'workeroutput', None)
-    if workeroutput is None:
-        return
+    plugin_manager = config.pluginmanager
+    plugin_manager.register(TimingPlugin(session_state), TIMING_PLUGIN_NAME)
 
-    config_adapter = PytestConfigAdapter(config)
-    session_state = config_adapter.get_plugin_state()
-    stats = config_adapter.get_distribution_stats()
+    if _get_enforce_timeout(config):
+        plugin_manager.register(TimeoutWatchdogPlugin(session_state), WATCHDOG_PLUGIN_NAME)
 
-    # Serialize and send distribution counts
-    if stats is not None:
-        workeroutput[WORKEROUTPUT_DISTRIBUTION_KEY] = serialize_distribution_counts(stats.counts)
+    plans = _get_enforcement_plans(config)
+    if plans is not NO_ENFORCEMENT_PLANS:
+        plugin_manager.register(EnforcementPlugin(plans, session_state), ENFORCEMENT_PLUGIN_NAME)
 
-    # Serialize and send report data if reporting is enabled
     if session_state.test_size_report is not None:
         test_report = cast('TestSizeReport', session_state.test_size_report)
-        workeroutput[WORKEROUTPUT_REPORT_KEY] = serialize_report_data(test_report)
-
+        reporting_plugin = ReportingPlugin(test_report, session_state, is_worker=is_xdist_worker_session(config))
+        plugin_manager.register(reporting_plugin, REPORTING_PLUGIN_NAME)
+        jsonl_report_path = _get_jsonl_report_path(config)
+        if jsonl_report_path is not None and not is_xdist_worker_session(config):
+            plugin_manager.register(
+                JsonlReportPlugin(config, test_report, jsonl_report_path, PLUGIN_VERSION), JSONL_REPORT_PLUGIN_NAME
+            )
+
+    # The history lives in .pytest_cache, so it needs the cache plugin
+    if _get_history_enabled(config) and plugin_manager.has_plugin('cacheprovider'):
+        plugin_manager.register(
+            DurationHistoryPlugin(session_state, _get_regression_factor(config)), HISTORY_PLUGIN_NAME
+        )
 
-@pytest.hookimpl(optionalhook=True)
-def pytest_testnodedown(node: object, error: object | None) -> None:  # noqa: ARG001
-    """Aggregate distribution stats from a worker when it shuts down.
+    if session_state.suggestion_collector is not None:
+        suggestion_collector = cast('SuggestionCollector', session_state.suggestion_collector)
+        plugin_manager.register(SuggestionPlugin(suggestion_collector), SUGGESTION_PLUGIN_NAME)
 
-    This xdist hook is called on the controller when a worker node completes.
-    We use it to aggregate the distribution counts and report data from all workers.
+    _register_export_plugins(config, session_state)
+    _register_selection_plugins(config, session_state)
 
-    Args:
-        node: The xdist WorkerController node that shut down.
-        error: Error if the worker crashed, None otherwise.
+    if is_xdist_worker() or plugin_manager.hasplugin('xdist'):
+        plugin_manager.register(XdistAggregationPlugin(config), XDIST_AGGREGATION_PLUGIN_NAME)
+        plugin_manager.register(SpillPlugin(config, _get_spill_interval(config)), SPILL_PLUGIN_NAME)
 
-    """
-    # This hook only runs on controller, but verify we're not a worker
-    if is_xdist_worker():
-        return
+    # Only the controller schedules tests
+    if not is_xdist_worker() and plugin_manager.hasplugin('xdist') and _get_schedule_enabled(config):
+        plugin_manager.register(
+            CategorySchedulingPlugin(session_state, tiered=_get_tiered(config)), SCHEDULING_PLUGIN_NAME
+        )
 
-    # Access workeroutput from the node
-    workeroutput = getattr(node, 'workeroutput', None)
-    if workeroutput is None:
-        return
 
-    # Get controller's config from the node
-    config = getattr(node, 'config', None)
-    if config is None:
-        return
+def _register_export_plugins(config: pytest.Config, session_state: pytest_test_categories.types.PluginState) -> None:
+    """Register the sub-plugins that write the session's metrics and trace files.
 
-    config_adapter = PytestConfigAdapter(config)
-    session_state = config_adapter.get_plugin_state()
+    Args:
+        config: The pytest configuration object.
+        session_state: The plugin state for the session.
 
-    # Get distribution counts from worker
-    # With xdist, each worker collects ALL tests but only runs assigned ones.
-    # The distribution counts from any worker represent the full test suite,
-    # so we only need to take the counts from the first worker (controller starts at 0).
-    worker_dist_data = workeroutput.get(WORKEROUTPUT_DISTRIBUTION_KEY)
-    if worker_dist_data is not None:
-        worker_counts = deserialize_distribution_counts(worker_dist_data)
-        current_stats = config_adapter.get_distribution_stats()
-
-        # Only update if controller hasn't been populated yet (counts are all 0)
-        # This ensures we use the first worker's counts and don't double-count
-        current_total = (
-            current_stats.counts.small
-            + current_stats.counts.medium
-            + current_stats.counts.large
-            + current_stats.counts.xlarge
-        )
+    """
+    plugin_manager = config.pluginmanager
+    metrics_path = _get_metrics_path(config)
+    if metrics_path is not None and session_state.session_metrics is not None:
+        session_metrics = cast('SessionMetrics', session_state.session_metrics)
+        plugin_manager.register(MetricsPlugin(config, session_metrics, metrics_path), METRICS_PLUGIN_NAME)
 
-        if current_total == 0:
-            updated_stats = DistributionStats(counts=TestCounts(**worker_counts))
-            config_adapter.set_distribution_stats(updated_stats)
+    trace_path = _get_trace_path(config)
+    if trace_path is not None:
+        plugin_manager.register(TracePlugin(config, session_state, trace_path), TRACE_PLUGIN_NAME)
 
-    # Aggregate report data from worker
-    worker_report_data = workeroutput.get(WORKEROUTPUT_REPORT_KEY)
-    if worker_report_data is not None and session_state.test_size_report is not None:
-        test_report = cast('TestSizeReport', session_state.test_size_report)
-        merge_report_data(test_report, worker_report_data)
 
+def _register_selection_plugins(config: pytest.Config, session_state: pytest_test_categories.types.PluginState) -> None:
+    """Register the sub-plugins that choose which tests run.
 
-def _ensure_discovery_service(session_state: pytest_test_categories.types.PluginState) -> TestDiscoveryService:
-    """Ensure TestDiscoveryService is initialized.
+    Args:
+        config: The pytest configuration object.
+        session_state: The plugin state for the session.
 
-    This is a helper function that creates the discovery service if it
-    doesn't exist. This should never be needed in normal operation (the
-    service is created in pytest_configure), but provides a safety net.
+    """
+    plugin_manager = config.pluginmanager
+    # Registered first so its trylast hook shards before tiering and the time budget
+    shard = _get_shard(config)
+    if shard is not None:
+        plugin_manager.register(
+            ShardingPlugin(session_state, shard, _get_shard_history(config)),
+            SHARDING_PLUGIN_NAME,
+        )
 
-    Args:
-        session_state: The plugin state containing the discovery service.
+    if _get_tiered(config):
+        plugin_manager.register(TieredExecutionPlugin(session_state), TIERED_PLUGIN_NAME)
 
-    Returns:
-        The TestDiscoveryService instance.
+    budget = _get_budget(config)
+    if budget is not None:
+        plugin_manager.register(TimeBudgetPlugin(session_state, budget), BUDGET_PLUGIN_NAME)
 
-    """
-    if session_state.test_discovery_service is None:
-        warning_system = PytestWarningAdapter()
-        session_state.test_discovery_service = TestDiscoveryService(warning_system=warning_system)
-    return cast('TestDiscoveryService', session_state.test_discovery_service)
+    sizes = _get_sizes(config)
+    if sizes is not None:
+        plugin_manager.register(SizePruningPlugin(session_state, sizes), PRUNING_PLUGIN_NAME)
 
 
 def _get_enforcement_mode(config: pytest.Config) -> EnforcementMode:
@@ -732,6 +820,488 @@ def _get_enforcement_mode(config: pytest.Config) -> EnforcementMode:
     return EnforcementMode.OFF
 
 
+def _get_patch_mode(config: pytest.Config) -> PatchMode:
+    """Get the blocker patch mode from configuration.
+
+    CLI option takes precedence over ini setting.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The PatchMode enum value.
+
+    """
+    cli_value = config.getoption('--test-categories-patch-mode', default=None)
+    if cli_value is not None:
+        return PatchMode(cli_value)
+
+    ini_value = config.getini('test_categories_patch_mode')
+    if ini_value and ini_value in _VALID_PATCH_MODES:
+        return PatchMode(ini_value)
+
+    return PatchMode.TEST
+
+
+def _get_enforcement_engine(config: pytest.Config) -> EnforcementEngine:
+    """Get the resource enforcement engine from configuration.
+
+    CLI option takes precedence over ini setting.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The EnforcementEngine enum value.
+
+    """
+    cli_value = config.getoption('--test-categories-engine', default=None)
+    if cli_value is not None:
+        return EnforcementEngine(cli_value)
+
+    ini_value = config.getini('test_categories_engine')
+    if ini_value and ini_value in _VALID_ENFORCEMENT_ENGINES:
+        return EnforcementEngine(ini_value)
+
+    return EnforcementEngine.PATCH
+
+
+def _get_enforce_timeout(config: pytest.Config) -> bool:
+    """Get whether the timeout watchdog interrupts tests past their time limit.
+
+    The CLI flag enables the watchdog regardless of the ini setting.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        True if tests should be interrupted once they exceed their time limit.
+
+    """
+    if config.getoption('--test-categories-enforce-timeout', default=False):
+        return True
+    return bool(config.getini('test_categories_enforce_timeout'))
+
+
+def _get_history_enabled(config: pytest.Config) -> bool:
+    """Get whether per-test duration history is kept.
+
+    Deriving baselines needs the history, so it enables it too.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        True if durations should be recorded in the history.
+
+    """
+    if config.getoption('--test-categories-history', default=False) or _get_derive_baselines(config):
+        return True
+    return bool(config.getini('test_categories_history'))
+
+
+def _get_derive_baselines(config: pytest.Config) -> bool:
+    """Get whether tests without a timeout= baseline get one derived from their history.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        True if baselines should be derived.
+
+    """
+    if config.getoption('--test-categories-derive-baselines', default=False):
+        return True
+    return bool(config.getini('test_categories_derive_baselines'))
+
+
+def _get_regression_factor(config: pytest.Config) -> float:
+    """Get the factor of a test's average duration that counts as a regression.
+
+    CLI option takes precedence over ini setting.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The regression factor.
+
+    Raises:
+        pytest.UsageError: If the factor is not a number greater than 1.
+
+    """
+    factor = config.getoption('--test-categories-regression-factor', default=None)
+    if factor is None:
+        ini_value = config.getini('test_categories_regression_factor')
+        try:
+            factor = float(ini_value) if isinstance(ini_value, str) and ini_value.strip() else DEFAULT_REGRESSION_FACTOR
+        except ValueError:
+            msg = f'test_categories_regression_factor must be a number, got {ini_value!r}'
+            raise pytest.UsageError(msg) from None
+    if factor <= 1.0:
+        msg = f'--test-categories-regression-factor must be greater than 1, got {factor}'
+        raise pytest.UsageError(msg)
+    return factor
+
+
+def _get_spill_interval(config: pytest.Config) -> float:
+    """Get how many seconds xdist workers buffer results for before spilling them.
+
+    CLI option takes precedence over ini setting.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The flush interval in seconds; 0 writes each record as it is made.
+
+    Raises:
+        pytest.UsageError: If the interval is not a number of seconds of at least 0.
+
+    """
+    interval = config.getoption('--test-categories-spill-interval', default=None)
+    if interval is None:
+        ini_value = config.getini('test_categories_spill_interval')
+        try:
+            interval = float(ini_value) if isinstance(ini_value, str) and ini_value.strip() else DEFAULT_SPILL_INTERVAL
+        except ValueError:
+            msg = f'test_categories_spill_interval must be a number, got {ini_value!r}'
+            raise pytest.UsageError(msg) from None
+    if interval < 0:
+        msg = f'--test-categories-spill-interval must be at least 0, got {interval}'
+        raise pytest.UsageError(msg)
+    return interval
+
+
+def _get_schedule_enabled(config: pytest.Config) -> bool:
+    """Get whether xdist tests are scheduled longest-expected-first.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        True if the size-aware xdist scheduler should be used.
+
+    """
+    if config.getoption('--test-categories-schedule', default=False):
+        return True
+    return bool(config.getini('test_categories_schedule'))
+
+
+def _get_tiered(config: pytest.Config) -> bool:
+    """Get whether the tests run one size tier at a time.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        True if later tiers are skipped once a tier fails.
+
+    """
+    if config.getoption('--test-categories-tiered', default=False):
+        return True
+    return bool(config.getini('test_categories_tiered'))
+
+
+def _get_shard(config: pytest.Config) -> tuple[int, int] | None:
+    """Get the shard of the suite this session runs.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The 0-based shard index and the shard count, or None to run every test.
+
+    Raises:
+        pytest.UsageError: If the option is not a valid INDEX/COUNT.
+
+    """
+    value = config.getoption('--test-categories-shard', default=None)
+    if not isinstance(value, str):
+        return None
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise pytest.UsageError(str(e)) from e
+
+
+def _get_shard_history(config: pytest.Config) -> Path | None:
+    """Get the duration history database every shard balances with.
+
+    The session's own history is not used: each machine has its own
+    .pytest_cache, and shards that balance with different histories
+    disagree on the assignment.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The database path, or None to balance by size time limits.
+
+    Raises:
+        pytest.UsageError: If the database does not exist.
+
+    """
+    file_path = config.getoption('--test-categories-shard-history', default=None)
+    if not file_path:
+        return None
+    path = Path(str(file_path))
+    if not path.is_file():
+        # A shard that balanced without it would disagree with the others
+        msg = f'--test-categories-shard-history: {path} does not exist'
+        raise pytest.UsageError(msg)
+    return path
+
+
+def _get_budget(config: pytest.Config) -> float | None:
+    """Get the time budget for the selected tests.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The budget in seconds, or None to run every test.
+
+    Raises:
+        pytest.UsageError: If the budget is not positive.
+
+    """
+    budget = config.getoption('--test-categories-budget', default=None)
+    if not isinstance(budget, float):
+        return None
+    if budget <= 0.0:
+        msg = f'--test-categories-budget must be a positive number of seconds, got {budget}'
+        raise pytest.UsageError(msg)
+    return budget
+
+
+def _get_jsonl_report_path(config: pytest.Config) -> Path | None:
+    """Get the file the JSON Lines test size report is streamed to.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The report file path, or None unless --test-size-report=jsonl is set.
+
+    Raises:
+        pytest.UsageError: If --test-size-report=jsonl is set without --test-size-report-file.
+
+    """
+    if config.getoption('--test-size-report', default=None) != 'jsonl':
+        return None
+    file_path = config.getoption('--test-size-report-file', default=None)
+    if not file_path:
+        msg = '--test-size-report=jsonl requires --test-size-report-file'
+        raise pytest.UsageError(msg)
+    return Path(str(file_path))
+
+
+def _get_metrics_path(config: pytest.Config) -> Path | None:
+    """Get the file the session metrics are written to.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The metrics file path, or None unless --test-categories-metrics-file is set.
+
+    """
+    file_path = config.getoption('--test-categories-metrics-file', default=None)
+    return Path(str(file_path)) if file_path else None
+
+
+def _get_trace_path(config: pytest.Config) -> Path | None:
+    """Get the file the test timeline trace is written to.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The trace file path, or None unless --test-categories-trace is set.
+
+    """
+    file_path = config.getoption('--test-categories-trace', default=None)
+    return Path(str(file_path)) if file_path else None
+
+
+def _get_sizes(config: pytest.Config) -> frozenset[TestSize] | None:
+    """Get the test sizes the session runs.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The sizes, or None to run tests of every size.
+
+    Raises:
+        pytest.UsageError: If the option names an unknown size.
+
+    """
+    value = config.getoption('--test-categories-sizes', default=None)
+    if not isinstance(value, str):
+        return None
+    try:
+        return parse_sizes(value)
+    except ValueError as e:
+        raise pytest.UsageError(str(e)) from e
+
+
+def _get_enforcement_plans(config: pytest.Config) -> EnforcementPlans:
+    """Get or compile the enforcement plans for the session.
+
+    The plans are compiled in pytest_configure and stored on the config object.
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The EnforcementPlans for the session.
+
+    """
+    plans = getattr(config, _ENFORCEMENT_PLANS_ATTR, None)
+    if plans is None:
+        plans = _compile_enforcement_plans(config)
+        setattr(config, _ENFORCEMENT_PLANS_ATTR, plans)
+    return cast('EnforcementPlans', plans)
+
+
+def _compile_enforcement_plans(config: pytest.Config) -> EnforcementPlans:
+    """Compile the blocker activations for small and medium tests.
+
+    Enforcement follows Google's test size definitions:
+    - Small tests: network, filesystem, process, sleep and database blocked
+    - Medium tests: network limited to localhost, database blocked
+    - Both: thread creation monitored (warns instead of blocking)
+    - Medium tests: external systems imports detected unless the marker sets
+      allow_external_systems=True
+
+    With the audit engine, one audit enforcer step replaces the patching
+    blockers (plus the sleep blocker for small tests on interpreters without
+    the time.sleep audit event).
+
+    Args:
+        config: The pytest configuration object.
+
+    Returns:
+        The compiled plans, or NO_ENFORCEMENT_PLANS when enforcement is off.
+
+    """
+    enforcement_mode = _get_enforcement_mode(config)
+    if enforcement_mode == EnforcementMode.OFF:
+        return NO_ENFORCEMENT_PLANS
+
+    medium_external_systems_allowed = _compile_size_plan(config, TestSize.MEDIUM, enforcement_mode)
+    detector = _get_external_systems_detector(config)
+    medium = EnforcementPlan(
+        steps=(*medium_external_systems_allowed.steps, blocker_step(detector, TestSize.MEDIUM, enforcement_mode)),
+        post_call_checks=(external_systems_check(detector),),
+    )
+    return EnforcementPlans(
+        small=_compile_size_plan(config, TestSize.SMALL, enforcement_mode),
+        medium=medium,
+        medium_external_systems_allowed=medium_external_systems_allowed,
+    )
+
+
+def _compile_size_plan(
+    config: pytest.Config,
+    test_size: TestSize,
+    enforcement_mode: EnforcementMode,
+) -> EnforcementPlan:
+    """Compile the resource blocker steps for small or medium tests.
+
+    Args:
+        config: The pytest configuration object.
+        test_size: The test size (SMALL or MEDIUM).
+        enforcement_mode: The active enforcement mode.
+
+    Returns:
+        The plan activating the engine's blockers and the thread monitor.
+
+    """
+    if _get_enforcement_engine(config) == EnforcementEngine.AUDIT:
+        steps = [blocker_step(_get_audit_enforcer(config), test_size, enforcement_mode)]
+        if test_size == TestSize.SMALL and not TIME_SLEEP_AUDITED:
+            steps.append(blocker_step(_get_sleep_blocker(config), test_size, enforcement_mode))
+    else:
+        # Network blocking applies to both small and medium tests
+        # - Small: BLOCK_ALL (no network)
+        # - Medium: LOCALHOST_ONLY (localhost only)
+        steps = [blocker_step(_get_network_blocker(config), test_size, enforcement_mode)]
+        # Filesystem (no escape hatches), process and sleep blocking only apply to small tests
+        if test_size == TestSize.SMALL:
+            steps.append(blocker_step(_get_filesystem_blocker(config), test_size, enforcement_mode, frozenset()))
+            steps.append(blocker_step(_get_process_blocker(config), test_size, enforcement_mode))
+            steps.append(blocker_step(_get_sleep_blocker(config), test_size, enforcement_mode))
+        steps.append(blocker_step(_get_database_blocker(config), test_size, enforcement_mode))
+
+    # Thread monitor warns instead of blocking
+    steps.append(blocker_step(_get_thread_monitor(config), test_size, enforcement_mode))
+    return EnforcementPlan(steps=tuple(steps))
+
+
+def _install_enforcement_engine(config: pytest.Config) -> None:
+    """Install what the configured engine and patch mode need at session start.
+
+    The audit engine registers its process-wide audit hook here. In session
+    patch mode, the blockers that will be used install their wrappers once.
+
+    Args:
+        config: The pytest configuration object.
+
+    """
+    engine = _get_enforcement_engine(config)
+    if engine == EnforcementEngine.AUDIT:
+        _get_audit_enforcer(config).install()
+
+    if _get_patch_mode(config) != PatchMode.SESSION:
+        return
+
+    if engine == EnforcementEngine.AUDIT:
+        # The audit engine still relies on the thread monitor, and on the
+        # sleep blocker where the interpreter has no time.sleep audit event
+        _get_thread_monitor(config).install()
+        if not TIME_SLEEP_AUDITED:
+            _get_sleep_blocker(config).install()
+    else:
+        _install_session_blockers(config)
+
+
+def _install_session_blockers(config: pytest.Config) -> None:
+    """Install every blocker's interception wrappers once for the session.
+
+    Once installed, activating a blocker for a test only sets its current
+    test size and enforcement mode instead of patching module globals.
+
+    Args:
+        config: The pytest configuration object.
+
+    """
+    _get_network_blocker(config).install()
+    _get_filesystem_blocker(config).install()
+    _get_process_blocker(config).install()
+    _get_sleep_blocker(config).install()
+    _get_database_blocker(config).install()
+    _get_thread_monitor(config).install()
+
+
+def _uninstall_session_blockers(config: pytest.Config) -> None:
+    """Remove session-wide blocker wrappers, restoring the original functions.
+
+    Blockers are uninstalled in reverse installation order so nested
+    sessions (e.g. pytester) unwind to the outer session's wrappers.
+
+    Args:
+        config: The pytest configuration object.
+
+    """
+    for blocker_attr in reversed(_SESSION_BLOCKER_ATTRS):
+        blocker = getattr(config, blocker_attr, None)
+        if blocker is not None and blocker.is_installed:
+            blocker.uninstall()
+
+
 def _get_distribution_enforcement_mode(config: pytest.Config) -> EnforcementMode:
     """Get the distribution enforcement mode from configuration.
 
@@ -889,32 +1459,6 @@ def _get_filesystem_blocker(config: pytest.Config) -> FilesystemPatchingBlocker:
     return cast('FilesystemPatchingBlocker', getattr(config, blocker_attr))
 
 
-def _safe_deactivate_network(blocker: SocketPatchingNetworkBlocker) -> None:
-    """Safely deactivate network blocker, handling edge cases.
-
-    This function is used as a callback in ExitStack to ensure cleanup.
-
-    Args:
-        blocker: The network blocker to deactivate.
-
-    """
-    if blocker.state.value == 'active':
-        blocker.deactivate()
-
-
-def _safe_deactivate_filesystem(blocker: FilesystemPatchingBlocker) -> None:
-    """Safely deactivate filesystem blocker, handling edge cases.
-
-    This function is used as a callback in ExitStack to ensure cleanup.
-
-    Args:
-        blocker: The filesystem blocker to deactivate.
-
-    """
-    if blocker.state.value == 'active':
-        blocker.deactivate()
-
-
 def _get_process_blocker(config: pytest.Config) -> SubprocessPatchingBlocker:
     """Get or create the process blocker instance.
 
@@ -936,19 +1480,6 @@ def _get_process_blocker(config: pytest.Config) -> SubprocessPatchingBlocker:
     return cast('SubprocessPatchingBlocker', getattr(config, blocker_attr))
 
 
-def _safe_deactivate_process(blocker: SubprocessPatchingBlocker) -> None:
-    """Safely deactivate process blocker, handling edge cases.
-
-    This function is used as a callback in ExitStack to ensure cleanup.
-
-    Args:
-        blocker: The process blocker to deactivate.
-
-    """
-    if blocker.state.value == 'active':
-        blocker.deactivate()
-
-
 def _get_sleep_blocker(config: pytest.Config) -> SleepPatchingBlocker:
     """Get or create the sleep blocker instance.
 
@@ -970,19 +1501,6 @@ def _get_sleep_blocker(config: pytest.Config) -> SleepPatchingBlocker:
     return cast('SleepPatchingBlocker', getattr(config, blocker_attr))
 
 
-def _safe_deactivate_sleep(blocker: SleepPatchingBlocker) -> None:
-    """Safely deactivate sleep blocker, handling edge cases.
-
-    This function is used as a callback in ExitStack to ensure cleanup.
-
-    Args:
-        blocker: The sleep blocker to deactivate.
-
-    """
-    if blocker.state.value == 'active':
-        blocker.deactivate()
-
-
 def _get_database_blocker(config: pytest.Config) -> DatabasePatchingBlocker:
     """Get or create the database blocker instance.
 
@@ -1004,19 +1522,6 @@ def _get_database_blocker(config: pytest.Config) -> DatabasePatchingBlocker:
     return cast('DatabasePatchingBlocker', getattr(config, blocker_attr))
 
 
-def _safe_deactivate_database(blocker: DatabasePatchingBlocker) -> None:
-    """Safely deactivate database blocker, handling edge cases.
-
-    This function is used as a callback in ExitStack to ensure cleanup.
-
-    Args:
-        blocker: The database blocker to deactivate.
-
-    """
-    if blocker.state.value == 'active':
-        blocker.deactivate()
-
-
 def _get_thread_monitor(config: pytest.Config) -> ThreadPatchingMonitor:
     """Get or create the thread monitor instance.
 
@@ -1037,17 +1542,25 @@ def _get_thread_monitor(config: pytest.Config) -> ThreadPatchingMonitor:
     return cast('ThreadPatchingMonitor', getattr(config, monitor_attr))
 
 
-def _safe_deactivate_thread_monitor(monitor: ThreadPatchingMonitor) -> None:
-    """Safely deactivate thread monitor, handling edge cases.
+def _get_audit_enforcer(config: pytest.Config) -> AuditHookEnforcer:
+    """Get or create the audit hook enforcer instance.
 
-    This function is used as a callback in ExitStack to ensure cleanup.
+    The enforcer is stored on the config object to ensure proper lifecycle
+    management across test execution.
 
     Args:
-        monitor: The thread monitor to deactivate.
+        config: The pytest configuration object.
+
+    Returns:
+        The AuditHookEnforcer instance.
 
     """
-    if monitor.state.value == 'active':
-        monitor.deactivate()
+    enforcer_attr = '_test_categories_audit_enforcer'
+    if not hasattr(config, enforcer_attr):
+        enforcer = AuditHookEnforcer()
+        enforcer.violation_callback = _make_violation_callback(config)
+        setattr(config, enforcer_attr, enforcer)
+    return cast('AuditHookEnforcer', getattr(config, enforcer_attr))
 
 
 def _get_external_systems_detector(config: pytest.Config) -> ExternalSystemsDetector:
@@ -1070,19 +1583,6 @@ def _get_external_systems_detector(config: pytest.Config) -> ExternalSystemsDete
     return cast('ExternalSystemsDetector', getattr(config, detector_attr))
 
 
-def _safe_deactivate_external_systems(detector: ExternalSystemsDetector) -> None:
-    """Safely deactivate external systems detector, handling edge cases.
-
-    This function is used as a callback in ExitStack to ensure cleanup.
-
-    Args:
-        detector: The external systems detector to deactivate.
-
-    """
-    if detector.state.value == 'active':
-        detector.deactivate()
-
-
 def _write_json_report(
     test_report: TestSizeReport,
     stats: DistributionStatsType,
@@ -1105,6 +1605,7 @@ def _write_json_report(
         distribution_stats=stats,
         version=PLUGIN_VERSION,
         violation_tracker=violation_tracker,
+        budget_selection=cast('BudgetSelection | None', config_adapter.get_plugin_state().budget_selection),
     )
 
     json_output = json_report.model_dump_json(indent=2)
@@ -57,6 +57,7 @@ from pytest_test_categories.ports.network import (
     BlockerState,
     EnforcementMode,
 )
+from pytest_test_categories.types import PortMeta
 
 if TYPE_CHECKING:
     from pytest_test_categories.types import TestSize
@@ -112,7 +113,7 @@ class DatabaseAccessAttempt(BaseModel, frozen=True):
     allowed: bool
 
 
-class DatabaseBlockerPort(BaseModel, ABC):
+class DatabaseBlockerPort(BaseModel, ABC, metaclass=PortMeta):
     """Abstract port defining database blocking behavior.
 
     This port defines the contract for database access control during test
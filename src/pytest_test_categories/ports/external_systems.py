@@ -58,6 +58,7 @@ from pytest_test_categories.ports.network import (
     BlockerState,
     EnforcementMode,
 )
+from pytest_test_categories.types import PortMeta
 
 if TYPE_CHECKING:
     from pytest_test_categories.types import TestSize
@@ -72,7 +73,7 @@ EXTERNAL_SYSTEM_PACKAGES = frozenset(
 )
 
 
-class ExternalSystemsDetectorPort(BaseModel, ABC):
+class ExternalSystemsDetectorPort(BaseModel, ABC, metaclass=PortMeta):
     """Abstract port defining external systems detection behavior.
 
     This port defines the contract for detecting external system usage during
@@ -51,6 +51,7 @@ from pytest_test_categories.ports.network import (
     BlockerState,
     EnforcementMode,
 )
+from pytest_test_categories.types import PortMeta
 
 if TYPE_CHECKING:
     from pytest_test_categories.types import TestSize
@@ -118,7 +119,7 @@ class FilesystemAccessAttempt(BaseModel, frozen=True):
     allowed: bool
 
 
-class FilesystemBlockerPort(BaseModel, ABC):
+class FilesystemBlockerPort(BaseModel, ABC, metaclass=PortMeta):
     """Abstract port defining filesystem blocking behavior.
 
     This port defines the contract for filesystem access control during test
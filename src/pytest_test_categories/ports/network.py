@@ -46,6 +46,8 @@ from icontract import (
 )
 from pydantic import BaseModel
 
+from pytest_test_categories.types import PortMeta
+
 if TYPE_CHECKING:
     from pytest_test_categories.types import TestSize
 
@@ -154,7 +156,7 @@ class ConnectionAttempt(BaseModel, frozen=True):
     allowed: bool
 
 
-class NetworkBlockerPort(BaseModel, ABC):
+class NetworkBlockerPort(BaseModel, ABC, metaclass=PortMeta):
     """Abstract port defining network blocking behavior.
 
     This port defines the contract for network access control during test
@@ -49,6 +49,7 @@ from pytest_test_categories.ports.network import (
     BlockerState,
     EnforcementMode,
 )
+from pytest_test_categories.types import PortMeta
 
 if TYPE_CHECKING:
     from pytest_test_categories.types import TestSize
@@ -86,7 +87,7 @@ class SpawnAttempt(BaseModel, frozen=True):
     method: str
 
 
-class ProcessBlockerPort(BaseModel, ABC):
+class ProcessBlockerPort(BaseModel, ABC, metaclass=PortMeta):
     """Abstract port defining process/subprocess blocking behavior.
 
     This port defines the contract for process spawning control during test
@@ -55,6 +55,7 @@ from pytest_test_categories.ports.network import (
     BlockerState,
     EnforcementMode,
 )
+from pytest_test_categories.types import PortMeta
 
 if TYPE_CHECKING:
     from pytest_test_categories.types import TestSize
@@ -89,7 +90,7 @@ class SleepAttempt(BaseModel, frozen=True):
     allowed: bool
 
 
-class SleepBlockerPort(BaseModel, ABC):
+class SleepBlockerPort(BaseModel, ABC, metaclass=PortMeta):
     """Abstract port defining sleep blocking behavior.
 
     This port defines the contract for sleep/timing control during test
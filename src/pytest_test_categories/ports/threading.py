@@ -55,6 +55,7 @@ from pytest_test_categories.ports.network import (
     BlockerState,
     EnforcementMode,
 )
+from pytest_test_categories.types import PortMeta
 
 if TYPE_CHECKING:
     from pytest_test_categories.types import TestSize
@@ -83,7 +84,7 @@ class ThreadCreationAttempt(BaseModel, frozen=True):
     test_nodeid: str
 
 
-class ThreadMonitorPort(BaseModel, ABC):
+class ThreadMonitorPort(BaseModel, ABC, metaclass=PortMeta):
     """Abstract port defining thread monitoring behavior.
 
     This port defines the contract for thread creation monitoring during test
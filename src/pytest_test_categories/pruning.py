@@ -0,0 +1,237 @@
+"""Collection pruning: skip importing test files that only hold tests of other sizes.
+
+Running only the small tests still imports every medium and large test
+module, and everything they import. With --test-categories-sizes=small each
+test file is looked up in a per-file size index before it is collected:
+
+- The static index (see static_index), read from its cache or scanned on the
+  spot, which reads the file with ast instead of importing it
+- The index of the last collection, which knows the size of every test the
+  file produced, for files whose content has not changed since
+
+A file is pruned only when the static scan proves that all its tests have
+sizes outside the requested ones, and the last collection, if current,
+agrees. The scan cannot see sizes given in ways other than literal markers,
+so a file in which it finds an unsized test is always collected. The last
+collection alone proves nothing: a test's size can come from a base class, a
+conftest.py or a helper module, which can change while the test file's
+content hash does not. A file that did not parse, or in which no tests were
+found, is collected as usual.
+
+Example:
+    >>> parse_sizes('small,medium') == frozenset({TestSize.SMALL, TestSize.MEDIUM})
+    True
+
+"""
+
+from __future__ import annotations
+
+import fnmatch
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+)
+
+from pytest_test_categories.static_index import (
+    INDEX_FILE_NAME,
+    FileIndex,
+    StaticIndexCache,
+    check_entry,
+    scan_file,
+)
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from collections import Counter
+    from pathlib import Path
+
+    from pytest_test_categories.static_index import CollectionRules
+
+__all__ = [
+    'COLLECTED_INDEX_FILE_NAME',
+    'IndexedFile',
+    'PruningSummary',
+    'SizeIndex',
+    'is_excluded',
+    'parse_sizes',
+]
+
+# Name of the index of the last collection in the cache directory
+COLLECTED_INDEX_FILE_NAME = 'collected_index.json'
+
+_SIZES_BY_MARKER = {size.marker_name: size for size in TestSize}
+
+
+class PruningSummary(BaseModel):
+    """The test files pruned from a session's collection.
+
+    Attributes:
+        sizes: The marker names of the sizes that run.
+        files: How many test files were collected or pruned.
+        pruned_files: How many test files were not collected.
+        pruned_tests: How many tests the pruned files hold.
+        time_saved: How long the pruned files took to collect when they were last collected, in seconds.
+        deselected: How many collected tests of other sizes were deselected.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    sizes: tuple[str, ...]
+    files: int = Field(ge=0)
+    pruned_files: int = Field(ge=0)
+    pruned_tests: int = Field(ge=0)
+    time_saved: float = Field(ge=0.0)
+    deselected: int = Field(default=0, ge=0)
+
+
+@dataclass(frozen=True)
+class IndexedFile:
+    """A test file's index, as found before collecting it.
+
+    Attributes:
+        index: The file's tests by size.
+        collect_seconds: How long the file took to collect when it was last
+            collected, or None if the index comes from the static scan.
+        scanned: The static scan of the file when the index comes from its
+            last collection, or None if the index is the static scan.
+
+    """
+
+    index: FileIndex
+    collect_seconds: float | None = None
+    scanned: FileIndex | None = None
+
+
+def parse_sizes(value: str) -> frozenset[TestSize]:
+    """Parse a comma-separated list of test sizes.
+
+    Args:
+        value: The sizes, such as 'small,medium'.
+
+    Returns:
+        The sizes.
+
+    Raises:
+        ValueError: If the list is empty or names an unknown size.
+
+    """
+    names = [name.strip().lower() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in _SIZES_BY_MARKER]
+    if unknown or not names:
+        msg = f'--test-categories-sizes must be a comma-separated list of {", ".join(_SIZES_BY_MARKER)}, got {value!r}'
+        raise ValueError(msg)
+    return frozenset(_SIZES_BY_MARKER[name] for name in names)
+
+
+def is_excluded(found: IndexedFile, sizes: frozenset[TestSize]) -> bool:
+    """Check whether a file's index proves that none of its tests have the given sizes.
+
+    Args:
+        found: The file's index.
+        sizes: The sizes that run.
+
+    Returns:
+        True if the static scan finds tests in the file, all sized with other
+        sizes, and the index of the last collection, if any, agrees.
+
+    """
+    scanned = found.index if found.scanned is None else found.scanned
+    if scanned.counts[None] or not _holds_only_other_sizes(scanned, sizes):
+        return False
+    return _holds_only_other_sizes(found.index, sizes)
+
+
+def _holds_only_other_sizes(index: FileIndex, sizes: frozenset[TestSize]) -> bool:
+    """Check whether an index has tests and none of them have the given sizes."""
+    present = [size for size, count in index.counts.items() if count]
+    return index.error is None and bool(present) and not any(size in sizes for size in present)
+
+
+class SizeIndex:
+    """The per-file size index consulted before collecting each test file.
+
+    Both indexes live in the cache directory. Every file is scanned, or its
+    scan read from the static index; the index of the last collection is
+    added for files that were not edited since, for exact counts and the
+    time their collection took.
+
+    Args:
+        directory: The cache directory holding the indexes.
+        rules: The collection rules of the session.
+
+    """
+
+    __slots__ = ('_collected', '_collected_cache', '_rules', '_static', '_static_cache', '_static_changed')
+
+    def __init__(self, directory: Path, rules: CollectionRules) -> None:
+        """Load the indexes from a cache directory."""
+        self._rules = rules
+        self._collected_cache = StaticIndexCache(directory / COLLECTED_INDEX_FILE_NAME)
+        self._static_cache = StaticIndexCache(directory / INDEX_FILE_NAME)
+        self._collected = self._collected_cache.load(rules)
+        self._static = self._static_cache.load(rules)
+        self._static_changed = False
+
+    def __repr__(self) -> str:
+        """Return a representation showing the cache files."""
+        return f'SizeIndex(collected={self._collected_cache!r}, static={self._static_cache!r})'
+
+    def is_test_file(self, path: Path) -> bool:
+        """Check whether a path is a Python file the collection rules make a test module."""
+        return path.suffix == '.py' and any(fnmatch.fnmatch(path.name, pattern) for pattern in self._rules.python_files)
+
+    def lookup(self, path: Path) -> IndexedFile | None:
+        """Get a test file's index, scanning the file if no cached index is current.
+
+        Args:
+            path: The test file's path.
+
+        Returns:
+            The file's index, or None if the file cannot be read.
+
+        """
+        key = str(path)
+        entry, current = check_entry(path, self._static.get(key))
+        if entry.get('sha256') is None:
+            return None
+        if not current:
+            entry['index'] = scan_file(key, self._rules).to_dict()
+        if entry is not self._static.get(key):
+            self._static[key] = entry
+            self._static_changed = True
+        scanned = FileIndex.from_dict(entry['index'])  # type: ignore[arg-type]
+
+        # The static entry holds the file's current stamp and hash
+        collected = self._collected.get(key)
+        if collected is not None and collected.get('sha256') == entry['sha256']:
+            self._collected[key] = {**collected, 'mtime_ns': entry['mtime_ns'], 'size': entry['size']}
+            seconds = collected.get('collect_seconds')
+            index = FileIndex.from_dict(collected['index'])  # type: ignore[arg-type]
+            return IndexedFile(index, float(seconds) if isinstance(seconds, int | float) else 0.0, scanned)
+        return IndexedFile(scanned)
+
+    def record(self, path: Path, counts: Counter[TestSize | None], collect_seconds: float) -> None:
+        """Record the tests a file produced when it was collected.
+
+        Args:
+            path: The test file's path.
+            counts: Its tests by size, with None for unsized tests.
+            collect_seconds: How long the file took to collect.
+
+        """
+        key = str(path)
+        entry, _ = check_entry(path, self._collected.get(key))
+        if entry.get('sha256') is None:
+            return
+        self._collected[key] = {**entry, 'index': FileIndex(counts).to_dict(), 'collect_seconds': collect_seconds}
+
+    def save(self) -> None:
+        """Write the indexes to the cache directory."""
+        self._collected_cache.save(self._rules, self._collected)
+        if self._static_changed:
+            self._static_cache.save(self._rules, self._static)
@@ -13,24 +13,34 @@ Example usage:
 
 from __future__ import annotations
 
+from array import array
 from collections import defaultdict
+from itertools import compress
+from math import isnan
 from typing import TYPE_CHECKING
 
-from pydantic import (
-    BaseModel,
-    Field,
-)
+from pydantic import BaseModel
 
+from pytest_test_categories.nodeids import NodeIdRegistry
 from pytest_test_categories.timing import get_limit
 from pytest_test_categories.types import TestSize
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     import pytest
 
 
-def _default_sized_tests() -> defaultdict[TestSize, list[str]]:
-    """Create a defaultdict for sized_tests field."""
-    return defaultdict(list)
+# Size codes in the report's size column: the position of the size in TestSize, then unsized
+_SIZE_CODES: tuple[TestSize | None, ...] = (*TestSize, None)
+_SIZE_CODE = {size: code for code, size in enumerate(_SIZE_CODES)}
+# Size code of a registered node ID that is not in the report
+_NOT_IN_REPORT = 255
+# Outcome code of a test without an outcome
+_NO_OUTCOME = 255
+_NO_DURATION = float('nan')
+# Translation tables mapping one size code to 1 and every other code to 0
+_SIZE_MASKS = tuple(bytes(int(code == selected) for code in range(256)) for selected in range(len(_SIZE_CODES)))
 
 
 class BaselineViolation(BaseModel):
@@ -46,19 +56,76 @@ class BaselineViolation(BaseModel):
     actual: float
 
 
-class TestSizeReport(BaseModel):
-    """Generator for test size reports."""
+class TestSizeReport:
+    """Generator for test size reports.
+
+    The report is columnar: each test is given an int by the session's node
+    ID registry, and its size, duration and outcome are stored at that index
+    in a bytearray of size codes, an array('d') of durations (NaN for none)
+    and a bytearray of outcome codes: 10 bytes per test besides the registry,
+    instead of an entry in a list and three dicts and a boxed float per test.
+
+    sized_tests, unsized_tests, test_durations and test_outcomes are read-only
+    views built on each access; use get_tests, get_duration and get_outcome in
+    loops.
 
-    sized_tests: defaultdict[TestSize, list[str]] = Field(default_factory=_default_sized_tests)
-    unsized_tests: list[str] = Field(default_factory=list)
-    test_durations: dict[str, float] = Field(default_factory=dict)
-    test_outcomes: dict[str, str] = Field(default_factory=dict)
-    baseline_violations: dict[str, BaselineViolation] = Field(default_factory=dict)
+    Args:
+        registry: The session's node ID registry; the report has its own by default.
+
+    """
+
+    __slots__ = (
+        '_durations',
+        '_outcome_codes',
+        '_outcome_names',
+        '_outcomes',
+        '_sizes',
+        'baseline_violations',
+        'registry',
+    )
+
+    def __init__(self, registry: NodeIdRegistry | None = None) -> None:
+        """Initialize an empty report."""
+        self.registry = registry if registry is not None else NodeIdRegistry()
+        self._sizes = bytearray()
+        self._durations = array('d')
+        self._outcomes = bytearray()
+        self._outcome_names: list[str] = []
+        self._outcome_codes: dict[str, int] = {}
+        self.baseline_violations: dict[str, BaselineViolation] = {}
+
+    def __repr__(self) -> str:
+        """Return a representation showing how many tests the report holds."""
+        return f'TestSizeReport(tests={self.get_total_tests()})'
+
+    def _reserve(self) -> None:
+        """Grow the columns to hold every node ID in the registry."""
+        extra = len(self.registry) - len(self._sizes)
+        if extra > 0:
+            self._sizes.extend(bytes([_NOT_IN_REPORT]) * extra)
+            self._durations.extend([_NO_DURATION] * extra)
+            self._outcomes.extend(bytes([_NO_OUTCOME]) * extra)
+
+    def _outcome_code(self, outcome: str) -> int:
+        """Get the code of an outcome, assigning the next one to a new outcome."""
+        code = self._outcome_codes.get(outcome)
+        if code is None:
+            code = len(self._outcome_names)
+            self._outcome_codes[outcome] = code
+            self._outcome_names.append(outcome)
+        return code
+
+    def _test_id(self, nodeid: str) -> int | None:
+        """Get the int of a test in the report, or None if the report does not have it."""
+        test_id = self.registry.get(nodeid)
+        if test_id is None or test_id >= len(self._sizes) or self._sizes[test_id] == _NOT_IN_REPORT:
+            return None
+        return test_id
 
     def add_test(
         self, nodeid: str, size: TestSize | None, duration: float | None = None, outcome: str = 'passed'
     ) -> None:
-        """Add a test to the report.
+        """Add a test to the report, or update it if the report already has it.
 
         Args:
             nodeid: The pytest node ID of the test
@@ -67,15 +134,35 @@ class TestSizeReport(BaseModel):
             outcome: The test outcome (passed, failed, etc.)
 
         """
-        if size is None:
-            self.unsized_tests.append(nodeid)
-        else:
-            self.sized_tests[size].append(nodeid)
-
+        test_id = self.registry.add(nodeid)
+        sizes = self._sizes
+        if test_id == len(sizes):
+            # A new node ID: append to the columns rather than growing and then setting them
+            sizes.append(_SIZE_CODE[size])
+            self._durations.append(_NO_DURATION if duration is None else duration)
+            self._outcomes.append(self._outcome_code(outcome))
+            return
+        self._reserve()
+        sizes[test_id] = _SIZE_CODE[size]
         if duration is not None:
-            self.test_durations[nodeid] = duration
+            self._durations[test_id] = duration
+        self._outcomes[test_id] = self._outcome_code(outcome)
 
-        self.test_outcomes[nodeid] = outcome
+    def record_result(self, nodeid: str, outcome: str, duration: float | None = None) -> None:
+        """Record a test's outcome and, if available, its duration.
+
+        Args:
+            nodeid: The pytest node ID of the test
+            outcome: The test outcome (passed, failed, etc.)
+            duration: The test execution time in seconds, if available
+
+        """
+        test_id = self.registry.add(nodeid)
+        if test_id >= len(self._sizes):
+            self._reserve()
+        if duration is not None:
+            self._durations[test_id] = duration
+        self._outcomes[test_id] = self._outcome_code(outcome)
 
     def add_baseline_violation(
         self,
@@ -112,17 +199,133 @@ class TestSizeReport(BaseModel):
         """
         return nodeid in self.baseline_violations
 
+    def has_test(self, nodeid: str) -> bool:
+        """Check if a test is in the report.
+
+        Args:
+            nodeid: The pytest node ID of the test
+
+        Returns:
+            True if the test was added to the report.
+
+        """
+        return self._test_id(nodeid) is not None
+
+    def get_test_size(self, nodeid: str) -> TestSize | None:
+        """Get a test's size.
+
+        Args:
+            nodeid: The pytest node ID of the test
+
+        Returns:
+            The test size category, or None if the test is unsized or not in the report.
+
+        """
+        test_id = self._test_id(nodeid)
+        return _SIZE_CODES[self._sizes[test_id]] if test_id is not None else None
+
+    def get_duration(self, nodeid: str) -> float | None:
+        """Get a test's duration.
+
+        Args:
+            nodeid: The pytest node ID of the test
+
+        Returns:
+            The test execution time in seconds, or None if it was not recorded.
+
+        """
+        test_id = self.registry.get(nodeid)
+        if test_id is None or test_id >= len(self._durations):
+            return None
+        duration = self._durations[test_id]
+        return None if isnan(duration) else duration
+
+    def get_outcome(self, nodeid: str) -> str | None:
+        """Get a test's outcome.
+
+        Args:
+            nodeid: The pytest node ID of the test
+
+        Returns:
+            The test outcome, or None if it was not recorded.
+
+        """
+        test_id = self.registry.get(nodeid)
+        if test_id is None or test_id >= len(self._outcomes) or self._outcomes[test_id] == _NO_OUTCOME:
+            return None
+        return self._outcome_names[self._outcomes[test_id]]
+
+    def get_tests(self, size: TestSize | None) -> list[str]:
+        """Get the tests of a size, in the order they were first added.
+
+        Args:
+            size: The test size category, or None for unsized tests
+
+        Returns:
+            The node IDs of the tests.
+
+        """
+        # Map the size's code to 1 and every other code to 0, so compress selects in C
+        mask = self._sizes.translate(_SIZE_MASKS[_SIZE_CODE[size]])
+        return list(compress(self.registry.nodeids, mask))
+
+    def add_new_tests(self, tests: Iterable[tuple[str, TestSize | None]]) -> None:
+        """Add the tests the report does not have yet, without durations or outcomes.
+
+        Args:
+            tests: The node ID and size, or None if unsized, of each test
+
+        """
+        tests = list(tests)
+        test_ids = self.registry.add_all(nodeid for nodeid, _ in tests)
+        self._reserve()
+        sizes = self._sizes
+        for test_id, (_, size) in zip(test_ids, tests, strict=True):
+            if sizes[test_id] == _NOT_IN_REPORT:
+                sizes[test_id] = _SIZE_CODE[size]
+
+    @property
+    def sized_tests(self) -> defaultdict[TestSize, list[str]]:
+        """The tests of each size that has any, in the order they were first added."""
+        sized: defaultdict[TestSize, list[str]] = defaultdict(list)
+        for size in TestSize:
+            tests = self.get_tests(size)
+            if tests:
+                sized[size] = tests
+        return sized
+
+    @property
+    def unsized_tests(self) -> list[str]:
+        """The unsized tests, in the order they were first added."""
+        return self.get_tests(None)
+
+    @property
+    def test_durations(self) -> dict[str, float]:
+        """The duration of each test that has one, by node ID."""
+        return {
+            nodeid: duration
+            for nodeid, duration in zip(self.registry.nodeids, self._durations, strict=False)
+            if not isnan(duration)
+        }
+
+    @property
+    def test_outcomes(self) -> dict[str, str]:
+        """The outcome of each test that has one, by node ID."""
+        names = self._outcome_names
+        return {
+            nodeid: names[code]
+            for nodeid, code in zip(self.registry.nodeids, self._outcomes, strict=False)
+            if code != _NO_OUTCOME
+        }
+
     def get_total_tests(self) -> int:
         """Get the total number of tests in the report."""
-        total = len(self.unsized_tests)
-        for tests in self.sized_tests.values():
-            total += len(tests)
-        return total
+        return len(self._sizes) - self._sizes.count(_NOT_IN_REPORT)
 
     def get_size_counts(self) -> dict[str, int]:
         """Get the count of tests by size category."""
-        counts = {size.name.lower(): len(self.sized_tests[size]) for size in TestSize}
-        counts['unsized'] = len(self.unsized_tests)
+        counts = {size.name.lower(): self._sizes.count(_SIZE_CODE[size]) for size in TestSize}
+        counts['unsized'] = self._sizes.count(_SIZE_CODE[None])
         return counts
 
     def get_size_percentages(self) -> dict[str, float]:
@@ -131,19 +334,15 @@ class TestSizeReport(BaseModel):
         if total == 0:
             return {size.name.lower(): 0.0 for size in TestSize} | {'unsized': 0.0}
 
-        percentages = {}
-        for size in TestSize:
-            percentages[size.name.lower()] = (len(self.sized_tests[size]) / total) * 100.0
-
-        percentages['unsized'] = (len(self.unsized_tests) / total) * 100.0
-        return percentages
+        return {name: (count / total) * 100.0 for name, count in self.get_size_counts().items()}
 
     def exceeds_time_limit(self, nodeid: str, size: TestSize | None) -> bool:
         """Check if a test exceeds its time limit based on size."""
-        if size is None or nodeid not in self.test_durations:
+        if size is None:
+            return False
+        duration = self.get_duration(nodeid)
+        if duration is None:
             return False
-
-        duration = self.test_durations[nodeid]
         limit = get_limit(size).limit
         return duration > limit
 
@@ -181,9 +380,9 @@ class TestSizeReport(BaseModel):
     def _write_sized_tests_to_report(self, terminalreporter: pytest.TerminalReporter) -> None:
         """Write sized tests to the detailed report."""
         for size in TestSize:
-            for nodeid in sorted(self.sized_tests[size]):
-                duration = self.test_durations.get(nodeid, 0.0)
-                outcome = self.test_outcomes.get(nodeid, 'unknown')
+            for nodeid in sorted(self.get_tests(size)):
+                duration = self.get_duration(nodeid) or 0.0
+                outcome = self.get_outcome(nodeid) or 'unknown'
 
                 exceeds_limit = self.exceeds_time_limit(nodeid, size)
                 status = 'FAIL' if outcome != 'passed' else 'SLOW' if exceeds_limit else 'Pass'
@@ -196,9 +395,9 @@ class TestSizeReport(BaseModel):
 
     def _write_unsized_tests_to_report(self, terminalreporter: pytest.TerminalReporter) -> None:
         """Write unsized tests to the detailed report."""
-        for nodeid in sorted(self.unsized_tests):
-            duration = self.test_durations.get(nodeid, 0.0)
-            outcome = self.test_outcomes.get(nodeid, 'unknown')
+        for nodeid in sorted(self.get_tests(None)):
+            duration = self.get_duration(nodeid) or 0.0
+            outcome = self.get_outcome(nodeid) or 'unknown'
             status = 'FAIL' if outcome != 'passed' else 'Pass'
 
             line = f'{nodeid:40} unsized  {duration:.1f}s      {status}'
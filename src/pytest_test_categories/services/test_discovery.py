@@ -16,6 +16,7 @@ Design:
 - Returns TestSize enum or None
 - Raises UsageError for invalid configuration (multiple markers)
 - Detects marker inheritance conflicts and emits warnings
+- Builds an immutable SizeProfile per test so runtime hooks avoid marker lookups
 
 Conflict Detection:
 - Multiple base class conflicts: class inherits from multiple sized base classes
@@ -60,9 +61,34 @@ class MarkerConflict:
     parent_marker: str
 
 
+@dataclass(frozen=True)
+class SizeProfile:
+    """Size-related settings of a test item, resolved once at collection.
+
+    Attributes:
+        size: The test's size, or None if it has no size marker.
+        timeout: Custom timeout from the size marker's `timeout` kwarg, if any.
+        allow_external_systems: Whether the size marker sets `allow_external_systems=True`.
+        label: The size label appended to the node ID (e.g. '[SMALL]'), or '' if unsized.
+
+    """
+
+    size: TestSize | None
+    timeout: float | None = None
+    allow_external_systems: bool = False
+    label: str = ''
+
+
+# Profile shared by all tests without a size marker
+UNSIZED_PROFILE = SizeProfile(size=None)
+
+
 # Error message for multiple size markers
 MULTIPLE_MARKERS_ERROR = 'Test cannot have multiple size markers: {}'
 
+# Warning message for a timeout kwarg that is not a number
+INVALID_TIMEOUT_WARNING = 'Ignoring invalid timeout {timeout!r} on {nodeid}: expected a number of seconds'
+
 # Warning messages for marker inheritance conflicts
 MULTIPLE_BASE_CONFLICT_WARNING = (
     'Marker inheritance conflict in {nodeid}: Class inherits from multiple base classes '
@@ -232,6 +258,52 @@ class TestDiscoveryService:
         # No size marker found
         return None
 
+    def get_size_profile(self, item: TestItemPort) -> SizeProfile:
+        """Resolve the size, timeout and marker options of a test item in one pass.
+
+        Performs the same marker discovery, warnings and conflict checks as
+        find_test_size(), then reads the size marker's kwargs once. The result
+        is immutable so the plugin can compute it at collection and reuse it in
+        every runtime hook.
+
+        Args:
+            item: The test item to inspect.
+
+        Returns:
+            The item's SizeProfile (UNSIZED_PROFILE if it has no size marker).
+
+        Raises:
+            pytest.UsageError: If the test has multiple size markers.
+
+        Example:
+            >>> # Test with @pytest.mark.medium(timeout=2, allow_external_systems=True)
+            >>> profile = service.get_size_profile(item)
+            >>> assert profile == SizeProfile(TestSize.MEDIUM, 2.0, True, '[MEDIUM]')
+
+        """
+        size = self.find_test_size(item)
+        if size is None:
+            return UNSIZED_PROFILE
+
+        marker_kwargs = item.get_marker_kwargs(size.marker_name)
+        timeout: float | None = None
+        raw_timeout = marker_kwargs.get('timeout')
+        if raw_timeout is not None:
+            try:
+                timeout = float(str(raw_timeout))
+            except ValueError:
+                self._warning_system.warn(
+                    INVALID_TIMEOUT_WARNING.format(timeout=raw_timeout, nodeid=item.nodeid),
+                    category=pytest.PytestWarning,
+                )
+
+        return SizeProfile(
+            size=size,
+            timeout=timeout,
+            allow_external_systems=bool(marker_kwargs.get('allow_external_systems', False)),
+            label=size.label,
+        )
+
     def _check_inheritance_conflicts(self, item: TestItemPort, effective_size: TestSize) -> None:
         """Check for marker inheritance conflicts and emit warnings.
 
@@ -98,7 +98,7 @@ class TestReportingService:
             >>> report = TestSizeReport()
             >>> service = TestReportingService()
             >>> service.add_test_to_report(report, 'test.py::test_func', TestSize.SMALL)
-            >>> 'test.py::test_func' in report.test_sizes
+            >>> report.has_test('test.py::test_func')
             True
 
         """
@@ -124,15 +124,13 @@ class TestReportingService:
             >>> service = TestReportingService()
             >>> service.add_test_to_report(report, 'test.py::test_func', TestSize.SMALL)
             >>> service.update_test_result(report, 'test.py::test_func', 'passed', 0.5)
-            >>> report.test_outcomes['test.py::test_func']
+            >>> report.get_outcome('test.py::test_func')
             'passed'
-            >>> report.test_durations['test.py::test_func']
+            >>> report.get_duration('test.py::test_func')
             0.5
 
         """
-        report.test_outcomes[nodeid] = outcome
-        if duration is not None:
-            report.test_durations[nodeid] = duration
+        report.record_result(nodeid, outcome, duration)
 
     def write_distribution_summary(
         self,
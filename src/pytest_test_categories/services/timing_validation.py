@@ -35,7 +35,7 @@ from pytest_test_categories import timing
 from pytest_test_categories.timing import validate_with_baseline
 from pytest_test_categories.types import (
     TestSize,
-    TestTimer,
+    TimerProtocol,
     TimerState,
 )
 
@@ -95,7 +95,7 @@ class TimingValidationService:
 
     def get_test_duration(
         self,
-        timer: TestTimer | None,
+        timer: TimerProtocol | None,
         report_duration: float | None,
     ) -> float | None:
         """Extract test duration from timer or report.
@@ -145,7 +145,7 @@ class TimingValidationService:
         # No duration available
         return None
 
-    def cleanup_timer(self, timers: MutableMapping[str, TestTimer], nodeid: str) -> None:
+    def cleanup_timer(self, timers: MutableMapping[str, TimerProtocol], nodeid: str) -> None:
         """Remove a timer from the timers dictionary to prevent memory leaks.
 
         This is a utility function for cleaning up timers after test execution.
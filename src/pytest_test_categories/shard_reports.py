@@ -0,0 +1,340 @@
+"""Merging the test size reports of a sharded run.
+
+A suite split across CI machines leaves one --test-size-report=json (or
+jsonl) report per shard. ShardMerge reads the shards one at a time, each as a
+stream of records, into one columnar TestSizeReport (see reporting), so the
+merge holds each test once and takes time linear in the total tests, however
+many shards there are and however large each report is. A test found in more
+than one shard keeps the record of the last shard read.
+
+Example:
+    >>> merge = ShardMerge()
+    >>> for path in sorted(Path('reports').glob('shard-*.json')):  # doctest: +SKIP
+    ...     merge.add_shard(path)
+    >>> merge.distribution_stats().counts.small  # doctest: +SKIP
+    12840
+
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+from datetime import UTC, datetime
+from json.decoder import WHITESPACE
+from typing import (
+    TYPE_CHECKING,
+    NoReturn,
+    TextIO,
+)
+
+from pytest_test_categories.distribution.stats import DistributionStats
+from pytest_test_categories.json_report import (
+    HermeticityViolationsSummary,
+    JsonReport,
+    JsonReportSummary,
+    JsonTestEntry,
+    ViolationsSummary,
+    build_distribution,
+)
+from pytest_test_categories.jsonl_report import open_report
+from pytest_test_categories.reporting import TestSizeReport
+from pytest_test_categories.types import TestSize
+from pytest_test_categories.violation_tracking import ViolationType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+__all__ = ['ShardMerge', 'iter_report_records']
+
+# Characters read from a report at a time
+_CHUNK_SIZE = 1 << 16
+_SIZES: dict[str, TestSize | None] = {size.value: size for size in TestSize} | {'unsized': None}
+
+
+class _JsonStream:
+    """Reads the JSON values of a file a chunk at a time.
+
+    Each value is decoded with json's raw_decode from a buffer holding the
+    rest of the current chunk; a value that runs past the end of the buffer
+    is decoded again once the next chunk is read.
+    """
+
+    __slots__ = ('_buffer', '_decoder', '_eof', '_file', '_position', 'path')
+
+    def __init__(self, report_file: TextIO, path: Path) -> None:
+        """Initialize the stream at the start of the file."""
+        self._file = report_file
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+        self.path = path
+
+    def _fill(self) -> bool:
+        """Read the next chunk into the buffer, dropping what has been consumed; False at the end of the file."""
+        chunk = self._file.read(_CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _skip_whitespace(self) -> None:
+        """Move past whitespace, reading chunks until there is something else or the file ends."""
+        while True:
+            self._position = WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer) or self._eof or not self._fill():
+                return
+
+    def peek(self) -> str:
+        """Get the next character that is not whitespace, or '' at the end of the file."""
+        self._skip_whitespace()
+        return self._buffer[self._position : self._position + 1]
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character that is not whitespace.
+
+        Raises:
+            ValueError: If it is not one of the given characters.
+
+        """
+        char = self.peek()
+        if not char or char not in chars:
+            self.fail(f'expected one of {chars!r}')
+        self._position += 1
+        return char
+
+    def value(self) -> object:
+        """Decode the next JSON value.
+
+        Raises:
+            ValueError: If the file does not hold a JSON value here.
+
+        """
+        while True:
+            self._position = WHITESPACE.match(self._buffer, self._position).end()
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError as e:
+                if self._eof or not self._fill():
+                    self.fail(e.msg)
+                continue
+            # A value ending with the buffer, such as a number, may go on in the next chunk
+            if end < len(self._buffer) or self._eof or not self._fill():
+                self._position = end
+                return value
+
+    def fail(self, reason: str) -> NoReturn:
+        """Raise the error for a file that is not a test size report."""
+        msg = f'{self.path}: not a test size report ({reason})'
+        raise ValueError(msg)
+
+
+def _iter_json_records(stream: _JsonStream) -> Iterator[tuple[str, object]]:
+    """Stream the fields of a JSON report, with each element of its tests list as its own record."""
+    stream.expect('{')
+    if stream.peek() == '}':
+        return
+    while True:
+        key = stream.value()
+        if not isinstance(key, str):
+            stream.fail('expected a field name')
+        stream.expect(':')
+        if key == 'tests' and stream.peek() == '[':
+            stream.expect('[')
+            if stream.peek() == ']':
+                stream.expect(']')
+            else:
+                while True:
+                    yield 'test', stream.value()
+                    if stream.expect(',]') == ']':
+                        break
+        else:
+            yield key, stream.value()
+        if stream.expect(',}') == '}':
+            return
+
+
+def _iter_jsonl_records(report_file: TextIO, path: Path) -> Iterator[tuple[str, object]]:
+    """Stream the test records of a JSON Lines report, then the fields of its summary records."""
+    for line_number, line in enumerate(report_file, start=1):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            msg = f'{path}:{line_number}: not a JSON record'
+            raise ValueError(msg)  # noqa: TRY004
+        if 'summary' in record:
+            yield from record.items()
+        else:
+            yield 'test', record
+
+
+def iter_report_records(path: Path) -> Iterator[tuple[str, object]]:
+    """Stream the records of a --test-size-report=json or jsonl report.
+
+    Args:
+        path: Path of the report; a name with a .jsonl suffix is read as JSON
+            Lines, and a name ending in .gz is read as gzip.
+
+    Yields:
+        ('test', record) for each test, and (field, value) for the other fields
+        of the report, such as 'version' and 'summary'. A JSON Lines report
+        also yields the 'hermeticity' tags of its tests.
+
+    Raises:
+        OSError: If the report cannot be read.
+        ValueError: If the file is not a test size report.
+
+    """
+    with open_report(path, 'r') as report_file:
+        if '.jsonl' in path.suffixes:
+            yield from _iter_jsonl_records(report_file, path)
+        else:
+            yield from _iter_json_records(_JsonStream(report_file, path))
+
+
+class ShardMerge:
+    """The tests of a sharded run, merged from each shard's report as it is read.
+
+    Attributes:
+        report: The merged tests' sizes, durations and outcomes.
+        violations: The violations of each test that has any, by node ID.
+        hermeticity: Hermeticity violation counts by type, summed over the shards.
+        shards: The number of shard reports merged.
+        version: The plugin version of the last shard read.
+
+    """
+
+    __slots__ = ('hermeticity', 'report', 'shards', 'version', 'violations')
+
+    def __init__(self) -> None:
+        """Initialize an empty merge."""
+        self.report = TestSizeReport()
+        self.violations: dict[str, list[str]] = {}
+        self.hermeticity = dict.fromkeys(ViolationType, 0)
+        self.shards = 0
+        self.version = 'unknown'
+
+    def add_shard(self, path: Path) -> None:
+        """Merge a shard's report.
+
+        Args:
+            path: Path of the shard's json or jsonl report.
+
+        Raises:
+            ValueError: If the report cannot be read or is not a test size report.
+
+        """
+        try:
+            for field, value in iter_report_records(path):
+                if field == 'test':
+                    self._add_test(path, value)
+                elif field == 'summary':
+                    self._add_summary(value)
+                elif field == 'hermeticity' and isinstance(value, dict):
+                    self._add_hermeticity_tags(value)
+                elif field == 'version' and isinstance(value, str):
+                    self.version = value
+        except OSError as e:
+            msg = f'{path}: {e.strerror or e}'
+            raise ValueError(msg) from e
+        self.shards += 1
+
+    def _add_test(self, path: Path, record: object) -> None:
+        """Merge a test's record, replacing the record of another shard."""
+        if not isinstance(record, dict) or not isinstance(record.get('name'), str) or record.get('size') not in _SIZES:
+            msg = f'{path}: not a test size report (invalid test record {record!r})'
+            raise ValueError(msg)
+        nodeid = record['name']
+        duration = record.get('duration')
+        # Checked for float first, since the reports write every duration as one
+        if duration is not None and not isinstance(duration, float):
+            duration = float(duration) if isinstance(duration, int) else None
+        status = record.get('status')
+        self.report.add_test(nodeid, _SIZES[record['size']], duration, status if isinstance(status, str) else 'unknown')
+        violations = record.get('violations')
+        if violations and isinstance(violations, list):
+            self.violations[nodeid] = [str(violation) for violation in violations]
+        elif nodeid in self.violations:
+            del self.violations[nodeid]
+
+    def _add_summary(self, summary: object) -> None:
+        """Add a shard's hermeticity violation counts to the totals."""
+        violations = summary.get('violations') if isinstance(summary, dict) else None
+        hermeticity = violations.get('hermeticity') if isinstance(violations, dict) else None
+        if isinstance(hermeticity, dict):
+            for violation_type in ViolationType:
+                count = hermeticity.get(violation_type.value)
+                if isinstance(count, int):
+                    self.hermeticity[violation_type] += count
+
+    def _add_hermeticity_tags(self, tags: dict[str, object]) -> None:
+        """Add the hermeticity tags a JSON Lines report keeps in its summary record to its tests."""
+        for nodeid, test_tags in tags.items():
+            if isinstance(test_tags, list) and test_tags and self.report.has_test(nodeid):
+                self.violations.setdefault(nodeid, []).extend(str(tag) for tag in test_tags)
+
+    def distribution_stats(self) -> DistributionStats:
+        """Get the distribution statistics of the merged tests."""
+        counts = self.report.get_size_counts()
+        return DistributionStats.update_counts({size: counts[size.name.lower()] for size in TestSize})
+
+    def time_violations(self, violation: str) -> list[str]:
+        """Get the tests with a time violation, in the order they were first merged.
+
+        Args:
+            violation: 'timing' for tests over their size's time limit, or
+                'baseline' for tests over their performance baseline.
+
+        Returns:
+            The node IDs of the tests.
+
+        """
+        return [nodeid for nodeid, violations in self.violations.items() if violation in violations]
+
+    def slowest(self, size: TestSize | None, count: int) -> list[tuple[str, float]]:
+        """Get the slowest tests of a size.
+
+        Args:
+            size: The test size category, or None for unsized tests.
+            count: The most tests to get.
+
+        Returns:
+            The node ID and duration of each test, slowest first.
+
+        """
+        get_duration = self.report.get_duration
+        durations = ((get_duration(nodeid), nodeid) for nodeid in self.report.get_tests(size))
+        slowest = heapq.nlargest(count, ((duration, nodeid) for duration, nodeid in durations if duration is not None))
+        return [(nodeid, duration) for duration, nodeid in slowest]
+
+    def to_json_report(self) -> JsonReport:
+        """Build the JSON report of the merged run."""
+        tests = [
+            JsonTestEntry(
+                name=nodeid,
+                size=size.value if size is not None else 'unsized',
+                duration=self.report.get_duration(nodeid),
+                status=self.report.get_outcome(nodeid) or 'unknown',
+                violations=self.violations.get(nodeid, []),
+            )
+            for size in (*TestSize, None)
+            for nodeid in self.report.get_tests(size)
+        ]
+        summary = JsonReportSummary(
+            total_tests=self.report.get_total_tests(),
+            distribution=build_distribution(self.distribution_stats()),
+            violations=ViolationsSummary(
+                timing=len(self.time_violations('timing')),
+                baseline=len(self.time_violations('baseline')),
+                hermeticity=HermeticityViolationsSummary(
+                    **{violation_type.value: count for violation_type, count in self.hermeticity.items()}
+                ),
+            ),
+        )
+        return JsonReport(version=self.version, timestamp=datetime.now(tz=UTC), summary=summary, tests=tests)
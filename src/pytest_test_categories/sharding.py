@@ -0,0 +1,121 @@
+"""Duration-balanced sharding of the collected tests across CI machines.
+
+Path-based sharding gives one machine every test in a directory, so a
+directory full of medium and large tests makes its shard the slowest.
+With --test-categories-shard=INDEX/COUNT each machine collects the whole
+suite and keeps only the tests assigned to its shard:
+
+- Each size is packed separately, longest expected test first, onto the
+  shard with the least expected runtime of that size, so every shard gets a
+  proportional share of each size
+- Ties go to the shard with the least expected runtime overall, then to the
+  lowest shard index
+
+Tests are ordered by expected duration and node ID before packing, so the
+assignment depends only on its inputs. Every machine must pass the same
+expected durations: the size's time limit, or durations from a history file
+all shards share. A machine's own .pytest_cache history differs from the
+others', and shards balanced with it can skip a test or run it twice.
+
+Example:
+    >>> assign_shards(
+    ...     ['a [LARGE]', 'b [SMALL]', 'c [SMALL]', 'd [LARGE]'],
+    ...     [TestSize.LARGE, TestSize.SMALL, TestSize.SMALL, TestSize.LARGE],
+    ...     [900.0, 1.0, 1.0, 900.0],
+    ...     count=2,
+    ... )
+    [0, 0, 1, 1]
+
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING
+
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__ = [
+    'assign_shards',
+    'parse_shard',
+]
+
+# Sizes in the order they are packed; unsized tests go last
+_PACKING_ORDER: tuple[TestSize | None, ...] = (
+    TestSize.XLARGE,
+    TestSize.LARGE,
+    TestSize.MEDIUM,
+    TestSize.SMALL,
+    None,
+)
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse an INDEX/COUNT shard specification.
+
+    Args:
+        value: The specification, with a 1-based index, such as '3/12'.
+
+    Returns:
+        The 0-based shard index and the shard count.
+
+    Raises:
+        ValueError: If the value is not INDEX/COUNT with 1 <= INDEX <= COUNT.
+
+    Example:
+        >>> parse_shard('3/12')
+        (2, 12)
+
+    """
+    index_text, separator, count_text = value.partition('/')
+    try:
+        index, count = int(index_text), int(count_text)
+    except ValueError:
+        index = count = 0
+    if not separator or not 1 <= index <= count:
+        msg = f'Invalid shard {value!r}: expected INDEX/COUNT with 1 <= INDEX <= COUNT, such as 1/4'
+        raise ValueError(msg)
+    return index - 1, count
+
+
+def assign_shards(
+    nodeids: Sequence[str],
+    sizes: Sequence[TestSize | None],
+    expected: Sequence[float],
+    count: int,
+) -> list[int]:
+    """Assign each test to a shard, balancing expected runtime per size.
+
+    Args:
+        nodeids: The tests' node IDs.
+        sizes: Each test's size, or None for an unsized test.
+        expected: Each test's expected duration in seconds.
+        count: The number of shards.
+
+    Returns:
+        The 0-based shard index of each test, in the order given.
+
+    """
+    by_size: dict[TestSize | None, list[int]] = {size: [] for size in _PACKING_ORDER}
+    for position, size in enumerate(sizes):
+        by_size[size].append(position)
+
+    shards = [0] * len(nodeids)
+    totals = [0.0] * count
+    for size in _PACKING_ORDER:
+        positions = by_size[size]
+        if not positions:
+            continue
+        positions.sort(key=lambda position: (-expected[position], nodeids[position]))
+        # Only the chosen shard's totals change while one size is packed, so a heap stays valid
+        heap = [(0.0, totals[shard], shard) for shard in range(count)]
+        for position in positions:
+            size_load, total, shard = heapq.heappop(heap)
+            duration = expected[position]
+            shards[position] = shard
+            totals[shard] = total + duration
+            heapq.heappush(heap, (size_load + duration, totals[shard], shard))
+    return shards
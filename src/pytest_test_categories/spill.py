@@ -0,0 +1,246 @@
+"""Crash-resilient spill files for xdist workers.
+
+xdist workers send their distribution counts, hermeticity violations and
+suggestion observations to the controller when they finish (see
+xdist_compat). A worker that segfaults or is killed never finishes, so each
+worker also appends compact JSON lines to a spill file under the session's
+basetemp:
+
+- {"counts": {...}}: the worker's distribution counts, once it has collected
+- {"test": nodeid, ...}: a test's hermeticity violations and, with
+  --test-categories-suggest, its size, duration and resource observations
+
+Records are buffered and written out at most once per flush interval, so a
+test only pays for appending to a list. When a worker goes down without
+sending its output, the controller merges whatever the worker flushed.
+
+Example:
+    >>> tracker = ViolationTracker()
+    >>> record = {'test': 'test_a.py::test_one', 'violations': [['sleep', 'time.sleep(1)', False]]}
+    >>> recovery = merge_spill([record], tracker, None)
+    >>> recovery.tests, tracker.total_violations
+    (1, 1)
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import time
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    TextIO,
+)
+
+from pytest_test_categories.suggestion import (
+    ResourceType,
+    SuggestionCollector,
+)
+from pytest_test_categories.types import TestSize
+from pytest_test_categories.violation_tracking import (
+    ViolationTracker,
+    ViolationType,
+)
+from pytest_test_categories.xdist_compat import deserialize_distribution_counts
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+__all__ = [
+    'DEFAULT_SPILL_INTERVAL',
+    'SPILL_DIR_NAME',
+    'SpillRecovery',
+    'SpillWriter',
+    'merge_spill',
+    'read_spill',
+    'spill_path',
+]
+
+# Seconds between writes of a worker's buffered records
+DEFAULT_SPILL_INTERVAL = 1.0
+
+# Directory under the controller's basetemp holding one spill file per worker
+SPILL_DIR_NAME = 'test-categories-spill'
+
+
+def spill_path(directory: Path, worker_id: str) -> Path:
+    """Get the path of a worker's spill file.
+
+    Args:
+        directory: The session's spill directory.
+        worker_id: The xdist worker ID, such as gw0.
+
+    Returns:
+        The path of the worker's spill file.
+
+    """
+    return directory / f'{worker_id}.jsonl'
+
+
+class SpillWriter:
+    """Appends a worker's records to its spill file, buffered between flushes.
+
+    Args:
+        path: Path of the spill file; it is created on the first flush.
+        flush_interval: Seconds to buffer records for before writing them out.
+
+    """
+
+    __slots__ = ('_buffer', '_file', '_flush_interval', '_last_flush', 'path')
+
+    def __init__(self, path: Path, flush_interval: float) -> None:
+        """Initialize a writer with nothing buffered yet."""
+        self.path = path
+        self._flush_interval = flush_interval
+        self._buffer: list[dict[str, object]] = []
+        self._file: TextIO | None = None
+        self._last_flush = time.monotonic()
+
+    def __repr__(self) -> str:
+        """Return a representation showing the spill file and how many records are buffered."""
+        return f'SpillWriter(path={self.path!r}, buffered={len(self._buffer)})'
+
+    def append(self, record: dict[str, object]) -> None:
+        """Buffer a record, writing out the buffer if the flush interval has passed.
+
+        Args:
+            record: A JSON-serializable record.
+
+        """
+        self._buffer.append(record)
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out the buffered records.
+
+        The records only back up what the worker sends when it finishes, so
+        they are dropped if the file cannot be written.
+        """
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        lines = ''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in self._buffer)
+        self._buffer.clear()
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open('a', encoding='utf-8')
+            # One write of whole lines, flushed to the OS so the lines outlive the process
+            self._file.write(lines)
+            self._file.flush()
+        except OSError:
+            return
+
+    def close(self) -> None:
+        """Write out the buffered records and close the file."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_spill(path: Path) -> list[dict[str, object]]:
+    """Read the records a worker flushed to its spill file.
+
+    Args:
+        path: Path of the spill file.
+
+    Returns:
+        The records, without a last line the worker died while writing, or no
+        records if the file does not exist.
+
+    """
+    try:
+        text = path.read_text(encoding='utf-8')
+    except OSError:
+        return []
+    records: list[dict[str, object]] = []
+    for line in text.splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            records.append(record)
+    return records
+
+
+@dataclass(frozen=True)
+class SpillRecovery:
+    """What was recovered from a worker's spill file.
+
+    Attributes:
+        counts: The worker's distribution counts, if it lived to collect.
+        tests: How many tests' records were merged.
+
+    """
+
+    counts: dict[str, int] | None
+    tests: int
+
+
+def merge_spill(
+    records: Iterable[dict[str, object]],
+    violation_tracker: ViolationTracker | None,
+    suggestion_collector: SuggestionCollector | None,
+) -> SpillRecovery:
+    """Merge the records of a worker's spill file into the controller's state.
+
+    Args:
+        records: The records read from the spill file.
+        violation_tracker: The controller's violation tracker, if any.
+        suggestion_collector: The controller's suggestion collector, if any.
+
+    Returns:
+        The distribution counts found and how many tests were merged.
+
+    """
+    counts: dict[str, int] | None = None
+    tests = 0
+    for record in records:
+        found_counts = record.get('counts')
+        if isinstance(found_counts, dict):
+            counts = deserialize_distribution_counts(found_counts)
+        nodeid = record.get('test')
+        if isinstance(nodeid, str):
+            tests += 1
+            if violation_tracker is not None:
+                _merge_violations(violation_tracker, nodeid, record.get('violations'))
+            if suggestion_collector is not None:
+                _merge_suggestion(suggestion_collector, nodeid, record)
+    return SpillRecovery(counts=counts, tests=tests)
+
+
+def _merge_violations(tracker: ViolationTracker, nodeid: str, violations: object) -> None:
+    """Record a test's spilled [type, details, failed] violations."""
+    if not isinstance(violations, list):
+        return
+    for entry in violations:
+        try:
+            violation_type, details, failed = entry
+            tracker.record_violation(ViolationType(violation_type), nodeid, str(details), failed=failed is True)
+        except (TypeError, ValueError):
+            continue
+
+
+def _merge_suggestion(collector: SuggestionCollector, nodeid: str, record: dict[str, object]) -> None:
+    """Record a test's spilled size, duration and [resource type, details] observations."""
+    if 'size' in record:
+        size = record['size']
+        with contextlib.suppress(ValueError):
+            collector.record_current_size(nodeid, TestSize(size) if size is not None else None)
+    duration = record.get('duration')
+    if isinstance(duration, int | float):
+        collector.record_execution_time(nodeid, duration)
+    observations = record.get('observations')
+    if isinstance(observations, list):
+        for entry in observations:
+            try:
+                resource_type, details = entry
+                collector.record_observation(nodeid, ResourceType(resource_type), str(details))
+            except (TypeError, ValueError):
+                continue
@@ -0,0 +1,581 @@
+r"""Static size index: count the tests of each size without importing test code.
+
+Checking the test distribution with pytest --collect-only imports every test
+module and everything it imports. The static index reads the test files with
+ast instead, resolving a test's size the way collection would:
+
+- Size markers on the test function, such as @pytest.mark.small
+- Size markers on its classes, from decorators, a class-level pytestmark,
+  local base classes and the SmallTest/MediumTest/LargeTest/XLargeTest bases
+- The module-level pytestmark
+
+The nearest marker wins. @pytest.mark.parametrize fan-out is multiplied out
+when its values are a literal or a module-level constant (or list(), tuple()
+or sorted() of one), or a range() of integers; other fan-outs count once and
+mark the file's index as approximate. Tests generated at import time, such
+as pytest-bdd scenarios, are not seen.
+
+Each file's index is cached with its modification time, size and SHA-256, so
+only changed files are parsed again. Changed files are parsed in a process
+pool once there are enough of them to pay for starting it.
+
+Example:
+    >>> index = scan_source('import pytest\n@pytest.mark.small\ndef test_a():\n    pass\n', CollectionRules())
+    >>> index.counts[TestSize.SMALL]
+    1
+
+"""
+
+from __future__ import annotations
+
+import ast
+import fnmatch
+import hashlib
+import itertools
+import json
+import math
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import (
+    dataclass,
+    field,
+)
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Iterator,
+        Mapping,
+        Sequence,
+    )
+
+__all__ = [
+    'INDEX_FILE_NAME',
+    'CollectionRules',
+    'FileIndex',
+    'StaticIndex',
+    'StaticIndexCache',
+    'build_index',
+    'check_entry',
+    'find_test_files',
+    'scan_file',
+    'scan_source',
+]
+
+# Base classes from test_bases and the size their pytestmark gives subclasses
+_BASE_CLASS_SIZES: dict[str, str] = {
+    'SmallTest': TestSize.SMALL.marker_name,
+    'MediumTest': TestSize.MEDIUM.marker_name,
+    'LargeTest': TestSize.LARGE.marker_name,
+    'XLargeTest': TestSize.XLARGE.marker_name,
+}
+_SIZES_BY_MARKER = {size.marker_name: size for size in TestSize}
+
+# Fewer files to parse than this are parsed in-process; a process pool costs more to start
+PARALLEL_THRESHOLD = 32
+
+# Name of the cached index file in the cache directory
+INDEX_FILE_NAME = 'static_index.json'
+
+# Bump when scanning changes, so indexes cached by older versions are rebuilt
+INDEX_FORMAT_VERSION = 1
+
+# A parsed marker: its name and, for parametrize, its fan-out (None when unresolved)
+_Mark = tuple[str, int | None]
+
+_FunctionNode = ast.FunctionDef | ast.AsyncFunctionDef
+
+# Calls whose result has as many values as their one argument
+_SAME_LENGTH_CALLS = frozenset({'list', 'tuple', 'sorted', 'reversed'})
+
+# How many module-level names are followed to resolve parametrize values
+_MAX_CONSTANT_DEPTH = 8
+
+
+@dataclass(frozen=True)
+class CollectionRules:
+    """The pytest settings that decide which files, classes and functions are tests.
+
+    The defaults are pytest's own; the command reads the project's settings
+    from its pytest configuration.
+    """
+
+    python_files: tuple[str, ...] = ('test_*.py', '*_test.py')
+    python_classes: tuple[str, ...] = ('Test',)
+    python_functions: tuple[str, ...] = ('test',)
+    norecursedirs: tuple[str, ...] = ('*.egg', '.*', '_darcs', 'build', 'CVS', 'dist', 'node_modules', 'venv', '{arch}')
+
+
+@dataclass(frozen=True)
+class FileIndex:
+    """The tests of each size in one test file.
+
+    Attributes:
+        counts: Tests by size, with None for unsized tests.
+        approximate: Whether a parametrize fan-out could not be resolved and counted once.
+        error: Why the file could not be parsed, or None.
+
+    """
+
+    counts: Counter[TestSize | None] = field(default_factory=Counter)
+    approximate: bool = False
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, object]:
+        """Serialize the index for the cache file."""
+        return {
+            'counts': {(size.marker_name if size else 'unsized'): count for size, count in self.counts.items()},
+            'approximate': self.approximate,
+            'error': self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> FileIndex:
+        """Deserialize an index read from the cache file."""
+        counts: Counter[TestSize | None] = Counter()
+        for name, count in dict(data['counts']).items():  # type: ignore[call-overload]
+            counts[_SIZES_BY_MARKER.get(name)] = int(count)
+        error = data.get('error')
+        return cls(counts, approximate=bool(data.get('approximate')), error=str(error) if error else None)
+
+
+@dataclass(frozen=True)
+class StaticIndex:
+    """The static index of a set of test files.
+
+    Attributes:
+        files: Each file's index, by path.
+        parsed: How many files were parsed, rather than read from the cache.
+
+    """
+
+    files: dict[str, FileIndex]
+    parsed: int = 0
+
+    def counts(self) -> Counter[TestSize | None]:
+        """Count the tests of each size across the files, with None for unsized tests."""
+        total: Counter[TestSize | None] = Counter()
+        for index in self.files.values():
+            total.update(index.counts)
+        return total
+
+    @property
+    def approximate(self) -> list[str]:
+        """The files with a parametrize fan-out that could not be resolved."""
+        return [path for path, index in self.files.items() if index.approximate]
+
+    @property
+    def errors(self) -> dict[str, str]:
+        """The files that could not be parsed, with the reason."""
+        return {path: index.error for path, index in self.files.items() if index.error is not None}
+
+
+def _matches_name(name: str, patterns: Sequence[str]) -> bool:
+    """Check a class or function name the way pytest does: by prefix, or by glob if the pattern has wildcards."""
+    for pattern in patterns:
+        if name.startswith(pattern):
+            return True
+        if any(wildcard in pattern for wildcard in '*?[') and fnmatch.fnmatch(name, pattern):
+            return True
+    return False
+
+
+def _length(values: ast.expr | None, constants: Mapping[str, ast.expr], depth: int = 0) -> int | None:
+    """Count the values of a literal, a module-level constant, or range/list/tuple/sorted of one."""
+    if isinstance(values, ast.Name) and depth < _MAX_CONSTANT_DEPTH:
+        return _length(constants.get(values.id), constants, depth + 1)
+    if isinstance(values, ast.List | ast.Tuple | ast.Set):
+        return None if any(isinstance(element, ast.Starred) for element in values.elts) else len(values.elts)
+    if isinstance(values, ast.Dict):
+        return None if None in values.keys else len(values.keys)
+    if isinstance(values, ast.Call) and isinstance(values.func, ast.Name) and not values.keywords:
+        return _call_length(values.func.id, values.args, constants, depth)
+    return None
+
+
+def _call_length(function: str, args: list[ast.expr], constants: Mapping[str, ast.expr], depth: int) -> int | None:
+    """Count the values returned by a call to range, or to list/tuple/sorted of countable values."""
+    if function in _SAME_LENGTH_CALLS and len(args) == 1:
+        return _length(args[0], constants, depth)
+    if function != 'range' or not all(isinstance(arg, ast.Constant) and type(arg.value) is int for arg in args):
+        return None
+    try:
+        return len(range(*(arg.value for arg in args)))  # type: ignore[attr-defined]
+    except (TypeError, ValueError):
+        return None
+
+
+def _fanout(call: ast.Call, constants: Mapping[str, ast.expr]) -> int | None:
+    """Count the parameter sets of a parametrize call, or None if they cannot be resolved."""
+    argvalues = (
+        call.args[1]
+        if len(call.args) > 1
+        else next((keyword.value for keyword in call.keywords if keyword.arg == 'argvalues'), None)
+    )
+    count = _length(argvalues, constants)
+    # An empty parameter set still collects one (skipped) test
+    return None if count is None else max(count, 1)
+
+
+def _mark_target(expr: ast.expr) -> tuple[ast.Attribute, ast.Call | None] | None:
+    """Split an attribute expression, called or not, into the attribute and the call."""
+    call = expr if isinstance(expr, ast.Call) else None
+    target = call.func if call is not None else expr
+    return (target, call) if isinstance(target, ast.Attribute) else None
+
+
+def _parse_mark(expr: ast.expr, constants: Mapping[str, ast.expr]) -> _Mark | None:
+    """Parse a pytest.mark.NAME or mark.NAME expression, called or not."""
+    parts = _mark_target(expr)
+    if parts is None:
+        return None
+    target, call = parts
+    owner = target.value
+    is_mark = (isinstance(owner, ast.Attribute) and owner.attr == 'mark') or (
+        isinstance(owner, ast.Name) and owner.id == 'mark'
+    )
+    if not is_mark:
+        return None
+    if target.attr == 'parametrize':
+        return ('parametrize', _fanout(call, constants) if call is not None else None)
+    return (target.attr, 1)
+
+
+def _parse_marks(exprs: Iterable[ast.expr], constants: Mapping[str, ast.expr]) -> list[_Mark]:
+    """Parse the marks among decorators or pytestmark values."""
+    return [mark for mark in (_parse_mark(expr, constants) for expr in exprs) if mark is not None]
+
+
+def _assignments(body: Sequence[ast.stmt]) -> Iterator[tuple[str, ast.expr]]:
+    """Yield the names assigned in a module or class body with their values."""
+    for statement in body:
+        if isinstance(statement, ast.Assign):
+            for target in statement.targets:
+                if isinstance(target, ast.Name):
+                    yield target.id, statement.value
+        elif (
+            isinstance(statement, ast.AnnAssign)
+            and statement.value is not None
+            and isinstance(statement.target, ast.Name)
+        ):
+            yield statement.target.id, statement.value
+
+
+def _pytestmark(body: Sequence[ast.stmt], constants: Mapping[str, ast.expr]) -> list[_Mark]:
+    """Parse the marks assigned to pytestmark in a module or class body."""
+    value = next((value for name, value in _assignments(body) if name == 'pytestmark'), None)
+    if value is None:
+        return []
+    return _parse_marks(value.elts if isinstance(value, ast.List | ast.Tuple) else [value], constants)
+
+
+def _is_fixture(node: _FunctionNode) -> bool:
+    """Check whether a function is a fixture, which pytest never collects as a test."""
+    for decorator in node.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if (isinstance(target, ast.Attribute) and target.attr == 'fixture') or (
+            isinstance(target, ast.Name) and target.id == 'fixture'
+        ):
+            return True
+    return False
+
+
+class _ModuleScanner:
+    """Resolves the size and fan-out of every test in one parsed module."""
+
+    __slots__ = ('_class_marks', '_classes', '_constants', '_rules', 'approximate', 'counts')
+
+    def __init__(self, module: ast.Module, rules: CollectionRules) -> None:
+        """Initialize the scanner for a parsed module."""
+        self._rules = rules
+        self._classes = {node.name: node for node in module.body if isinstance(node, ast.ClassDef)}
+        self._constants = dict(_assignments(module.body))
+        self._class_marks: dict[int, list[_Mark]] = {}
+        self.counts: Counter[TestSize | None] = Counter()
+        self.approximate = False
+
+    def scan(self, module: ast.Module) -> None:
+        """Count the module's tests."""
+        levels = [_pytestmark(module.body, self._constants)]
+        for node in module.body:
+            if isinstance(node, _FunctionNode) and _matches_name(node.name, self._rules.python_functions):
+                self._add_test(node, levels)
+            elif isinstance(node, ast.ClassDef) and _matches_name(node.name, self._rules.python_classes):
+                self._scan_class(node, levels)
+
+    def _scan_class(self, node: ast.ClassDef, outer_levels: list[list[_Mark]]) -> None:
+        """Count the tests of a test class and its nested test classes."""
+        # pytest does not collect test classes with an __init__
+        if any(isinstance(statement, _FunctionNode) and statement.name == '__init__' for statement in node.body):
+            return
+        levels = [self._marks_of_class(node, set()), *outer_levels]
+        for method in self._methods(node, set()):
+            self._add_test(method, levels)
+        for statement in node.body:
+            if isinstance(statement, ast.ClassDef) and _matches_name(statement.name, self._rules.python_classes):
+                self._scan_class(statement, levels)
+
+    def _methods(self, node: ast.ClassDef, seen: set[str]) -> Iterator[_FunctionNode]:
+        """Yield the test methods of a class, including those inherited from classes in the module."""
+        for statement in node.body:
+            if (
+                isinstance(statement, _FunctionNode)
+                and statement.name not in seen
+                and _matches_name(statement.name, self._rules.python_functions)
+            ):
+                seen.add(statement.name)
+                yield statement
+        for base in node.bases:
+            local = self._classes.get(base.id) if isinstance(base, ast.Name) else None
+            if local is not None and local is not node:
+                yield from self._methods(local, seen)
+
+    def _marks_of_class(self, node: ast.ClassDef, visiting: set[str]) -> list[_Mark]:
+        """Get a class's marks: its own, then those of its bases."""
+        cached = self._class_marks.get(id(node))
+        if cached is not None:
+            return cached
+        visiting.add(node.name)
+        marks = _parse_marks(node.decorator_list, self._constants) + _pytestmark(node.body, self._constants)
+        for base in node.bases:
+            name = base.id if isinstance(base, ast.Name) else base.attr if isinstance(base, ast.Attribute) else None
+            if name in _BASE_CLASS_SIZES:
+                marks.append((_BASE_CLASS_SIZES[name], 1))
+            elif name in self._classes and name not in visiting:
+                marks.extend(self._marks_of_class(self._classes[name], visiting))
+        self._class_marks[id(node)] = marks
+        return marks
+
+    def _add_test(self, node: _FunctionNode, outer_levels: list[list[_Mark]]) -> None:
+        """Count a test function with the size of its nearest size marker."""
+        if _is_fixture(node):
+            return
+        levels = [_parse_marks(node.decorator_list, self._constants), *outer_levels]
+        size = next(
+            (_SIZES_BY_MARKER[name] for marks in levels for name, _ in marks if name in _SIZES_BY_MARKER),
+            None,
+        )
+        fanouts = [fanout for marks in levels for name, fanout in marks if name == 'parametrize']
+        if None in fanouts:
+            self.approximate = True
+        self.counts[size] += math.prod(fanout or 1 for fanout in fanouts)
+
+
+def scan_source(source: str | bytes, rules: CollectionRules) -> FileIndex:
+    """Count the tests of each size in a test module's source.
+
+    Args:
+        source: The module's source code.
+        rules: The names pytest collects as tests.
+
+    Returns:
+        The file's index, with the error set if the source does not parse.
+
+    """
+    try:
+        module = ast.parse(source)
+    except (SyntaxError, ValueError) as e:
+        return FileIndex(error=f'{type(e).__name__}: {e}')
+    scanner = _ModuleScanner(module, rules)
+    scanner.scan(module)
+    return FileIndex(scanner.counts, approximate=scanner.approximate)
+
+
+def scan_file(path: str, rules: CollectionRules) -> FileIndex:
+    """Count the tests of each size in a test file.
+
+    Args:
+        path: The test file's path.
+        rules: The names pytest collects as tests.
+
+    Returns:
+        The file's index, with the error set if it cannot be read or parsed.
+
+    """
+    try:
+        source = Path(path).read_bytes()
+    except OSError as e:
+        return FileIndex(error=f'{type(e).__name__}: {e}')
+    return scan_source(source, rules)
+
+
+def find_test_files(paths: Iterable[Path], rules: CollectionRules) -> list[Path]:
+    """Find the test files pytest would collect under the given paths.
+
+    Args:
+        paths: Files and directories to search; files are always included.
+        rules: The file patterns and directories to skip.
+
+    Returns:
+        The test files, sorted.
+
+    """
+    found: set[Path] = set()
+    for path in paths:
+        if path.is_file():
+            found.add(path)
+            continue
+        for directory, dirnames, filenames in os.walk(path):
+            dirnames[:] = [
+                name for name in dirnames if not any(fnmatch.fnmatch(name, pattern) for pattern in rules.norecursedirs)
+            ]
+            found.update(
+                Path(directory, name)
+                for name in filenames
+                if name.endswith('.py') and any(fnmatch.fnmatch(name, pattern) for pattern in rules.python_files)
+            )
+    return sorted(found)
+
+
+class StaticIndexCache:
+    """Each file's index, cached with the file's modification time, size and hash.
+
+    A file whose modification time or size changed is hashed again; only a
+    file whose content changed is parsed again. The cache is discarded when
+    the collection rules or the index format change.
+
+    Args:
+        path: Path of the cache file.
+
+    """
+
+    __slots__ = ('path',)
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the cache for a file path."""
+        self.path = path
+
+    def __repr__(self) -> str:
+        """Return a representation showing the cache file."""
+        return f'StaticIndexCache(path={self.path!r})'
+
+    def load(self, rules: CollectionRules) -> dict[str, dict[str, object]]:
+        """Read the cached entries, by file path.
+
+        Args:
+            rules: The collection rules the entries must have been built with.
+
+        Returns:
+            The entries, or an empty mapping if the cache is missing, unreadable or stale.
+
+        """
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != INDEX_FORMAT_VERSION:
+            return {}
+        if data.get('rules') != _rules_key(rules):
+            return {}
+        entries = data.get('files')
+        return entries if isinstance(entries, dict) else {}
+
+    def save(self, rules: CollectionRules, entries: dict[str, dict[str, object]]) -> None:
+        """Write the entries, replacing the cache file.
+
+        Args:
+            rules: The collection rules the entries were built with.
+            entries: The entries, by file path.
+
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Named per process, so xdist workers writing the same cache do not clash
+        pending = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+        data = {'version': INDEX_FORMAT_VERSION, 'rules': _rules_key(rules), 'files': entries}
+        pending.write_text(json.dumps(data, separators=(',', ':')), encoding='utf-8')
+        pending.replace(self.path)
+
+
+def _rules_key(rules: CollectionRules) -> list[list[str]]:
+    """Get the collection rules in the form stored in the cache file."""
+    return [list(rules.python_files), list(rules.python_classes), list(rules.python_functions)]
+
+
+def build_index(
+    files: Sequence[Path],
+    rules: CollectionRules,
+    cache: StaticIndexCache | None = None,
+    jobs: int | None = None,
+) -> StaticIndex:
+    """Index the test files, parsing only the files that changed since they were cached.
+
+    Args:
+        files: The test files, from find_test_files.
+        rules: The names pytest collects as tests.
+        cache: The cache of earlier indexes, or None to parse every file.
+        jobs: How many processes parse files; None for one per CPU, 1 to parse in-process.
+
+    Returns:
+        The index of the files.
+
+    """
+    cached = cache.load(rules) if cache is not None else {}
+    entries: dict[str, dict[str, object]] = {}
+    to_parse: list[str] = []
+    for path in files:
+        key = str(path)
+        entries[key], current = check_entry(path, cached.get(key))
+        if not current:
+            to_parse.append(key)
+
+    for key, index in zip(to_parse, _parse_files(to_parse, rules, jobs), strict=True):
+        entries.setdefault(key, {})['index'] = index.to_dict()
+
+    if cache is not None:
+        cache.save(rules, {key: entry for key, entry in entries.items() if entry.get('sha256') is not None})
+    return StaticIndex(
+        files={key: FileIndex.from_dict(entry['index']) for key, entry in entries.items()},  # type: ignore[arg-type]
+        parsed=len(to_parse),
+    )
+
+
+def check_entry(path: Path, entry: dict[str, object] | None) -> tuple[dict[str, object], bool]:
+    """Check whether a file's cached entry still describes its content.
+
+    The modification time and size are compared first; the file is hashed
+    only when they changed, so a file that was touched but not edited keeps
+    its entry.
+
+    Args:
+        path: The file's path.
+        entry: The file's cached entry, or None.
+
+    Returns:
+        The entry to cache for the file and whether it is current. A current
+        entry keeps its index; otherwise the entry only holds the file's
+        stamp, without a sha256 if the file cannot be read.
+
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}, False
+    if entry is not None and entry.get('mtime_ns') == stat.st_mtime_ns and entry.get('size') == stat.st_size:
+        return entry, True
+    digest = _digest(path)
+    if entry is not None and digest is not None and entry.get('sha256') == digest:
+        return {**entry, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}, True
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest}, False
+
+
+def _digest(path: Path) -> str | None:
+    """Hash a file's content, or return None if it cannot be read."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _parse_files(paths: list[str], rules: CollectionRules, jobs: int | None) -> list[FileIndex]:
+    """Parse the files, in a process pool when there are enough of them."""
+    workers = jobs if jobs is not None else os.cpu_count() or 1
+    if workers <= 1 or len(paths) < PARALLEL_THRESHOLD:
+        return [scan_file(path, rules) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(paths) // (workers * 4))
+        return list(executor.map(scan_file, paths, itertools.repeat(rules), chunksize=chunksize))
@@ -0,0 +1,125 @@
+"""Tiered fail-fast execution: cheapest sizes first, stopping at the first failing tier.
+
+Small tests give the fastest signal, but in collection order they are
+interleaved with expensive medium and large tests. In tiered mode the tests
+run one size tier at a time, small (and unsized) first, then medium, large
+and xlarge. Once a test in a tier fails, the rest of that tier still runs but
+every test in a more expensive tier is skipped.
+
+With pytest-xdist the workers only see their own failures, so the controller
+shares the first failed tier with them through a TierBarrier file.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+__all__ = [
+    'TIERED_SKIP_REASON',
+    'TierBarrier',
+    'tier_name',
+    'tier_of',
+    'tiered_order',
+]
+
+# Tiers in the order they run; unsized tests run with the small tests
+_TIERS: dict[TestSize | None, int] = {
+    None: 0,
+    TestSize.SMALL: 0,
+    TestSize.MEDIUM: 1,
+    TestSize.LARGE: 2,
+    TestSize.XLARGE: 3,
+}
+_TIER_NAMES = ('small', 'medium', 'large', 'xlarge')
+
+# Start of the skip reason for tests in a tier after a failed one
+TIERED_SKIP_REASON = 'tiered execution'
+
+
+def tier_of(size: TestSize | None) -> int:
+    """Get the tier a test of the given size runs in.
+
+    Args:
+        size: The test's size, or None for an unsized test.
+
+    Returns:
+        The tier, 0 for the first (small) tier.
+
+    """
+    return _TIERS[size]
+
+
+def tier_name(tier: int) -> str:
+    """Get the name of a tier, such as 'medium'."""
+    return _TIER_NAMES[tier]
+
+
+def tiered_order(sizes: Sequence[TestSize | None], expected: Sequence[float]) -> list[int]:
+    """Order tests by tier, then by expected duration within a tier.
+
+    Args:
+        sizes: Each test's size, or None for an unsized test.
+        expected: Each test's expected duration in seconds.
+
+    Returns:
+        The tests' positions in run order. Tests in the same tier and with
+        the same expected duration keep their collection order.
+
+    Example:
+        >>> tiered_order([TestSize.LARGE, TestSize.SMALL, TestSize.SMALL], [900.0, 0.5, 0.1])
+        [2, 1, 0]
+
+    """
+    return sorted(range(len(sizes)), key=lambda position: (_TIERS[sizes[position]], expected[position]))
+
+
+class TierBarrier:
+    """The first failed tier, shared through a file by the xdist controller.
+
+    The controller writes the file once a test fails; workers read it before
+    each test of a later tier until they see a failure.
+
+    Args:
+        path: Path of the barrier file; it exists only once a tier has failed.
+
+    """
+
+    __slots__ = ('path',)
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the barrier for a file path."""
+        self.path = path
+
+    def __repr__(self) -> str:
+        """Return a representation showing the barrier file."""
+        return f'TierBarrier(path={self.path!r})'
+
+    def read(self) -> int | None:
+        """Read the first failed tier.
+
+        Returns:
+            The tier, or None if no tier has failed yet.
+
+        """
+        try:
+            return int(self.path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def write(self, tier: int) -> None:
+        """Record the first failed tier for the workers.
+
+        Args:
+            tier: The failed tier.
+
+        """
+        # Replace atomically so a worker never reads a partly written file
+        pending = self.path.with_name(f'{self.path.name}.tmp')
+        pending.write_text(str(tier), encoding='utf-8')
+        pending.replace(self.path)
@@ -3,26 +3,53 @@
 from __future__ import annotations
 
 import time
+from array import array
 
 from pydantic import Field
 
+from pytest_test_categories.contracts import (
+    debug_contracts_enabled,
+    require_instance,
+    require_state,
+)
 from pytest_test_categories.types import (
     TestTimer,
     TimerState,
 )
 
 
-class WallTimer(TestTimer):
+@TestTimer.register
+class WallTimer:
     """Timer implementation using wall clock time.
 
     This timer uses time.perf_counter() for high-resolution timing
     that is not affected by system clock updates.
 
     This is the production adapter that should be used in real pytest runs.
+    One is created, started and stopped for every test, so it implements the
+    TestTimer interface as a slotted plain class instead of a pydantic model.
+    The TestTimer state-machine contracts are checked only when debug contracts
+    are enabled (see pytest_test_categories.contracts).
     """
 
-    start_time: float | None = Field(default=None, description='Start time in seconds')
-    end_time: float | None = Field(default=None, description='End time in seconds')
+    __slots__ = ('end_time', 'start_time', 'state')
+
+    def __init__(
+        self,
+        state: TimerState = TimerState.READY,
+        start_time: float | None = None,
+        end_time: float | None = None,
+    ) -> None:
+        """Initialize the timer, READY by default."""
+        if debug_contracts_enabled():
+            require_instance(state, TimerState, 'state')
+        self.state = state
+        self.start_time = start_time
+        self.end_time = end_time
+
+    def __repr__(self) -> str:
+        """Return a representation showing the state and recorded times."""
+        return f'WallTimer(state={self.state!r}, start_time={self.start_time!r}, end_time={self.end_time!r})'
 
     def reset(self) -> None:
         """Reset the timer to initial state."""
@@ -34,14 +61,21 @@ class WallTimer(TestTimer):
         """Start timing, recording the current time."""
         if self.state != TimerState.READY:
             self.reset()  # Reset if not in ready state
-        super().start()  # Parent handles state transition and contracts
+        self.state = TimerState.RUNNING
         self.start_time = time.perf_counter()
         self.end_time = None
 
     def stop(self) -> None:
-        """Stop timing, recording the end time."""
+        """Stop timing, recording the end time.
+
+        Raises:
+            icontract.ViolationError: In debug mode, if the timer is not RUNNING.
+
+        """
+        if debug_contracts_enabled():
+            require_state(self.state, TimerState.RUNNING, 'Timer must be in RUNNING state to stop')
         self.end_time = time.perf_counter()
-        super().stop()  # Parent handles state transition and contracts
+        self.state = TimerState.STOPPED
 
     def duration(self) -> float:
         """Calculate the duration in seconds.
@@ -63,6 +97,113 @@ class WallTimer(TestTimer):
         return self.end_time - self.start_time
 
 
+class TimingStore:
+    """Compact start/stop timestamps for every collected test.
+
+    Rather than one timer object per test, each item is given an ordinal at
+    collection and its perf_counter_ns() start and end values are written into
+    two preallocated array('q') buffers. Memory is 16 bytes per collected test
+    regardless of how many times tests run, and starting or stopping a test
+    allocates no objects.
+
+    An end value of 0 marks a test that has not been stopped since it was last
+    started.
+
+    Example:
+        >>> store = TimingStore(2)
+        >>> store.start(0)
+        >>> store.stop(0)
+        >>> store.duration(0) >= 0.0
+        True
+        >>> store.duration(1) is None
+        True
+
+    """
+
+    __slots__ = ('_end_ns', '_start_ns')
+
+    def __init__(self, capacity: int = 0) -> None:
+        """Preallocate buffers for the given number of tests."""
+        self._start_ns = array('q', bytes(8 * capacity))
+        self._end_ns = array('q', bytes(8 * capacity))
+
+    def __len__(self) -> int:
+        """Return the number of test slots in the store."""
+        return len(self._start_ns)
+
+    def __repr__(self) -> str:
+        """Return a representation showing the capacity."""
+        return f'TimingStore(capacity={len(self)})'
+
+    def reserve(self, capacity: int) -> None:
+        """Grow the buffers to hold at least capacity tests.
+
+        Existing timestamps are kept; the store never shrinks.
+
+        Args:
+            capacity: The number of tests the store must hold.
+
+        """
+        extra = capacity - len(self._start_ns)
+        if extra > 0:
+            self._start_ns.frombytes(bytes(8 * extra))
+            self._end_ns.frombytes(bytes(8 * extra))
+
+    def start(self, ordinal: int) -> None:
+        """Record the start time of a test, clearing any previous end time.
+
+        Args:
+            ordinal: The test's collection ordinal.
+
+        """
+        self._end_ns[ordinal] = 0
+        self._start_ns[ordinal] = time.perf_counter_ns()
+
+    def stop(self, ordinal: int) -> None:
+        """Record the end time of a test.
+
+        Args:
+            ordinal: The test's collection ordinal.
+
+        """
+        self._end_ns[ordinal] = time.perf_counter_ns()
+
+    def is_running(self, ordinal: int) -> bool:
+        """Return True if the test was started and not yet stopped."""
+        return self._start_ns[ordinal] != 0 and self._end_ns[ordinal] == 0
+
+    def span(self, ordinal: int) -> tuple[int, int] | None:
+        """Return the last recorded start and end of a test.
+
+        Args:
+            ordinal: The test's collection ordinal.
+
+        Returns:
+            The perf_counter_ns() values at the start and end, or None if the
+            test has not been stopped.
+
+        """
+        end_ns = self._end_ns[ordinal]
+        if end_ns == 0:
+            return None
+        return self._start_ns[ordinal], end_ns
+
+    def duration(self, ordinal: int) -> float | None:
+        """Return the last recorded duration of a test in seconds.
+
+        Args:
+            ordinal: The test's collection ordinal.
+
+        Returns:
+            The duration in seconds, or None if the test has not been stopped.
+
+        """
+        end_ns = self._end_ns[ordinal]
+        if end_ns == 0:
+            return None
+        return (end_ns - self._start_ns[ordinal]) / 1e9
+
+
 class FakeTimer(TestTimer):
     """Controllable timer adapter for testing.
 
@@ -39,6 +39,7 @@ __all__ = [
     'TimeLimit',
     'TimingViolationError',
     'get_limit',
+    'time_violation',
     'validate',
     'validate_with_baseline',
 ]
@@ -372,3 +373,34 @@ def validate_with_baseline(
             category_limit=category_limit,
             actual=duration,
         )
+
+
+def time_violation(size: TestSize, duration: float, baseline: float | None) -> str | None:
+    """Get the kind of time violation of a test's duration, without raising.
+
+    Matches validate_with_baseline: a test with a baseline is checked against
+    the baseline instead of its size's limit, and a baseline over the limit is
+    an error in the baseline rather than a violation.
+
+    Args:
+        size: The test size category.
+        duration: The actual test duration in seconds.
+        baseline: Optional custom performance baseline in seconds.
+
+    Returns:
+        'baseline' or 'timing', as the test size reports tag the violations,
+        or None if the duration is within its limit.
+
+    Example:
+        >>> time_violation(TestSize.SMALL, 1.5, None)
+        'timing'
+        >>> time_violation(TestSize.SMALL, 0.5, baseline=0.1)
+        'baseline'
+
+    """
+    category_limit = get_limit(size).limit
+    if baseline is None:
+        return 'timing' if duration > category_limit else None
+    if baseline > category_limit:
+        return None
+    return 'baseline' if duration > baseline else None
@@ -0,0 +1,294 @@
+"""Chrome Trace Event Format export of per-test timelines.
+
+A TraceRecorder buffers a span for each test and for its setup, call and
+teardown phases as tests run, one row per span across a few arrays, so
+recording a span allocates no objects and the buffer takes 28 bytes per span
+plus the node ID registry. Span times are perf_counter_ns() values, the clock
+of the session TimingStore; on one machine every process reads the same
+clock, so the spans of pytest-xdist workers line up on one timeline.
+
+write_trace writes the spans of every recorder once, as the JSON Object
+Format Perfetto and chrome://tracing open, with one track (thread) per
+recorder: 'main' for a run without workers, or each xdist worker's ID.
+
+Example:
+    >>> recorder = TraceRecorder()
+    >>> recorder.add_span('test_a.py::test_one', 'call', 1_000, 2_500, TestSize.SMALL, 'passed')
+    >>> len(recorder)
+    1
+
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from array import array
+from typing import TYPE_CHECKING
+
+from pytest_test_categories.nodeids import NodeIdRegistry
+from pytest_test_categories.types import TestSize
+from pytest_test_categories.violation_tracking import ViolationType
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Iterable,
+        Mapping,
+    )
+    from pathlib import Path
+
+__all__ = ['PHASES', 'TraceRecorder', 'violation_flag', 'write_trace']
+
+# Span kinds: a whole test, then its phases
+PHASES = ('test', 'setup', 'call', 'teardown')
+
+# Violation tags, named as in the test size reports, whose flags are 1 << their index
+VIOLATION_TAGS = ('timing', 'baseline', *(f'hermeticity:{violation_type.value}' for violation_type in ViolationType))
+
+_PHASE_CODES = {phase: code for code, phase in enumerate(PHASES)}
+_SIZE_LABELS = (*(size.value for size in TestSize), 'unsized')
+_SIZE_CODES: dict[TestSize | None, int] = {size: code for code, size in enumerate(TestSize)} | {None: len(TestSize)}
+_OUTCOMES = ('passed', 'failed', 'skipped')
+_OUTCOME_CODES = {outcome: code for code, outcome in enumerate(_OUTCOMES)}
+# Outcome code of an outcome pytest does not report, written as 'unknown'
+_UNKNOWN_OUTCOME = 255
+
+# The array fields of a serialized recorder, with their typecodes
+_COLUMNS = (('tests', 'q'), ('starts', 'q'), ('durations', 'q'))
+_CODE_COLUMNS = ('phases', 'sizes', 'outcomes', 'flags')
+
+# Trace process ID of the session; the tracks are its threads
+_PID = 1
+_TRACK_NUMBER = re.compile(r'(\d+)$')
+
+
+def violation_flag(tag: str) -> int:
+    """Get the flag of a violation tag, such as 'timing' or 'hermeticity:network'."""
+    return 1 << VIOLATION_TAGS.index(tag)
+
+
+class TraceRecorder:
+    """The spans of the tests run in one process, in the order they ended.
+
+    Attributes:
+        registry: The node IDs of the recorded tests.
+
+    """
+
+    __slots__ = ('_durations', '_flags', '_outcomes', '_phases', '_sizes', '_starts', '_tests', 'registry')
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        self.registry = NodeIdRegistry()
+        self._tests = array('q')
+        self._starts = array('q')
+        self._durations = array('q')
+        self._phases = bytearray()
+        self._sizes = bytearray()
+        self._outcomes = bytearray()
+        self._flags = bytearray()
+
+    def __len__(self) -> int:
+        """Return the number of recorded spans."""
+        return len(self._tests)
+
+    def __repr__(self) -> str:
+        """Return a representation showing how many spans are recorded."""
+        return f'TraceRecorder(spans={len(self)})'
+
+    def add_span(  # noqa: PLR0913, PLR0917 - one argument per column, on the per-phase path
+        self,
+        nodeid: str,
+        phase: str,
+        start_ns: int,
+        duration_ns: int,
+        size: TestSize | None,
+        outcome: str,
+        flags: int = 0,
+    ) -> None:
+        """Record a span.
+
+        Args:
+            nodeid: The pytest node ID of the test.
+            phase: 'test' for the whole test, or 'setup', 'call' or 'teardown'.
+            start_ns: The perf_counter_ns() value at the start of the span.
+            duration_ns: The span's duration in nanoseconds.
+            size: The test's size, or None if it has no size marker.
+            outcome: The outcome of the phase or test, such as 'passed'.
+            flags: The flags of the span's violations (see violation_flag).
+
+        """
+        self._tests.append(self.registry.add(nodeid))
+        self._starts.append(start_ns)
+        self._durations.append(max(duration_ns, 0))
+        self._phases.append(_PHASE_CODES[phase])
+        self._sizes.append(_SIZE_CODES[size])
+        self._outcomes.append(_OUTCOME_CODES.get(outcome, _UNKNOWN_OUTCOME))
+        self._flags.append(flags)
+
+    def get_spans(self) -> list[tuple[str, str, int, int, str, str, list[str]]]:
+        """Get the recorded spans.
+
+        Returns:
+            The node ID, phase, start and duration in nanoseconds, size label,
+            outcome and violation tags of each span, in the order recorded.
+
+        """
+        return [
+            (
+                self.registry.nodeids[test],
+                PHASES[phase],
+                start,
+                duration,
+                _SIZE_LABELS[size],
+                _OUTCOMES[outcome] if outcome < len(_OUTCOMES) else 'unknown',
+                _tags(flags),
+            )
+            for test, start, duration, phase, size, outcome, flags in zip(
+                self._tests,
+                self._starts,
+                self._durations,
+                self._phases,
+                self._sizes,
+                self._outcomes,
+                self._flags,
+                strict=True,
+            )
+        ]
+
+    def to_dict(self) -> dict[str, object]:
+        """Serialize the spans for xdist worker output.
+
+        Returns:
+            A dict of the node IDs and each column's bytes, which execnet can send.
+
+        """
+        return {
+            'nodeids': list(self.registry.nodeids),
+            'tests': self._tests.tobytes(),
+            'starts': self._starts.tobytes(),
+            'durations': self._durations.tobytes(),
+            'phases': bytes(self._phases),
+            'sizes': bytes(self._sizes),
+            'outcomes': bytes(self._outcomes),
+            'flags': bytes(self._flags),
+        }
+
+    def merge(self, data: Mapping[str, object]) -> None:
+        """Add a worker's spans to these.
+
+        Data that is not of the form to_dict writes is skipped.
+
+        Args:
+            data: Spans serialized by to_dict.
+
+        """
+        nodeids = data.get('nodeids')
+        if not isinstance(nodeids, list) or not all(isinstance(nodeid, str) for nodeid in nodeids):
+            return
+        columns = []
+        for name, typecode in _COLUMNS:
+            column = array(typecode)
+            raw = data.get(name)
+            if not isinstance(raw, bytes) or len(raw) % column.itemsize:
+                return
+            column.frombytes(raw)
+            columns.append(column)
+        codes = [data.get(name) for name in _CODE_COLUMNS]
+        if not all(isinstance(code, bytes) and len(code) == len(columns[0]) for code in codes):
+            return
+        tests, starts, durations = columns
+        if len(starts) != len(tests) or len(durations) != len(tests):
+            return
+        if tests and (min(tests) < 0 or max(tests) >= len(nodeids)):
+            return
+        test_ids = self.registry.add_all(nodeids)
+        self._tests.extend(test_ids[test] for test in tests)
+        self._starts.extend(starts)
+        self._durations.extend(durations)
+        for column, code in zip((self._phases, self._sizes, self._outcomes, self._flags), codes, strict=True):
+            column.extend(code)  # type: ignore[arg-type]
+
+    def first_start(self) -> int | None:
+        """Get the earliest start of the recorded spans, or None if there are none."""
+        return min(self._starts) if self._starts else None
+
+    def iter_events(self, tid: int, origin_ns: int) -> Iterable[str]:
+        """Get the complete ('X') event of each span, as JSON text.
+
+        Args:
+            tid: The trace thread ID of the recorder's track.
+            origin_ns: The perf_counter_ns() value written as time 0.
+
+        Yields:
+            The JSON text of each event.
+
+        """
+        nodeids = [json.dumps(nodeid) for nodeid in self.registry.nodeids]
+        size_args = [f'"size":"{label}"' for label in _SIZE_LABELS]
+        columns = zip(
+            self._tests,
+            self._starts,
+            self._durations,
+            self._phases,
+            self._sizes,
+            self._outcomes,
+            self._flags,
+            strict=True,
+        )
+        for test, start, duration, phase, size, outcome, flags in columns:
+            outcome_name = _OUTCOMES[outcome] if outcome < len(_OUTCOMES) else 'unknown'
+            args = f'{size_args[size]},"outcome":"{outcome_name}"'
+            if flags:
+                args += ',"violations":' + json.dumps(_tags(flags))
+            # The whole test is named by its node ID; its phases nest inside it on the track
+            if phase == 0:
+                name = nodeids[test]
+            else:
+                name = f'"{PHASES[phase]}"'
+                args += f',"test":{nodeids[test]}'
+            yield (
+                f'{{"name":{name},"cat":"{PHASES[phase]}","ph":"X","ts":{(start - origin_ns) / 1000:.3f},'
+                f'"dur":{duration / 1000:.3f},"pid":{_PID},"tid":{tid},"args":{{{args}}}}}'
+            )
+
+
+def _tags(flags: int) -> list[str]:
+    """Get the violation tags of a span's flags."""
+    return [tag for bit, tag in enumerate(VIOLATION_TAGS) if flags & (1 << bit)]
+
+
+def _track_order(name: str) -> tuple[str, int]:
+    """Sort tracks by name, numbering gw2 before gw10."""
+    match = _TRACK_NUMBER.search(name)
+    if match is None:
+        return name, -1
+    return name[: match.start()], int(match.group(1))
+
+
+def write_trace(path: Path, tracks: Mapping[str, TraceRecorder]) -> None:
+    """Write the spans of every track as a Trace Event Format file.
+
+    Times are written in microseconds from the earliest span of any track.
+
+    Args:
+        path: Path of the trace file; missing parent directories are created.
+        tracks: The recorder of each track, by track name.
+
+    """
+    names = sorted((name for name, recorder in tracks.items() if len(recorder)), key=_track_order)
+    starts = [tracks[name].first_start() for name in names]
+    origin_ns = min((start for start in starts if start is not None), default=0)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('w', encoding='utf-8') as trace_file:
+        trace_file.write('{"traceEvents":[\n')
+        trace_file.write(f'{{"name":"process_name","ph":"M","pid":{_PID},"tid":0,"args":{{"name":"pytest"}}}}')
+        for tid, name in enumerate(names):
+            trace_file.write(
+                f',\n{{"name":"thread_name","ph":"M","pid":{_PID},"tid":{tid},"args":{{"name":{json.dumps(name)}}}}}'
+                f',\n{{"name":"thread_sort_index","ph":"M","pid":{_PID},"tid":{tid},"args":{{"sort_index":{tid}}}}}'
+            )
+            for event in tracks[name].iter_events(tid, origin_ns):
+                trace_file.write(',\n')
+                trace_file.write(event)
+        trace_file.write('\n],"displayTimeUnit":"ms"}\n')
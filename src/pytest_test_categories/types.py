@@ -4,16 +4,22 @@ from __future__ import annotations
 
 from abc import (
     ABC,
+    ABCMeta,
     abstractmethod,
 )
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import (
+    TYPE_CHECKING,
+    Protocol,
+    runtime_checkable,
+)
 
 from icontract import (
     ensure,
     require,
 )
 from pydantic import BaseModel
+from pydantic._internal._model_construction import ModelMetaclass
 
 
 # TimingViolationError is now defined in timing.py with enhanced error messages
@@ -100,7 +106,42 @@ class TimerState(StrEnum):
     STOPPED = 'stopped'
 
 
-class TestTimer(BaseModel, ABC):
+class PatchMode(StrEnum):
+    """When resource blockers install their interception wrappers.
+
+    - TEST: Patch before each test and restore afterwards (default)
+    - SESSION: Patch once at session start and only switch the current policy per test
+    """
+
+    TEST = 'test'
+    SESSION = 'session'
+
+
+class EnforcementEngine(StrEnum):
+    """How resource access is intercepted during tests.
+
+    - PATCH: Monkeypatch module attributes such as socket.socket (default)
+    - AUDIT: Observe CPython audit events through a single sys.addaudithook callback
+    """
+
+    PATCH = 'patch'
+    AUDIT = 'audit'
+
+
+class PortMeta(ModelMetaclass):
+    """Metaclass of the pydantic ports that honours virtual subclasses.
+
+    pydantic skips ABC virtual subclasses in isinstance() and issubclass()
+    checks. The production adapters are slotted plain classes registered with
+    Port.register(), so the ports restore the ABCMeta checks.
+    """
+
+    __instancecheck__ = ABCMeta.__instancecheck__
+    __subclasscheck__ = ABCMeta.__subclasscheck__
+    register = ABCMeta.register
+
+
+class TestTimer(BaseModel, ABC, metaclass=PortMeta):
     """Abstract base class defining the timer interface."""
 
     state: TimerState = TimerState.READY
@@ -146,6 +187,30 @@ class TestTimer(BaseModel, ABC):
         """
 
 
+@runtime_checkable
+class TimerProtocol(Protocol):
+    """Structural interface shared by TestTimer implementations and WallTimer.
+
+    WallTimer implements the TestTimer interface as a slotted plain class
+    rather than a TestTimer subclass, so code that accepts any timer is typed
+    against this protocol.
+    """
+
+    state: TimerState
+
+    def reset(self) -> None:
+        """Reset timer to initial state."""
+
+    def start(self) -> None:
+        """Start timing a test."""
+
+    def stop(self) -> None:
+        """Stop timing a test."""
+
+    def duration(self) -> float:
+        """Get the duration of the test in seconds."""
+
+
 class TestItemPort(ABC):
     """Abstract base class defining the test item interface.
 
@@ -421,7 +486,9 @@ class PluginState(BaseModel):
     and test discovery service.
 
     The timer_factory allows tests to inject FakeTimer for deterministic
-    testing while production uses WallTimer for actual timing.
+    testing. With the default WallTimer factory, collected tests are timed in
+    the timing_store instead, indexed by the ordinal assigned at collection,
+    and timers only holds timers for tests outside that store.
 
     The test_discovery_service is created during pytest_configure and uses
     dependency injection to provide the warning system adapter.
@@ -431,6 +498,17 @@ class PluginState(BaseModel):
 
     The violation_tracker collects hermeticity violations for terminal summary
     reporting in both WARN and STRICT enforcement modes.
+
+    The duration_recorder buffers call durations for the persistent duration
+    history when it is enabled.
+
+    The budget_selection summarizes the tests kept by --test-categories-budget.
+
+    The pruning_summary counts the test files --test-categories-sizes kept
+    out of collection.
+
+    The session_metrics accumulate the --test-categories-metrics-file
+    metrics when it is set.
     """
 
     model_config = {'arbitrary_types_allowed': True}
@@ -440,9 +518,11 @@ class PluginState(BaseModel):
     warned_tests: set[str] = set()
     test_size_report: object | None = None  # Will be TestSizeReport
     # Store timers per test item to avoid race conditions in parallel execution
-    timers: dict[str, TestTimer] = {}
+    timers: dict[str, TimerProtocol] = {}
     # Timer factory for dependency injection (hexagonal architecture port)
-    timer_factory: type[TestTimer] | None = None
+    timer_factory: type[TimerProtocol] | None = None
+    # Array-backed timestamps for collected tests when using the WallTimer factory
+    timing_store: object | None = None  # Will be TimingStore
     # Test discovery service for finding size markers (hexagonal architecture)
     test_discovery_service: object | None = None
     # Distribution configuration for targets and tolerances (configurable)
@@ -451,6 +531,14 @@ class PluginState(BaseModel):
     violation_tracker: object | None = None  # ViolationTracker, avoiding circular import
     # Suggestion collector for auto-categorization suggestions
     suggestion_collector: object | None = None  # SuggestionCollector, avoiding circular import
+    # Recorder for the per-test duration history (when history is enabled)
+    duration_recorder: object | None = None  # Will be DurationRecorder
+    # Tests selected within --test-categories-budget, for the terminal summary and JSON report
+    budget_selection: object | None = None  # Will be BudgetSelection
+    # Test files pruned from collection by --test-categories-sizes, for the terminal summary
+    pruning_summary: object | None = None  # Will be PruningSummary
+    # Duration histograms and overhead timings for --test-categories-metrics-file
+    session_metrics: object | None = None  # Will be SessionMetrics
 
     def __init__(self, **data: object) -> None:
         """Initialize PluginState with defaults for circular import fields."""
@@ -197,17 +197,18 @@ class ViolationTracker:
         """
         return len(self._violations.get(violation_type, []))
 
-    def get_violations_by_type(self, violation_type: ViolationType) -> list[ViolationRecord]:
+    def get_violations_by_type(self, violation_type: ViolationType, start: int = 0) -> list[ViolationRecord]:
         """Get all violations of a specific type.
 
         Args:
             violation_type: The type to retrieve violations for.
+            start: How many of the earliest violations of the type to leave out.
 
         Returns:
             List of ViolationRecord instances for the specified type.
 
         """
-        return list(self._violations.get(violation_type, []))
+        return self._violations.get(violation_type, [])[start:]
 
     def get_test_nodeids_by_type(self, violation_type: ViolationType) -> list[str]:
         """Get the list of test nodeids for a specific violation type.
@@ -0,0 +1,177 @@
+"""Preemptive timeout watchdog that interrupts tests exceeding their time limit.
+
+Time limits are normally checked after a test finishes, so a hung test runs
+until the CI job times out. The watchdog is armed when a test's call phase
+starts and interrupts the test once its limit passes:
+
+- On the main thread, where signal.setitimer is available, a SIGALRM handler
+  raises the timeout error at the interrupted frame. Blocking calls such as
+  time.sleep() and socket reads are interrupted too.
+- Elsewhere (another thread, or platforms without setitimer), a watchdog
+  thread raises WatchdogInterrupt asynchronously in the test's thread. This is
+  delivered at the next bytecode boundary, so a test blocked inside a single C
+  call is only interrupted once that call returns.
+
+There is only one ITIMER_REAL timer per process, so the watchdog also uses a
+thread while another caller's timer is pending, such as pytest-timeout's
+signal method or an outer pytest session's watchdog. That timer and its
+SIGALRM handler are left untouched.
+
+In both cases the stack at the interruption point is captured in
+TimeoutWatchdog.stack as a traceback.StackSummary.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import signal
+import sys
+import threading
+import traceback
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import FrameType
+
+__all__ = [
+    'TimeoutWatchdog',
+    'WatchdogInterrupt',
+    'signal_timer_available',
+]
+
+
+class WatchdogInterrupt(Exception):  # noqa: N818
+    """Raised asynchronously in a test's thread by the thread-based watchdog.
+
+    Asynchronous exceptions can only be raised by class, so the error built
+    for the timeout is kept in TimeoutWatchdog.error instead.
+    """
+
+
+def signal_timer_available() -> bool:
+    """Check whether the SIGALRM interval timer can be used from this thread.
+
+    Returns:
+        True on platforms with signal.setitimer when called from the main thread.
+
+    """
+    return hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+
+
+def _signal_timer_pending() -> bool:
+    """Check whether another caller's ITIMER_REAL timer is counting down."""
+    return signal.getitimer(signal.ITIMER_REAL)[0] > 0
+
+
+class TimeoutWatchdog:
+    """Interrupts the current thread once a time limit passes.
+
+    One watchdog is armed for each test's call phase and cancelled when the
+    call completes. After it fires, error holds the exception built by the
+    make_error callback and stack holds the stack of the interrupted frame.
+
+    Example:
+        >>> watchdog = TimeoutWatchdog()
+        >>> watchdog.arm(60.0, lambda: TimeoutError('too slow'))
+        >>> watchdog.cancel()
+        >>> watchdog.fired
+        False
+
+    """
+
+    __slots__ = (
+        '_armed',
+        '_lock',
+        '_make_error',
+        '_previous_handler',
+        '_thread_ident',
+        '_timer',
+        '_uses_signal',
+        'error',
+        'stack',
+    )
+
+    def __init__(self) -> None:
+        """Initialize a disarmed watchdog."""
+        self._armed = False
+        # Reentrant because the SIGALRM handler can run while cancel() holds the lock
+        self._lock = threading.RLock()
+        self._make_error: Callable[[], BaseException] | None = None
+        self._previous_handler: Callable[[int, FrameType | None], object] | int | None = None
+        self._thread_ident: int | None = None
+        self._timer: threading.Timer | None = None
+        self._uses_signal = False
+        self.error: BaseException | None = None
+        self.stack = traceback.StackSummary()
+
+    def __repr__(self) -> str:
+        """Return a representation showing whether the watchdog is armed or fired."""
+        return f'TimeoutWatchdog(armed={self._armed!r}, fired={self.fired!r})'
+
+    @property
+    def fired(self) -> bool:
+        """Whether the watchdog interrupted the test since it was last armed."""
+        return self.error is not None
+
+    def arm(self, seconds: float, make_error: Callable[[], BaseException]) -> None:
+        """Start the countdown for the current thread.
+
+        Args:
+            seconds: Time until the thread is interrupted.
+            make_error: Builds the exception to raise when the watchdog fires.
+
+        """
+        self.cancel()
+        self.error = None
+        self.stack = traceback.StackSummary()
+        self._make_error = make_error
+        self._armed = True
+        if signal_timer_available() and not _signal_timer_pending():
+            self._uses_signal = True
+            self._previous_handler = signal.signal(signal.SIGALRM, self._on_alarm)
+            signal.setitimer(signal.ITIMER_REAL, seconds)
+        else:
+            self._thread_ident = threading.get_ident()
+            self._timer = threading.Timer(seconds, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self) -> None:
+        """Stop the countdown, if armed, and restore the previous SIGALRM handler."""
+        with self._lock:
+            self._armed = False
+        if self._uses_signal:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler or signal.SIG_DFL)
+            self._previous_handler = None
+            self._uses_signal = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _fire(self, frame: FrameType | None) -> BaseException | None:
+        """Record the interrupted stack and build the error, if still armed."""
+        with self._lock:
+            if not self._armed or self._make_error is None:
+                return None
+            self._armed = False
+        self.stack = traceback.extract_stack(frame) if frame is not None else traceback.StackSummary()
+        self.error = self._make_error()
+        return self.error
+
+    def _on_alarm(self, signum: int, frame: FrameType | None) -> None:  # noqa: ARG002
+        """SIGALRM handler: raise the timeout error in the interrupted frame."""
+        error = self._fire(frame)
+        if error is not None:
+            raise error
+
+    def _on_timer(self) -> None:
+        """Watchdog thread callback: raise WatchdogInterrupt in the test's thread."""
+        thread_ident = self._thread_ident
+        if thread_ident is None:
+            return
+        if self._fire(sys._current_frames().get(thread_ident)) is not None:  # noqa: SLF001
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                ctypes.c_ulong(thread_ident), ctypes.py_object(WatchdogInterrupt)
+            )
@@ -11,8 +11,16 @@ Key concepts:
 - workeroutput: Dict on worker config for passing data to controller
 
 Hooks used:
-- pytest_sessionfinish (worker): Send stats via workeroutput
-- pytest_testnodedown (controller): Aggregate stats from workers
+- pytest_runtest_makereport (worker): Attach each test's size and result to
+  its reports, which xdist sends to the controller as the test runs
+- pytest_runtest_logreport (controller): Add each test to the size report as
+  its reports arrive
+- pytest_sessionfinish (worker): Send distribution counts, hermeticity
+  violations and suggestion observations via workeroutput
+- pytest_testnodedown (controller): Aggregate them from workers, or recover
+  them from the spill file of a worker that crashed (see spill)
+- pytest_xdist_make_scheduler (controller): Size-aware scheduling with
+  --test-categories-schedule (see xdist_scheduler)
 """
 
 from __future__ import annotations
@@ -20,20 +28,43 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING
 
+from pytest_test_categories.suggestion import ResourceType
 from pytest_test_categories.types import TestSize
+from pytest_test_categories.violation_tracking import ViolationType
 
 if TYPE_CHECKING:
     import pytest
 
     from pytest_test_categories.distribution.stats import TestCounts
     from pytest_test_categories.reporting import TestSizeReport
+    from pytest_test_categories.suggestion import SuggestionCollector
+    from pytest_test_categories.violation_tracking import ViolationTracker
 
 # Environment variable set by xdist on worker processes
 XDIST_WORKER_ENV = 'PYTEST_XDIST_WORKER'
 
 # Keys for worker output data
 WORKEROUTPUT_DISTRIBUTION_KEY = 'test_categories_distribution'
-WORKEROUTPUT_REPORT_KEY = 'test_categories_report'
+WORKEROUTPUT_BUDGET_KEY = 'test_categories_budget'
+WORKEROUTPUT_PRUNING_KEY = 'test_categories_pruning'
+WORKEROUTPUT_VIOLATIONS_KEY = 'test_categories_violations'
+WORKEROUTPUT_SUGGESTIONS_KEY = 'test_categories_suggestions'
+WORKEROUTPUT_METRICS_KEY = 'test_categories_metrics'
+WORKEROUTPUT_TRACE_KEY = 'test_categories_trace'
+
+# TestReport attribute carrying a test's size or result from a worker; xdist serializes it with the report
+REPORT_DATA_ATTR = 'test_categories'
+
+# Keys for the tiered execution barrier file and the spill directory in the controller's workerinput
+WORKERINPUT_TIER_BARRIER_KEY = 'test_categories_tier_barrier'
+WORKERINPUT_SPILL_DIR_KEY = 'test_categories_spill_dir'
+
+_SIZES_BY_LABEL = {size.label: size for size in TestSize}
+
+# A size's code in the serialized worker data is its position here, and likewise for the other enums
+_SIZE_CODES = tuple(TestSize)
+_VIOLATION_TYPE_CODES = tuple(ViolationType)
+_RESOURCE_TYPE_CODES = tuple(ResourceType)
 
 
 def is_xdist_worker() -> bool:
@@ -46,6 +77,42 @@ def is_xdist_worker() -> bool:
     return XDIST_WORKER_ENV in os.environ
 
 
+def is_xdist_worker_session(config: pytest.Config) -> bool:
+    """Check if a session runs on an xdist worker that sends its test reports to a controller.
+
+    Unlike is_xdist_worker, this is False for a session that pytester runs
+    in-process on a worker, which reports to nobody but itself.
+
+    Args:
+        config: The session's pytest configuration object.
+
+    Returns:
+        True if xdist started this session on a worker.
+
+    """
+    return hasattr(config, 'workerinput')
+
+
+def size_from_nodeid(nodeid: str) -> TestSize | None:
+    """Get a test's size from the label pytest_collection_modifyitems appends to its node ID.
+
+    The controller does not collect tests, so the label is all it knows of a
+    test's size.
+
+    Args:
+        nodeid: The test's node ID.
+
+    Returns:
+        The test's size, or None for an unsized test.
+
+    Example:
+        >>> size_from_nodeid('test_a.py::test_one [MEDIUM]')
+        <TestSize.MEDIUM: 'medium'>
+
+    """
+    return _SIZES_BY_LABEL.get(nodeid.rpartition(' ')[2])
+
+
 def is_xdist_controller(config: pytest.Config) -> bool:
     """Check if current process is the xdist controller.
 
@@ -112,86 +179,225 @@ def deserialize_distribution_counts(data: dict[str, int]) -> dict[str, int]:
     }
 
 
-def serialize_report_data(report: TestSizeReport) -> dict[str, object]:
-    """Serialize TestSizeReport data for worker output.
+def _column(worker_data: dict[str, object], key: str, length: int) -> list[object]:
+    """Get a parallel array from worker data, or Nones if it is missing or of another length."""
+    column = worker_data.get(key)
+    if isinstance(column, list) and len(column) == length:
+        return column
+    return [None] * length
+
+
+def _decode(table: tuple[object, ...] | list[object], code: object) -> object | None:
+    """Get the value a code in worker data stands for, or None if it is not a valid code."""
+    if isinstance(code, int) and 0 <= code < len(table):
+        return table[code]
+    return None
+
+
+def _table(worker_data: dict[str, object], key: str) -> list[object]:
+    """Get an interned value table from worker data, or an empty table if it is missing."""
+    table = worker_data.get(key)
+    return table if isinstance(table, list) else []
+
+
+def serialize_violations(tracker: ViolationTracker) -> dict[str, object]:
+    """Serialize a worker's hermeticity violations for worker output.
+
+    Each violation is sent as a type code, a test code and a detail code,
+    indexing the ViolationType members and the 'nodeids' and 'details' tables,
+    which hold each node ID and detail once however many violations share it.
 
     Args:
-        report: The test size report to serialize.
+        tracker: The worker's violation tracker.
 
     Returns:
         A dict that can be safely passed through workeroutput.
 
     """
-    # Convert defaultdict to regular dict with string keys
-    sized_tests: dict[str, list[str]] = {}
-    for size in TestSize:
-        sized_tests[size.value] = list(report.sized_tests.get(size, []))
-
+    nodeid_codes: dict[str, int] = {}
+    detail_codes: dict[str, int] = {}
+    types: list[int] = []
+    tests: list[int] = []
+    details: list[int] = []
+    failed: list[bool] = []
+    for type_code, violation_type in enumerate(_VIOLATION_TYPE_CODES):
+        for record in tracker.get_violations_by_type(violation_type):
+            types.append(type_code)
+            tests.append(nodeid_codes.setdefault(record.test_nodeid, len(nodeid_codes)))
+            details.append(detail_codes.setdefault(record.details, len(detail_codes)))
+            failed.append(record.failed)
     return {
-        'sized_tests': sized_tests,
-        'unsized_tests': list(report.unsized_tests),
-        'test_durations': dict(report.test_durations),
-        'test_outcomes': dict(report.test_outcomes),
+        'nodeids': list(nodeid_codes),
+        'details': list(detail_codes),
+        'types': types,
+        'tests': tests,
+        'detail_codes': details,
+        'failed': failed,
     }
 
 
-def _merge_sized_tests(target: TestSizeReport, sized_tests: object) -> None:
-    """Merge sized tests from worker data into target report."""
-    if not isinstance(sized_tests, dict):
-        return
-    for size_str, tests in sized_tests.items():
-        if not isinstance(tests, list):
-            continue
-        try:
-            size = TestSize(size_str)
-        except ValueError:
-            continue
-        for nodeid in tests:
-            if nodeid not in target.sized_tests[size]:
-                target.sized_tests[size].append(nodeid)
+def merge_violations(target: ViolationTracker, worker_data: dict[str, object]) -> None:
+    """Merge a worker's hermeticity violations into the target tracker.
 
+    Args:
+        target: The controller's violation tracker.
+        worker_data: Serialized violations from a worker (see serialize_violations).
 
-def _merge_unsized_tests(target: TestSizeReport, unsized_tests: object) -> None:
-    """Merge unsized tests from worker data into target report."""
-    if not isinstance(unsized_tests, list):
+    """
+    types = worker_data.get('types')
+    if not isinstance(types, list):
         return
-    for nodeid in unsized_tests:
-        if nodeid not in target.unsized_tests:
-            target.unsized_tests.append(nodeid)
+    nodeids = _table(worker_data, 'nodeids')
+    details = _table(worker_data, 'details')
+    columns = zip(
+        types,
+        _column(worker_data, 'tests', len(types)),
+        _column(worker_data, 'detail_codes', len(types)),
+        _column(worker_data, 'failed', len(types)),
+        strict=True,
+    )
+    for type_code, test_code, detail_code, failed in columns:
+        violation_type = _decode(_VIOLATION_TYPE_CODES, type_code)
+        nodeid = _decode(nodeids, test_code)
+        detail = _decode(details, detail_code)
+        if isinstance(violation_type, ViolationType) and isinstance(nodeid, str) and isinstance(detail, str):
+            target.record_violation(violation_type, nodeid, detail, failed=failed is True)
+
+
+def serialize_suggestions(collector: SuggestionCollector) -> dict[str, object]:
+    """Serialize a worker's suggestion observations for worker output.
+
+    Every test the worker recorded is sent with its size code, or None if
+    uncategorized; tests it ran also have a duration, and resource accesses
+    are sent as test, resource type and detail codes. Node IDs and details are
+    interned in the 'nodeids' and 'details' tables.
 
+    Args:
+        collector: The worker's suggestion collector.
 
-def _merge_durations(target: TestSizeReport, durations: object) -> None:
-    """Merge test durations from worker data into target report."""
-    if not isinstance(durations, dict):
-        return
-    for nodeid, duration in durations.items():
-        if isinstance(duration, (int, float)):
-            target.test_durations[nodeid] = duration
+    Returns:
+        A dict that can be safely passed through workeroutput.
 
+    """
+    nodeids = list(collector.get_all_test_nodeids())
+    detail_codes: dict[str, int] = {}
+    observed_tests: list[int] = []
+    resource_types: list[int] = []
+    details: list[int] = []
+    timed_tests: list[int] = []
+    durations: list[float] = []
+    sizes: list[int | None] = []
+    for test_code, nodeid in enumerate(nodeids):
+        for observation in collector.get_observations(nodeid):
+            observed_tests.append(test_code)
+            resource_types.append(_RESOURCE_TYPE_CODES.index(observation.resource_type))
+            details.append(detail_codes.setdefault(observation.details, len(detail_codes)))
+        duration = collector.get_execution_time(nodeid)
+        if duration is not None:
+            timed_tests.append(test_code)
+            durations.append(duration)
+        size = collector.get_current_size(nodeid)
+        sizes.append(_SIZE_CODES.index(size) if size is not None else None)
+    return {
+        'nodeids': nodeids,
+        'details': list(detail_codes),
+        'sizes': sizes,
+        'observed_tests': observed_tests,
+        'resource_types': resource_types,
+        'detail_codes': details,
+        'timed_tests': timed_tests,
+        'durations': durations,
+    }
 
-def _merge_outcomes(target: TestSizeReport, outcomes: object) -> None:
-    """Merge test outcomes from worker data into target report."""
-    if not isinstance(outcomes, dict):
-        return
-    for nodeid, outcome in outcomes.items():
-        if isinstance(outcome, str):
-            target.test_outcomes[nodeid] = outcome
 
+def merge_suggestions(target: SuggestionCollector, worker_data: dict[str, object]) -> None:
+    """Merge a worker's suggestion observations into the target collector.
+
+    Every worker collects the whole suite, so the sizes of tests another
+    worker ran are recorded again with the same value.
 
-def merge_report_data(
-    target: TestSizeReport,
-    worker_data: dict[str, object],
-) -> None:
-    """Merge worker report data into target report.
+    Args:
+        target: The controller's suggestion collector.
+        worker_data: Serialized observations from a worker (see serialize_suggestions).
 
-    This modifies the target report in place, adding all tests from the worker.
+    """
+    nodeids = _table(worker_data, 'nodeids')
+    details = _table(worker_data, 'details')
+    for nodeid, size_code in zip(nodeids, _column(worker_data, 'sizes', len(nodeids)), strict=True):
+        size = _decode(_SIZE_CODES, size_code)
+        if isinstance(nodeid, str) and (size_code is None or isinstance(size, TestSize)):
+            target.record_current_size(nodeid, size)
+
+    observed_tests = _table(worker_data, 'observed_tests')
+    observations = zip(
+        observed_tests,
+        _column(worker_data, 'resource_types', len(observed_tests)),
+        _column(worker_data, 'detail_codes', len(observed_tests)),
+        strict=True,
+    )
+    for test_code, type_code, detail_code in observations:
+        nodeid = _decode(nodeids, test_code)
+        resource_type = _decode(_RESOURCE_TYPE_CODES, type_code)
+        detail = _decode(details, detail_code)
+        if isinstance(nodeid, str) and isinstance(resource_type, ResourceType) and isinstance(detail, str):
+            target.record_observation(nodeid, resource_type, detail)
+
+    timed_tests = _table(worker_data, 'timed_tests')
+    for test_code, duration in zip(timed_tests, _column(worker_data, 'durations', len(timed_tests)), strict=True):
+        nodeid = _decode(nodeids, test_code)
+        if isinstance(nodeid, str) and isinstance(duration, int | float):
+            target.record_execution_time(nodeid, duration)
+
+
+def serialize_test_size(size: TestSize | None) -> dict[str, object]:
+    """Serialize a test's size for its setup report.
+
+    Args:
+        size: The test's size, or None for an unsized test.
+
+    Returns:
+        The data to attach to the report as REPORT_DATA_ATTR.
+
+    """
+    return {'size': size.value if size is not None else None}
+
+
+def serialize_test_result(outcome: str, duration: float | None) -> dict[str, object]:
+    """Serialize a test's outcome and duration for its call report.
+
+    Args:
+        outcome: The call-phase outcome.
+        duration: The call-phase duration in seconds, if measured.
+
+    Returns:
+        The data to attach to the report as REPORT_DATA_ATTR.
+
+    """
+    return {'outcome': outcome, 'duration': duration}
+
+
+def merge_test_data(target: TestSizeReport, nodeid: str, data: object) -> None:
+    """Merge the data a worker attached to one of a test's reports into the target report.
+
+    The setup report adds the test with its size, unless a rerun already added
+    it; the call report records its outcome and duration. Each is merged in
+    constant time as it arrives.
 
     Args:
         target: The target report to merge into.
-        worker_data: Serialized report data from a worker.
+        nodeid: The test's node ID.
+        data: The REPORT_DATA_ATTR of the report.
 
     """
-    _merge_sized_tests(target, worker_data.get('sized_tests', {}))
-    _merge_unsized_tests(target, worker_data.get('unsized_tests', []))
-    _merge_durations(target, worker_data.get('test_durations', {}))
-    _merge_outcomes(target, worker_data.get('test_outcomes', {}))
+    if not isinstance(data, dict):
+        return
+    if 'size' in data and not target.has_test(nodeid):
+        size = data['size']
+        try:
+            target.add_test(nodeid, TestSize(size) if size is not None else None)
+        except ValueError:
+            return
+    outcome = data.get('outcome')
+    if isinstance(outcome, str):
+        duration = data.get('duration')
+        target.record_result(nodeid, outcome, duration if isinstance(duration, int | float) else None)
@@ -0,0 +1,180 @@
+"""Size-aware test scheduling for pytest-xdist.
+
+xdist's load scheduling hands out tests in collection order, so a few long
+large tests collected late end up running alone at the end of the session.
+CategoryScheduling dispatches tests longest-expected-first instead:
+
+- A test's expected duration is its average from the duration history when
+  it has one, otherwise its size's limit in timing.TIME_LIMITS
+- Long tests are sent to workers one at a time, so each goes to the next
+  worker that frees up
+- Tests expected to take no longer than a small test are sent in batches,
+  cutting round-trips to the controller for the bulk of the suite
+- In tiered mode (see tiers) the tests are dispatched one tier at a time,
+  longest first within each tier
+
+The controller does not collect tests. It reads each test's size from the
+size label that pytest_collection_modifyitems appends to the node IDs the
+workers send back.
+
+This module imports pytest-xdist and is only imported once xdist asks for a
+scheduler.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from xdist.scheduler import LoadScheduling
+
+from pytest_test_categories.duration_history import expected_duration as expected_duration_of
+from pytest_test_categories.tiers import tier_of
+from pytest_test_categories.timing import TIME_LIMITS
+from pytest_test_categories.types import TestSize
+from pytest_test_categories.xdist_compat import size_from_nodeid
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import pytest
+    from xdist.remote import Producer
+    from xdist.workermanage import WorkerController
+
+    from pytest_test_categories.duration_history import DurationStats
+
+__all__ = [
+    'MAX_SMALL_BATCH',
+    'CategoryScheduling',
+    'expected_duration',
+]
+
+# Most tests sent to a worker in one batch
+MAX_SMALL_BATCH = 64
+
+# Tests expected to take no longer than this are batched
+BATCH_THRESHOLD = TIME_LIMITS[TestSize.SMALL].limit
+
+
+def expected_duration(nodeid: str, stats: Mapping[str, DurationStats]) -> float:
+    """Get how long a test is expected to take.
+
+    Args:
+        nodeid: The test's node ID, including its size label.
+        stats: Duration statistics by node ID.
+
+    Returns:
+        The test's average recorded duration, or its size's time limit
+        (the small limit for unsized tests) if it has no history.
+
+    Example:
+        >>> expected_duration('test_a.py::test_one [LARGE]', {})
+        900.0
+        >>> expected_duration('test_a.py::test_one', {})
+        1.0
+
+    """
+    return expected_duration_of(stats.get(nodeid), size_from_nodeid(nodeid))
+
+
+class CategoryScheduling(LoadScheduling):
+    """Load scheduling that dispatches the longest expected tests first.
+
+    Args:
+        config: The pytest configuration object.
+        log: The xdist log producer.
+        stats: Duration statistics by node ID from the duration history.
+        tiered: Whether to dispatch the tests one size tier at a time.
+
+    """
+
+    def __init__(
+        self,
+        config: pytest.Config,
+        log: Producer | None = None,
+        stats: Mapping[str, DurationStats] | None = None,
+        *,
+        tiered: bool = False,
+    ) -> None:
+        """Initialize the scheduler for the session's workers."""
+        super().__init__(config, log)
+        self._stats = stats or {}
+        self._tiered = tiered
+        self._expected: list[float] = []
+
+    def schedule(self) -> None:
+        """Order the collection longest-expected-first and start distributing it.
+
+        Called by xdist once every worker has collected. Later calls, after a
+        worker is replaced, top up every worker as check_schedule does.
+        """
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log('**Different tests collected, aborting run**')
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        expected = [expected_duration(nodeid, self._stats) for nodeid in self.collection]
+        self._expected = expected
+        # sorted is stable, so tests expected to take as long keep their collection order
+        if self._tiered:
+            tiers = [tier_of(size_from_nodeid(nodeid)) for nodeid in self.collection]
+            self.pending[:] = sorted(range(len(self.collection)), key=lambda index: (tiers[index], -expected[index]))
+        else:
+            self.pending[:] = sorted(range(len(self.collection)), key=expected.__getitem__, reverse=True)
+        if not self.collection:
+            return
+        if self.maxschedchunk is None:
+            self.maxschedchunk = len(self.collection)
+        self._deal()
+
+    def check_schedule(self, node: WorkerController, duration: float = 0) -> None:  # noqa: ARG002
+        """Keep the worker's queue at its running test plus the next batch.
+
+        A worker needs the next test before it can finish the current one, so
+        two tests (or batches) stay queued per worker.
+
+        Args:
+            node: The worker to top up.
+            duration: The worker's last test duration; unused since the
+                expected durations are known up front.
+
+        """
+        if node.shutting_down:
+            return
+
+        node_pending = self.node2pending[node]
+        while len(node_pending) < 2 and self.pending:  # noqa: PLR2004 - running test plus the next one
+            self._send_tests(node, self._batch_size())
+
+        if not self.pending:
+            node.shutdown()
+
+        self.log('num items waiting for node:', len(self.pending))
+
+    def _deal(self) -> None:
+        """Send each worker its first two tests (or batches)."""
+        # Deal in rounds so the longest tests start on different workers
+        for _ in range(2):
+            for node in self.nodes:
+                if self.pending:
+                    self._send_tests(node, self._batch_size())
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def _batch_size(self) -> int:
+        """Get how many of the next pending tests to send together."""
+        # Half of each worker's share, like LoadScheduling, so batches shrink as the queue drains
+        share = len(self.pending) // (len(self.node2pending) * 2)
+        limit = max(1, min(share, MAX_SMALL_BATCH, self.maxschedchunk or MAX_SMALL_BATCH))
+        expected = self._expected
+        size = 0
+        # Stop at the first longer test, which only follows short ones in tiered mode
+        while size < limit and expected and expected[self.pending[size]] <= BATCH_THRESHOLD:
+            size += 1
+        return max(size, 1)
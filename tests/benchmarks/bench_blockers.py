@@ -0,0 +1,340 @@
+"""Benchmarks for per-test resource blocker activation overhead.
+
+These benchmarks compare the two blocker patch modes for a small test:
+- test: every activate()/deactivate() patches and restores ~40 module globals
+- session: wrappers are installed once and each test only flips the policy
+
+The session-mode flip is also measured with debug contracts enabled, showing
+the cost of the state-machine checks the production blockers skip by default.
+
+They also compare the patching engine with the audit-hook engine, both for
+per-test activation and for the per-call cost of an intercepted call.
+
+Finally, they measure the enforcement sub-plugin's pytest_runtest_call hook for
+small, medium and large tests under warn and strict enforcement, with
+session-wide blocker wrappers so the hook's own bookkeeping is not hidden
+behind module patching. With enforcement off the sub-plugin is not registered.
+
+Target: Session mode activation cost is independent of the number of patched globals
+Target: Audit engine per-call overhead is a dict lookup when the test size allows the call
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.adapters import audit_hook
+from pytest_test_categories.adapters.audit_hook import AuditHookEnforcer
+from pytest_test_categories.adapters.database import DatabasePatchingBlocker
+from pytest_test_categories.adapters.filesystem import FilesystemPatchingBlocker
+from pytest_test_categories.adapters.network import SocketPatchingNetworkBlocker
+from pytest_test_categories.adapters.process import SubprocessPatchingBlocker
+from pytest_test_categories.adapters.sleep import SleepPatchingBlocker
+from pytest_test_categories.adapters.threading import ThreadPatchingMonitor
+from pytest_test_categories.contracts import enable_debug_contracts
+from pytest_test_categories.features import EnforcementPlugin
+from pytest_test_categories.item_stash import SIZE_PROFILE_KEY
+from pytest_test_categories.plugin import (
+    _compile_enforcement_plans,
+    _install_enforcement_engine,
+    _uninstall_session_blockers,
+)
+from pytest_test_categories.ports.network import EnforcementMode
+from pytest_test_categories.services.test_discovery import SizeProfile
+from pytest_test_categories.types import (
+    PluginState,
+    TestSize,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+Blockers = tuple[
+    SocketPatchingNetworkBlocker,
+    FilesystemPatchingBlocker,
+    SubprocessPatchingBlocker,
+    SleepPatchingBlocker,
+    DatabasePatchingBlocker,
+    ThreadPatchingMonitor,
+]
+
+
+@pytest.fixture
+def blockers() -> Iterator[Blockers]:
+    """Provide one instance of every production blocker, reset afterwards."""
+    instances = (
+        SocketPatchingNetworkBlocker(),
+        FilesystemPatchingBlocker(),
+        SubprocessPatchingBlocker(),
+        SleepPatchingBlocker(),
+        DatabasePatchingBlocker(),
+        ThreadPatchingMonitor(),
+    )
+    yield instances
+    for blocker in reversed(instances):
+        blocker.reset()
+
+
+@pytest.fixture
+def audit_enforcer() -> Iterator[AuditHookEnforcer]:
+    """Provide an audit enforcer with the process-wide hook registered, reset afterwards."""
+    enforcer = AuditHookEnforcer()
+    enforcer.install()
+    yield enforcer
+    enforcer.reset()
+
+
+def _open_devnull() -> int:
+    """Open and close the null device, a call both engines intercept."""
+    with open(os.devnull, 'rb') as f:  # noqa: PTH123
+        return f.fileno()
+
+
+def _make_small_test_cycle(blockers: Blockers) -> Callable[[], int]:
+    """Build a function that activates and deactivates all blockers like pytest_runtest_call."""
+    network, filesystem, process, sleep, database, threads = blockers
+    mode = EnforcementMode.STRICT
+    size = TestSize.SMALL
+
+    def cycle() -> int:
+        network.activate(size, mode)
+        filesystem.activate(size, mode, frozenset())
+        process.activate(size, mode)
+        sleep.activate(size, mode)
+        database.activate(size, mode)
+        threads.activate(size, mode)
+        threads.deactivate()
+        database.deactivate()
+        sleep.deactivate()
+        process.deactivate()
+        filesystem.deactivate()
+        network.deactivate()
+        return len(blockers)
+
+    return cycle
+
+
+class DescribeBenchBlockerActivation:
+    """Benchmarks comparing per-test and session-scoped blocker patching."""
+
+    @pytest.mark.medium
+    def it_benchmarks_per_test_patch_cycle(self, benchmark: BenchmarkFixture, blockers: Blockers) -> None:
+        """Benchmark activate/deactivate of all blockers when each test patches and restores."""
+        result = benchmark(_make_small_test_cycle(blockers))
+        assert result == 6
+
+    @pytest.mark.medium
+    def it_benchmarks_session_policy_flip(self, benchmark: BenchmarkFixture, blockers: Blockers) -> None:
+        """Benchmark activate/deactivate of all blockers after a single session-wide install."""
+        for blocker in blockers:
+            blocker.install()
+
+        result = benchmark(_make_small_test_cycle(blockers))
+        assert result == 6
+
+    @pytest.mark.medium
+    def it_benchmarks_session_policy_flip_with_debug_contracts(
+        self, benchmark: BenchmarkFixture, blockers: Blockers
+    ) -> None:
+        """Benchmark the session-mode policy flip with --test-categories-debug-contracts checks enabled."""
+        enable_debug_contracts()
+        for blocker in blockers:
+            blocker.install()
+
+        result = benchmark(_make_small_test_cycle(blockers))
+        assert result == 6
+
+    @pytest.mark.medium
+    def it_benchmarks_1000_small_tests_per_test_patching(self, benchmark: BenchmarkFixture, blockers: Blockers) -> None:
+        """Benchmark 1000 small-test activations with per-test patching."""
+        cycle = _make_small_test_cycle(blockers)
+
+        def run_1000() -> int:
+            return sum(cycle() for _ in range(1000))
+
+        result = benchmark(run_1000)
+        assert result == 6000
+
+    @pytest.mark.medium
+    def it_benchmarks_1000_small_tests_session_patching(self, benchmark: BenchmarkFixture, blockers: Blockers) -> None:
+        """Benchmark 1000 small-test activations with session-wide patching."""
+        for blocker in blockers:
+            blocker.install()
+        cycle = _make_small_test_cycle(blockers)
+
+        def run_1000() -> int:
+            return sum(cycle() for _ in range(1000))
+
+        result = benchmark(run_1000)
+        assert result == 6000
+
+
+class DescribeBenchWrapperClassCache:
+    """Benchmarks for building wrapper classes versus reusing the cached ones."""
+
+    @pytest.mark.medium
+    def it_benchmarks_uncached_wrapper_class_creation(self, benchmark: BenchmarkFixture, blockers: Blockers) -> None:
+        """Benchmark building every wrapper class from scratch, as each activation used to."""
+        network, _, process, _, _, threads = blockers
+        network.activate(TestSize.SMALL, EnforcementMode.STRICT)
+        process.activate(TestSize.SMALL, EnforcementMode.STRICT)
+        threads.activate(TestSize.SMALL, EnforcementMode.WARN)
+
+        def build_classes() -> int:
+            built = (
+                network._create_patched_socket_class(),
+                process._create_patched_popen(),
+                process._create_patched_mp_process(),
+                threads._create_patched_thread_class(),
+                threads._create_patched_thread_pool_executor(),
+                threads._create_patched_process_pool_executor(),
+            )
+            return len(built)
+
+        result = benchmark(build_classes)
+        assert result == 6
+
+    @pytest.mark.medium
+    def it_benchmarks_cached_wrapper_activation(self, benchmark: BenchmarkFixture, blockers: Blockers) -> None:
+        """Benchmark activate/deactivate of the class-wrapping blockers with the class cache warm."""
+        network, _, process, _, _, threads = blockers
+        size = TestSize.SMALL
+
+        def cycle() -> int:
+            network.activate(size, EnforcementMode.STRICT)
+            process.activate(size, EnforcementMode.STRICT)
+            threads.activate(size, EnforcementMode.WARN)
+            threads.deactivate()
+            process.deactivate()
+            network.deactivate()
+            return 3
+
+        result = benchmark(cycle)
+        assert result == 3
+
+
+class DescribeBenchAuditEngine:
+    """Benchmarks comparing the audit-hook engine with the patching engine."""
+
+    @pytest.mark.medium
+    def it_benchmarks_audit_engine_activation(
+        self, benchmark: BenchmarkFixture, audit_enforcer: AuditHookEnforcer
+    ) -> None:
+        """Benchmark per-test activate/deactivate of the audit engine for a small test."""
+
+        def cycle() -> bool:
+            audit_enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+            audit_enforcer.deactivate()
+            return audit_enforcer.is_active
+
+        result = benchmark(cycle)
+        assert result is False
+
+    @pytest.mark.medium
+    def it_benchmarks_open_without_enforcement(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark the baseline cost of open() with no engine active."""
+        result = benchmark(_open_devnull)
+        assert result >= 0
+
+    @pytest.mark.medium
+    def it_benchmarks_open_through_patched_filesystem_blocker(
+        self, benchmark: BenchmarkFixture, blockers: Blockers
+    ) -> None:
+        """Benchmark open() through the patched builtins.open wrapper for a medium test."""
+        filesystem = blockers[1]
+        filesystem.activate(TestSize.MEDIUM, EnforcementMode.STRICT, frozenset())
+
+        result = benchmark(_open_devnull)
+        assert result >= 0
+
+    @pytest.mark.medium
+    def it_benchmarks_open_through_audit_hook(
+        self, benchmark: BenchmarkFixture, audit_enforcer: AuditHookEnforcer
+    ) -> None:
+        """Benchmark open() with the audit hook active for a medium test (allowed event)."""
+        audit_enforcer.activate(TestSize.MEDIUM, EnforcementMode.STRICT)
+
+        result = benchmark(_open_devnull)
+        assert result >= 0
+
+    @pytest.mark.medium
+    def it_benchmarks_audit_hook_fast_path(
+        self, benchmark: BenchmarkFixture, audit_enforcer: AuditHookEnforcer
+    ) -> None:
+        """Benchmark 10000 dispatches of an event the current test size allows."""
+        audit_enforcer.activate(TestSize.MEDIUM, EnforcementMode.STRICT)
+        args = (os.devnull, 'rb', os.O_RDONLY)
+
+        def dispatch_10000() -> int:
+            for _ in range(10000):
+                audit_hook._audit_hook('open', args)
+            return 10000
+
+        result = benchmark(dispatch_10000)
+        assert result == 10000
+
+
+class _BenchConfig:
+    """Minimal stand-in for pytest.Config resolving the enforcement options."""
+
+    def __init__(self, enforcement_mode: str) -> None:
+        self._options = {
+            '--test-categories-enforcement': enforcement_mode,
+            '--test-categories-patch-mode': 'session',
+            '--test-categories-engine': 'patch',
+        }
+
+    def getoption(self, name: str, default: object = None) -> object:
+        return self._options.get(name, default)
+
+    def getini(self, name: str) -> str:
+        return ''
+
+
+class _BenchItem:
+    """Minimal stand-in for pytest.Item with a stashed size profile."""
+
+    def __init__(self, config: _BenchConfig, test_size: TestSize) -> None:
+        self.config = config
+        self.nodeid = f'test_module.py::test_{test_size.name.lower()}'
+        self.stash = pytest.Stash()
+        self.stash[SIZE_PROFILE_KEY] = SizeProfile(size=test_size, label=test_size.label)
+
+
+@pytest.fixture
+def bench_config(request: pytest.FixtureRequest) -> Iterator[_BenchConfig]:
+    """Provide a config for the parametrized enforcement mode with session-wide blocker wrappers."""
+    config = _BenchConfig(request.param)
+    _install_enforcement_engine(config)  # type: ignore[arg-type]
+    yield config
+    _uninstall_session_blockers(config)  # type: ignore[arg-type]
+
+
+class DescribeBenchRuntestCallHook:
+    """Benchmarks for the per-test cost of the enforcement sub-plugin's pytest_runtest_call hook."""
+
+    @pytest.mark.medium
+    @pytest.mark.parametrize('bench_config', ['warn', 'strict'], indirect=True)
+    @pytest.mark.parametrize('test_size', [TestSize.SMALL, TestSize.MEDIUM, TestSize.LARGE])
+    def it_benchmarks_runtest_call_hook(
+        self, benchmark: BenchmarkFixture, bench_config: _BenchConfig, test_size: TestSize
+    ) -> None:
+        """Benchmark one pass through pytest_runtest_call around an empty test body."""
+        item = _BenchItem(bench_config, test_size)
+        plans = _compile_enforcement_plans(bench_config)  # type: ignore[arg-type]
+        enforcement_plugin = EnforcementPlugin(plans, PluginState())
+
+        def run_hook() -> bool:
+            hook = enforcement_plugin.pytest_runtest_call(item)  # type: ignore[arg-type]
+            next(hook)
+            with contextlib.suppress(StopIteration):
+                next(hook)
+            return True
+
+        assert benchmark(run_hook) is True
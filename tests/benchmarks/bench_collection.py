@@ -4,8 +4,13 @@ These benchmarks measure the overhead of:
 - Marker detection during collection
 - Test ID modification (appending size labels)
 - Distribution statistics counting
+- Per-test size lookups in the runtime hooks, with and without the stashed size profile
+- Assigning 100k collected tests to duration-balanced shards
+- Selecting the most valuable of 100k collected tests within a time budget
+- Checking the distribution from the static index of 1,000 test files
 
 Target: Collection overhead < 1% additional time
+Target: Runtime hooks read the size profile in O(1) per test
 """
 
 from __future__ import annotations
@@ -14,7 +19,21 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from pytest_test_categories.services.test_discovery import TestDiscoveryService
+from pytest_test_categories.budget import select_within_budget
+from pytest_test_categories.item_stash import (
+    SIZE_PROFILE_KEY,
+    get_size_profile,
+)
+from pytest_test_categories.services.test_discovery import (
+    SizeProfile,
+    TestDiscoveryService,
+)
+from pytest_test_categories.sharding import assign_shards
+from pytest_test_categories.static_index import (
+    CollectionRules,
+    StaticIndexCache,
+    build_index,
+)
 from pytest_test_categories.types import TestSize
 from tests._fixtures.test_item import FakeTestItem
 from tests._fixtures.warning_system import FakeWarningSystem
@@ -22,6 +41,7 @@ from tests.benchmarks.conftest import FakeMarker
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
 
     from pytest_benchmark.fixture import BenchmarkFixture
 
@@ -135,3 +155,135 @@ class DescribeBenchCollectionOverhead:
         assert result[TestSize.MEDIUM] == 150
         assert result[TestSize.LARGE] == 40
         assert result[TestSize.XLARGE] == 10
+
+
+class _StashedItem:
+    """Minimal stand-in for pytest.Item carrying only a stash."""
+
+    def __init__(self, profile: SizeProfile) -> None:
+        self.stash = pytest.Stash()
+        self.stash[SIZE_PROFILE_KEY] = profile
+
+
+class DescribeBenchRuntimeSizeLookup:
+    """Benchmarks for the per-test size lookups done by the runtime hooks.
+
+    Before the size profile was stashed, each test repeated marker discovery in
+    pytest_runtest_protocol, pytest_runtest_call and pytest_runtest_makereport,
+    plus the timeout and allow_external_systems kwarg lookups.
+    """
+
+    @pytest.mark.medium
+    def it_benchmarks_repeated_discovery_for_1000_tests(
+        self,
+        benchmark: BenchmarkFixture,
+        test_discovery_service: TestDiscoveryService,
+        fake_test_items_factory: Callable[[int, TestSize | None], list[FakeTestItem]],
+    ) -> None:
+        """Benchmark three find_test_size calls plus kwarg lookups per test for 1000 tests."""
+        items = fake_test_items_factory(1000, TestSize.MEDIUM)
+
+        def runtime_lookups() -> int:
+            resolved = 0
+            for item in items:
+                for _ in range(3):
+                    test_size = test_discovery_service.find_test_size(item)
+                test_discovery_service.get_timeout(item)
+                item.get_marker_kwargs('medium')
+                resolved += test_size is not None
+            return resolved
+
+        result = benchmark(runtime_lookups)
+        assert result == 1000
+
+    @pytest.mark.medium
+    def it_benchmarks_stashed_profile_for_1000_tests(
+        self,
+        benchmark: BenchmarkFixture,
+        test_discovery_service: TestDiscoveryService,
+        fake_test_items_factory: Callable[[int, TestSize | None], list[FakeTestItem]],
+    ) -> None:
+        """Benchmark three stashed profile reads per test for 1000 tests."""
+        items = [
+            _StashedItem(test_discovery_service.get_size_profile(item))
+            for item in fake_test_items_factory(1000, TestSize.MEDIUM)
+        ]
+
+        def runtime_lookups() -> int:
+            resolved = 0
+            for item in items:
+                for _ in range(3):
+                    profile = get_size_profile(item, test_discovery_service)  # type: ignore[arg-type]
+                resolved += profile.size is not None
+            return resolved
+
+        result = benchmark(runtime_lookups)
+        assert result == 1000
+
+
+class DescribeBenchSharding:
+    """Benchmarks for assigning collected tests to shards."""
+
+    SIMULATED_TESTS = 100_000
+
+    @pytest.mark.medium
+    def it_benchmarks_sharding_100k_tests(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark packing 100k tests of mixed sizes onto 12 shards."""
+        sizes = [
+            (TestSize.SMALL, TestSize.SMALL, TestSize.SMALL, TestSize.MEDIUM, TestSize.LARGE)[i % 5]
+            for i in range(self.SIMULATED_TESTS)
+        ]
+        nodeids = [f'tests/test_{i // 100}.py::test_{i} {size.label}' for i, size in enumerate(sizes)]
+        expected = [0.001 * (1 + i % 97) for i in range(self.SIMULATED_TESTS)]
+
+        shards = benchmark(assign_shards, nodeids, sizes, expected, 12)
+
+        assert len(shards) == self.SIMULATED_TESTS
+
+
+class DescribeBenchTimeBudget:
+    """Benchmarks for selecting collected tests within a time budget."""
+
+    SIMULATED_TESTS = 100_000
+
+    @pytest.mark.medium
+    def it_benchmarks_budget_selection_100k_tests(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark selecting 100k tests with mixed costs and values into a 120 second budget."""
+        costs = [0.001 * (1 + i % 97) for i in range(self.SIMULATED_TESTS)]
+        values = [(2.0, 2.0, 1.0, 20.0, 0.5)[i % 5] for i in range(self.SIMULATED_TESTS)]
+
+        selected = benchmark(select_within_budget, costs, values, 120.0)
+
+        assert sum(cost for cost, keep in zip(costs, selected, strict=True) if keep) <= 120.0
+
+
+class DescribeBenchStaticIndex:
+    """Benchmarks for indexing test sizes without importing test code."""
+
+    SIMULATED_FILES = 1_000
+
+    @pytest.mark.medium
+    def it_benchmarks_cached_index_of_1000_files(self, benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+        """Benchmark re-indexing 1,000 unchanged test files of 20 tests each from the cache."""
+        source = (
+            'import pytest\n\n'
+            '@pytest.mark.small\n'
+            'class TestUnit:\n'
+            "    @pytest.mark.parametrize('n', range(19))\n"
+            '    def test_small(self, n): pass\n\n'
+            '@pytest.mark.medium\n'
+            'def test_medium(): pass\n'
+        )
+        files = []
+        for number in range(self.SIMULATED_FILES):
+            test_file = tmp_path / f'test_{number}.py'
+            test_file.write_text(source)
+            files.append(test_file)
+        rules = CollectionRules()
+        cache = StaticIndexCache(tmp_path / 'static_index.json')
+        build_index(files, rules, cache, jobs=1)
+
+        index = benchmark(build_index, files, rules, cache, 1)
+
+        assert index.parsed == 0
+        assert sum(index.counts().values()) == 20 * self.SIMULATED_FILES
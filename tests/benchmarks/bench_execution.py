@@ -1,9 +1,11 @@
 """Benchmarks for per-test execution overhead.
 
 These benchmarks measure the overhead of:
-- Timer start/stop operations
+- Timer start/stop operations, with and without debug contracts
 - Timing validation
 - Duration extraction
+- Array-backed timing for 1M simulated tests
+- Recording durations into, and flushing, the duration history
 
 Target: Per-test execution overhead < 1ms per test
 """
@@ -14,11 +16,15 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from pytest_test_categories.contracts import enable_debug_contracts
+from pytest_test_categories.duration_history import HISTORY_WINDOW, DurationHistory, DurationRecorder
 from pytest_test_categories.services.timing_validation import TimingValidationService
-from pytest_test_categories.timers import FakeTimer, WallTimer
+from pytest_test_categories.timers import FakeTimer, TimingStore, WallTimer
 from pytest_test_categories.types import TestSize, TestTimer, TimerState
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest_benchmark.fixture import BenchmarkFixture
 
 
@@ -71,6 +77,24 @@ class DescribeBenchTimerOverhead:
         result = benchmark(run_1000_cycles)
         assert result == 1000
 
+    @pytest.mark.medium
+    def it_benchmarks_1000_timer_cycles_with_debug_contracts(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark 1000 timer cycles with --test-categories-debug-contracts checks enabled."""
+        enable_debug_contracts()
+
+        def run_1000_cycles() -> int:
+            count = 0
+            for _ in range(1000):
+                timer = WallTimer(state=TimerState.READY)
+                timer.start()
+                timer.stop()
+                timer.duration()
+                count += 1
+            return count
+
+        result = benchmark(run_1000_cycles)
+        assert result == 1000
+
     @pytest.mark.medium
     def it_benchmarks_timer_creation_overhead(self, benchmark: BenchmarkFixture) -> None:
         """Benchmark timer instance creation overhead."""
@@ -178,3 +202,90 @@ class DescribeBenchTimerCleanup:
             service.cleanup_timer(timers, 'test_workflow')
 
         benchmark(full_workflow)
+
+
+class DescribeBenchTimingStore:
+    """Benchmarks for the array-backed timing store against a dict of timers."""
+
+    SIMULATED_TESTS = 1_000_000
+
+    @pytest.mark.medium
+    def it_benchmarks_1m_tests_in_timing_store(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark timing 1M simulated tests in preallocated array('q') buffers."""
+        ordinals = range(self.SIMULATED_TESTS)
+
+        def time_1m_tests() -> TimingStore:
+            store = TimingStore(self.SIMULATED_TESTS)
+            for ordinal in ordinals:
+                store.start(ordinal)
+                store.stop(ordinal)
+            return store
+
+        store = benchmark.pedantic(time_1m_tests, rounds=3, iterations=1)
+        assert store.duration(self.SIMULATED_TESTS - 1) is not None
+
+    @pytest.mark.medium
+    def it_benchmarks_1m_tests_in_timer_dict(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark 1M simulated tests with one WallTimer per node ID kept for the session."""
+        nodeids = [f'test_module.py::test_{i}' for i in range(self.SIMULATED_TESTS)]
+
+        def time_1m_tests() -> dict[str, WallTimer]:
+            timers: dict[str, WallTimer] = {}
+            for nodeid in nodeids:
+                timer = WallTimer(state=TimerState.READY)
+                timers[nodeid] = timer
+                timer.start()
+                timer.stop()
+            return timers
+
+        timers = benchmark.pedantic(time_1m_tests, rounds=3, iterations=1)
+        assert len(timers) == self.SIMULATED_TESTS
+
+
+class DescribeBenchDurationHistory:
+    """Benchmarks for the duration history's hot path and session-end write."""
+
+    SIMULATED_TESTS = 10_000
+
+    @pytest.mark.medium
+    def it_benchmarks_recording_10k_durations(self, benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+        """Benchmark the per-test cost of buffering durations."""
+        nodeids = [f'test_module.py::test_{i}' for i in range(self.SIMULATED_TESTS)]
+        history = DurationHistory(tmp_path / 'durations.sqlite3')
+
+        def record_10k() -> DurationRecorder:
+            recorder = DurationRecorder(history, {})
+            for nodeid in nodeids:
+                recorder.record(nodeid, 0.01)
+            return recorder
+
+        recorder = benchmark(record_10k)
+        assert len(recorder) == self.SIMULATED_TESTS
+
+    @pytest.mark.medium
+    def it_benchmarks_flushing_10k_durations(self, benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+        """Benchmark folding 10k durations into existing history and saving them in one transaction."""
+        nodeids = [f'test_module.py::test_{i}' for i in range(self.SIMULATED_TESTS)]
+        history = DurationHistory(tmp_path / 'durations.sqlite3')
+        seed = DurationRecorder(history, {})
+        for nodeid in nodeids:
+            seed.record(nodeid, 0.01)
+        seed.flush()
+
+        def setup() -> tuple[tuple[DurationRecorder], dict[str, object]]:
+            recorder = DurationRecorder(history, history.load())
+            for nodeid in nodeids:
+                recorder.record(nodeid, 0.02)
+            return (recorder,), {}
+
+        benchmark.pedantic(DurationRecorder.flush, setup=setup, rounds=5, iterations=1)
+        assert history.load()[nodeids[0]].run_count > 1
+
+    @pytest.mark.medium
+    def it_benchmarks_loading_60k_tests_with_full_windows(self, benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+        """Benchmark the session-start load of a large history whose tests all have HISTORY_WINDOW samples."""
+        history = DurationHistory(tmp_path / 'durations.sqlite3')
+        history.update({f'test_module.py::test_{i}': [0.01] * HISTORY_WINDOW for i in range(60_000)})
+
+        stats = benchmark.pedantic(history.load, rounds=5, iterations=1)
+        assert len(stats) == 60_000
@@ -3,24 +3,56 @@
 These benchmarks measure the overhead of:
 - Distribution statistics calculation
 - JSON report generation
+- Streaming the JSON Lines report
+- Building and querying the columnar report of a million-test suite
 - Basic and detailed report formatting
+- Merging the json reports of a sharded run
+- Merging xdist worker report data, violations and suggestions on the controller
+- Accumulating, merging and rendering the Prometheus session metrics
+- Recording test timeline spans and writing the trace file
 
 Target: Report generation < 100ms for 10,000 tests
 """
 
 from __future__ import annotations
 
+import tracemalloc
 from typing import TYPE_CHECKING
 
 import pytest
 
 from pytest_test_categories.distribution.stats import DistributionStats, TestCounts
 from pytest_test_categories.json_report import JsonReport
+from pytest_test_categories.jsonl_report import JsonlReportWriter
+from pytest_test_categories.metrics import SessionMetrics
 from pytest_test_categories.reporting import TestSizeReport
+from pytest_test_categories.shard_reports import ShardMerge
+from pytest_test_categories.suggestion import (
+    ResourceType,
+    SuggestionCollector,
+)
+from pytest_test_categories.trace_events import (
+    TraceRecorder,
+    write_trace,
+)
 from pytest_test_categories.types import TestSize
+from pytest_test_categories.violation_tracking import (
+    ViolationTracker,
+    ViolationType,
+)
+from pytest_test_categories.xdist_compat import (
+    merge_suggestions,
+    merge_test_data,
+    merge_violations,
+    serialize_suggestions,
+    serialize_test_result,
+    serialize_test_size,
+    serialize_violations,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
 
     from pytest_benchmark.fixture import BenchmarkFixture
 
@@ -284,3 +316,314 @@ class DescribeBenchJsonReport:
 
         result = benchmark(serialize_report)
         assert len(result) > 0
+
+
+class DescribeBenchJsonlReport:
+    """Benchmarks for the JSON report of a large suite, built at the end or streamed as JSON Lines."""
+
+    SIMULATED_TESTS = 150_000
+
+    @pytest.fixture
+    def large_report(self) -> TestSizeReport:
+        """A report of a large suite, as the session has built it by the end."""
+        sizes = [TestSize.SMALL, TestSize.SMALL, TestSize.SMALL, TestSize.MEDIUM, None]
+        test_report = TestSizeReport()
+        for i in range(self.SIMULATED_TESTS):
+            test_report.add_test(f'test_module_{i % 500}.py::test_{i}', sizes[i % len(sizes)], duration=0.01)
+        return test_report
+
+    @pytest.mark.medium
+    def it_benchmarks_writing_the_json_report_of_150k_tests(
+        self, benchmark: BenchmarkFixture, large_report: TestSizeReport, tmp_path: Path
+    ) -> None:
+        """Benchmark building, serializing and writing the JSON report at the end of the session."""
+        stats = DistributionStats()
+
+        def write_json_report() -> None:
+            json_report = JsonReport.from_test_size_report(large_report, stats, '0.7.0')
+            (tmp_path / 'report.json').write_text(json_report.model_dump_json(indent=2))
+
+        benchmark.pedantic(write_json_report, rounds=3, iterations=1)
+        assert (tmp_path / 'report.json').stat().st_size > 0
+
+    @pytest.mark.medium
+    @pytest.mark.parametrize('file_name', ['report.jsonl', 'report.jsonl.gz'])
+    def it_benchmarks_streaming_the_jsonl_report_of_150k_tests(
+        self, benchmark: BenchmarkFixture, large_report: TestSizeReport, tmp_path: Path, file_name: str
+    ) -> None:
+        """Benchmark writing every test's record, as tests finish, then the summary record."""
+        nodeids = [nodeid for size in (None, *TestSize) for nodeid in large_report.get_tests(size)]
+        stats = DistributionStats()
+
+        def stream_jsonl_report() -> None:
+            writer = JsonlReportWriter(tmp_path / file_name)
+            for nodeid in nodeids:
+                writer.write_test(large_report, nodeid)
+            writer.write_summary(large_report, stats, '0.7.0')
+            writer.close()
+
+        benchmark.pedantic(stream_jsonl_report, rounds=3, iterations=1)
+        assert (tmp_path / file_name).stat().st_size > 0
+
+
+class DescribeBenchMillionTestReport:
+    """Benchmarks for the columnar report of a million-test suite."""
+
+    SIMULATED_TESTS = 1_000_000
+    SIZES = (TestSize.SMALL, TestSize.SMALL, TestSize.SMALL, TestSize.MEDIUM, None)
+
+    @pytest.fixture(scope='class')
+    def nodeids(self) -> list[str]:
+        """Parametrized node IDs, created once so they are not counted as report memory."""
+        return [f'tests/test_module_{i % 500}.py::test_case[{i}]' for i in range(self.SIMULATED_TESTS)]
+
+    def _build(self, nodeids: list[str]) -> TestSizeReport:
+        """Add every test with its size, duration and outcome, as the session does."""
+        report = TestSizeReport()
+        sizes = self.SIZES
+        for i, nodeid in enumerate(nodeids):
+            report.add_test(nodeid, sizes[i % len(sizes)], duration=0.001 * (i % 1000), outcome='passed')
+        return report
+
+    @pytest.mark.medium
+    def it_benchmarks_building_the_report_of_1m_tests(self, benchmark: BenchmarkFixture, nodeids: list[str]) -> None:
+        """Benchmark adding 1M tests, and record the memory the report holds besides the node IDs."""
+        tracemalloc.start()
+        try:
+            report = self._build(nodeids)
+            report_bytes = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        del report
+        benchmark.extra_info.update(report_mb=report_bytes / 1e6, bytes_per_test=report_bytes / self.SIMULATED_TESTS)
+
+        result = benchmark.pedantic(self._build, args=(nodeids,), rounds=3, iterations=1)
+        assert result.get_total_tests() == self.SIMULATED_TESTS
+        assert report_bytes / self.SIMULATED_TESTS < 100
+
+    @pytest.mark.medium
+    def it_benchmarks_querying_the_report_of_1m_tests(self, benchmark: BenchmarkFixture, nodeids: list[str]) -> None:
+        """Benchmark the size counts, each size's tests, and the time limit check of 100k tests."""
+        report = self._build(nodeids)
+        checked = nodeids[: self.SIMULATED_TESTS // 10]
+
+        def query_report() -> dict[str, int]:
+            for size in (*TestSize, None):
+                report.get_tests(size)
+            for nodeid in checked:
+                report.exceeds_time_limit(nodeid, TestSize.SMALL)
+            return report.get_size_counts()
+
+        result = benchmark.pedantic(query_report, rounds=3, iterations=1)
+        assert result['unsized'] == self.SIMULATED_TESTS // len(self.SIZES)
+
+
+class DescribeBenchShardReportMerge:
+    """Benchmarks for merging the json reports of a sharded run."""
+
+    SHARDS = 8
+    SIMULATED_TESTS = 200_000
+
+    @pytest.fixture(scope='class')
+    def shards(self, tmp_path_factory: pytest.TempPathFactory) -> list[Path]:
+        """The json reports of 8 shards totalling 200k tests."""
+        sizes = [TestSize.SMALL, TestSize.SMALL, TestSize.SMALL, TestSize.MEDIUM, None]
+        root = tmp_path_factory.mktemp('shards')
+        paths = []
+        for shard in range(self.SHARDS):
+            shard_report = TestSizeReport()
+            for i in range(shard, self.SIMULATED_TESTS, self.SHARDS):
+                shard_report.add_test(f'test_module_{i % 500}.py::test_{i}', sizes[i % len(sizes)], duration=0.01)
+            path = root / f'shard-{shard}.json'
+            path.write_text(
+                JsonReport.from_test_size_report(shard_report, DistributionStats(), '0.7.0').model_dump_json(indent=2)
+            )
+            paths.append(path)
+        return paths
+
+    @pytest.mark.medium
+    def it_benchmarks_merging_8_shards_of_200k_tests(self, benchmark: BenchmarkFixture, shards: list[Path]) -> None:
+        """Benchmark streaming 8 shard reports into one merge and listing each size's slowest tests."""
+
+        def merge_shards() -> ShardMerge:
+            merge = ShardMerge()
+            for path in shards:
+                merge.add_shard(path)
+            for size in (*TestSize, None):
+                merge.slowest(size, 10)
+            return merge
+
+        result = benchmark.pedantic(merge_shards, rounds=3, iterations=1)
+        assert result.report.get_total_tests() == self.SIMULATED_TESTS
+
+
+class DescribeBenchWorkerReportMerge:
+    """Benchmarks for merging the data xdist workers attach to test reports on the controller."""
+
+    WORKERS = 32
+    SIMULATED_TESTS = 200_000
+
+    @pytest.mark.medium
+    def it_benchmarks_merging_32_workers_of_200k_tests(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark merging the setup and call report data of 200k tests from 32 workers into one report."""
+        sizes = [TestSize.SMALL, TestSize.SMALL, TestSize.SMALL, TestSize.MEDIUM, None]
+        # Each worker sends a setup then a call report per test, interleaved with the other workers'
+        reports: list[tuple[str, dict[str, object]]] = []
+        for position in range(self.SIMULATED_TESTS // self.WORKERS):
+            for worker in range(self.WORKERS):
+                i = position * self.WORKERS + worker
+                nodeid = f'test_module_{i % 500}.py::test_{i}'
+                reports.append((nodeid, serialize_test_size(sizes[i % len(sizes)])))
+                reports.append((nodeid, serialize_test_result('passed', 0.01)))
+
+        def merge_workers() -> TestSizeReport:
+            target = TestSizeReport()
+            for nodeid, data in reports:
+                merge_test_data(target, nodeid, data)
+            return target
+
+        result = benchmark.pedantic(merge_workers, rounds=3, iterations=1)
+        assert result.get_total_tests() == self.SIMULATED_TESTS
+        assert len(result.get_tests(None)) == self.SIMULATED_TESTS // len(sizes)
+
+
+class DescribeBenchWorkerObservationMerge:
+    """Benchmarks for merging xdist worker violations and suggestions on the controller."""
+
+    WORKERS = 32
+    SIMULATED_TESTS = 20_000
+    VIOLATIONS_PER_WORKER = 2_000
+
+    @pytest.mark.medium
+    def it_benchmarks_merging_violations_from_32_workers(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark merging 32 workers' violations, 64k in all with 50 distinct details."""
+        violation_types = list(ViolationType)
+        payloads = []
+        for worker in range(self.WORKERS):
+            tracker = ViolationTracker()
+            for i in range(self.VIOLATIONS_PER_WORKER):
+                test = worker + i * self.WORKERS
+                tracker.record_violation(
+                    violation_types[i % len(violation_types)], f'test_module.py::test_{test}', f'detail {i % 50}'
+                )
+            payloads.append(serialize_violations(tracker))
+
+        def merge_workers() -> ViolationTracker:
+            target = ViolationTracker()
+            for payload in payloads:
+                merge_violations(target, payload)
+            return target
+
+        result = benchmark.pedantic(merge_workers, rounds=3, iterations=1)
+        assert result.total_violations == self.WORKERS * self.VIOLATIONS_PER_WORKER
+
+    @pytest.mark.medium
+    def it_benchmarks_merging_suggestions_from_32_workers(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark merging 32 workers' observations of a 20k-test suite each worker collected in full."""
+        nodeids = [f'test_module_{i % 500}.py::test_{i}' for i in range(self.SIMULATED_TESTS)]
+        payloads = []
+        for worker in range(self.WORKERS):
+            collector = SuggestionCollector()
+            for i, nodeid in enumerate(nodeids):
+                collector.record_current_size(nodeid, TestSize.SMALL if i % 4 else None)
+            for nodeid in nodeids[worker :: self.WORKERS]:
+                collector.record_execution_time(nodeid, 0.01)
+                collector.record_observation(nodeid, ResourceType.FILESYSTEM, '/etc/hosts')
+            payloads.append(serialize_suggestions(collector))
+
+        def merge_workers() -> SuggestionCollector:
+            target = SuggestionCollector()
+            for payload in payloads:
+                merge_suggestions(target, payload)
+            return target
+
+        result = benchmark.pedantic(merge_workers, rounds=3, iterations=1)
+        assert result.observation_count == self.SIMULATED_TESTS
+
+
+class DescribeBenchSessionMetrics:
+    """Benchmarks for the --test-categories-metrics-file metrics."""
+
+    WORKERS = 32
+    SIMULATED_TESTS = 1_000_000
+
+    @pytest.mark.medium
+    def it_benchmarks_observing_1m_call_phases(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark adding a million tests' call phases to the duration histograms."""
+        sizes = [TestSize.SMALL, TestSize.SMALL, TestSize.SMALL, TestSize.MEDIUM, None]
+        outcomes = ['passed'] * 9 + ['failed']
+        observations = [
+            (sizes[i % len(sizes)], outcomes[i % len(outcomes)], (i % 1000) / 2000, None)
+            for i in range(self.SIMULATED_TESTS)
+        ]
+
+        def observe_all() -> SessionMetrics:
+            metrics = SessionMetrics()
+            observe = metrics.observe
+            for size, outcome, duration, baseline in observations:
+                observe(size, outcome, duration, baseline)
+            return metrics
+
+        result = benchmark.pedantic(observe_all, rounds=3, iterations=1)
+        medium = sum(result.histogram(TestSize.MEDIUM, outcome)[0][-1] for outcome in ('passed', 'failed'))
+        assert medium == self.SIMULATED_TESTS // len(sizes)
+
+    @pytest.mark.medium
+    def it_benchmarks_merging_and_rendering_32_workers(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark merging 32 workers' metrics on the controller and rendering the exposition."""
+        payloads = []
+        for worker in range(self.WORKERS):
+            metrics = SessionMetrics()
+            for i in range(1000):
+                metrics.observe(TestSize.SMALL, 'passed' if i % 10 else 'failed', (worker + i) / 1000, None)
+            metrics.add_overhead('runtest', 0.5)
+            payloads.append(metrics.to_dict())
+        stats = DistributionStats(counts=TestCounts(small=self.WORKERS * 1000))
+
+        def merge_and_render() -> str:
+            target = SessionMetrics()
+            for payload in payloads:
+                target.merge(payload)
+            return target.render(stats, {})
+
+        result = benchmark.pedantic(merge_and_render, rounds=3, iterations=1)
+        assert 'test_duration_seconds_count{size="small",outcome="passed"} 28800' in result
+
+
+class DescribeBenchTrace:
+    """Benchmarks for the --test-categories-trace timeline."""
+
+    SIMULATED_TESTS = 250_000
+
+    @pytest.mark.medium
+    def it_benchmarks_recording_1m_spans(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark recording the test and phase spans of 250,000 tests, a million spans in all."""
+        nodeids = [f'tests/test_module_{i % 100}.py::test_{i}' for i in range(self.SIMULATED_TESTS)]
+
+        def record_all() -> TraceRecorder:
+            recorder = TraceRecorder()
+            add_span = recorder.add_span
+            for i, nodeid in enumerate(nodeids):
+                start = i * 4_000
+                add_span(nodeid, 'setup', start, 1_000, TestSize.SMALL, 'passed')
+                add_span(nodeid, 'call', start + 1_000, 1_000, TestSize.SMALL, 'passed')
+                add_span(nodeid, 'teardown', start + 2_000, 1_000, TestSize.SMALL, 'passed')
+                add_span(nodeid, 'test', start, 3_000, TestSize.SMALL, 'passed')
+            return recorder
+
+        result = benchmark.pedantic(record_all, rounds=3, iterations=1)
+        assert len(result) == 4 * self.SIMULATED_TESTS
+
+    @pytest.mark.medium
+    def it_benchmarks_writing_a_1m_span_trace(self, benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+        """Benchmark writing a million spans across 8 worker tracks."""
+        tracks = {f'gw{worker}': TraceRecorder() for worker in range(8)}
+        for i in range(self.SIMULATED_TESTS):
+            recorder = tracks[f'gw{i % 8}']
+            nodeid = f'tests/test_module_{i % 100}.py::test_{i}'
+            for phase in ('setup', 'call', 'teardown', 'test'):
+                recorder.add_span(nodeid, phase, i * 4_000, 1_000, TestSize.SMALL, 'passed')
+        path = tmp_path / 'trace.json'
+
+        benchmark.pedantic(write_trace, args=(path, tracks), rounds=3, iterations=1)
+        assert path.stat().st_size > 0
@@ -0,0 +1,133 @@
+"""Benchmarks for xdist scheduling.
+
+These benchmarks replay a simulated session of 5,000 small, 200 medium and
+8 large tests (collected last) on 32 workers and measure:
+- The controller-side cost of xdist's LoadScheduling and of CategoryScheduling
+- The simulated makespan and number of dispatches of each scheduler
+
+Target: CategoryScheduling's makespan is bounded by the longest test, not by
+where the long tests were collected
+"""
+
+from __future__ import annotations
+
+import heapq
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+from xdist.scheduler import LoadScheduling
+
+from pytest_test_categories.duration_history import DurationStats
+from pytest_test_categories.xdist_scheduler import CategoryScheduling
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+NUM_WORKERS = 32
+LARGE_TEST_SECONDS = 600.0
+
+
+class SimulatedNode:
+    """Stand-in for an xdist WorkerController that queues what it is sent."""
+
+    def __init__(self, gateway_id: str) -> None:
+        """Initialize an idle node."""
+        self.gateway = SimpleNamespace(id=gateway_id)
+        self.queue: list[int] = []
+        self.dispatches = 0
+        self.shutting_down = False
+
+    def send_runtest_some(self, indices: list[int]) -> None:
+        """Queue a batch of test indices."""
+        self.queue.extend(indices)
+        self.dispatches += 1
+
+    def shutdown(self) -> None:
+        """Record that the node was told to shut down."""
+        self.shutting_down = True
+
+
+def _simulated_suite() -> tuple[list[str], list[float]]:
+    """Build node IDs and durations for a suite with its long tests collected last."""
+    collection = [f'test_unit_{i % 50}.py::test_{i} [SMALL]' for i in range(5000)]
+    durations = [0.001 * (1 + i % 50) for i in range(5000)]
+    collection += [f'test_integration.py::test_{i} [MEDIUM]' for i in range(200)]
+    durations += [1.0 + i % 20 for i in range(200)]
+    collection += [f'test_system.py::test_{i} [LARGE]' for i in range(8)]
+    durations += [LARGE_TEST_SECONDS] * 8
+    return collection, durations
+
+
+def _simulate(scheduler: LoadScheduling, collection: list[str], durations: list[float]) -> tuple[float, int]:
+    """Run the simulated session through a scheduler and return its makespan and dispatch count."""
+    nodes = [SimulatedNode(f'gw{i}') for i in range(NUM_WORKERS)]
+    for node in nodes:
+        scheduler.add_node(node)  # type: ignore[arg-type]
+        scheduler.add_node_collection(node, collection)  # type: ignore[arg-type]
+    scheduler.schedule()
+
+    events = [(durations[node.queue[0]], i) for i, node in enumerate(nodes) if node.queue]
+    heapq.heapify(events)
+    makespan = 0.0
+    while events:
+        now, i = heapq.heappop(events)
+        node = nodes[i]
+        index = node.queue.pop(0)
+        makespan = now
+        scheduler.mark_test_complete(node, index, durations[index])  # type: ignore[arg-type]
+        if node.queue:
+            heapq.heappush(events, (now + durations[node.queue[0]], i))
+    return makespan, sum(node.dispatches for node in nodes)
+
+
+def _config() -> Mock:
+    """Build a config for NUM_WORKERS local workers."""
+    config = Mock()
+    config.getvalue.return_value = [f'{NUM_WORKERS}*popen']
+    config.getoption.return_value = None
+    return config
+
+
+class DescribeBenchCategoryScheduling:
+    """Benchmarks for longest-expected-first scheduling against xdist's load scheduling."""
+
+    @pytest.mark.medium
+    def it_benchmarks_load_scheduling(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark xdist's LoadScheduling over the simulated session."""
+        collection, durations = _simulated_suite()
+        config = _config()
+
+        makespan, dispatches = benchmark.pedantic(
+            lambda: _simulate(LoadScheduling(config, Mock()), collection, durations), rounds=5, iterations=1
+        )
+        benchmark.extra_info.update(makespan=makespan, dispatches=dispatches)
+
+    @pytest.mark.medium
+    def it_benchmarks_category_scheduling(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark CategoryScheduling over the simulated session using only the size limits."""
+        collection, durations = _simulated_suite()
+        config = _config()
+
+        makespan, dispatches = benchmark.pedantic(
+            lambda: _simulate(CategoryScheduling(config, Mock()), collection, durations), rounds=5, iterations=1
+        )
+        benchmark.extra_info.update(makespan=makespan, dispatches=dispatches)
+        assert makespan < 1.1 * LARGE_TEST_SECONDS
+
+    @pytest.mark.medium
+    def it_benchmarks_category_scheduling_with_history(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark CategoryScheduling over the simulated session with every test's history."""
+        collection, durations = _simulated_suite()
+        config = _config()
+        stats = {
+            nodeid: DurationStats(run_count=5, ewma=duration, p50=duration, p95=duration)
+            for nodeid, duration in zip(collection, durations, strict=True)
+        }
+
+        makespan, dispatches = benchmark.pedantic(
+            lambda: _simulate(CategoryScheduling(config, Mock(), stats), collection, durations), rounds=5, iterations=1
+        )
+        benchmark.extra_info.update(makespan=makespan, dispatches=dispatches)
+        assert makespan < 1.1 * LARGE_TEST_SECONDS
@@ -0,0 +1,65 @@
+"""Benchmarks for the plugin's total overhead on a whole pytest session.
+
+These benchmarks run the same 500 small tests in-process under each plugin
+configuration, with the plugin disabled as the baseline:
+- default: only the timing sub-plugin adds per-test hooks
+- enforcement, report, suggest, metrics, trace: one optional feature sub-plugin each
+- all: every optional feature enabled
+
+Target: A session with every optional feature off adds only collection-time work and timing
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+TEST_COUNT = 500
+
+SESSION_CONFIGURATIONS = {
+    'plugin-disabled': ('-p', 'no:test_categories'),
+    'default': (),
+    'enforcement': ('--test-categories-enforcement=strict',),
+    'report': ('--test-size-report=basic',),
+    'suggest': ('--test-categories-suggest',),
+    'metrics': ('--test-categories-metrics-file=metrics.prom',),
+    'trace': ('--test-categories-trace=trace.json',),
+    'all': (
+        '--test-categories-enforcement=strict',
+        '--test-size-report=basic',
+        '--test-categories-suggest',
+    ),
+}
+
+
+class DescribeBenchSessionOverhead:
+    """Benchmarks for a whole in-process pytest session per plugin configuration."""
+
+    @pytest.mark.medium
+    @pytest.mark.parametrize('configuration', list(SESSION_CONFIGURATIONS))
+    def it_benchmarks_session_of_500_small_tests(
+        self, benchmark: BenchmarkFixture, pytester: pytest.Pytester, configuration: str
+    ) -> None:
+        """Benchmark collecting and running 500 trivial small tests."""
+        pytester.makepyfile(
+            test_many=f"""
+            import pytest
+
+            @pytest.mark.small
+            @pytest.mark.parametrize('n', range({TEST_COUNT}))
+            def test_trivial(n):
+                pass
+            """
+        )
+        args = ('-p', 'no:xdist', '-q', *SESSION_CONFIGURATIONS[configuration])
+
+        def run_session() -> int:
+            reprec = pytester.inline_run(*args)
+            return len(reprec.getreports('pytest_runtest_logreport')) // 3
+
+        result = benchmark.pedantic(run_session, rounds=10, iterations=1, warmup_rounds=1)
+        assert result == TEST_COUNT
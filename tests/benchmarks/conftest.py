@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from pytest_test_categories.contracts import enable_debug_contracts
 from pytest_test_categories.distribution.stats import DistributionStats, TestCounts
 from pytest_test_categories.reporting import TestSizeReport
 from pytest_test_categories.services.test_discovery import TestDiscoveryService
@@ -12,7 +13,7 @@ from tests._fixtures.test_item import FakeTestItem
 from tests._fixtures.warning_system import FakeWarningSystem
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
 
 class FakeMarker:
@@ -22,6 +23,14 @@ class FakeMarker:
         self.name = name
 
 
+@pytest.fixture(autouse=True)
+def debug_contracts() -> Iterator[None]:
+    """Benchmark the production configuration, with debug contracts disabled."""
+    previous = enable_debug_contracts(enabled=False)
+    yield
+    enable_debug_contracts(enabled=previous)
+
+
 @pytest.fixture
 def fake_warning_system() -> FakeWarningSystem:
     """Provide a fake warning system for benchmarks."""
@@ -2,7 +2,27 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.contracts import enable_debug_contracts
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 pytest_plugins = [
     'pytester',
     'tests._fixtures.timer',
 ]
+
+
+@pytest.fixture
+def debug_contracts() -> Iterator[None]:
+    """Turn on the timer and blocker contract checks for a test that checks them.
+
+    The rest of the suite runs the production configuration, with the checks off.
+    """
+    previous = enable_debug_contracts()
+    yield
+    enable_debug_contracts(enabled=previous)
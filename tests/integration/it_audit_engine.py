@@ -0,0 +1,207 @@
+"""Integration tests for the audit-hook enforcement engine.
+
+These tests verify the --test-categories-engine option end to end:
+- The option and ini setting are registered
+- Small tests are blocked through audit events, including calls that bypass
+  the patched module attributes (os.open, names imported before the test)
+- Large tests keep full access
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.mark.medium
+class DescribeAuditEngineConfiguration:
+    """Integration tests for engine configuration."""
+
+    def it_provides_engine_cli_option(self, pytester: pytest.Pytester) -> None:
+        """Verify plugin provides --test-categories-engine CLI option."""
+        result = pytester.runpytest('--help')
+
+        assert '--test-categories-engine' in result.stdout.str()
+
+    def it_accepts_engine_ini_option(self, pytester: pytest.Pytester) -> None:
+        """Verify plugin registers the test_categories_engine ini option."""
+        pytester.makeini("""
+            [pytest]
+            test_categories_enforcement = strict
+            test_categories_engine = audit
+        """)
+        pytester.makepyfile(
+            test_example="""
+            import pytest
+
+            @pytest.mark.small
+            def test_small():
+                assert True
+            """
+        )
+
+        result = pytester.runpytest('-v')
+
+        assert 'unrecognized configuration option' not in result.stderr.str()
+        result.assert_outcomes(passed=1)
+
+
+@pytest.mark.medium
+class DescribeAuditEngineEnforcement:
+    """Integration tests for enforcement through audit events."""
+
+    def it_blocks_os_level_file_access_in_small_tests(self, pytester: pytest.Pytester) -> None:
+        """Verify os.open is blocked even though builtins.open is not patched."""
+        pytester.makeini("""
+            [pytest]
+            test_categories_enforcement = strict
+        """)
+        pytester.makepyfile(
+            test_example="""
+            import os
+
+            import pytest
+
+            @pytest.mark.small
+            def test_small_with_os_open():
+                fd = os.open(os.devnull, os.O_RDONLY)
+                os.close(fd)
+            """
+        )
+
+        result = pytester.runpytest('--test-categories-engine=audit', '-v')
+
+        assert 'FilesystemAccessViolationError' in result.stdout.str()
+        result.assert_outcomes(failed=1)
+
+    def it_blocks_writing_a_module_file_in_small_tests(self, pytester: pytest.Pytester) -> None:
+        """Verify writing a .py file is blocked, though module files may be read."""
+        pytester.makeini("""
+            [pytest]
+            test_categories_enforcement = strict
+        """)
+        pytester.makepyfile(
+            test_example="""
+            import pytest
+
+            @pytest.mark.small
+            def test_small_writing_a_module(tmp_path):
+                (tmp_path / 'out.py').write_text('x')
+            """
+        )
+
+        result = pytester.runpytest('--test-categories-engine=audit', '-v')
+
+        assert 'FilesystemAccessViolationError' in result.stdout.str()
+        result.assert_outcomes(failed=1)
+
+    def it_blocks_reading_a_module_file_but_not_importing_it(self, pytester: pytest.Pytester) -> None:
+        """Verify a small test reading a .py file is blocked, while importing one in the test is not."""
+        pytester.makeini("""
+            [pytest]
+            test_categories_enforcement = strict
+        """)
+        pytester.makepyfile(
+            data='VALUE = 1',
+            test_example="""
+            import pytest
+
+            @pytest.mark.small
+            def test_small_reading_a_module():
+                with open('data.py') as f:
+                    f.read()
+
+            @pytest.mark.small
+            def test_small_importing_a_module():
+                import data
+
+                assert data.VALUE == 1
+            """,
+        )
+
+        result = pytester.runpytest('--test-categories-engine=audit', '-v')
+
+        result.stdout.fnmatch_lines(['*test_small_reading_a_module*FAILED*', '*test_small_importing_a_module*PASSED*'])
+        assert 'FilesystemAccessViolationError' in result.stdout.str()
+        result.assert_outcomes(passed=1, failed=1)
+
+    def it_blocks_names_imported_before_the_test(self, pytester: pytest.Pytester) -> None:
+        """Verify a socket class imported at module level is still blocked."""
+        pytester.makeini("""
+            [pytest]
+            test_categories_enforcement = strict
+        """)
+        pytester.makepyfile(
+            test_example="""
+            from socket import AF_INET, SOCK_STREAM, socket
+
+            import pytest
+
+            @pytest.mark.small
+            def test_small_with_prebound_socket():
+                s = socket(AF_INET, SOCK_STREAM)
+                try:
+                    s.connect(('127.0.0.1', 9))
+                finally:
+                    s.close()
+            """
+        )
+
+        result = pytester.runpytest('--test-categories-engine=audit', '-v')
+
+        assert 'NetworkAccessViolationError' in result.stdout.str()
+        result.assert_outcomes(failed=1)
+
+    def it_blocks_sleep_in_small_tests_only(self, pytester: pytest.Pytester) -> None:
+        """Verify time.sleep fails a small test but not a large one."""
+        pytester.makeini("""
+            [pytest]
+            test_categories_enforcement = strict
+        """)
+        pytester.makepyfile(
+            test_example="""
+            import time
+
+            import pytest
+
+            @pytest.mark.small
+            def test_small_with_sleep():
+                time.sleep(0.01)
+
+            @pytest.mark.large
+            def test_large_with_sleep():
+                time.sleep(0.01)
+            """
+        )
+
+        result = pytester.runpytest('--test-categories-engine=audit', '-v')
+
+        assert 'SleepViolationError' in result.stdout.str()
+        result.assert_outcomes(passed=1, failed=1)
+
+    def it_records_violations_in_warn_mode(self, pytester: pytest.Pytester) -> None:
+        """Verify warn mode lets the test pass and reports the violation."""
+        pytester.makeini("""
+            [pytest]
+            test_categories_enforcement = warn
+        """)
+        pytester.makepyfile(
+            test_example="""
+            import os
+
+            import pytest
+
+            @pytest.mark.small
+            def test_small_with_os_open():
+                fd = os.open(os.devnull, os.O_RDONLY)
+                os.close(fd)
+            """
+        )
+
+        result = pytester.runpytest('--test-categories-engine=audit', '-v')
+
+        result.assert_outcomes(passed=1)
+        stdout = result.stdout.str()
+        assert 'Hermeticity Violation Summary' in stdout
+        assert 'Filesystem:' in stdout
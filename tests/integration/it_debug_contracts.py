@@ -0,0 +1,58 @@
+"""Integration tests for the --test-categories-debug-contracts option.
+
+These tests verify that:
+- The option is registered
+- Contract checks stay off by default and are enabled for the session with the option
+- The previous setting is restored when the session ends
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from pytest_test_categories.contracts import (
+    debug_contracts_enabled,
+    enable_debug_contracts,
+)
+
+CHECK_DEBUG_CONTRACTS_TEST = """
+import pytest
+
+from pytest_test_categories.contracts import debug_contracts_enabled
+
+@pytest.mark.small
+def test_debug_contracts():
+    assert debug_contracts_enabled() is {expected}
+"""
+
+
+@pytest.mark.medium
+class DescribeDebugContractsOption:
+    """Integration tests for the debug contracts option."""
+
+    def it_provides_debug_contracts_cli_option(self, pytester: pytest.Pytester) -> None:
+        """Verify plugin provides --test-categories-debug-contracts CLI option."""
+        result = pytester.runpytest('--help')
+
+        assert '--test-categories-debug-contracts' in result.stdout.str()
+
+    def it_leaves_contracts_off_by_default(self, pytester: pytest.Pytester) -> None:
+        """Verify a session without the option runs with contract checks disabled."""
+        enable_debug_contracts(enabled=False)
+        pytester.makepyfile(test_example=CHECK_DEBUG_CONTRACTS_TEST.format(expected=False))
+
+        result = pytester.runpytest()
+
+        result.assert_outcomes(passed=1)
+
+    def it_enables_contracts_for_the_session(self, pytester: pytest.Pytester) -> None:
+        """Verify the option turns contract checks on and restores the setting afterwards."""
+        enable_debug_contracts(enabled=False)
+        pytester.makepyfile(test_example=CHECK_DEBUG_CONTRACTS_TEST.format(expected=True))
+
+        result = pytester.runpytest('--test-categories-debug-contracts')
+
+        result.assert_outcomes(passed=1)
+        assert debug_contracts_enabled() is False
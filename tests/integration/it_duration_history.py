@@ -0,0 +1,89 @@
+"""Integration tests for the persistent duration history.
+
+These tests verify that:
+- Durations of passing tests are written to .pytest_cache at session end
+- A test much slower than its history is flagged with a DurationRegressionWarning
+- Derived baselines fail tests like a marker's timeout= baseline
+- History is not kept without the cache plugin
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from pytest_test_categories.duration_history import (
+    HISTORY_CACHE_DIR,
+    HISTORY_FILE_NAME,
+    MIN_HISTORY_RUNS,
+    DurationHistory,
+)
+
+SLEEPY_TEST = """
+import os
+import time
+import pytest
+
+@pytest.mark.medium
+def test_sleepy():
+    time.sleep(float(os.environ.get('SLEEPY_SECONDS', '0')))
+"""
+
+
+def _history(pytester: pytest.Pytester) -> DurationHistory:
+    """Return the duration history in the pytester directory's cache."""
+    return DurationHistory(pytester.path / '.pytest_cache' / 'd' / HISTORY_CACHE_DIR / HISTORY_FILE_NAME)
+
+
+def _build_history(pytester: pytest.Pytester) -> None:
+    """Run the fast test enough times for its history to be used."""
+    for _ in range(MIN_HISTORY_RUNS):
+        pytester.runpytest('-p', 'no:xdist', '--test-categories-history').assert_outcomes(passed=1)
+
+
+@pytest.mark.medium
+class DescribeDurationHistory:
+    """Integration tests for recording and using the duration history."""
+
+    def it_records_durations_in_the_cache(self, pytester: pytest.Pytester) -> None:
+        """Verify each session adds a run to the test's statistics."""
+        pytester.makepyfile(test_sleepy=SLEEPY_TEST)
+
+        _build_history(pytester)
+
+        stats = _history(pytester).load()['test_sleepy.py::test_sleepy [MEDIUM]']
+        assert stats.run_count == MIN_HISTORY_RUNS
+
+    def it_warns_when_a_test_regresses(self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify a test far slower than its history is flagged."""
+        pytester.makepyfile(test_sleepy=SLEEPY_TEST)
+        _build_history(pytester)
+        monkeypatch.setenv('SLEEPY_SECONDS', '0.2')
+
+        result = pytester.runpytest('-p', 'no:xdist', '--test-categories-history')
+
+        result.assert_outcomes(passed=1, warnings=1)
+        result.stdout.fnmatch_lines(['*DurationRegressionWarning: test_sleepy.py::test_sleepy*its average*'])
+
+    def it_fails_tests_slower_than_their_derived_baseline(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify derived baselines are enforced like a timeout= baseline."""
+        pytester.makepyfile(test_sleepy=SLEEPY_TEST)
+        _build_history(pytester)
+        monkeypatch.setenv('SLEEPY_SECONDS', '0.2')
+
+        result = pytester.runpytest('-p', 'no:xdist', '--test-categories-derive-baselines')
+
+        result.assert_outcomes(failed=1)
+        result.stdout.fnmatch_lines(['*exceeded performance baseline*'])
+
+    def it_keeps_no_history_without_the_cache_plugin(self, pytester: pytest.Pytester) -> None:
+        """Verify nothing is written when the cache plugin is disabled."""
+        pytester.makepyfile(test_sleepy=SLEEPY_TEST)
+
+        result = pytester.runpytest('-p', 'no:xdist', '-p', 'no:cacheprovider', '--test-categories-history')
+
+        result.assert_outcomes(passed=1)
+        assert not _history(pytester).path.exists()
@@ -0,0 +1,93 @@
+"""Integration tests for the enforcement plans compiled at configure time.
+
+These tests verify that:
+- Enforcement off compiles empty plans
+- The patch engine plans the blockers each test size needs
+- The audit engine replaces the patching blockers with one audit step
+- Blockers are deactivated after a failing test
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.adapters.audit_hook import TIME_SLEEP_AUDITED
+from pytest_test_categories.plugin import _get_enforcement_plans
+
+if TYPE_CHECKING:
+    from pytest_test_categories.enforcement_plan import EnforcementPlans
+
+SINGLE_TEST = """
+import pytest
+
+@pytest.mark.small
+def test_example():
+    pass
+"""
+
+
+def _compiled_plans(pytester: pytest.Pytester, *args: str) -> EnforcementPlans:
+    """Run a session with the given options and return its compiled plans."""
+    pytester.makepyfile(test_example=SINGLE_TEST)
+    reprec = pytester.inline_run(*args)
+    reprec.assertoutcome(passed=1)
+    return _get_enforcement_plans(reprec.getcall('pytest_sessionfinish').session.config)
+
+
+@pytest.mark.medium
+class DescribeCompiledEnforcementPlans:
+    """Integration tests for the per-size enforcement plans."""
+
+    def it_compiles_empty_plans_with_enforcement_off(self, pytester: pytest.Pytester) -> None:
+        """Verify no test activates blockers when enforcement is off."""
+        plans = _compiled_plans(pytester, '--test-categories-enforcement=off')
+
+        assert not plans.small.steps
+        assert not plans.medium.steps
+        assert not plans.medium_external_systems_allowed.steps
+
+    def it_plans_patching_blockers_per_size(self, pytester: pytest.Pytester) -> None:
+        """Verify small, medium and allow_external_systems medium tests get their blockers."""
+        plans = _compiled_plans(pytester, '--test-categories-enforcement=strict')
+
+        # network, filesystem, process, sleep, database, threads
+        assert len(plans.small.steps) == 6
+        # network, database, threads, external systems detector
+        assert len(plans.medium.steps) == 4
+        assert len(plans.medium.post_call_checks) == 1
+        assert len(plans.medium_external_systems_allowed.steps) == 3
+        assert not plans.medium_external_systems_allowed.post_call_checks
+
+    def it_plans_one_audit_step_for_the_audit_engine(self, pytester: pytest.Pytester) -> None:
+        """Verify the audit engine replaces the patching blockers."""
+        plans = _compiled_plans(pytester, '--test-categories-enforcement=warn', '--test-categories-engine=audit')
+
+        # audit enforcer and threads, plus the sleep blocker without the time.sleep audit event
+        assert len(plans.small.steps) == (2 if TIME_SLEEP_AUDITED else 3)
+        assert len(plans.medium_external_systems_allowed.steps) == 2
+
+    def it_deactivates_blockers_after_a_failing_test(self, pytester: pytest.Pytester) -> None:
+        """Verify a small test raising an exception does not leave blockers active."""
+        pytester.makepyfile(
+            test_example="""
+            import socket
+
+            import pytest
+
+            @pytest.mark.small
+            def test_fails():
+                raise AssertionError('boom')
+
+            @pytest.mark.large
+            def test_network_after_failure():
+                socket.socket(socket.AF_INET, socket.SOCK_STREAM).close()
+            """
+        )
+
+        result = pytester.runpytest('--test-categories-enforcement=strict')
+
+        result.assert_outcomes(passed=1, failed=1)
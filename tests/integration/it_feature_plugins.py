@@ -0,0 +1,180 @@
+"""Integration tests for the feature sub-plugins registered at configure time.
+
+These tests verify that:
+- A default session registers only the timing sub-plugin
+- Enabling enforcement, the size report, suggestions or the timeout watchdog registers their sub-plugins
+- Features still work end to end through their sub-plugins
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from pytest_test_categories.plugin import (
+    BUDGET_PLUGIN_NAME,
+    ENFORCEMENT_PLUGIN_NAME,
+    HISTORY_PLUGIN_NAME,
+    JSONL_REPORT_PLUGIN_NAME,
+    METRICS_PLUGIN_NAME,
+    PRUNING_PLUGIN_NAME,
+    REPORTING_PLUGIN_NAME,
+    SHARDING_PLUGIN_NAME,
+    SPILL_PLUGIN_NAME,
+    SUGGESTION_PLUGIN_NAME,
+    TIERED_PLUGIN_NAME,
+    TIMING_PLUGIN_NAME,
+    TRACE_PLUGIN_NAME,
+    WATCHDOG_PLUGIN_NAME,
+    XDIST_AGGREGATION_PLUGIN_NAME,
+)
+from pytest_test_categories.xdist_compat import XDIST_WORKER_ENV
+
+FEATURE_PLUGIN_NAMES = (
+    TIMING_PLUGIN_NAME,
+    ENFORCEMENT_PLUGIN_NAME,
+    REPORTING_PLUGIN_NAME,
+    JSONL_REPORT_PLUGIN_NAME,
+    METRICS_PLUGIN_NAME,
+    TRACE_PLUGIN_NAME,
+    SUGGESTION_PLUGIN_NAME,
+    WATCHDOG_PLUGIN_NAME,
+    HISTORY_PLUGIN_NAME,
+    SHARDING_PLUGIN_NAME,
+    TIERED_PLUGIN_NAME,
+    BUDGET_PLUGIN_NAME,
+    PRUNING_PLUGIN_NAME,
+    XDIST_AGGREGATION_PLUGIN_NAME,
+    SPILL_PLUGIN_NAME,
+)
+
+SINGLE_TEST = """
+import pytest
+
+@pytest.mark.small
+def test_example():
+    pass
+"""
+
+
+def _registered_features(pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch, *args: str) -> set[str]:
+    """Run a session with the given options and return the registered sub-plugin names."""
+    # The inner session is not an xdist worker even when this suite runs under xdist
+    monkeypatch.delenv(XDIST_WORKER_ENV, raising=False)
+    pytester.makepyfile(test_example=SINGLE_TEST)
+    reprec = pytester.inline_run('-p', 'no:xdist', *args)
+    reprec.assertoutcome(passed=1)
+    plugin_manager = reprec.getcall('pytest_sessionfinish').session.config.pluginmanager
+    return {name for name in FEATURE_PLUGIN_NAMES if plugin_manager.has_plugin(name)}
+
+
+@pytest.mark.medium
+class DescribeFeaturePluginRegistration:
+    """Integration tests for registering only the sub-plugins a session needs."""
+
+    def it_registers_only_timing_by_default(self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify a session with every optional feature off registers only timing."""
+        assert _registered_features(pytester, monkeypatch) == {TIMING_PLUGIN_NAME}
+
+    def it_registers_enforcement_when_enabled(self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify warn enforcement registers the enforcement sub-plugin."""
+        features = _registered_features(pytester, monkeypatch, '--test-categories-enforcement=warn')
+
+        assert features == {TIMING_PLUGIN_NAME, ENFORCEMENT_PLUGIN_NAME}
+
+    def it_registers_reporting_and_suggestion_when_requested(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify the size report and suggest options register their sub-plugins."""
+        features = _registered_features(pytester, monkeypatch, '--test-size-report=basic', '--test-categories-suggest')
+
+        assert features == {TIMING_PLUGIN_NAME, REPORTING_PLUGIN_NAME, SUGGESTION_PLUGIN_NAME}
+
+    def it_registers_the_jsonl_report_when_requested(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify --test-size-report=jsonl registers the jsonl report sub-plugin after the reporting sub-plugin."""
+        features = _registered_features(
+            pytester, monkeypatch, '--test-size-report=jsonl', '--test-size-report-file=report.jsonl'
+        )
+
+        assert features == {TIMING_PLUGIN_NAME, REPORTING_PLUGIN_NAME, JSONL_REPORT_PLUGIN_NAME}
+
+    def it_registers_the_metrics_exporter_when_requested(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify --test-categories-metrics-file registers the metrics sub-plugin."""
+        features = _registered_features(pytester, monkeypatch, '--test-categories-metrics-file=metrics.prom')
+
+        assert features == {TIMING_PLUGIN_NAME, METRICS_PLUGIN_NAME}
+
+    def it_registers_the_trace_when_requested(self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify --test-categories-trace registers the trace sub-plugin."""
+        features = _registered_features(pytester, monkeypatch, '--test-categories-trace=trace.json')
+
+        assert features == {TIMING_PLUGIN_NAME, TRACE_PLUGIN_NAME}
+
+    def it_registers_the_timeout_watchdog_when_requested(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify --test-categories-enforce-timeout registers the watchdog sub-plugin."""
+        features = _registered_features(pytester, monkeypatch, '--test-categories-enforce-timeout')
+
+        assert features == {TIMING_PLUGIN_NAME, WATCHDOG_PLUGIN_NAME}
+
+    def it_registers_the_duration_history_when_requested(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify --test-categories-history registers the duration history sub-plugin."""
+        features = _registered_features(pytester, monkeypatch, '--test-categories-history')
+
+        assert features == {TIMING_PLUGIN_NAME, HISTORY_PLUGIN_NAME}
+
+    def it_registers_sharding_when_requested(self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify --test-categories-shard registers the sharding sub-plugin."""
+        features = _registered_features(pytester, monkeypatch, '--test-categories-shard=1/2')
+
+        assert features == {TIMING_PLUGIN_NAME, SHARDING_PLUGIN_NAME}
+
+    def it_registers_tiered_execution_when_requested(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify --test-categories-tiered registers the tiered execution sub-plugin."""
+        features = _registered_features(pytester, monkeypatch, '--test-categories-tiered')
+
+        assert features == {TIMING_PLUGIN_NAME, TIERED_PLUGIN_NAME}
+
+    def it_registers_the_time_budget_when_requested(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify --test-categories-budget registers the time budget sub-plugin."""
+        features = _registered_features(pytester, monkeypatch, '--test-categories-budget=60')
+
+        assert features == {TIMING_PLUGIN_NAME, BUDGET_PLUGIN_NAME}
+
+    def it_registers_size_pruning_when_requested(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify --test-categories-sizes registers the size pruning sub-plugin."""
+        features = _registered_features(pytester, monkeypatch, '--test-categories-sizes=small')
+
+        assert features == {TIMING_PLUGIN_NAME, PRUNING_PLUGIN_NAME}
+
+    def it_reports_time_limit_failures_through_the_sub_plugins(self, pytester: pytest.Pytester) -> None:
+        """Verify the report records the outcome set by the timing sub-plugin."""
+        pytester.makepyfile(
+            test_slow="""
+            import time
+            import pytest
+
+            @pytest.mark.medium(timeout=0.05)
+            def test_slow():
+                time.sleep(0.1)
+            """
+        )
+
+        result = pytester.runpytest('-p', 'no:xdist', '--test-size-report=detailed')
+
+        result.assert_outcomes(failed=1)
+        result.stdout.fnmatch_lines(['*test_slow*medium*FAIL'])
@@ -0,0 +1,61 @@
+"""Integration tests for --test-categories-metrics-file.
+
+These tests verify that:
+- The session's metrics are written as a Prometheus text exposition when it finishes
+- Time limit failures and hermeticity violations are counted
+- The plugin's collection and per-test overhead are reported
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.mark.medium
+class DescribeMetricsExporter:
+    """Integration tests for the Prometheus textfile exporter."""
+
+    def it_writes_the_session_metrics(self, pytester: pytest.Pytester) -> None:
+        """Verify the file holds the size counts, duration histograms and violation counters."""
+        pytester.makepyfile(
+            test_example="""
+            import time
+            import pytest
+
+            @pytest.mark.small
+            def test_fast():
+                pass
+
+            @pytest.mark.small
+            def test_sleeps():
+                time.sleep(0.001)
+
+            @pytest.mark.medium(timeout=0.05)
+            def test_over_baseline():
+                time.sleep(0.1)
+
+            def test_unsized():
+                pass
+            """
+        )
+
+        result = pytester.runpytest(
+            '-p',
+            'no:xdist',
+            '--test-categories-enforcement=warn',
+            '--test-categories-metrics-file=textfile/pytest.prom',
+        )
+
+        result.assert_outcomes(passed=3, failed=1)
+        lines = (pytester.path / 'textfile' / 'pytest.prom').read_text().splitlines()
+        assert 'test_size_tests{size="small"} 2' in lines
+        assert 'test_duration_seconds_count{size="small",outcome="passed"} 2' in lines
+        assert 'test_duration_seconds_count{size="medium",outcome="failed"} 1' in lines
+        assert 'test_duration_seconds_count{size="unsized",outcome="passed"} 1' in lines
+        assert 'test_baseline_violations_total{size="medium"} 1' in lines
+        assert 'test_hermeticity_violations_total{type="sleep"} 1' in lines
+        assert any(line.startswith('test_categories_overhead_seconds_total{phase="collection"} ') for line in lines)
+        assert any(line.startswith('test_categories_overhead_seconds_total{phase="runtest"} ') for line in lines)
+        assert '# TYPE test_baseline_violations_total counter' in lines
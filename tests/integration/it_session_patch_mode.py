@@ -0,0 +1,147 @@
+"""Integration tests for session-scoped blocker patching.
+
+These tests verify the --test-categories-patch-mode option end to end:
+- The option and ini setting are registered
+- Session mode enforces the same rules as per-test mode
+- Wrappers stay installed between tests and are removed at unconfigure
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+import socket
+import subprocess
+import time
+
+import pytest
+
+
+@pytest.mark.medium
+class DescribeSessionPatchModeConfiguration:
+    """Integration tests for patch mode configuration."""
+
+    def it_provides_patch_mode_cli_option(self, pytester: pytest.Pytester) -> None:
+        """Verify plugin provides --test-categories-patch-mode CLI option."""
+        result = pytester.runpytest('--help')
+
+        assert '--test-categories-patch-mode' in result.stdout.str()
+
+    def it_accepts_patch_mode_ini_option(self, pytester: pytest.Pytester) -> None:
+        """Verify plugin registers the test_categories_patch_mode ini option."""
+        pytester.makeini("""
+            [pytest]
+            test_categories_enforcement = strict
+            test_categories_patch_mode = session
+        """)
+        pytester.makepyfile(
+            test_example="""
+            import pytest
+
+            @pytest.mark.small
+            def test_small():
+                assert True
+            """
+        )
+
+        result = pytester.runpytest('-v')
+
+        assert 'unrecognized configuration option' not in result.stderr.str()
+        result.assert_outcomes(passed=1)
+
+
+@pytest.mark.medium
+class DescribeSessionPatchModeEnforcement:
+    """Integration tests for enforcement with session-wide wrappers."""
+
+    def it_blocks_violations_in_small_tests(self, pytester: pytest.Pytester) -> None:
+        """Verify small tests are still blocked when wrappers are installed once."""
+        pytester.makeini("""
+            [pytest]
+            test_categories_enforcement = strict
+        """)
+        pytester.makepyfile(
+            test_example="""
+            import socket
+            import time
+
+            import pytest
+
+            @pytest.mark.small
+            def test_small_with_network():
+                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                try:
+                    s.connect(('httpbin.org', 80))
+                finally:
+                    s.close()
+
+            @pytest.mark.small
+            def test_small_with_sleep():
+                time.sleep(0.01)
+
+            @pytest.mark.small
+            def test_small_pure():
+                assert 1 + 1 == 2
+            """
+        )
+
+        result = pytester.runpytest('--test-categories-patch-mode=session', '-v')
+
+        stdout = result.stdout.str()
+        assert 'NetworkAccessViolationError' in stdout or 'HermeticityViolationError' in stdout
+        result.assert_outcomes(passed=1, failed=2)
+
+    def it_keeps_wrappers_installed_between_tests(self, pytester: pytest.Pytester) -> None:
+        """Verify a later medium test sees the same wrapper and is allowed to sleep."""
+        pytester.makeini("""
+            [pytest]
+            test_categories_enforcement = strict
+        """)
+        pytester.makepyfile(
+            test_example="""
+            import time
+
+            import pytest
+
+            seen = []
+
+            @pytest.mark.small
+            def test_small_records_wrapper():
+                seen.append(time.sleep)
+
+            @pytest.mark.medium
+            def test_medium_sees_same_wrapper_and_sleeps():
+                assert time.sleep is seen[0]
+                time.sleep(0.01)
+            """
+        )
+
+        result = pytester.runpytest('--test-categories-patch-mode=session', '-v')
+
+        result.assert_outcomes(passed=2)
+
+    def it_restores_original_functions_after_the_session(self, pytester: pytest.Pytester) -> None:
+        """Verify unconfigure removes the wrappers installed at configure time."""
+        pytester.makeini("""
+            [pytest]
+            test_categories_enforcement = strict
+        """)
+        pytester.makepyfile(
+            test_example="""
+            import pytest
+
+            @pytest.mark.small
+            def test_small():
+                assert True
+            """
+        )
+        socket_before = socket.socket
+        sleep_before = time.sleep
+        popen_before = subprocess.Popen
+
+        result = pytester.runpytest('--test-categories-patch-mode=session')
+
+        result.assert_outcomes(passed=1)
+        assert socket.socket is socket_before
+        assert time.sleep is sleep_before
+        assert subprocess.Popen is popen_before
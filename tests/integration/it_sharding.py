@@ -0,0 +1,167 @@
+"""Integration tests for --test-categories-shard.
+
+These tests verify that:
+- The shards of a suite are disjoint and together run every test
+- Each shard gets one of the suite's large tests
+- The shards split only the tests left after -m and -k deselection
+- Each machine's own duration history does not change the assignment
+- A history file shared by every shard balances recorded durations
+- Distribution statistics still count the whole suite on every shard
+- An invalid shard specification is a usage error
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.duration_history import (
+    HISTORY_CACHE_DIR,
+    HISTORY_FILE_NAME,
+    DurationHistory,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SLOW_DIRECTORY_TESTS = """
+import pytest
+
+@pytest.mark.large
+def test_large_1():
+    pass
+
+@pytest.mark.large
+def test_large_2():
+    pass
+
+@pytest.mark.large
+def test_large_3():
+    pass
+
+@pytest.mark.medium
+def test_medium_1():
+    pass
+"""
+
+UNIT_TESTS = """
+import pytest
+
+@pytest.mark.parametrize('n', range(6))
+@pytest.mark.small
+def test_small(n):
+    pass
+"""
+
+
+def _save_history(path: Path, slow_param: int) -> None:
+    """Record one small test as much slower than the others."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    DurationHistory(path).update(
+        {f'test_unit.py::test_small[{n}] [SMALL]': [0.9 if n == slow_param else 0.01 * (n + 1)] * 5 for n in range(6)}
+    )
+
+
+def _passed(result: pytest.RunResult) -> set[str]:
+    """Return the node IDs reported as passed."""
+    return {line.split(' ')[0] for line in result.stdout.lines if ' PASSED' in line}
+
+
+@pytest.mark.medium
+class DescribeSharding:
+    """Integration tests for duration-balanced sharding."""
+
+    def it_splits_the_suite_into_disjoint_shards(self, pytester: pytest.Pytester) -> None:
+        """Verify the three shards together run every test exactly once."""
+        pytester.makepyfile(test_slow=SLOW_DIRECTORY_TESTS, test_unit=UNIT_TESTS)
+
+        shards = [
+            _passed(pytester.runpytest('-p', 'no:xdist', '-v', f'--test-categories-shard={i}/3')) for i in (1, 2, 3)
+        ]
+
+        assert sum(len(shard) for shard in shards) == 10
+        assert len(set().union(*shards)) == 10
+        assert all(sum('test_large' in nodeid for nodeid in shard) == 1 for shard in shards)
+
+    def it_reports_the_other_shards_tests_as_deselected(self, pytester: pytest.Pytester) -> None:
+        """Verify tests of other shards are deselected while the distribution counts the whole suite."""
+        pytester.makepyfile(test_slow=SLOW_DIRECTORY_TESTS, test_unit=UNIT_TESTS)
+
+        result = pytester.runpytest('-p', 'no:xdist', '--test-categories-shard=2/3')
+
+        result.stdout.fnmatch_lines(['*Large*3 tests*', '*7 deselected*'])
+
+    def it_splits_only_the_tests_left_after_deselection(self, pytester: pytest.Pytester) -> None:
+        """Verify -m and -k deselect before sharding, so the shards split the selected tests evenly."""
+        pytester.makepyfile(test_slow=SLOW_DIRECTORY_TESTS, test_unit=UNIT_TESTS, test_other=UNIT_TESTS)
+        selection = ('-m', 'small', '-k', '0 or 1 or 2')
+
+        shards = [
+            _passed(pytester.runpytest('-p', 'no:xdist', '-v', *selection, f'--test-categories-shard={i}/2'))
+            for i in (1, 2)
+        ]
+
+        assert [len(shard) for shard in shards] == [3, 3]
+        assert len(set().union(*shards)) == 6
+
+    def it_covers_every_test_once_when_the_machines_histories_differ(self, pytester: pytest.Pytester) -> None:
+        """Verify shards with different local .pytest_cache histories still agree on the split."""
+        pytester.makepyfile(test_unit=UNIT_TESTS)
+        local_history = pytester.path / '.pytest_cache' / 'd' / HISTORY_CACHE_DIR / HISTORY_FILE_NAME
+
+        shards = []
+        for index, slow_param in ((1, 0), (2, 5)):
+            _save_history(local_history, slow_param)
+            result = pytester.runpytest(
+                '-p', 'no:xdist', '-v', '--test-categories-history', f'--test-categories-shard={index}/2'
+            )
+            shards.append(_passed(result))
+
+        assert sum(len(shard) for shard in shards) == 6
+        assert len(set().union(*shards)) == 6
+
+    def it_balances_with_a_shared_history_file(self, pytester: pytest.Pytester) -> None:
+        """Verify a history file given to every shard puts the slow test on a shard of its own."""
+        pytester.makepyfile(test_unit=UNIT_TESTS)
+        shared_history = pytester.path / 'artifacts' / HISTORY_FILE_NAME
+        _save_history(shared_history, slow_param=0)
+
+        shards = [
+            _passed(
+                pytester.runpytest(
+                    '-p',
+                    'no:xdist',
+                    '-v',
+                    f'--test-categories-shard={i}/2',
+                    f'--test-categories-shard-history={shared_history}',
+                )
+            )
+            for i in (1, 2)
+        ]
+
+        assert shards[0] == {'test_unit.py::test_small[0]'}
+        assert len(shards[1]) == 5
+
+    def it_rejects_a_missing_shared_history_file(self, pytester: pytest.Pytester) -> None:
+        """Verify a shard without the shared history fails instead of computing a different split."""
+        pytester.makepyfile(test_unit=UNIT_TESTS)
+
+        result = pytester.runpytest(
+            '-p', 'no:xdist', '--test-categories-shard=1/2', '--test-categories-shard-history=missing.sqlite3'
+        )
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(['*missing.sqlite3 does not exist*'])
+
+    def it_rejects_an_invalid_shard(self, pytester: pytest.Pytester) -> None:
+        """Verify a shard index past the count is a usage error."""
+        pytester.makepyfile(test_unit=UNIT_TESTS)
+
+        result = pytester.runpytest('-p', 'no:xdist', '--test-categories-shard=4/3')
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(['*Invalid shard*4/3*'])
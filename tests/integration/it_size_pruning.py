@@ -0,0 +1,158 @@
+"""Integration tests for --test-categories-sizes.
+
+These tests verify that:
+- Test files whose tests all have other sizes are not imported
+- Tests of other sizes in collected files are deselected
+- Files the static scan cannot prove excluded are collected every time
+- A size from a base class in another module is not trusted from the last collection
+- An edited file is looked up again instead of trusting its old index
+- Pruned tests still count towards the test distribution
+- An unknown size is a usage error
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+SMALL_TESTS = """
+import pytest
+
+@pytest.mark.small
+def test_small():
+    pass
+"""
+
+# Importing this module fails, so a run that imports it reports a collection error
+HEAVY_LARGE_TESTS = """
+import pytest
+import heavy_dependency_that_is_not_installed
+
+pytestmark = pytest.mark.large
+
+def test_large():
+    pass
+"""
+
+MIXED_TESTS = """
+import pytest
+
+@pytest.mark.small
+def test_small_in_mixed():
+    pass
+
+@pytest.mark.medium
+def test_medium_in_mixed():
+    pass
+"""
+
+# The scan cannot resolve this marker, so it sees an unsized test
+DYNAMIC_LARGE_TESTS = """
+import pytest
+
+pytestmark = getattr(pytest.mark, 'large')
+
+def test_dynamic():
+    pass
+"""
+
+BASE_CLASS = """
+import pytest
+
+@pytest.mark.{size}
+class Base:
+    pass
+"""
+
+# The scan sees an unsized test: its size comes from helpers/base.py
+BASE_CLASS_TESTS = """
+from helpers.base import Base
+
+class TestD(Base):
+    def test_d(self):
+        pass
+"""
+
+
+@pytest.mark.medium
+class DescribeSizePruning:
+    """Integration tests for running only some test sizes."""
+
+    def it_does_not_import_files_of_other_sizes(self, pytester: pytest.Pytester) -> None:
+        """Verify the large test file is pruned and the medium test in the mixed file is deselected."""
+        pytester.makepyfile(test_small=SMALL_TESTS, test_heavy=HEAVY_LARGE_TESTS, test_mixed=MIXED_TESTS)
+
+        result = pytester.runpytest('-p', 'no:xdist', '--test-categories-sizes=small')
+
+        result.assert_outcomes(passed=2, deselected=1)
+        result.stdout.fnmatch_lines(
+            [
+                '*Size Pruning Summary*',
+                'Pruned 1 of 3 test files without importing them, running only small tests',
+                '  Tests in pruned files: 1',
+                '  Collection time saved: about 0.0s',
+                '  Deselected in collected files: 1',
+            ]
+        )
+
+    def it_collects_files_the_scan_cannot_size_every_time(self, pytester: pytest.Pytester) -> None:
+        """Verify a file sized in a way the scan cannot see is not pruned after it has been collected."""
+        pytester.makepyfile(test_small=SMALL_TESTS, test_dynamic=DYNAMIC_LARGE_TESTS)
+
+        pytester.runpytest('-p', 'no:xdist', '--test-categories-sizes=small')
+        second = pytester.runpytest('-p', 'no:xdist', '--test-categories-sizes=small')
+
+        second.assert_outcomes(passed=1, deselected=1)
+        second.stdout.fnmatch_lines(['Pruned 0 of 2 test files without importing them, running only small tests'])
+
+    def it_collects_tests_sized_by_a_base_class_in_another_module(self, pytester: pytest.Pytester) -> None:
+        """Verify a base class marker changed from medium to small is seen, as -m small sees it."""
+        pytester.mkpydir('helpers')
+        pytester.makepyfile(**{'helpers/base': BASE_CLASS.format(size='medium')})
+        pytester.makepyfile(test_small=SMALL_TESTS, test_d=BASE_CLASS_TESTS)
+        pytester.runpytest('-p', 'no:xdist', '--test-categories-sizes=small,medium').assert_outcomes(passed=2)
+        pytester.makepyfile(**{'helpers/base': BASE_CLASS.format(size='small')})
+
+        result = pytester.runpytest('-p', 'no:xdist', '-v', '--test-categories-sizes=small')
+
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(['*test_d.py::TestD::test_d *PASSED*'])
+
+    def it_looks_up_edited_files_again(self, pytester: pytest.Pytester) -> None:
+        """Verify a file collected as large is collected again once it is edited to be small."""
+        pytester.makepyfile(test_small=SMALL_TESTS, test_dynamic=DYNAMIC_LARGE_TESTS)
+        pytester.runpytest('-p', 'no:xdist', '--test-categories-sizes=small')
+        pytester.makepyfile(test_dynamic=DYNAMIC_LARGE_TESTS.replace("'large'", "'small'"))
+
+        result = pytester.runpytest('-p', 'no:xdist', '-v', '--test-categories-sizes=small')
+
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(['*::test_dynamic *PASSED*'])
+
+    def it_counts_pruned_tests_in_the_distribution(self, pytester: pytest.Pytester) -> None:
+        """Verify the distribution summary includes the tests of the pruned file."""
+        pytester.makepyfile(test_small=SMALL_TESTS, test_heavy=HEAVY_LARGE_TESTS)
+
+        result = pytester.runpytest('-p', 'no:xdist', '--test-categories-sizes=small')
+
+        result.stdout.fnmatch_lines(['*Large*1 test*'])
+
+    def it_rejects_an_unknown_size(self, pytester: pytest.Pytester) -> None:
+        """Verify a size that does not exist is a usage error."""
+        pytester.makepyfile(test_small=SMALL_TESTS)
+
+        result = pytester.runpytest('-p', 'no:xdist', '--test-categories-sizes=small,tiny')
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(['*--test-categories-sizes must be a comma-separated list of*'])
+
+    def it_reports_the_pruning_under_xdist(self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify every xdist worker prunes the same files and the controller reports them."""
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+        pytester.makepyfile(test_small=SMALL_TESTS, test_heavy=HEAVY_LARGE_TESTS, test_mixed=MIXED_TESTS)
+
+        result = pytester.runpytest('-n', '2', '--test-categories-sizes=small')
+
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(['Pruned 1 of 3 test files without importing them, running only small tests'])
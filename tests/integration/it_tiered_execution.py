@@ -0,0 +1,112 @@
+"""Integration tests for --test-categories-tiered.
+
+These tests verify that:
+- Tests run one size tier at a time, small first
+- A failure in a tier skips every test in the more expensive tiers
+- The terminal summary reports the failed tier and the skipped tests
+- With pytest-xdist, the controller stops the workers' later tiers
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+MIXED_TESTS = """
+import os
+import pytest
+
+@pytest.mark.large
+def test_large():
+    pass
+
+@pytest.mark.medium
+def test_medium():
+    pass
+
+@pytest.mark.small
+def test_small():
+    assert os.environ.get('FAIL_SMALL') != '1'
+
+@pytest.mark.small
+def test_small_other():
+    pass
+"""
+
+
+@pytest.mark.medium
+class DescribeTieredExecution:
+    """Integration tests for running and stopping size tiers."""
+
+    def it_runs_the_cheapest_tier_first(self, pytester: pytest.Pytester) -> None:
+        """Verify small tests run before medium and large tests collected ahead of them."""
+        pytester.makepyfile(test_mixed=MIXED_TESTS)
+
+        result = pytester.runpytest('-p', 'no:xdist', '-v', '--test-categories-tiered')
+
+        result.assert_outcomes(passed=4)
+        result.stdout.fnmatch_lines(
+            [
+                '*::test_small *PASSED*',
+                '*::test_small_other *PASSED*',
+                '*::test_medium *PASSED*',
+                '*::test_large *PASSED*',
+            ]
+        )
+        assert 'Tiered Execution Summary' not in result.stdout.str()
+
+    def it_skips_later_tiers_after_a_failure(self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify the rest of the failing tier runs and the later tiers are skipped."""
+        pytester.makepyfile(test_mixed=MIXED_TESTS)
+        monkeypatch.setenv('FAIL_SMALL', '1')
+
+        result = pytester.runpytest('-p', 'no:xdist', '-rs', '--test-categories-tiered')
+
+        result.assert_outcomes(passed=1, failed=1, skipped=2)
+        result.stdout.fnmatch_lines(['*SKIPPED [[]2[]]*tiered execution: a small test failed*'])
+        result.stdout.fnmatch_lines(
+            [
+                '*Tiered Execution Summary*',
+                'The small tier failed, so the later tiers were skipped:',
+                '  Medium: 1 test skipped',
+                '  Large: 1 test skipped',
+            ]
+        )
+
+    @pytest.mark.skipif(
+        'PYTEST_XDIST_WORKER' in os.environ,
+        reason='Cannot run nested xdist sessions; run these tests without -n flag',
+    )
+    def it_stops_later_tiers_on_every_xdist_worker(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify a failure on one worker skips the later tiers on the others."""
+        pytester.makepyfile(
+            test_mixed="""
+            import time
+            import pytest
+
+            @pytest.mark.small
+            def test_small_fails():
+                assert False
+
+            @pytest.mark.small
+            @pytest.mark.parametrize('n', range(4))
+            def test_small_slow(n):
+                time.sleep(0.3)
+
+            @pytest.mark.medium
+            @pytest.mark.parametrize('n', range(8))
+            def test_medium(n):
+                pass
+            """
+        )
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+
+        result = pytester.runpytest('-n', '2', '--test-categories-tiered')
+
+        result.assert_outcomes(passed=4, failed=1, skipped=8)
+        result.stdout.fnmatch_lines(['*Medium: 8 tests skipped*'])
@@ -0,0 +1,125 @@
+"""Integration tests for --test-categories-budget.
+
+These tests verify that:
+- Tests that do not fit in the budget are deselected, without history using size limits
+- Tests that failed in the last run are selected first
+- Tests in files changed since the last budgeted run are selected first
+- The selection is reported in the terminal summary and the JSON report
+- A budget that is not positive is a usage error
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+MIXED_TESTS = """
+import os
+import pytest
+
+@pytest.mark.small
+def test_small_first():
+    pass
+
+@pytest.mark.small
+def test_small_second():
+    assert os.environ.get('FAIL_SECOND') != '1'
+
+@pytest.mark.small
+def test_small_third():
+    pass
+
+@pytest.mark.medium
+def test_medium():
+    pass
+"""
+
+
+@pytest.mark.medium
+class DescribeTimeBudget:
+    """Integration tests for selecting tests within a time budget."""
+
+    def it_deselects_the_tests_that_do_not_fit(self, pytester: pytest.Pytester) -> None:
+        """Verify small tests fill the budget by their time limit and the medium test is left out."""
+        pytester.makepyfile(test_mixed=MIXED_TESTS)
+
+        result = pytester.runpytest('-p', 'no:xdist', '-v', '--test-categories-budget=2.5')
+
+        result.assert_outcomes(passed=2, deselected=2)
+        result.stdout.fnmatch_lines(
+            [
+                '*::test_small_first *PASSED*',
+                '*::test_small_second *PASSED*',
+                '*Time Budget Summary*',
+                'Selected 2 of 4 tests, expected to take 2.0s of the 2.5s budget',
+                '  Recently failed: 0',
+                '  In changed files: 0',
+                '  Deselected: 2',
+            ]
+        )
+
+    def it_selects_recently_failed_tests_first(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify the test that failed in the last run takes the budget ahead of earlier tests."""
+        pytester.makepyfile(test_mixed=MIXED_TESTS)
+        monkeypatch.setenv('FAIL_SECOND', '1')
+        pytester.runpytest('-p', 'no:xdist')
+
+        result = pytester.runpytest('-p', 'no:xdist', '-v', '--test-categories-budget=1')
+
+        result.assert_outcomes(failed=1, deselected=3)
+        result.stdout.fnmatch_lines(['*::test_small_second *FAILED*', '  Recently failed: 1'])
+
+    def it_selects_tests_in_changed_files_first(
+        self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify a file modified since the last budgeted run takes the budget ahead of earlier files."""
+        # Only a session outside an xdist worker records when the budgeted run started
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+        pytester.makepyfile(test_a=MIXED_TESTS)
+        test_b = pytester.makepyfile(test_b='import pytest\n\n@pytest.mark.small\ndef test_changed():\n    pass\n')
+        pytester.runpytest('-p', 'no:xdist', '--test-categories-budget=1')
+        later = time.time() + 60
+        os.utime(test_b, (later, later))
+
+        result = pytester.runpytest('-p', 'no:xdist', '-v', '--test-categories-budget=1')
+
+        result.assert_outcomes(passed=1, deselected=4)
+        result.stdout.fnmatch_lines(['*test_b.py::test_changed *PASSED*', '  In changed files: 1'])
+
+    def it_includes_the_selection_in_the_json_report(self, pytester: pytest.Pytester) -> None:
+        """Verify the JSON report carries the budget selection."""
+        pytester.makepyfile(test_mixed=MIXED_TESTS)
+
+        pytester.runpytest(
+            '-p',
+            'no:xdist',
+            '--test-categories-budget=2.5',
+            '--test-size-report=json',
+            '--test-size-report-file=report.json',
+        )
+
+        report = json.loads((pytester.path / 'report.json').read_text())
+        assert report['budget'] == {
+            'budget': 2.5,
+            'collected': 4,
+            'selected': 2,
+            'expected_duration': 2.0,
+            'recently_failed': 0,
+            'recently_changed': 0,
+        }
+
+    def it_rejects_a_budget_that_is_not_positive(self, pytester: pytest.Pytester) -> None:
+        """Verify a zero budget is a usage error."""
+        pytester.makepyfile(test_mixed=MIXED_TESTS)
+
+        result = pytester.runpytest('-p', 'no:xdist', '--test-categories-budget=0')
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(['*--test-categories-budget must be a positive number of seconds*'])
@@ -0,0 +1,112 @@
+"""Integration tests for the preemptive timeout watchdog.
+
+These tests verify that:
+- A hung test is interrupted once it exceeds its time limit
+- The stack at the interruption point is added to the failure report
+- The ini option enables the watchdog
+- Another plugin's pending SIGALRM timer (e.g. pytest-timeout's) keeps running
+- Tests within their limit pass and the session continues
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+HUNG_TESTS = """
+import time
+import pytest
+
+@pytest.mark.medium(timeout=0.2)
+def test_hung():
+    time.sleep(60)
+
+@pytest.mark.medium(timeout=0.2)
+def test_fast():
+    pass
+"""
+
+
+@pytest.mark.medium
+class DescribeTimeoutWatchdog:
+    """Integration tests for interrupting tests past their time limit."""
+
+    def it_interrupts_a_hung_test_at_its_limit(self, pytester: pytest.Pytester) -> None:
+        """Verify the hung test fails with the baseline violation instead of running on."""
+        pytester.makepyfile(test_hung=HUNG_TESTS)
+
+        result = pytester.runpytest('-p', 'no:xdist', '--test-categories-enforce-timeout')
+
+        result.assert_outcomes(passed=1, failed=1)
+        result.stdout.fnmatch_lines(['*exceeded performance baseline of 0.2s*'])
+        assert result.duration < 30
+
+    def it_reports_the_stack_at_the_interruption_point(self, pytester: pytest.Pytester) -> None:
+        """Verify the failure shows where the test was interrupted."""
+        pytester.makepyfile(test_hung=HUNG_TESTS)
+
+        result = pytester.runpytest('-p', 'no:xdist', '--test-categories-enforce-timeout')
+
+        result.stdout.fnmatch_lines(
+            [
+                '*Captured timeout watchdog call*',
+                'Test interrupted at:',
+                '*test_hung.py*, line 6, in test_hung',
+                '*time.sleep(60)',
+            ]
+        )
+
+    def it_leaves_another_plugins_alarm_running(self, pytester: pytest.Pytester) -> None:
+        """Verify a pending SIGALRM timer, as pytest-timeout's signal method sets, survives each test."""
+        pytester.makeconftest(
+            """
+            import signal
+            import pytest
+
+            @pytest.fixture(autouse=True)
+            def outer_alarm():
+                previous_handler = signal.signal(signal.SIGALRM, lambda signum, frame: pytest.fail('outer alarm'))
+                signal.setitimer(signal.ITIMER_REAL, 30)
+                yield
+                remaining = signal.getitimer(signal.ITIMER_REAL)[0]
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                signal.signal(signal.SIGALRM, previous_handler)
+                assert remaining > 0
+            """
+        )
+        pytester.makepyfile(
+            test_hung="""
+            import time
+            import pytest
+
+            @pytest.mark.medium(timeout=0.2)
+            def test_hung():
+                while True:
+                    time.sleep(0.01)
+
+            @pytest.mark.medium(timeout=0.2)
+            def test_fast():
+                pass
+            """
+        )
+
+        result = pytester.runpytest('-p', 'no:xdist', '--test-categories-enforce-timeout')
+
+        result.assert_outcomes(passed=1, failed=1)
+        result.stdout.fnmatch_lines(['*exceeded performance baseline of 0.2s*'])
+
+    def it_is_enabled_by_the_ini_option(self, pytester: pytest.Pytester) -> None:
+        """Verify test_categories_enforce_timeout = true arms the watchdog."""
+        pytester.makeini(
+            """
+            [pytest]
+            test_categories_enforce_timeout = true
+            """
+        )
+        pytester.makepyfile(test_hung=HUNG_TESTS)
+
+        result = pytester.runpytest('-p', 'no:xdist')
+
+        result.assert_outcomes(passed=1, failed=1)
+        assert result.duration < 30
@@ -0,0 +1,90 @@
+"""Integration tests for timing collected tests in the array-backed TimingStore.
+
+These tests verify that:
+- Every collected item gets a slot in the session TimingStore
+- No per-test timer objects accumulate, with or without a size report
+- Injected timer factories keep using per-test timer objects
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.adapters.pytest_adapter import PytestConfigAdapter
+from pytest_test_categories.timers import (
+    FakeTimer,
+    TimingStore,
+)
+
+if TYPE_CHECKING:
+    from pytest_test_categories.types import PluginState
+
+THREE_TESTS = """
+import pytest
+
+@pytest.mark.small
+def test_one():
+    pass
+
+@pytest.mark.small
+def test_two():
+    pass
+
+@pytest.mark.medium
+def test_three():
+    pass
+"""
+
+
+def _session_state(reprec: pytest.HookRecorder) -> PluginState:
+    """Get the plugin state of an inline run."""
+    session = reprec.getcall('pytest_sessionfinish').session
+    return PytestConfigAdapter(session.config).get_plugin_state()
+
+
+@pytest.mark.medium
+class DescribeTimingStoreSession:
+    """Integration tests for session timing."""
+
+    @pytest.mark.parametrize('report_args', [(), ('--test-size-report=basic',)])
+    def it_times_collected_tests_without_timer_objects(
+        self, pytester: pytest.Pytester, report_args: tuple[str, ...]
+    ) -> None:
+        """Verify tests are timed in the store and the timers dict stays empty."""
+        pytester.makepyfile(test_example=THREE_TESTS)
+
+        reprec = pytester.inline_run(*report_args)
+
+        reprec.assertoutcome(passed=3)
+        session_state = _session_state(reprec)
+        timing_store = session_state.timing_store
+        assert isinstance(timing_store, TimingStore)
+        assert len(timing_store) == 3
+        assert all(timing_store.duration(ordinal) is not None for ordinal in range(3))
+        assert session_state.timers == {}
+
+    def it_keeps_timer_objects_for_injected_factories(self, pytester: pytest.Pytester) -> None:
+        """Verify a custom timer_factory still times each test with its own timer."""
+        pytester.makeconftest(
+            """
+            import pytest
+
+            from pytest_test_categories.timers import FakeTimer
+
+            @pytest.hookimpl(trylast=True)
+            def pytest_configure(config):
+                config._test_categories_state.timer_factory = FakeTimer
+            """
+        )
+        pytester.makepyfile(test_example=THREE_TESTS)
+
+        reprec = pytester.inline_run()
+
+        reprec.assertoutcome(passed=3)
+        session_state = _session_state(reprec)
+        assert session_state.timer_factory is FakeTimer
+        assert session_state.timers == {}
@@ -0,0 +1,69 @@
+"""Integration tests for --test-categories-trace.
+
+These tests verify that:
+- Every test has a span, with a span for each of its setup, call and teardown phases
+- Spans are labelled with the test's size, outcome and violations
+- The phases lie within their test's span on one track
+
+All tests use @pytest.mark.medium since they involve real pytest infrastructure.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+
+@pytest.mark.medium
+class DescribeTraceExport:
+    """Integration tests for the Trace Event Format export."""
+
+    def it_writes_a_span_for_each_test_and_phase(self, pytester: pytest.Pytester) -> None:
+        """Verify the trace labels the spans and nests each test's phases in its span."""
+        pytester.makepyfile(
+            test_example="""
+            import time
+            import pytest
+
+            @pytest.mark.small
+            def test_sleeps():
+                time.sleep(0.001)
+
+            @pytest.mark.medium(timeout=0.05)
+            def test_over_baseline():
+                time.sleep(0.1)
+
+            @pytest.mark.skip(reason='not today')
+            def test_skipped():
+                pass
+            """
+        )
+
+        result = pytester.runpytest(
+            '-p', 'no:xdist', '--test-categories-enforcement=warn', '--test-categories-trace=trace.json'
+        )
+
+        result.assert_outcomes(passed=1, failed=1, skipped=1)
+        events = json.loads((pytester.path / 'trace.json').read_text())['traceEvents']
+        assert {event['args']['name'] for event in events if event['name'] == 'thread_name'} == {'main'}
+        tests = {event['name'].split('::')[-1].split()[0]: event for event in events if event.get('cat') == 'test'}
+        assert tests['test_sleeps']['args'] == {
+            'size': 'small',
+            'outcome': 'passed',
+            'violations': ['hermeticity:sleep'],
+        }
+        assert tests['test_over_baseline']['args'] == {
+            'size': 'medium',
+            'outcome': 'failed',
+            'violations': ['baseline'],
+        }
+        assert tests['test_skipped']['args']['outcome'] == 'skipped'
+
+        slow = tests['test_over_baseline']
+        phases = [event for event in events if event['ph'] == 'X' and event['args'].get('test') == slow['name']]
+        assert [event['name'] for event in phases] == ['setup', 'call', 'teardown']
+        for phase in phases:
+            assert slow['ts'] <= phase['ts']
+            assert phase['ts'] + phase['dur'] <= slow['ts'] + slow['dur'] + 1
+        assert phases[1]['dur'] >= 100_000
@@ -8,6 +8,7 @@ Key concerns addressed:
 2. Distribution validation - Test counts are aggregated correctly across workers
 3. Reporting - Reports contain aggregated results from all workers
 4. No duplicate warnings - Warnings only appear once, not per-worker
+5. Summaries - Hermeticity violations and suggestions are aggregated from all workers
 
 All tests use @pytest.mark.medium since they involve real pytest infrastructure
 and require spawning worker processes.
@@ -19,6 +20,8 @@ skipped when running under xdist (e.g., `pytest -n auto`).
 
 from __future__ import annotations
 
+import gzip
+import json
 import os
 
 import pytest
@@ -175,6 +178,222 @@ class DescribeXdistJsonReporting:
         # At least one test should have non-null duration
         assert '"duration": null' not in stdout or '"duration": 0' in stdout or '"status": "passed"' in stdout
 
+    def it_keeps_the_tests_a_crashed_worker_reported(self, pytester: pytest.Pytester) -> None:
+        """JSON report keeps the tests that ran on a worker before it crashed, and fails the crashed test."""
+        pytester.makepyfile(
+            test_example="""
+            import os
+            import pytest
+
+            @pytest.mark.small
+            def test_before_crash_1():
+                assert True
+
+            @pytest.mark.small
+            def test_before_crash_2():
+                assert True
+
+            @pytest.mark.small
+            def test_crash():
+                os._exit(1)
+            """
+        )
+
+        result = pytester.runpytest('--test-size-report=json', '-n', '1')
+
+        result.assert_outcomes(passed=2, failed=1)
+        stdout = result.stdout.str()
+        assert '"total_tests": 3' in stdout
+        assert '"status": "failed"' in stdout
+
+    def it_streams_the_jsonl_report_on_the_controller(self, pytester: pytest.Pytester) -> None:
+        """JSON Lines report holds a record for each test from every worker, including a crashed worker's."""
+        pytester.makepyfile(
+            test_example="""
+            import os
+            import pytest
+
+            @pytest.mark.small
+            def test_small():
+                assert True
+
+            @pytest.mark.medium
+            def test_medium():
+                assert True
+
+            @pytest.mark.small
+            def test_crash():
+                os._exit(1)
+            """
+        )
+
+        report_path = pytester.path / 'report.jsonl.gz'
+        result = pytester.runpytest('--test-size-report=jsonl', f'--test-size-report-file={report_path}', '-n', '2')
+
+        result.assert_outcomes(passed=2, failed=1)
+        lines = gzip.decompress(report_path.read_bytes()).decode().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert sorted((record['name'], record['size'], record['status']) for record in records[:-1]) == [
+            ('test_example.py::test_crash [SMALL]', 'small', 'failed'),
+            ('test_example.py::test_medium [MEDIUM]', 'medium', 'passed'),
+            ('test_example.py::test_small [SMALL]', 'small', 'passed'),
+        ]
+        assert records[-1]['summary']['total_tests'] == 3
+
+
+@pytest.mark.medium
+class DescribeXdistObservationAggregation:
+    """Tests for aggregating hermeticity violations and suggestions from workers."""
+
+    def it_summarizes_violations_from_every_worker(self, pytester: pytest.Pytester) -> None:
+        """Hermeticity summary counts the violations of tests that ran on different workers."""
+        pytester.makepyfile(
+            test_example="""
+            import time
+            import pytest
+
+            @pytest.mark.small
+            def test_sleep_1():
+                time.sleep(0.001)
+
+            @pytest.mark.small
+            def test_sleep_2():
+                time.sleep(0.001)
+            """
+        )
+
+        result = pytester.runpytest('-n', '2', '--dist=each', '--test-categories-enforcement=warn')
+
+        result.assert_outcomes(passed=4)
+        result.stdout.fnmatch_lines(
+            ['*Hermeticity Violation Summary*', '*Sleep:*4 tests*', 'Total: 4 violations in 2 tests']
+        )
+
+    def it_merges_the_metrics_of_every_worker(self, pytester: pytest.Pytester) -> None:
+        """The controller's metrics file counts the tests and violations of every worker."""
+        pytester.makepyfile(
+            test_example="""
+            import time
+            import pytest
+
+            @pytest.mark.small
+            def test_sleep_1():
+                time.sleep(0.001)
+
+            @pytest.mark.small
+            def test_sleep_2():
+                time.sleep(0.001)
+            """
+        )
+
+        result = pytester.runpytest(
+            '-n', '2', '--dist=each', '--test-categories-enforcement=warn', '--test-categories-metrics-file=pytest.prom'
+        )
+
+        result.assert_outcomes(passed=4)
+        lines = (pytester.path / 'pytest.prom').read_text().splitlines()
+        assert 'test_size_tests{size="small"} 2' in lines
+        assert 'test_duration_seconds_count{size="small",outcome="passed"} 4' in lines
+        assert 'test_hermeticity_violations_total{type="sleep"} 4' in lines
+        assert '# TYPE test_hermeticity_violations_total counter' in lines
+
+    def it_writes_a_trace_track_for_every_worker(self, pytester: pytest.Pytester) -> None:
+        """The controller's trace has one track per worker, holding the spans of its tests."""
+        pytester.makepyfile(
+            test_example="""
+            import pytest
+
+            @pytest.mark.small
+            def test_one():
+                pass
+
+            @pytest.mark.small
+            def test_two():
+                pass
+            """
+        )
+
+        result = pytester.runpytest('-n', '2', '--dist=each', '--test-categories-trace=trace.json')
+
+        result.assert_outcomes(passed=4)
+        events = json.loads((pytester.path / 'trace.json').read_text())['traceEvents']
+        tracks = {event['tid']: event['args']['name'] for event in events if event['name'] == 'thread_name'}
+        assert tracks == {0: 'gw0', 1: 'gw1'}
+        for tid in tracks:
+            spans = [event for event in events if event['ph'] == 'X' and event['tid'] == tid]
+            assert sorted(event['cat'] for event in spans) == sorted(['setup', 'call', 'teardown', 'test'] * 2)
+
+    def it_suggests_sizes_for_tests_from_every_worker(self, pytester: pytest.Pytester) -> None:
+        """Suggestion summary covers the uncategorized tests of every worker."""
+        pytester.makepyfile(
+            test_first="""
+            def test_uncategorized_first():
+                assert True
+            """,
+            test_second="""
+            def test_uncategorized_second():
+                assert True
+            """,
+        )
+
+        result = pytester.runpytest('-n', '2', '--dist=loadfile', '--test-categories-suggest')
+
+        result.assert_outcomes(passed=2)
+        stdout = result.stdout.str()
+        assert 'test_uncategorized_first' in stdout
+        assert 'test_uncategorized_second' in stdout
+
+
+@pytest.mark.medium
+class DescribeXdistCrashRecovery:
+    """Tests for recovering the results a crashed worker spilled."""
+
+    def it_recovers_violations_and_counts_from_a_crashed_worker(self, pytester: pytest.Pytester) -> None:
+        """Hermeticity summary and distribution counts include what the crashed worker spilled."""
+        pytester.makepyfile(
+            test_example="""
+            import os
+            import time
+            import pytest
+
+            @pytest.mark.small
+            def test_sleep_1():
+                time.sleep(0.001)
+
+            @pytest.mark.small
+            def test_sleep_2():
+                time.sleep(0.001)
+
+            @pytest.mark.small
+            def test_crash():
+                os._exit(1)
+            """
+        )
+
+        result = pytester.runpytest(
+            '-n', '1', '--test-categories-enforcement=warn', '--test-categories-spill-interval=0'
+        )
+
+        result.assert_outcomes(passed=2, failed=1)
+        result.stdout.fnmatch_lines(
+            [
+                '*Hermeticity Violation Summary*',
+                '*Sleep:*2 tests*',
+                '*xdist Worker Recovery*',
+                'gw0 went down before sending its results; recovered 2 spilled test records',
+            ]
+        )
+        result.stdout.fnmatch_lines(['*Small*3 tests*'])
+
+    def it_rejects_a_negative_spill_interval(self, pytester: pytest.Pytester) -> None:
+        """A negative flush interval is a usage error."""
+        pytester.makepyfile(test_example='def test_a(): pass')
+
+        result = pytester.runpytest('--test-categories-spill-interval=-1')
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(['*--test-categories-spill-interval must be at least 0, got -1.0*'])
+
 
 @pytest.mark.medium
 class DescribeXdistTimerIsolation:
@@ -825,3 +1044,53 @@ class DescribeXdistLoadGroupDistribution:
         assert '2 tests' in stdout
         assert 'Medium' in stdout
         assert '2 tests' in stdout
+
+
+@pytest.mark.medium
+class DescribeXdistCategoryScheduling:
+    """Tests for the --test-categories-schedule xdist scheduler."""
+
+    MIXED_TESTS = """
+        import pytest
+
+        @pytest.mark.small
+        def test_small_1():
+            assert True
+
+        @pytest.mark.small
+        def test_small_2():
+            assert True
+
+        @pytest.mark.medium
+        def test_medium_1():
+            assert True
+
+        @pytest.mark.large
+        def test_large_1():
+            assert True
+        """
+
+    def it_runs_the_longest_expected_test_first(self, pytester: pytest.Pytester) -> None:
+        """The large test collected last is dispatched before the others."""
+        pytester.makepyfile(test_example=self.MIXED_TESTS)
+
+        result = pytester.runpytest('-v', '-n', '1', '--test-categories-schedule')
+
+        result.assert_outcomes(passed=4)
+        result.stdout.fnmatch_lines(
+            [
+                '*scheduling tests via CategoryScheduling*',
+                '*PASSED test_example.py::test_large_1*',
+                '*PASSED test_example.py::test_medium_1*',
+                '*PASSED test_example.py::test_small_1*',
+            ]
+        )
+
+    def it_leaves_explicit_distribution_modes_to_xdist(self, pytester: pytest.Pytester) -> None:
+        """An explicit --dist mode other than load keeps xdist's own scheduler."""
+        pytester.makepyfile(test_example=self.MIXED_TESTS)
+
+        result = pytester.runpytest('-v', '-n', '2', '--dist=loadfile', '--test-categories-schedule')
+
+        result.assert_outcomes(passed=4)
+        result.stdout.fnmatch_lines(['*scheduling tests via LoadFileScheduling*'])
@@ -0,0 +1,435 @@
+"""Test the audit-hook enforcement engine.
+
+These tests drive the audit hook dispatcher and the event handlers directly with
+synthetic audit event arguments, so no real filesystem, network, or process
+access happens while an enforcer is active.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from icontract import ViolationError
+
+from pytest_test_categories.adapters import audit_hook
+from pytest_test_categories.adapters.audit_hook import AuditHookEnforcer
+from pytest_test_categories.exceptions import (
+    DatabaseViolationError,
+    FilesystemAccessViolationError,
+    NetworkAccessViolationError,
+    SleepViolationError,
+    SubprocessViolationError,
+)
+from pytest_test_categories.ports.filesystem import FilesystemOperation
+from pytest_test_categories.ports.network import (
+    BlockerState,
+    EnforcementMode,
+)
+from pytest_test_categories.types import (
+    EnforcementEngine,
+    TestSize,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class RecordingCallback:
+    """Violation callback that records every call."""
+
+    def __init__(self) -> None:
+        """Initialize with no recorded calls."""
+        self.calls: list[tuple[str, str, str, bool]] = []
+
+    def __call__(self, violation_type: str, test_nodeid: str, details: str, *, failed: bool) -> None:
+        self.calls.append((violation_type, test_nodeid, details, failed))
+
+
+@pytest.fixture
+def callback() -> RecordingCallback:
+    """Provide a recording violation callback."""
+    return RecordingCallback()
+
+
+@pytest.fixture
+def enforcer(callback: RecordingCallback) -> Iterator[AuditHookEnforcer]:
+    """Provide an enforcer that is deactivated after the test."""
+    enforcer = AuditHookEnforcer(violation_callback=callback, current_test_nodeid='test_example.py::test_it')
+    yield enforcer
+    enforcer.reset()
+
+
+def _dispatch(event: str, *args: object) -> None:
+    """Feed a synthetic audit event to the hook."""
+    audit_hook._audit_hook(event, args)
+
+
+# Calls _dispatch from a frame that belongs to the import system
+_IMPORT_SYSTEM_CALL = compile('dispatch(event, *args)', '<frozen importlib._bootstrap_external>', 'eval')
+
+
+def _dispatch_from_import_system(event: str, *args: object) -> None:
+    """Feed a synthetic audit event to the hook as if the import system raised it."""
+    eval(_IMPORT_SYSTEM_CALL, {'dispatch': _dispatch, 'event': event, 'args': args})  # noqa: S307
+
+
+@pytest.mark.small
+class DescribeEnforcementEngine:
+    """Tests for the EnforcementEngine enum."""
+
+    def it_defines_patch_and_audit_engines(self) -> None:
+        """Verify both engines are available with their ini values."""
+        assert EnforcementEngine('patch') == EnforcementEngine.PATCH
+        assert EnforcementEngine('audit') == EnforcementEngine.AUDIT
+
+
+@pytest.mark.small
+class DescribeAuditHookEnforcerLifecycle:
+    """Tests for activation and the module-level dispatch state."""
+
+    def it_starts_inactive(self) -> None:
+        """Verify the enforcer initializes in INACTIVE state."""
+        enforcer = AuditHookEnforcer()
+
+        assert enforcer.state == BlockerState.INACTIVE
+        assert enforcer.is_active is False
+
+    def it_routes_events_to_the_active_enforcer(self, enforcer: AuditHookEnforcer) -> None:
+        """Verify activate() points the hook at the enforcer and deactivate() clears it."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.WARN)
+
+        assert audit_hook._active_enforcer is enforcer
+        assert 'open' in audit_hook._active_handlers
+
+        enforcer.deactivate()
+
+        assert audit_hook._active_enforcer is None
+        assert audit_hook._active_handlers == {}
+
+    def it_uses_network_handlers_only_for_medium_tests(self, enforcer: AuditHookEnforcer) -> None:
+        """Verify medium tests only handle socket events."""
+        enforcer.activate(TestSize.MEDIUM, EnforcementMode.STRICT)
+
+        assert set(audit_hook._active_handlers) == {'socket.connect', 'socket.getaddrinfo'}
+
+    @pytest.mark.parametrize('test_size', [TestSize.LARGE, TestSize.XLARGE])
+    def it_uses_no_handlers_for_large_tests(self, enforcer: AuditHookEnforcer, test_size: TestSize) -> None:
+        """Verify large and xlarge tests take the empty fast path."""
+        enforcer.activate(test_size, EnforcementMode.STRICT)
+
+        assert audit_hook._active_handlers == {}
+
+    def it_uses_no_handlers_when_enforcement_is_off(self, enforcer: AuditHookEnforcer) -> None:
+        """Verify enforcement mode OFF takes the empty fast path."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.OFF)
+
+        assert audit_hook._active_handlers == {}
+
+    def it_restores_the_outer_enforcer_when_nested(self, enforcer: AuditHookEnforcer) -> None:
+        """Verify a nested session unwinds to the outer session's enforcer."""
+        inner = AuditHookEnforcer()
+        enforcer.activate(TestSize.MEDIUM, EnforcementMode.STRICT)
+        outer_handlers = audit_hook._active_handlers
+
+        inner.activate(TestSize.SMALL, EnforcementMode.STRICT)
+        inner.deactivate()
+
+        assert audit_hook._active_enforcer is enforcer
+        assert audit_hook._active_handlers is outer_handlers
+
+    @pytest.mark.usefixtures('debug_contracts')
+    def it_rejects_double_activation(self, enforcer: AuditHookEnforcer) -> None:
+        """Verify activate() fails when already active."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+
+        with pytest.raises(ViolationError):
+            enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+
+    def it_registers_the_audit_hook_only_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verify install() calls sys.addaudithook at most once per process."""
+        registered: list[object] = []
+        monkeypatch.setattr(audit_hook.sys, 'addaudithook', registered.append)
+        monkeypatch.setattr(audit_hook, '_hook_registered', False)
+        enforcer = AuditHookEnforcer()
+
+        enforcer.install()
+        enforcer.install()
+
+        assert registered == [audit_hook._audit_hook]
+        assert enforcer.is_installed is True
+
+
+@pytest.mark.small
+class DescribeAuditHookDispatch:
+    """Tests for the process-wide audit hook function."""
+
+    def it_ignores_events_while_no_enforcer_is_active(self, callback: RecordingCallback) -> None:
+        """Verify events outside a test are ignored."""
+        _dispatch('time.sleep', 1.0)
+
+        assert callback.calls == []
+
+    def it_ignores_events_without_a_handler(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify events the current size allows are ignored."""
+        enforcer.activate(TestSize.MEDIUM, EnforcementMode.STRICT)
+
+        _dispatch('time.sleep', 1.0)
+
+        assert callback.calls == []
+
+    def it_does_not_reenter_while_handling_an_event(self, enforcer: AuditHookEnforcer) -> None:
+        """Verify events raised by a handler are not dispatched again."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.WARN)
+        nested: list[str] = []
+
+        def record_nested(*_args: object, **_kwargs: object) -> None:
+            nested.append('called')
+            _dispatch('time.sleep', 1.0)
+
+        enforcer.violation_callback = record_nested
+
+        _dispatch('time.sleep', 1.0)
+
+        assert nested == ['called']
+
+
+@pytest.mark.small
+class DescribeAuditHookSmallTestRules:
+    """Tests for the events blocked in small tests."""
+
+    def it_blocks_file_open(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify opening a file raises FilesystemAccessViolationError in strict mode."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+
+        with pytest.raises(FilesystemAccessViolationError):
+            _dispatch('open', '/etc/hosts', 'r', os.O_RDONLY)
+
+        assert callback.calls == [
+            ('filesystem', 'test_example.py::test_it', 'Attempted read on filesystem path: /etc/hosts', True)
+        ]
+
+    @pytest.mark.parametrize(
+        ('mode', 'flags', 'operation'),
+        [
+            ('w', os.O_WRONLY, FilesystemOperation.WRITE),
+            ('a', os.O_APPEND, FilesystemOperation.WRITE),
+            ('r+', os.O_RDWR, FilesystemOperation.WRITE),
+            ('x', os.O_CREAT | os.O_EXCL, FilesystemOperation.CREATE),
+            (None, os.O_WRONLY | os.O_TRUNC, FilesystemOperation.WRITE),
+            (None, os.O_CREAT | os.O_EXCL | os.O_WRONLY, FilesystemOperation.CREATE),
+            (None, os.O_CREAT, FilesystemOperation.CREATE),
+            (None, os.O_RDONLY, FilesystemOperation.READ),
+        ],
+    )
+    def it_derives_the_operation_from_mode_and_flags(
+        self,
+        enforcer: AuditHookEnforcer,
+        callback: RecordingCallback,
+        mode: str | None,
+        flags: int,
+        operation: FilesystemOperation,
+    ) -> None:
+        """Verify the reported operation follows the open mode or os.open flags."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.WARN)
+
+        _dispatch('open', Path('/var/data.txt'), mode, flags)
+
+        assert callback.calls[0][2] == f'Attempted {operation.value} on filesystem path: /var/data.txt'
+
+    @pytest.mark.parametrize('path', [3, None, '/project/.coverage.host.1234.567890'])
+    def it_ignores_file_descriptors_and_coverage_data(
+        self, enforcer: AuditHookEnforcer, callback: RecordingCallback, path: object
+    ) -> None:
+        """Verify fds and coverage data files are not reported."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+
+        _dispatch('open', path, 'r', os.O_RDONLY)
+
+        assert callback.calls == []
+
+    @pytest.mark.parametrize(
+        'path', ['/project/src/module.py', '/project/src/__pycache__/module.cpython-311.pyc', '/project/data.txt']
+    )
+    def it_ignores_the_import_systems_reads(
+        self, enforcer: AuditHookEnforcer, callback: RecordingCallback, path: str
+    ) -> None:
+        """Verify files read while the import system runs are not reported."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+
+        _dispatch_from_import_system('open', path, 'rb', os.O_RDONLY)
+
+        assert callback.calls == []
+
+    @pytest.mark.parametrize('path', ['/project/data.py', '/project/src/__pycache__/module.cpython-311.pyc'])
+    def it_blocks_a_test_reading_module_files(
+        self, enforcer: AuditHookEnforcer, callback: RecordingCallback, path: str
+    ) -> None:
+        """Verify a test reading a module or bytecode file itself is reported, whatever the suffix."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.WARN)
+
+        _dispatch('open', path, 'r', os.O_RDONLY)
+
+        assert callback.calls == [
+            ('filesystem', 'test_example.py::test_it', f'Attempted read on filesystem path: {path}', False)
+        ]
+
+    @pytest.mark.parametrize(
+        ('path', 'mode', 'flags'),
+        [
+            ('/project/src/module.py', 'w', os.O_WRONLY | os.O_CREAT | os.O_TRUNC),
+            ('/project/src/module.py', 'a', os.O_WRONLY | os.O_APPEND),
+            ('/project/src/__pycache__/notes.txt', 'w', os.O_WRONLY | os.O_CREAT | os.O_TRUNC),
+            ('/project/src/__pycache__/module.py', None, os.O_CREAT | os.O_EXCL | os.O_WRONLY),
+            ('/project/src/my__pycache__/module.cpython-311.pyc', 'wb', os.O_WRONLY | os.O_CREAT | os.O_TRUNC),
+        ],
+    )
+    def it_blocks_the_import_systems_other_writes(
+        self, enforcer: AuditHookEnforcer, callback: RecordingCallback, path: str, mode: str | None, flags: int
+    ) -> None:
+        """Verify the import system is exempt only for .pyc files in a __pycache__ directory."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.WARN)
+
+        _dispatch_from_import_system('open', path, mode, flags)
+
+        assert len(callback.calls) == 1
+
+    def it_ignores_bytecode_cache_writes(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify the import system's __pycache__ directory and atomic .pyc write and rename are not reported."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+        cache_file = '/project/src/__pycache__/module.cpython-311.pyc'
+
+        _dispatch_from_import_system('os.mkdir', '/project/src/__pycache__', 0o777, -1)
+        _dispatch_from_import_system('open', f'{cache_file}.140234', None, os.O_EXCL | os.O_CREAT | os.O_WRONLY)
+        _dispatch_from_import_system('os.rename', f'{cache_file}.140234', cache_file, -1, -1)
+
+        assert callback.calls == []
+
+    def it_blocks_a_test_writing_the_bytecode_cache(
+        self, enforcer: AuditHookEnforcer, callback: RecordingCallback
+    ) -> None:
+        """Verify a test writing a .pyc file itself is reported."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.WARN)
+
+        _dispatch('open', '/project/src/__pycache__/module.cpython-311.pyc', 'wb', os.O_WRONLY | os.O_CREAT)
+
+        assert len(callback.calls) == 1
+
+    def it_blocks_os_level_filesystem_events(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify os-level filesystem events are reported with their operation."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.WARN)
+
+        _dispatch('os.remove', '/var/data.txt', -1)
+        _dispatch('os.mkdir', b'/var/new', 0o777, -1)
+        _dispatch('os.scandir', '/var')
+
+        assert [call[2] for call in callback.calls] == [
+            'Attempted delete on filesystem path: /var/data.txt',
+            'Attempted create on filesystem path: /var/new',
+            'Attempted list on filesystem path: /var',
+        ]
+
+    def it_blocks_network_connections(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify socket.connect raises NetworkAccessViolationError in small tests."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+
+        with pytest.raises(NetworkAccessViolationError):
+            _dispatch('socket.connect', object(), ('127.0.0.1', 8080))
+
+        assert callback.calls[0][:3] == (
+            'network',
+            'test_example.py::test_it',
+            'Attempted network connection to 127.0.0.1:8080',
+        )
+
+    def it_ignores_non_inet_socket_addresses(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify Unix socket addresses are not reported as network access."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+
+        _dispatch('socket.connect', object(), '/run/app.sock')
+
+        assert callback.calls == []
+
+    def it_blocks_subprocess_popen(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify subprocess.Popen raises SubprocessViolationError."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+
+        with pytest.raises(SubprocessViolationError):
+            _dispatch('subprocess.Popen', 'echo', ['echo', 'hello'], None, None)
+
+        assert callback.calls[0][2] == 'Attempted subprocess via subprocess.Popen: echo hello'
+
+    def it_blocks_os_level_process_events(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify os.system, os.posix_spawn and os.exec are reported."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.WARN)
+
+        _dispatch('os.system', b'ls -la')
+        _dispatch('os.posix_spawn', '/bin/ls', ['ls', '/var'], None)
+        _dispatch('os.exec', '/bin/ls', ('ls',), None)
+
+        assert [call[2] for call in callback.calls] == [
+            'Attempted subprocess via os.system: ls -la',
+            'Attempted subprocess via os.posix_spawn: ls /var',
+            'Attempted subprocess via os.exec: ls',
+        ]
+
+    def it_blocks_sqlite3_connections(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify sqlite3.connect raises DatabaseViolationError."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+
+        with pytest.raises(DatabaseViolationError):
+            _dispatch('sqlite3.connect', ':memory:')
+
+        assert callback.calls[0][2] == 'Attempted sqlite3 connection: :memory:'
+
+    def it_blocks_time_sleep(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify time.sleep raises SleepViolationError."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.STRICT)
+
+        with pytest.raises(SleepViolationError):
+            _dispatch('time.sleep', 0.5)
+
+        assert callback.calls[0][2] == 'Attempted time.sleep for 0.500s'
+
+    def it_records_without_raising_in_warn_mode(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify warn mode records a non-failing violation."""
+        enforcer.activate(TestSize.SMALL, EnforcementMode.WARN)
+
+        _dispatch('time.sleep', 0.5)
+
+        assert callback.calls[0][3] is False
+
+
+@pytest.mark.small
+class DescribeAuditHookMediumTestRules:
+    """Tests for the localhost-only network rule in medium tests."""
+
+    @pytest.mark.parametrize('host', ['localhost', '127.0.0.1', '::1'])
+    def it_allows_localhost(self, enforcer: AuditHookEnforcer, callback: RecordingCallback, host: str) -> None:
+        """Verify medium tests may resolve and connect to localhost."""
+        enforcer.activate(TestSize.MEDIUM, EnforcementMode.STRICT)
+
+        _dispatch('socket.getaddrinfo', host, 80, 0, 0, 0)
+        _dispatch('socket.connect', object(), (host, 80))
+
+        assert callback.calls == []
+
+    def it_blocks_external_hosts(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify medium tests may not resolve external hosts."""
+        enforcer.activate(TestSize.MEDIUM, EnforcementMode.STRICT)
+
+        with pytest.raises(NetworkAccessViolationError):
+            _dispatch('socket.getaddrinfo', b'example.com', 443, 0, 0, 0)
+
+        assert callback.calls[0][2] == 'Attempted network connection to example.com:443'
+
+    def it_allows_filesystem_and_sleep(self, enforcer: AuditHookEnforcer, callback: RecordingCallback) -> None:
+        """Verify medium tests may use the filesystem and sleep."""
+        enforcer.activate(TestSize.MEDIUM, EnforcementMode.STRICT)
+
+        _dispatch('open', '/etc/hosts', 'r', os.O_RDONLY)
+        _dispatch('time.sleep', 0.5)
+
+        assert callback.calls == []
@@ -0,0 +1,64 @@
+"""Tests for time-budgeted test selection."""
+
+from __future__ import annotations
+
+import pytest
+
+from pytest_test_categories.budget import (
+    BudgetSelection,
+    budget_value,
+    select_within_budget,
+)
+from pytest_test_categories.types import TestSize
+
+
+@pytest.mark.small
+class DescribeBudgetValue:
+    """Test how valuable each test is to run within a budget."""
+
+    def it_favors_small_tests(self) -> None:
+        """Test that small tests are worth more than larger or unsized tests."""
+        assert budget_value(TestSize.SMALL) > budget_value(TestSize.MEDIUM) > budget_value(TestSize.LARGE)
+        assert budget_value(TestSize.SMALL) > budget_value(None)
+
+    def it_favors_recently_failed_and_changed_tests(self) -> None:
+        """Test that failing or changed tests are worth more than a small test that is neither."""
+        assert budget_value(TestSize.MEDIUM, failed=True) > budget_value(TestSize.SMALL)
+        assert budget_value(TestSize.MEDIUM, changed=True) > budget_value(TestSize.SMALL)
+        assert budget_value(TestSize.SMALL, failed=True, changed=True) > budget_value(TestSize.SMALL, failed=True)
+
+
+@pytest.mark.small
+class DescribeSelectWithinBudget:
+    """Test selecting tests that fit in a time budget."""
+
+    def it_keeps_the_total_cost_within_the_budget(self) -> None:
+        """Test that the selected tests' costs add up to no more than the budget."""
+        costs = [0.4, 2.0, 0.3, 5.0, 1.0, 0.2]
+
+        selected = select_within_budget(costs, [1.0] * len(costs), budget=2.0)
+
+        assert sum(cost for cost, keep in zip(costs, selected, strict=True) if keep) <= 2.0
+        assert selected == [True, False, True, False, True, True]
+
+    def it_takes_the_most_value_per_second_first(self) -> None:
+        """Test that a costly but valuable test wins over cheap tests worth less per second."""
+        selected = select_within_budget([1.0, 1.0, 4.0], [1.0, 1.0, 40.0], budget=5.0)
+
+        assert selected == [True, False, True]
+
+    def it_skips_tests_that_no_longer_fit(self) -> None:
+        """Test that a test too costly for the remaining budget does not stop cheaper ones."""
+        selected = select_within_budget([3.0, 0.5, 0.5], [30.0, 1.0, 1.0], budget=3.5)
+
+        assert selected == [True, True, False]
+
+    def it_selects_tests_recorded_as_taking_no_time(self) -> None:
+        """Test that zero-cost tests are selected without dividing by zero."""
+        assert select_within_budget([0.0, 10.0], [1.0, 1.0], budget=1.0) == [True, False]
+
+    def it_reports_the_deselected_count(self) -> None:
+        """Test that the selection derives how many tests did not fit."""
+        selection = BudgetSelection(budget=60.0, collected=10, selected=7, expected_duration=58.5)
+
+        assert selection.deselected == 3
@@ -0,0 +1,218 @@
+"""Tests for the pytest-test-categories command."""
+
+from __future__ import annotations
+
+import io
+import json
+import textwrap
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.cli import main
+from pytest_test_categories.distribution.stats import DistributionStats
+from pytest_test_categories.json_report import JsonReport
+from pytest_test_categories.jsonl_report import JsonlReportWriter
+from pytest_test_categories.reporting import TestSizeReport
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PYPROJECT = """
+[tool.pytest.ini_options]
+testpaths = ["tests"]
+python_classes = ["Describe[A-Z]*"]
+python_functions = ["it_*"]
+"""
+
+
+def _write_suite(root: Path, small: int, medium: int, large: int = 0) -> None:
+    """Write a suite with the given numbers of small, medium and large tests."""
+    (root / 'pyproject.toml').write_text(PYPROJECT)
+    tests = root / 'tests'
+    tests.mkdir()
+    (tests / 'test_suite.py').write_text(
+        textwrap.dedent(f"""
+            import pytest
+
+            @pytest.mark.small
+            class DescribeUnit:
+                @pytest.mark.parametrize('n', range({small}))
+                def it_is_small(self, n): pass
+
+            @pytest.mark.medium
+            @pytest.mark.parametrize('n', range({medium}))
+            def it_is_medium(n): pass
+
+            @pytest.mark.large
+            @pytest.mark.parametrize('n', range({large}))
+            def it_is_large(n): pass
+        """)
+    )
+
+
+def _run(*args: str) -> tuple[int, str, str]:
+    """Run the command and return its exit code, output and errors."""
+    out, err = io.StringIO(), io.StringIO()
+    code = main(list(args), out, err)
+    return code, out.getvalue(), err.getvalue()
+
+
+@pytest.mark.medium
+class DescribeIndexCommand:
+    """Test checking the distribution from the static index."""
+
+    def it_passes_a_healthy_distribution(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the project's collection rules and testpaths are used and a good distribution passes."""
+        _write_suite(tmp_path, small=80, medium=15, large=5)
+        monkeypatch.chdir(tmp_path)
+
+        code, out, _ = _run('index')
+
+        assert code == 0
+        assert '80 tests (80.00%)' in out
+        assert 'Indexed 100 tests in 1 files (1 parsed, 0 cached)' in out
+
+    def it_fails_a_bad_distribution_in_strict_mode(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the check fails by default when the distribution is off target."""
+        _write_suite(tmp_path, small=5, medium=5)
+        monkeypatch.chdir(tmp_path)
+
+        code, _, err = _run('index')
+
+        assert code == 1
+        assert 'Test Distribution' in err
+
+    def it_only_warns_in_warn_mode(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that warn mode reports the distribution problem and succeeds."""
+        _write_suite(tmp_path, small=5, medium=5)
+        monkeypatch.chdir(tmp_path)
+
+        code, _, err = _run('index', '--distribution-enforcement=warn')
+
+        assert code == 0
+        assert err.startswith('warning: ')
+
+    def it_reuses_the_cached_index(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a second run reads the unchanged file from the cache in .pytest_cache."""
+        _write_suite(tmp_path, small=80, medium=15, large=5)
+        monkeypatch.chdir(tmp_path)
+        _run('index')
+
+        _, out, _ = _run('index')
+
+        assert '(0 parsed, 1 cached)' in out
+        assert (tmp_path / '.pytest_cache' / '.gitignore').is_file()
+
+    def it_rejects_an_invalid_target(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a distribution target that is not a number is a usage error."""
+        _write_suite(tmp_path, small=80, medium=15, large=5)
+        (tmp_path / 'pyproject.toml').write_text(PYPROJECT + 'test_categories_small_target = "most"\n')
+        monkeypatch.chdir(tmp_path)
+
+        code, _, err = _run('index')
+
+        assert code == pytest.ExitCode.USAGE_ERROR
+        assert 'test_categories_small_target must be a number' in err
+
+
+@pytest.mark.medium
+class DescribeConvertCommand:
+    """Test converting a jsonl test size report to the json format."""
+
+    def it_writes_the_json_report(self, tmp_path: Path) -> None:
+        """Test that the json report is written to the output file."""
+        report = TestSizeReport()
+        report.add_test('test_a.py::test_one', TestSize.SMALL, 0.1, 'passed')
+        writer = JsonlReportWriter(tmp_path / 'report.jsonl.gz')
+        writer.write_test(report, 'test_a.py::test_one')
+        writer.write_summary(report, DistributionStats(), '1.0.0')
+        writer.close()
+
+        code, _, _ = _run(
+            'convert', str(tmp_path / 'report.jsonl.gz'), '--output', str(tmp_path / 'out' / 'report.json')
+        )
+
+        assert code == 0
+        converted = json.loads((tmp_path / 'out' / 'report.json').read_text())
+        assert converted['summary']['total_tests'] == 1
+        assert converted['tests'][0]['name'] == 'test_a.py::test_one'
+
+    def it_rejects_a_missing_report(self, tmp_path: Path) -> None:
+        """Test that a report that does not exist is a usage error."""
+        code, _, err = _run('convert', str(tmp_path / 'missing.jsonl'))
+
+        assert code == pytest.ExitCode.USAGE_ERROR
+        assert 'missing.jsonl' in err
+
+
+def _write_shard(path: Path, tests: list[tuple[str, TestSize, float]]) -> str:
+    """Write a shard's --test-size-report=json report and return its path."""
+    report = TestSizeReport()
+    for nodeid, size, duration in tests:
+        report.add_test(nodeid, size, duration, 'passed')
+    path.write_text(JsonReport.from_test_size_report(report, DistributionStats(), '1.0.0').model_dump_json(indent=2))
+    return str(path)
+
+
+def _write_shards(root: Path, *, slow_small: bool = False) -> list[str]:
+    """Write two shards of a healthy 80/15/5 suite, optionally with a small test over its time limit."""
+    tests = [(f'test_small_{i}', TestSize.SMALL, 0.01 * i) for i in range(80)]
+    tests += [(f'test_medium_{i}', TestSize.MEDIUM, 1.0 + i) for i in range(15)]
+    tests += [(f'test_large_{i}', TestSize.LARGE, 30.0) for i in range(5)]
+    if slow_small:
+        tests[0] = ('test_small_0', TestSize.SMALL, 3.0)
+    return [_write_shard(root / 'shard-1.json', tests[::2]), _write_shard(root / 'shard-2.json', tests[1::2])]
+
+
+@pytest.mark.medium
+class DescribeReportCommand:
+    """Test merging and analyzing the reports of a sharded run."""
+
+    def it_merges_the_shards_into_one_json_report(self, tmp_path: Path) -> None:
+        """Test that the merged report has every shard's tests and the recomputed distribution."""
+        code, _, _ = _run('report', 'merge', *_write_shards(tmp_path), '-o', str(tmp_path / 'out' / 'report.json'))
+
+        assert code == 0
+        merged = json.loads((tmp_path / 'out' / 'report.json').read_text())
+        assert merged['summary']['total_tests'] == 100
+        assert merged['summary']['distribution']['small']['percentage'] == 80.0
+        assert len(merged['tests']) == 100
+
+    def it_lists_the_slowest_tests_of_each_size(self, tmp_path: Path) -> None:
+        """Test that top lists the requested number of tests of each size, slowest first."""
+        code, out, _ = _run('report', 'top', *_write_shards(tmp_path), '-n', '2')
+
+        assert code == 0
+        lines = out.splitlines()
+        small = lines.index('    Small:')
+        assert lines[small + 1 : small + 3] == ['          0.79s  test_small_79', '          0.78s  test_small_78']
+        assert '    Unsized:' not in lines
+
+    def it_passes_a_healthy_sharded_run(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that validate succeeds when the merged distribution is on target and no test was too slow."""
+        monkeypatch.chdir(tmp_path)
+
+        code, out, _ = _run('report', 'validate', *_write_shards(tmp_path))
+
+        assert code == 0
+        assert 'Merged 100 tests from 2 shard reports' in out
+
+    def it_fails_a_sharded_run_with_a_time_violation(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that validate lists the tests over their time limit and exits non-zero."""
+        monkeypatch.chdir(tmp_path)
+
+        code, out, _ = _run('report', 'validate', *_write_shards(tmp_path, slow_small=True))
+
+        assert code == 1
+        assert 'Tests over their time limit: 1\n    test_small_0\n' in out
+
+    def it_rejects_a_shard_that_is_not_a_report(self, tmp_path: Path) -> None:
+        """Test that a shard that is not a report is a usage error."""
+        (tmp_path / 'shard.json').write_text('[]')
+
+        code, _, err = _run('report', 'top', str(tmp_path / 'shard.json'))
+
+        assert code == pytest.ExitCode.USAGE_ERROR
+        assert 'shard.json: not a test size report' in err
@@ -0,0 +1,135 @@
+"""Tests for the debug-contracts switch and the slotted production adapters.
+
+The production timer and blockers skip their state-machine and type checks
+unless debug contracts are enabled. The suite runs with them off, as in
+production; tests that check them turn them on with the debug_contracts fixture.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+from icontract import ViolationError
+
+from pytest_test_categories import contracts
+from pytest_test_categories.adapters.audit_hook import AuditHookEnforcer
+from pytest_test_categories.adapters.database import DatabasePatchingBlocker
+from pytest_test_categories.adapters.external_systems import ExternalSystemsDetector
+from pytest_test_categories.adapters.filesystem import FilesystemPatchingBlocker
+from pytest_test_categories.adapters.network import SocketPatchingNetworkBlocker
+from pytest_test_categories.adapters.process import SubprocessPatchingBlocker
+from pytest_test_categories.adapters.sleep import SleepPatchingBlocker
+from pytest_test_categories.adapters.threading import ThreadPatchingMonitor
+from pytest_test_categories.contracts import (
+    DEBUG_CONTRACTS_ENV_VAR,
+    debug_contracts_enabled,
+    enable_debug_contracts,
+    require_instance,
+    require_state,
+)
+from pytest_test_categories.ports.network import (
+    BlockerState,
+    EnforcementMode,
+)
+from pytest_test_categories.types import TestSize
+
+PRODUCTION_ADAPTERS = [
+    SocketPatchingNetworkBlocker,
+    FilesystemPatchingBlocker,
+    SubprocessPatchingBlocker,
+    SleepPatchingBlocker,
+    DatabasePatchingBlocker,
+    ThreadPatchingMonitor,
+    ExternalSystemsDetector,
+    AuditHookEnforcer,
+]
+
+
+@pytest.mark.small
+class DescribeDebugContractsSwitch:
+    """Tests for enabling and disabling debug contracts."""
+
+    @pytest.mark.usefixtures('debug_contracts')
+    def it_is_enabled_by_the_debug_contracts_fixture(self) -> None:
+        """Verify the debug_contracts fixture turns the checks on."""
+        assert debug_contracts_enabled() is True
+
+    @pytest.mark.usefixtures('debug_contracts')
+    def it_returns_the_previous_setting(self) -> None:
+        """Verify enable_debug_contracts returns the setting it replaced."""
+        assert enable_debug_contracts(enabled=False) is True
+        assert enable_debug_contracts(enabled=True) is False
+        assert debug_contracts_enabled() is True
+
+    @pytest.mark.parametrize(
+        ('value', 'expected'), [('1', True), ('TRUE', True), ('on', True), ('0', False), ('', False)]
+    )
+    def it_reads_the_environment_variable_at_import(
+        self, monkeypatch: pytest.MonkeyPatch, value: str, *, expected: bool
+    ) -> None:
+        """Verify the default comes from PYTEST_TEST_CATEGORIES_DEBUG_CONTRACTS."""
+        monkeypatch.setenv(DEBUG_CONTRACTS_ENV_VAR, value)
+        try:
+            assert importlib.reload(contracts).debug_contracts_enabled() is expected
+        finally:
+            monkeypatch.delenv(DEBUG_CONTRACTS_ENV_VAR)
+            importlib.reload(contracts)
+
+
+@pytest.mark.small
+class DescribeRequireHelpers:
+    """Tests for the contract helpers."""
+
+    def it_raises_violation_error_with_the_contract_description(self) -> None:
+        """Verify require_state raises icontract's ViolationError."""
+        with pytest.raises(ViolationError, match='Blocker must be ACTIVE to deactivate: state was inactive'):
+            require_state(BlockerState.INACTIVE, BlockerState.ACTIVE, 'Blocker must be ACTIVE to deactivate')
+
+    def it_passes_when_the_state_matches(self) -> None:
+        """Verify require_state is silent for the expected state."""
+        require_state(BlockerState.ACTIVE, BlockerState.ACTIVE, 'Blocker must be ACTIVE to deactivate')
+
+    def it_raises_type_error_for_wrong_types(self) -> None:
+        """Verify require_instance names the argument and both types."""
+        with pytest.raises(TypeError, match='test_size must be TestSize, got str'):
+            require_instance('small', TestSize, 'test_size')
+
+
+@pytest.mark.small
+class DescribeSlottedProductionAdapters:
+    """Tests for the production blockers built as slotted plain classes."""
+
+    @pytest.mark.parametrize('adapter_class', PRODUCTION_ADAPTERS)
+    def it_has_no_instance_dict(self, adapter_class: type) -> None:
+        """Verify the adapter uses __slots__ rather than a pydantic model."""
+        adapter = adapter_class()
+
+        assert not hasattr(adapter, '__dict__')
+        assert not hasattr(adapter_class, 'model_fields')
+        assert adapter.state == BlockerState.INACTIVE
+
+    @pytest.mark.usefixtures('debug_contracts')
+    def it_checks_argument_types_in_debug_mode(self) -> None:
+        """Verify activate() rejects a non-enum test size while debug contracts are on."""
+        blocker = SleepPatchingBlocker()
+
+        with pytest.raises(TypeError, match='test_size'):
+            blocker.activate('small', EnforcementMode.STRICT)  # type: ignore[arg-type]
+
+        assert blocker.state == BlockerState.INACTIVE
+
+    def it_skips_state_checks_when_debug_contracts_are_off(self) -> None:
+        """Verify check methods run without the ACTIVE precondition when debug contracts are off."""
+        enable_debug_contracts(enabled=False)
+        blocker = SleepPatchingBlocker()
+
+        assert blocker.check_sleep_allowed('time.sleep', 0.1) is True
+
+    @pytest.mark.usefixtures('debug_contracts')
+    def it_uses_the_port_contract_messages(self) -> None:
+        """Verify each adapter reports violations with its port's wording."""
+        with pytest.raises(ViolationError, match='Monitor must be ACTIVE to deactivate'):
+            ThreadPatchingMonitor().deactivate()
+        with pytest.raises(ViolationError, match='Detector must be ACTIVE to check'):
+            ExternalSystemsDetector().check_external_systems_detected()
@@ -29,6 +29,7 @@ from pytest_test_categories.adapters.fake_database import FakeDatabaseBlocker
 from pytest_test_categories.exceptions import DatabaseViolationError
 from pytest_test_categories.ports.database import (
     DatabaseAccessAttempt,
+    DatabaseBlockerPort,
     is_coverage_data_file,
 )
 from pytest_test_categories.ports.network import (
@@ -232,6 +233,10 @@ class DescribeFakeDatabaseBlocker:
 class DescribeDatabasePatchingBlocker:
     """Tests for the DatabasePatchingBlocker production adapter."""
 
+    def it_implements_the_port(self) -> None:
+        """Verify the adapter is registered as a virtual subclass of DatabaseBlockerPort."""
+        assert isinstance(DatabasePatchingBlocker(), DatabaseBlockerPort)
+
     def it_starts_in_inactive_state(self) -> None:
         """Verify the blocker initializes in INACTIVE state."""
         blocker = DatabasePatchingBlocker()
@@ -257,6 +262,7 @@ class DescribeDatabasePatchingBlocker:
 
         assert blocker.state == BlockerState.INACTIVE
 
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_activate_when_already_active(self) -> None:
         """Verify activate() raises when already ACTIVE."""
         blocker = DatabasePatchingBlocker()
@@ -268,6 +274,7 @@ class DescribeDatabasePatchingBlocker:
         finally:
             blocker.reset()
 
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_deactivate_when_inactive(self) -> None:
         """Verify deactivate() raises when already INACTIVE."""
         blocker = DatabasePatchingBlocker()
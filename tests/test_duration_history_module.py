@@ -0,0 +1,156 @@
+"""Tests for the persistent duration history."""
+
+from __future__ import annotations
+
+import sqlite3
+from array import array
+from contextlib import closing
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.duration_history import (
+    HISTORY_WINDOW,
+    MIN_HISTORY_RUNS,
+    DurationHistory,
+    DurationRecorder,
+    DurationStats,
+    derive_baseline,
+    is_regression,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _stats(*durations: float) -> DurationStats:
+    """Build statistics from a sequence of durations."""
+    return DurationStats().updated(durations, array('d'))
+
+
+@pytest.mark.small
+class DescribeDurationStats:
+    """Test folding durations into rolling statistics."""
+
+    def it_starts_the_average_at_the_first_duration(self) -> None:
+        """Test that the first run sets the EWMA directly."""
+        stats = _stats(0.4)
+
+        assert stats.run_count == 1
+        assert stats.ewma == 0.4
+
+    def it_computes_percentiles_of_the_recent_durations(self) -> None:
+        """Test nearest-rank p50 and p95 over the samples."""
+        stats = _stats(*(i / 100 for i in range(1, 101)))
+
+        assert stats.p50 == 0.5
+        assert stats.p95 == 0.95
+
+    def it_keeps_only_the_most_recent_window(self) -> None:
+        """Test that old samples fall out of the window while run_count keeps counting."""
+        samples = array('d')
+        stats = DurationStats().updated([10.0] + [0.1] * HISTORY_WINDOW, samples)
+
+        assert stats.run_count == HISTORY_WINDOW + 1
+        assert len(samples) == HISTORY_WINDOW
+        assert stats.p95 == 0.1
+
+    def it_folds_runs_into_the_stored_samples(self) -> None:
+        """Test that updating in several steps matches updating at once."""
+        samples = array('d')
+        stats = DurationStats().updated([0.3, 0.1], samples).updated([0.2], samples)
+
+        assert stats == _stats(0.3, 0.1, 0.2)
+        assert list(samples) == [0.3, 0.1, 0.2]
+
+
+@pytest.mark.small
+class DescribeRegressionDetection:
+    """Test flagging regressions and deriving baselines."""
+
+    def it_needs_enough_history_to_flag_a_regression(self) -> None:
+        """Test that tests with few runs are never flagged."""
+        stats = _stats(*[0.1] * (MIN_HISTORY_RUNS - 1))
+
+        assert not is_regression(stats, 5.0, factor=2.0)
+
+    def it_flags_durations_beyond_the_factor(self) -> None:
+        """Test that only durations beyond factor times the average are flagged."""
+        stats = _stats(*[0.1] * MIN_HISTORY_RUNS)
+
+        assert is_regression(stats, 0.25, factor=2.0)
+        assert not is_regression(stats, 0.15, factor=2.0)
+
+    def it_ignores_slowdowns_within_timer_noise(self) -> None:
+        """Test that a large factor on a tiny duration is not a regression."""
+        stats = _stats(*[0.001] * MIN_HISTORY_RUNS)
+
+        assert not is_regression(stats, 0.01, factor=2.0)
+
+    def it_derives_a_baseline_capped_at_the_category_limit(self) -> None:
+        """Test the derived baseline scales p95 and never exceeds the size's limit."""
+        stats = _stats(*[0.4] * MIN_HISTORY_RUNS)
+
+        assert derive_baseline(stats, 2.0, category_limit=1.0) == 0.8
+        assert derive_baseline(stats, 5.0, category_limit=1.0) == 1.0
+        assert derive_baseline(_stats(0.4), 2.0, category_limit=1.0) is None
+
+
+@pytest.mark.medium
+class DescribeDurationHistory:
+    """Test storing statistics in sqlite."""
+
+    def it_returns_no_history_before_the_first_save(self, tmp_path: Path) -> None:
+        """Test that a missing database loads as empty."""
+        assert DurationHistory(tmp_path / 'durations.sqlite3').load() == {}
+
+    def it_round_trips_statistics(self, tmp_path: Path) -> None:
+        """Test that updated statistics load back unchanged."""
+        history = DurationHistory(tmp_path / 'durations.sqlite3')
+
+        updated = history.update({'test_a.py::test_one': [0.1, 0.2, 0.3]})
+
+        assert updated == {'test_a.py::test_one': _stats(0.1, 0.2, 0.3)}
+        assert history.load() == updated
+
+    def it_folds_new_durations_into_the_stored_samples(self, tmp_path: Path) -> None:
+        """Test that each update continues from the recent durations stored by the last."""
+        history = DurationHistory(tmp_path / 'durations.sqlite3')
+        history.update({'test_a.py::test_one': [0.1, 0.5]})
+
+        history.update({'test_a.py::test_one': [0.3]})
+
+        assert history.load() == {'test_a.py::test_one': _stats(0.1, 0.5, 0.3)}
+
+    def it_flushes_buffered_durations_in_one_update(self, tmp_path: Path) -> None:
+        """Test that the recorder folds pending durations into the stored and loaded statistics."""
+        history = DurationHistory(tmp_path / 'durations.sqlite3')
+        history.update({'test_a.py::test_one': [0.1]})
+        recorder = DurationRecorder(history, history.load())
+
+        recorder.record('test_a.py::test_one', 0.3)
+        recorder.record('test_a.py::test_two', 0.2)
+        recorder.flush()
+
+        loaded = history.load()
+        assert len(recorder) == 0
+        assert loaded == recorder.stats
+        assert loaded['test_a.py::test_one'] == _stats(0.1, 0.3)
+        assert loaded['test_a.py::test_two'].run_count == 1
+
+    def it_adds_the_percentile_columns_to_an_older_database(self, tmp_path: Path) -> None:
+        """Test that a database storing only samples gets its percentiles computed once."""
+        path = tmp_path / 'durations.sqlite3'
+        with closing(sqlite3.connect(path)) as connection, connection:
+            connection.execute(
+                'CREATE TABLE durations '
+                '(nodeid TEXT PRIMARY KEY, run_count INTEGER NOT NULL, ewma REAL NOT NULL, samples BLOB NOT NULL)'
+            )
+            connection.execute(
+                'INSERT INTO durations VALUES (?, ?, ?, ?)',
+                ('test_a.py::test_one', 2, 0.2, array('d', [0.1, 0.3]).tobytes()),
+            )
+
+        loaded = DurationHistory(path).load()
+
+        assert loaded == {'test_a.py::test_one': DurationStats(run_count=2, ewma=0.2, p50=0.1, p95=0.3)}
@@ -0,0 +1,102 @@
+"""Tests for the precomputed enforcement plans."""
+
+from __future__ import annotations
+
+import pytest
+
+from pytest_test_categories.adapters.external_systems import ExternalSystemsDetector
+from pytest_test_categories.adapters.threading import ThreadPatchingMonitor
+from pytest_test_categories.enforcement_plan import (
+    NO_ENFORCEMENT,
+    EnforcementPlan,
+    EnforcementPlans,
+    blocker_step,
+    external_systems_check,
+)
+from pytest_test_categories.ports.network import (
+    BlockerState,
+    EnforcementMode,
+)
+from pytest_test_categories.services.test_discovery import SizeProfile
+from pytest_test_categories.types import TestSize
+
+
+@pytest.mark.small
+class DescribeEnforcementPlans:
+    """Tests for selecting the plan for a test."""
+
+    def it_defaults_to_no_enforcement(self) -> None:
+        """Verify plans compiled with enforcement off are all empty."""
+        plans = EnforcementPlans()
+
+        assert plans.for_profile(SizeProfile(size=TestSize.SMALL)) is NO_ENFORCEMENT
+        assert not NO_ENFORCEMENT.steps
+
+    def it_selects_the_plan_by_size_and_external_systems_flag(self) -> None:
+        """Verify small and medium tests get their plans and others get none."""
+        small = EnforcementPlan()
+        medium = EnforcementPlan()
+        medium_allowed = EnforcementPlan()
+        plans = EnforcementPlans(small=small, medium=medium, medium_external_systems_allowed=medium_allowed)
+
+        assert plans.for_profile(SizeProfile(size=TestSize.SMALL)) is small
+        assert plans.for_profile(SizeProfile(size=TestSize.MEDIUM)) is medium
+        assert plans.for_profile(SizeProfile(size=TestSize.MEDIUM, allow_external_systems=True)) is medium_allowed
+        assert plans.for_profile(SizeProfile(size=TestSize.LARGE)) is NO_ENFORCEMENT
+        assert plans.for_profile(SizeProfile(size=TestSize.XLARGE)) is NO_ENFORCEMENT
+        assert plans.for_profile(SizeProfile(size=None)) is NO_ENFORCEMENT
+
+
+@pytest.mark.small
+class DescribeBlockerStep:
+    """Tests for the (activate, deactivate) pair built for a blocker."""
+
+    def it_activates_the_blocker_for_the_test(self) -> None:
+        """Verify activate sets the node ID and activates with the bound arguments."""
+        monitor = ThreadPatchingMonitor()
+        activate, deactivate = blocker_step(monitor, TestSize.SMALL, EnforcementMode.WARN)
+
+        activate('test_module.py::test_one')
+        try:
+            assert monitor.state == BlockerState.ACTIVE
+            assert monitor.current_test_nodeid == 'test_module.py::test_one'
+            assert monitor.current_test_size == TestSize.SMALL
+            assert monitor.current_enforcement_mode == EnforcementMode.WARN
+        finally:
+            deactivate()
+
+        assert monitor.state == BlockerState.INACTIVE
+
+    def it_skips_deactivating_an_inactive_blocker(self) -> None:
+        """Verify deactivate is a no-op when the blocker never activated."""
+        monitor = ThreadPatchingMonitor()
+        _, deactivate = blocker_step(monitor, TestSize.SMALL, EnforcementMode.STRICT)
+
+        deactivate()
+
+        assert monitor.state == BlockerState.INACTIVE
+
+
+@pytest.mark.small
+class DescribeExternalSystemsCheck:
+    """Tests for the post-call external systems check."""
+
+    def it_skips_an_inactive_detector(self) -> None:
+        """Verify the check does not query a detector that is not active."""
+        check = external_systems_check(ExternalSystemsDetector())
+
+        check('test_module.py::test_one')
+
+    def it_checks_an_active_detector(self) -> None:
+        """Verify the check queries the detector while it is active."""
+        detector = ExternalSystemsDetector()
+        activate, deactivate = blocker_step(detector, TestSize.MEDIUM, EnforcementMode.WARN)
+        check = external_systems_check(detector)
+
+        activate('test_module.py::test_one')
+        try:
+            check('test_module.py::test_one')
+        finally:
+            deactivate()
+
+        assert detector.state == BlockerState.INACTIVE
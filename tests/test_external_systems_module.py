@@ -30,7 +30,10 @@ from pytest_test_categories.adapters.external_systems import (
     ExternalSystemsWarning,
 )
 from pytest_test_categories.adapters.fake_external_systems import FakeExternalSystemsDetector
-from pytest_test_categories.ports.external_systems import EXTERNAL_SYSTEM_PACKAGES
+from pytest_test_categories.ports.external_systems import (
+    EXTERNAL_SYSTEM_PACKAGES,
+    ExternalSystemsDetectorPort,
+)
 from pytest_test_categories.ports.network import (
     BlockerState,
     EnforcementMode,
@@ -244,6 +247,10 @@ class DescribeFakeExternalSystemsDetector:
 class DescribeExternalSystemsDetector:
     """Tests for the ExternalSystemsDetector production adapter."""
 
+    def it_implements_the_port(self) -> None:
+        """Verify the adapter is registered as a virtual subclass of ExternalSystemsDetectorPort."""
+        assert isinstance(ExternalSystemsDetector(), ExternalSystemsDetectorPort)
+
     def it_starts_in_inactive_state(self) -> None:
         """Verify the detector initializes in INACTIVE state."""
         detector = ExternalSystemsDetector()
@@ -269,6 +276,7 @@ class DescribeExternalSystemsDetector:
 
         assert detector.state == BlockerState.INACTIVE
 
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_activate_when_already_active(self) -> None:
         """Verify activate() raises when already ACTIVE."""
         detector = ExternalSystemsDetector()
@@ -280,6 +288,7 @@ class DescribeExternalSystemsDetector:
         finally:
             detector.reset()
 
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_deactivate_when_inactive(self) -> None:
         """Verify deactivate() raises when already INACTIVE."""
         detector = ExternalSystemsDetector()
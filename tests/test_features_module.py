@@ -0,0 +1,150 @@
+"""Tests for the feature sub-plugins."""
+
+from __future__ import annotations
+
+import contextlib
+from unittest.mock import Mock
+
+import pytest
+
+from pytest_test_categories.features import (
+    DurationHistoryPlugin,
+    ReportingPlugin,
+    SuggestionPlugin,
+)
+from pytest_test_categories.item_stash import (
+    get_call_duration,
+    store_call_duration,
+)
+from pytest_test_categories.legacy_hooks import (
+    pytest_runtest_makereport,
+    pytest_runtest_protocol,
+)
+from pytest_test_categories.plugin import TIMING_PLUGIN_NAME
+from pytest_test_categories.reporting import TestSizeReport
+from pytest_test_categories.suggestion import SuggestionCollector
+from pytest_test_categories.types import PluginState
+
+
+def _run_wrapper(gen: object, report: object) -> None:
+    """Drive a makereport hookwrapper through one report."""
+    next(gen)  # type: ignore[call-overload]
+    outcome = Mock()
+    outcome.get_result.return_value = report
+    with contextlib.suppress(StopIteration):
+        gen.send(outcome)  # type: ignore[attr-defined]
+
+
+@pytest.mark.small
+class DescribeCallDuration:
+    """Test sharing the call-phase duration between sub-plugins."""
+
+    def it_reads_the_duration_stored_by_the_timing_sub_plugin(self) -> None:
+        """Test that a stored duration takes precedence over the report's."""
+        item = Mock(stash=pytest.Stash())
+        store_call_duration(item, 0.25)
+
+        assert get_call_duration(item, Mock(duration=1.0)) == 0.25
+
+    def it_falls_back_to_the_report_duration(self) -> None:
+        """Test that items without a stored duration use the report's duration."""
+        assert get_call_duration(Mock(stash=pytest.Stash()), Mock(duration=1.0)) == 1.0
+
+
+@pytest.mark.small
+class DescribeReportingPlugin:
+    """Test the reporting sub-plugin."""
+
+    def it_ignores_setup_and_teardown_reports(self) -> None:
+        """Test that only call-phase reports update the test size report."""
+        test_report = TestSizeReport()
+        plugin = ReportingPlugin(test_report, PluginState())
+
+        _run_wrapper(plugin.pytest_runtest_makereport(Mock(), Mock(when='setup')), Mock(outcome='passed'))
+
+        assert test_report.test_outcomes == {}
+
+
+@pytest.mark.small
+class DescribeSuggestionPlugin:
+    """Test the suggestion sub-plugin."""
+
+    def it_records_the_call_duration(self) -> None:
+        """Test that the call-phase duration is recorded for the test."""
+        collector = SuggestionCollector()
+        item = Mock(nodeid='test_example.py::test_one', stash=pytest.Stash())
+        store_call_duration(item, 0.5)
+
+        _run_wrapper(SuggestionPlugin(collector).pytest_runtest_makereport(item, Mock(when='call')), Mock())
+
+        assert collector.get_execution_time('test_example.py::test_one') == 0.5
+
+
+@pytest.mark.small
+class DescribeDeprecatedHookAliases:
+    """Test the deprecated module-level per-test hooks."""
+
+    def it_forwards_the_protocol_hook_to_the_timing_sub_plugin(self) -> None:
+        """Test that the alias warns and drives the timing sub-plugin's wrapper."""
+        events: list[str] = []
+
+        def protocol(item: object) -> object:  # noqa: ARG001
+            events.append('before')
+            yield
+            events.append('after')
+
+        timing_plugin = Mock(pytest_runtest_protocol=protocol)
+        item = Mock()
+        item.config.pluginmanager.get_plugin.return_value = timing_plugin
+
+        with pytest.warns(DeprecationWarning, match='pytest_runtest_protocol'):
+            _run_wrapper(pytest_runtest_protocol(item, None), Mock())
+
+        item.config.pluginmanager.get_plugin.assert_called_once_with(TIMING_PLUGIN_NAME)
+        assert events == ['before', 'after']
+
+    def it_forwards_the_makereport_hook_with_the_outcome(self) -> None:
+        """Test that the pytest outcome reaches the timing sub-plugin's wrapper."""
+        outcomes: list[object] = []
+
+        def makereport(item: object, call: object) -> object:  # noqa: ARG001
+            outcome = yield
+            outcomes.append((call.when, outcome.get_result()))  # type: ignore[attr-defined]
+
+        item = Mock()
+        item.config.pluginmanager.get_plugin.return_value = Mock(pytest_runtest_makereport=makereport)
+        report = Mock()
+
+        with pytest.warns(DeprecationWarning, match='pytest_runtest_makereport'):
+            _run_wrapper(pytest_runtest_makereport(item, Mock(when='call')), report)
+
+        assert outcomes == [('call', report)]
+
+    def it_fails_without_the_timing_sub_plugin(self) -> None:
+        """Test that the alias cannot run before pytest_configure registers the sub-plugin."""
+        item = Mock()
+        item.config.pluginmanager.get_plugin.return_value = None
+
+        with (
+            pytest.warns(DeprecationWarning, match='pytest_runtest_protocol'),
+            pytest.raises(RuntimeError, match=TIMING_PLUGIN_NAME),
+        ):
+            next(pytest_runtest_protocol(item, None))
+
+
+@pytest.mark.small
+class DescribeDurationHistoryPlugin:
+    """Test the duration history sub-plugin."""
+
+    def it_does_not_load_the_history_on_the_xdist_controller(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the controller, which runs no tests, leaves the history to its workers."""
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+        session_state = PluginState()
+        session = Mock()
+        session.config.pluginmanager.hasplugin.return_value = True
+        session.config.getoption.return_value = 2
+
+        DurationHistoryPlugin(session_state, 2.0).pytest_sessionstart(session)
+
+        session.config.cache.mkdir.assert_not_called()
+        assert session_state.duration_recorder is None
@@ -27,6 +27,7 @@ from pytest_test_categories.adapters.filesystem import FilesystemPatchingBlocker
 from pytest_test_categories.exceptions import FilesystemAccessViolationError
 from pytest_test_categories.ports.filesystem import (
     FilesystemAccessAttempt,
+    FilesystemBlockerPort,
     FilesystemOperation,
 )
 from pytest_test_categories.ports.network import (
@@ -289,6 +290,10 @@ class DescribeFilesystemOperations:
 class DescribeFilesystemPatchingBlocker:
     """Tests for the FilesystemPatchingBlocker production adapter."""
 
+    def it_implements_the_port(self) -> None:
+        """Verify the adapter is registered as a virtual subclass of FilesystemBlockerPort."""
+        assert isinstance(FilesystemPatchingBlocker(), FilesystemBlockerPort)
+
     def it_starts_in_inactive_state(self) -> None:
         """Verify the blocker initializes in INACTIVE state."""
         blocker = FilesystemPatchingBlocker()
@@ -314,6 +319,7 @@ class DescribeFilesystemPatchingBlocker:
 
         assert blocker.state == BlockerState.INACTIVE
 
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_activate_when_already_active(self) -> None:
         """Verify activate() raises when already ACTIVE."""
         blocker = FilesystemPatchingBlocker()
@@ -325,6 +331,19 @@ class DescribeFilesystemPatchingBlocker:
         finally:
             blocker.reset()
 
+    def it_ignores_a_second_activation_without_debug_contracts(self) -> None:
+        """Verify activating an ACTIVE blocker again keeps the first activation."""
+        blocker = FilesystemPatchingBlocker()
+        blocker.activate(TestSize.SMALL, EnforcementMode.STRICT, frozenset())
+
+        try:
+            blocker.activate(TestSize.MEDIUM, EnforcementMode.WARN, frozenset())
+
+            assert blocker.current_test_size == TestSize.SMALL
+        finally:
+            blocker.deactivate()
+
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_deactivate_when_inactive(self) -> None:
         """Verify deactivate() raises when already INACTIVE."""
         blocker = FilesystemPatchingBlocker()
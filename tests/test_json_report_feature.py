@@ -327,3 +327,45 @@ class DescribeJsonReportFileOption:
 
         result.assert_outcomes(passed=1)
         assert report_path.exists()
+
+
+@pytest.mark.medium
+class DescribeJsonlReportExport:
+    """Test suite for the streaming --test-size-report=jsonl format."""
+
+    def it_streams_a_record_per_test_and_a_summary(self, pytester: pytest.Pytester) -> None:
+        """Write a compact record per test in run order, then the summary record."""
+        pytester.makepyfile(
+            test_example="""
+            import pytest
+
+            @pytest.mark.medium
+            def test_medium():
+                assert True
+
+            @pytest.mark.small
+            def test_small():
+                assert False
+            """
+        )
+
+        report_path = pytester.path / 'report.jsonl'
+        result = pytester.runpytest('--test-size-report=jsonl', f'--test-size-report-file={report_path}')
+
+        result.assert_outcomes(passed=1, failed=1)
+        records = [json.loads(line) for line in report_path.read_text().splitlines()]
+        assert [(record['name'], record['size'], record['status']) for record in records[:-1]] == [
+            ('test_example.py::test_medium [MEDIUM]', 'medium', 'passed'),
+            ('test_example.py::test_small [SMALL]', 'small', 'failed'),
+        ]
+        assert records[-1]['summary']['total_tests'] == 2
+        assert 'Test Size Report' not in result.stdout.str()
+
+    def it_requires_a_report_file(self, pytester: pytest.Pytester) -> None:
+        """Reject jsonl without --test-size-report-file, since it is not printed."""
+        pytester.makepyfile(test_example='def test_one(): pass')
+
+        result = pytester.runpytest('--test-size-report=jsonl')
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(['*--test-size-report=jsonl requires --test-size-report-file*'])
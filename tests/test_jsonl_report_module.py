@@ -0,0 +1,133 @@
+"""Unit tests for the streaming JSON Lines test size report."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.distribution.stats import DistributionStats
+from pytest_test_categories.json_report import JsonReport
+from pytest_test_categories.jsonl_report import (
+    JsonlReportWriter,
+    open_report,
+    read_jsonl_report,
+)
+from pytest_test_categories.reporting import TestSizeReport
+from pytest_test_categories.types import TestSize
+from pytest_test_categories.violation_tracking import (
+    ViolationTracker,
+    ViolationType,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _session_report() -> tuple[TestSizeReport, ViolationTracker]:
+    """Build a report and tracker as a session would, in run order."""
+    report = TestSizeReport()
+    report.add_test('test_a.py::test_medium', TestSize.MEDIUM, 0.5, 'passed')
+    report.add_test('test_a.py::test_slow', TestSize.SMALL, 2.0, 'failed')
+    report.add_test('test_a.py::test_unsized', None, 0.1, 'passed')
+    report.add_test('test_a.py::test_fast', TestSize.SMALL, 0.1, 'passed')
+    tracker = ViolationTracker()
+    tracker.record_violation(ViolationType.NETWORK, 'test_a.py::test_fast', 'socket.connect')
+    tracker.record_violation(ViolationType.SLEEP, 'test_a.py::test_fast', 'time.sleep(1)')
+    return report, tracker
+
+
+def _write(path: Path, report: TestSizeReport, tracker: ViolationTracker, nodeids: list[str]) -> None:
+    """Write the tests' records in the given order, then the summary."""
+    writer = JsonlReportWriter(path)
+    for nodeid in nodeids:
+        writer.write_test(report, nodeid)
+    writer.write_summary(report, DistributionStats(), '1.0.0', violation_tracker=tracker)
+    writer.close()
+
+
+def _without_timestamp(report: JsonReport) -> dict[str, object]:
+    """Dump a report without its timestamp, which differs between two reports of a session."""
+    return report.model_dump(mode='json', exclude={'timestamp'})
+
+
+@pytest.mark.medium
+class DescribeJsonlReport:
+    """Tests for writing the JSON Lines report and rebuilding the JSON report from it."""
+
+    @pytest.mark.parametrize('file_name', ['report.jsonl', 'report.jsonl.gz'])
+    def it_rebuilds_the_json_report(self, tmp_path: Path, file_name: str) -> None:
+        """The converted report matches the JSON report of the same session, gzipped or not."""
+        report, tracker = _session_report()
+        path = tmp_path / 'reports' / file_name
+        _write(path, report, tracker, ['test_a.py::test_medium', 'test_a.py::test_slow', 'test_a.py::test_fast'])
+
+        expected = JsonReport.from_test_size_report(report, DistributionStats(), '1.0.0', violation_tracker=tracker)
+        assert _without_timestamp(read_jsonl_report(path)) == _without_timestamp(expected)
+
+    def it_writes_one_compact_record_per_test_then_the_summary(self, tmp_path: Path) -> None:
+        """Each test is a line as it is written, and the summary counts the time violations."""
+        report, tracker = _session_report()
+        path = tmp_path / 'report.jsonl.gz'
+        _write(path, report, tracker, ['test_a.py::test_slow'])
+
+        lines = gzip.decompress(path.read_bytes()).decode().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert records[0] == {
+            'name': 'test_a.py::test_slow',
+            'size': 'small',
+            'duration': 2.0,
+            'status': 'failed',
+            'violations': ['timing'],
+        }
+        assert [record.get('name') for record in records[1:-1]] == [
+            'test_a.py::test_fast',
+            'test_a.py::test_medium',
+            'test_a.py::test_unsized',
+        ]
+        assert records[-1]['summary']['violations']['timing'] == 1
+        assert records[-1]['hermeticity'] == {
+            'test_a.py::test_fast': ['hermeticity:network', 'hermeticity:sleep'],
+        }
+        assert ' ' not in lines[0]
+
+    def it_keeps_the_last_record_of_a_rerun_test(self, tmp_path: Path) -> None:
+        """A test written again after a rerun is reported once, with its last result."""
+        report, tracker = _session_report()
+        path = tmp_path / 'report.jsonl'
+        writer = JsonlReportWriter(path)
+        writer.write_test(report, 'test_a.py::test_slow')
+        report.record_result('test_a.py::test_slow', 'passed', 0.2)
+        writer.write_test(report, 'test_a.py::test_slow')
+        writer.write_summary(report, DistributionStats(), '1.0.0', violation_tracker=tracker)
+        writer.close()
+
+        converted = read_jsonl_report(path)
+
+        slow = [test for test in converted.tests if test.name == 'test_a.py::test_slow']
+        assert [(test.status, test.violations) for test in slow] == [('passed', [])]
+        assert converted.summary.violations.timing == 0
+
+    def it_rejects_a_report_without_a_summary(self, tmp_path: Path) -> None:
+        """A session that did not finish left no summary to rebuild the report from."""
+        report, _ = _session_report()
+        path = tmp_path / 'report.jsonl'
+        writer = JsonlReportWriter(path)
+        writer.write_test(report, 'test_a.py::test_fast')
+        writer.close()
+
+        with pytest.raises(ValueError, match='no summary record'):
+            read_jsonl_report(path)
+
+    @pytest.mark.parametrize(('file_name', 'compressed'), [('report.jsonl', False), ('report.jsonl.gz', True)])
+    def it_opens_a_report_gzip_compressed_by_its_name(self, tmp_path: Path, file_name: str, compressed: bool) -> None:  # noqa: FBT001
+        """A report file whose name ends in .gz is read and written through gzip."""
+        path = tmp_path / file_name
+        with open_report(path, 'w') as report_file:
+            report_file.write('{}\n')
+
+        assert (path.read_bytes()[:2] == b'\x1f\x8b') is compressed
+        with open_report(path, 'r') as report_file:
+            assert report_file.read() == '{}\n'
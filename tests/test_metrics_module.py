@@ -0,0 +1,224 @@
+"""Unit tests for the session metrics and their Prometheus text exposition."""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.distribution.stats import DistributionStats
+from pytest_test_categories.metrics import (
+    DURATION_BUCKETS,
+    SessionMetrics,
+    write_metrics_file,
+)
+from pytest_test_categories.types import TestSize
+from pytest_test_categories.violation_tracking import ViolationType
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_METRIC_NAME = r'[a-zA-Z_:][a-zA-Z0-9_:]*'
+_SAMPLE = re.compile(rf'({_METRIC_NAME})(?:\{{(.*)\}})? (\S+)(?: -?\d+)?')
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\\n]|\\[\\"n])*)"(?:,|$)')
+_TYPES = frozenset({'counter', 'gauge', 'histogram', 'summary', 'untyped'})
+_SUFFIXES = {'histogram': ('_bucket', '_sum', '_count'), 'summary': ('_sum', '_count')}
+
+_Sample = tuple[str, dict[str, str], float]
+
+
+def _family_of(name: str, types: dict[str, str]) -> str | None:
+    """Get the typed family a sample belongs to: its own name, or a histogram or summary's _bucket, _sum or _count."""
+    for family, metric_type in types.items():
+        if name == family or name in (family + suffix for suffix in _SUFFIXES.get(metric_type, ())):
+            return family
+    return None
+
+
+def _parse_prometheus_text(text: str) -> tuple[dict[str, tuple[str, list[_Sample]]], list[str]]:
+    """Parse an exposition by the rules of the Prometheus text format 0.0.4.
+
+    Each sample must belong to a family declared by an earlier TYPE line, or
+    it is read as untyped, and a family's samples must be grouped together.
+
+    Returns:
+        Each family's type and samples, by family name, and the rules broken.
+
+    """
+    problems = [] if text.endswith('\n') else ['no newline at the end']
+    types: dict[str, str] = {}
+    samples: dict[str, list[_Sample]] = {}
+    order: list[str] = []
+    for line in text.splitlines():
+        if line.startswith('# TYPE '):
+            _, _, name, metric_type = line.split(' ')
+            if not re.fullmatch(_METRIC_NAME, name) or metric_type not in _TYPES or name in types:
+                problems.append(f'invalid TYPE line: {line}')
+            types.setdefault(name, metric_type)
+            continue
+        if not line or line.startswith('#'):
+            continue
+        match = _SAMPLE.fullmatch(line)
+        family = _family_of(match.group(1), types) if match is not None else None
+        if match is None or family is None:
+            problems.append(f'untyped sample: {line}' if match is not None else f'invalid sample line: {line}')
+            continue
+        name, label_text, value = match.groups()
+        samples.setdefault(family, []).append((name, dict(_LABEL.findall(label_text or '')), float(value)))
+        if not order or order[-1] != family:
+            order.append(family)
+    problems.extend(f'samples of {family} are not grouped together' for family in set(order) if order.count(family) > 1)
+    return {family: (metric_type, samples.get(family, [])) for family, metric_type in types.items()}, problems
+
+
+def _check_histogram(samples: list[_Sample]) -> None:
+    """Check each histogram series has increasing cumulative buckets ending at +Inf, and a matching count."""
+    series: dict[tuple[tuple[str, str], ...], dict[str, list[tuple[dict[str, str], float]]]] = {}
+    for name, labels, value in samples:
+        key = tuple(sorted((label, text) for label, text in labels.items() if label != 'le'))
+        series.setdefault(key, {}).setdefault(name.rsplit('_', 1)[1], []).append((labels, value))
+    for parts in series.values():
+        bounds = [float(labels['le']) for labels, _ in parts['bucket']]
+        counts = [value for _, value in parts['bucket']]
+        assert bounds == sorted(bounds)
+        assert math.isinf(bounds[-1])
+        assert counts == sorted(counts)
+        assert [value for _, value in parts['count']] == [counts[-1]]
+        assert len(parts['sum']) == 1
+
+
+@pytest.mark.small
+class DescribeSessionMetrics:
+    """Tests for accumulating and merging the session metrics."""
+
+    def it_counts_each_duration_in_the_first_bucket_that_holds_it(self) -> None:
+        """Bounds are inclusive, and a duration over every bound only counts towards the total."""
+        metrics = SessionMetrics()
+        for duration in (0.0005, 0.001, 0.002, 5000.0):
+            metrics.observe(TestSize.SMALL, 'passed', duration, None)
+
+        cumulative, duration_sum = metrics.histogram(TestSize.SMALL, 'passed')
+
+        assert len(cumulative) == len(DURATION_BUCKETS) + 1
+        assert cumulative[:3] == [2, 2, 3]
+        assert cumulative[-2:] == [3, 4]
+        assert duration_sum == pytest.approx(5000.0035)
+        assert metrics.histogram(TestSize.SMALL, 'failed') == ([0] * (len(DURATION_BUCKETS) + 1), 0.0)
+
+    def it_counts_time_limit_and_baseline_violations(self) -> None:
+        """A test with a baseline is checked against it instead of its size's limit."""
+        metrics = SessionMetrics()
+        metrics.observe(TestSize.SMALL, 'failed', 1.5, None)
+        metrics.observe(TestSize.MEDIUM, 'failed', 0.2, 0.1)
+        metrics.observe(TestSize.MEDIUM, 'passed', 0.05, 0.1)
+        metrics.observe(None, 'passed', 5000.0, None)
+
+        assert metrics.timing_violations == {'small': 1, 'medium': 0, 'large': 0, 'xlarge': 0}
+        assert metrics.baseline_violations == {'small': 0, 'medium': 1, 'large': 0, 'xlarge': 0}
+
+    def it_merges_worker_metrics(self) -> None:
+        """Bucket counts, sums, violations and overhead add up across workers, skipping bad entries."""
+        worker = SessionMetrics()
+        worker.observe(TestSize.SMALL, 'passed', 0.01, None)
+        worker.observe(TestSize.SMALL, 'failed', 2.0, None)
+        worker.add_overhead('runtest', 0.25)
+        data = worker.to_dict()
+        data['histograms'].append(['huge', 'passed', [1], 1.0])  # type: ignore[attr-defined]
+
+        controller = SessionMetrics()
+        controller.observe(TestSize.SMALL, 'passed', 0.01, None)
+        controller.add_overhead('runtest', 0.5)
+        controller.merge(data)
+
+        cumulative, duration_sum = controller.histogram(TestSize.SMALL, 'passed')
+        assert cumulative[-1] == 2
+        assert duration_sum == pytest.approx(0.02)
+        assert controller.timing_violations['small'] == 1
+        assert controller.overhead == {'runtest': 0.75}
+
+
+@pytest.mark.small
+class DescribePrometheusExposition:
+    """Tests for rendering the metrics as Prometheus text."""
+
+    def it_renders_every_metric_family(self) -> None:
+        """The exposition has the distribution, histograms, counters and overhead."""
+        metrics = SessionMetrics()
+        metrics.observe(TestSize.SMALL, 'passed', 0.004, None)
+        metrics.observe(None, 'failed', 0.5, None)
+        metrics.add_overhead('collection', 0.125)
+        stats = DistributionStats.update_counts({TestSize.SMALL: 3, TestSize.MEDIUM: 1})
+
+        lines = metrics.render(stats, {ViolationType.NETWORK: 2}).splitlines()
+
+        assert 'test_size_distribution{size="small"} 0.75' in lines
+        assert 'test_size_tests{size="medium"} 1' in lines
+        assert 'test_duration_seconds_bucket{size="small",outcome="passed",le="0.00316"} 0' in lines
+        assert 'test_duration_seconds_bucket{size="small",outcome="passed",le="0.00562"} 1' in lines
+        assert 'test_duration_seconds_bucket{size="unsized",outcome="failed",le="+Inf"} 1' in lines
+        assert 'test_duration_seconds_count{size="unsized",outcome="failed"} 1' in lines
+        assert 'test_duration_seconds_sum{size="small",outcome="passed"} 0.004' in lines
+        assert 'test_timing_violations_total{size="small"} 0' in lines
+        assert 'test_hermeticity_violations_total{type="network"} 2' in lines
+        assert 'test_hermeticity_violations_total{type="sleep"} 0' in lines
+        assert 'test_categories_overhead_seconds_total{phase="collection"} 0.125' in lines
+        assert '# TYPE test_timing_violations_total counter' in lines
+
+    def it_parses_by_the_prometheus_text_format_rules(self) -> None:
+        """Every sample belongs to a typed family, so the textfile collector reads none of them as untyped."""
+        metrics = SessionMetrics()
+        metrics.observe(TestSize.SMALL, 'passed', 0.004, None)
+        metrics.observe(TestSize.SMALL, 'passed', 2.0, None)
+        metrics.observe(None, 'failed', 0.5, None)
+        metrics.add_overhead('collection', 0.125)
+        stats = DistributionStats.update_counts({TestSize.SMALL: 3})
+
+        families, problems = _parse_prometheus_text(metrics.render(stats, {ViolationType.SLEEP: 1}))
+
+        assert problems == []
+
+        assert {family: metric_type for family, (metric_type, _) in families.items()} == {
+            'test_size_distribution': 'gauge',
+            'test_size_tests': 'gauge',
+            'test_duration_seconds': 'histogram',
+            'test_timing_violations_total': 'counter',
+            'test_baseline_violations_total': 'counter',
+            'test_hermeticity_violations_total': 'counter',
+            'test_categories_overhead_seconds_total': 'counter',
+        }
+        _check_histogram(families['test_duration_seconds'][1])
+        assert ('test_timing_violations_total', {'size': 'small'}, 1.0) in families['test_timing_violations_total'][1]
+        assert all(samples for _, samples in families.values())
+
+    def it_rejects_counter_samples_named_apart_from_their_type(self) -> None:
+        """The parser reads an OpenMetrics-style counter, typed without its _total suffix, as untyped."""
+        _, problems = _parse_prometheus_text('# TYPE test_timing_violations counter\ntest_timing_violations_total 1\n')
+
+        assert problems == ['untyped sample: test_timing_violations_total 1']
+
+    def it_writes_small_series_before_unsized_ones(self) -> None:
+        """Series follow the size order, so the exposition is the same for every run order."""
+        metrics = SessionMetrics()
+        metrics.observe(None, 'passed', 0.1, None)
+        metrics.observe(TestSize.SMALL, 'passed', 0.1, None)
+
+        text = metrics.render(DistributionStats(), {})
+
+        assert text.index('size="small",outcome="passed"') < text.index('size="unsized",outcome="passed"')
+
+
+@pytest.mark.medium
+class DescribeWriteMetricsFile:
+    """Tests for writing the metrics file."""
+
+    def it_replaces_the_file_without_leaving_a_temporary_file(self, tmp_path: Path) -> None:
+        """The file is created with its directory, replaced on a second write, and nothing else is left."""
+        path = tmp_path / 'textfile' / 'pytest.prom'
+
+        write_metrics_file(path, 'first\n')
+        write_metrics_file(path, 'second\n')
+
+        assert path.read_text() == 'second\n'
+        assert [child.name for child in path.parent.iterdir()] == ['pytest.prom']
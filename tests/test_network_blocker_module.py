@@ -13,6 +13,8 @@ This follows the same pattern as the timer module (TestTimer/FakeTimer/WallTimer
 
 from __future__ import annotations
 
+import socket
+
 import pytest
 from icontract import ViolationError
 
@@ -23,6 +25,7 @@ from pytest_test_categories.ports.network import (
     BlockerState,
     ConnectionAttempt,
     EnforcementMode,
+    NetworkBlockerPort,
 )
 from pytest_test_categories.types import (
     NetworkMode,
@@ -227,6 +230,10 @@ class DescribeFakeNetworkBlocker:
 class DescribeSocketPatchingNetworkBlocker:
     """Tests for the SocketPatchingNetworkBlocker production adapter."""
 
+    def it_implements_the_port(self) -> None:
+        """Verify the adapter is registered as a virtual subclass of NetworkBlockerPort."""
+        assert isinstance(SocketPatchingNetworkBlocker(), NetworkBlockerPort)
+
     def it_starts_in_inactive_state(self) -> None:
         """Verify the blocker initializes in INACTIVE state."""
         blocker = SocketPatchingNetworkBlocker()
@@ -253,6 +260,7 @@ class DescribeSocketPatchingNetworkBlocker:
 
         assert blocker.state == BlockerState.INACTIVE
 
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_activate_when_already_active(self) -> None:
         """Verify activate() raises when already ACTIVE."""
         blocker = SocketPatchingNetworkBlocker()
@@ -264,6 +272,19 @@ class DescribeSocketPatchingNetworkBlocker:
         finally:
             blocker.reset()
 
+    def it_ignores_a_second_activation_without_debug_contracts(self) -> None:
+        """Verify activating an ACTIVE blocker again does not stack a second patch."""
+        original_socket = socket.socket
+        blocker = SocketPatchingNetworkBlocker()
+        blocker.activate(TestSize.SMALL, EnforcementMode.STRICT)
+
+        blocker.activate(TestSize.MEDIUM, EnforcementMode.WARN)
+        blocker.deactivate()
+
+        assert socket.socket is original_socket
+        assert blocker.state == BlockerState.INACTIVE
+
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_deactivate_when_inactive(self) -> None:
         """Verify deactivate() raises when already INACTIVE."""
         blocker = SocketPatchingNetworkBlocker()
@@ -380,6 +401,21 @@ class DescribeSocketPatchingNetworkBlocker:
 
         assert socket.socket is original_socket
 
+    def it_reuses_the_wrapper_class_across_activations(self) -> None:
+        """Verify the socket wrapper class is built once and reused."""
+        import socket
+
+        blocker = SocketPatchingNetworkBlocker()
+
+        blocker.activate(TestSize.SMALL, EnforcementMode.STRICT)
+        first_wrapper = socket.socket
+        blocker.deactivate()
+        blocker.activate(TestSize.MEDIUM, EnforcementMode.WARN)
+        second_wrapper = socket.socket
+        blocker.deactivate()
+
+        assert second_wrapper is first_wrapper
+
 
 @pytest.mark.small
 class DescribeLocalhostDetection:
@@ -0,0 +1,41 @@
+"""Unit tests for the session node ID registry."""
+
+from __future__ import annotations
+
+import pytest
+
+from pytest_test_categories.nodeids import NodeIdRegistry
+
+
+@pytest.mark.small
+class DescribeNodeIdRegistry:
+    """Tests for mapping node IDs to ints."""
+
+    def it_assigns_ints_in_the_order_node_ids_are_first_added(self) -> None:
+        """Each new node ID gets the next int, and an added node ID keeps its int."""
+        registry = NodeIdRegistry()
+
+        assert registry.add('test_a.py::test_one') == 0
+        assert registry.add('test_a.py::test_two') == 1
+        assert registry.add('test_a.py::test_one') == 0
+        assert registry.nodeids == ['test_a.py::test_one', 'test_a.py::test_two']
+        assert len(registry) == 2
+
+    def it_adds_many_node_ids_at_once(self) -> None:
+        """add_all returns each node ID's int, including repeats within the batch."""
+        registry = NodeIdRegistry()
+        registry.add('test_b')
+
+        assert registry.add_all(['test_a', 'test_b', 'test_c', 'test_a']) == [1, 0, 2, 1]
+        assert registry.nodeids == ['test_b', 'test_a', 'test_c']
+
+    def it_looks_up_node_ids_without_adding_them(self) -> None:
+        """Looking up a node ID that was never added does not register it."""
+        registry = NodeIdRegistry()
+        registry.add('test_a')
+
+        assert registry.get('test_a') == 0
+        assert registry.get('test_b') is None
+        assert 'test_a' in registry
+        assert 'test_b' not in registry
+        assert len(registry) == 1
@@ -20,22 +20,47 @@ from pytest_test_categories import (
     pytest_collection_finish,
     pytest_collection_modifyitems,
     pytest_configure,
-    pytest_runtest_makereport,
-    pytest_runtest_protocol,
     pytest_terminal_summary,
 )
 from pytest_test_categories.adapters.pytest_adapter import PytestConfigAdapter
+from pytest_test_categories.features import (
+    ReportingPlugin,
+    TimingPlugin,
+)
 from pytest_test_categories.formatting import (
     format_distribution_row,
     get_status_message,
     pluralize_test,
 )
+from pytest_test_categories.item_stash import (
+    CALL_DURATION_KEY,
+    SIZE_PROFILE_KEY,
+    TIMING_ORDINAL_KEY,
+    get_size_profile,
+)
 from pytest_test_categories.plugin import (
     _get_distribution_enforcement_mode,
     _get_enforcement_mode,
     _get_network_blocker,
 )
 from pytest_test_categories.ports.network import EnforcementMode
+from pytest_test_categories.services.test_discovery import (
+    SizeProfile,
+    TestDiscoveryService,
+)
+from pytest_test_categories.timers import TimingStore
+
+
+class _LookupRecordingTimers(dict[str, object]):
+    """A timers dict that records the node IDs looked up with get()."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups: list[str] = []
+
+    def get(self, key: str, default: object = None) -> object:
+        self.lookups.append(key)
+        return super().get(key, default)
 
 
 @pytest.mark.small
@@ -187,14 +212,20 @@ class DescribePytestAddoption:
         pytest_addoption(parser)
 
         parser.getgroup.assert_called_once_with('test-categories')
-        # Now adds ten CLI options:
+        # Now adds twenty-one CLI options:
         # --test-size-report, --test-size-report-file,
-        # --test-categories-enforcement,
+        # --test-categories-enforcement, --test-categories-patch-mode,
+        # --test-categories-engine, --test-categories-enforce-timeout,
+        # --test-categories-history, --test-categories-regression-factor,
+        # --test-categories-derive-baselines, --test-categories-schedule,
+        # --test-categories-tiered, --test-categories-shard,
+        # --test-categories-shard-history,
+        # --test-categories-budget, --test-categories-debug-contracts,
         # --test-categories-distribution-enforcement,
         # --test-categories-small-target, --test-categories-medium-target,
         # --test-categories-large-target, --test-categories-tolerance,
         # --test-categories-suggest, --test-categories-suggest-output
-        assert group.addoption.call_count == 10
+        assert group.addoption.call_count == 26
         # Find the test-size-report call
         test_size_report_call = None
         for call in group.addoption.call_args_list:
@@ -202,7 +233,7 @@ class DescribePytestAddoption:
                 test_size_report_call = call
                 break
         assert test_size_report_call is not None
-        assert test_size_report_call[1]['choices'] == [None, 'basic', 'detailed', 'json']
+        assert test_size_report_call[1]['choices'] == [None, 'basic', 'detailed', 'json', 'jsonl']
 
     def it_adds_enforcement_cli_option(self) -> None:
         """Test that pytest_addoption adds the enforcement CLI option."""
@@ -249,7 +280,7 @@ class DescribePytestConfigure:
     def it_registers_markers_and_initializes_report(self) -> None:
         """Test that pytest_configure registers markers and initializes report."""
         config = Mock()
-        config.getoption.return_value = 'basic'
+        config.getoption.side_effect = lambda name, default=None: 'basic' if name == '--test-size-report' else default
         config.distribution_stats = None
 
         pytest_configure(config)
@@ -289,10 +320,13 @@ class DescribePytestCollectionModifyitems:
 
         # Initialize plugin state with test discovery service
         config._test_categories_state = PluginState()
-        from pytest_test_categories.services.test_discovery import TestDiscoveryService
+        from pytest_test_categories.services.test_discovery import (
+            SizeProfile,
+            TestDiscoveryService,
+        )
 
         mock_discovery_service = Mock(spec=TestDiscoveryService)
-        mock_discovery_service.find_test_size.return_value = TestSize.SMALL
+        mock_discovery_service.get_size_profile.return_value = SizeProfile(size=TestSize.SMALL, label='[SMALL]')
         config._test_categories_state.test_discovery_service = mock_discovery_service
 
         pytest_collection_modifyitems(config, items)  # type: ignore[arg-type]
@@ -351,10 +385,10 @@ class DescribePytestCollectionFinish:
 
 @pytest.mark.small
 class DescribePytestRuntestProtocol:
-    """Test the pytest_runtest_protocol hook."""
+    """Test the timing sub-plugin's pytest_runtest_protocol hook."""
 
-    def it_tracks_test_timing_and_adds_to_report(self) -> None:
-        """Test that pytest_runtest_protocol tracks timing and adds to report."""
+    def it_tracks_test_timing(self) -> None:
+        """Test that pytest_runtest_protocol tracks timing."""
         item = Mock()
         item.config = Mock()
         item.nodeid = 'test_example'
@@ -367,14 +401,17 @@ class DescribePytestRuntestProtocol:
         item.config._test_categories_state.timer_factory = Mock(side_effect=lambda state: Mock(state=state))
 
         # Mock the test discovery service
-        from pytest_test_categories.services.test_discovery import TestDiscoveryService
+        from pytest_test_categories.services.test_discovery import (
+            SizeProfile,
+            TestDiscoveryService,
+        )
 
         mock_discovery_service = Mock(spec=TestDiscoveryService)
-        mock_discovery_service.find_test_size.return_value = TestSize.SMALL
+        mock_discovery_service.get_size_profile.return_value = SizeProfile(size=TestSize.SMALL, label='[SMALL]')
         item.config._test_categories_state.test_discovery_service = mock_discovery_service
 
         # This is a hookwrapper, so we need to simulate the behavior
-        gen = pytest_runtest_protocol(item, None)
+        gen = TimingPlugin(item.config._test_categories_state).pytest_runtest_protocol(item)
         next(gen)  # Start the generator
         gen.close()  # Clean up
 
@@ -395,13 +432,16 @@ class DescribePytestRuntestProtocol:
         item.config._test_categories_state.timer_factory = Mock(side_effect=lambda state: Mock(state=state))
 
         # Mock the test discovery service to return None
-        from pytest_test_categories.services.test_discovery import TestDiscoveryService
+        from pytest_test_categories.services.test_discovery import (
+            SizeProfile,
+            TestDiscoveryService,
+        )
 
         mock_discovery_service = Mock(spec=TestDiscoveryService)
-        mock_discovery_service.find_test_size.return_value = None
+        mock_discovery_service.get_size_profile.return_value = SizeProfile(size=None)
         item.config._test_categories_state.test_discovery_service = mock_discovery_service
 
-        gen = pytest_runtest_protocol(item, None)
+        gen = TimingPlugin(item.config._test_categories_state).pytest_runtest_protocol(item)
         next(gen)  # Start the generator
         gen.close()  # Clean up
 
@@ -411,7 +451,7 @@ class DescribePytestRuntestProtocol:
 
 @pytest.mark.small
 class DescribePytestRuntestMakereport:
-    """Test the pytest_runtest_makereport hook."""
+    """Test the timing and reporting sub-plugins' pytest_runtest_makereport hooks."""
 
     def it_validates_timing_and_updates_report(self) -> None:
         """Test that pytest_runtest_makereport validates timing and updates report."""
@@ -437,18 +477,28 @@ class DescribePytestRuntestMakereport:
         item.config._test_categories_state.test_size_report = TestSizeReport()
 
         # Mock the test discovery service
-        from pytest_test_categories.services.test_discovery import TestDiscoveryService
+        from pytest_test_categories.services.test_discovery import (
+            SizeProfile,
+            TestDiscoveryService,
+        )
 
         mock_discovery_service = Mock(spec=TestDiscoveryService)
-        mock_discovery_service.find_test_size.return_value = TestSize.SMALL
-        mock_discovery_service.get_timeout.return_value = None  # No custom baseline
+        # No custom baseline
+        mock_discovery_service.get_size_profile.return_value = SizeProfile(size=TestSize.SMALL, label='[SMALL]')
         item.config._test_categories_state.test_discovery_service = mock_discovery_service
 
-        gen = pytest_runtest_makereport(item)
-        next(gen)  # Start the generator
-        with contextlib.suppress(StopIteration):
-            gen.send(outcome)  # type: ignore[arg-type]  # Send the outcome
-        gen.close()  # Clean up
+        session_state = item.config._test_categories_state
+        call = Mock(when='call')
+        reporting_gen = ReportingPlugin(session_state.test_size_report, session_state).pytest_runtest_makereport(
+            item, call
+        )
+        timing_gen = TimingPlugin(session_state).pytest_runtest_makereport(item, call)
+        next(reporting_gen)  # The reporting wrapper is entered first
+        next(timing_gen)
+        for gen in (timing_gen, reporting_gen):
+            with contextlib.suppress(StopIteration):
+                gen.send(outcome)  # type: ignore[arg-type]  # Send the outcome
+            gen.close()  # Clean up
 
         # Should update report with duration and outcome
         assert item.config._test_categories_state.test_size_report.test_durations['test_example'] == 0.5
@@ -480,14 +530,17 @@ class DescribePytestRuntestMakereport:
         item.config._test_categories_state.test_size_report = None
 
         # Mock the test discovery service
-        from pytest_test_categories.services.test_discovery import TestDiscoveryService
+        from pytest_test_categories.services.test_discovery import (
+            SizeProfile,
+            TestDiscoveryService,
+        )
 
         mock_discovery_service = Mock(spec=TestDiscoveryService)
-        mock_discovery_service.find_test_size.return_value = TestSize.SMALL
-        mock_discovery_service.get_timeout.return_value = None  # No custom baseline
+        # No custom baseline
+        mock_discovery_service.get_size_profile.return_value = SizeProfile(size=TestSize.SMALL, label='[SMALL]')
         item.config._test_categories_state.test_discovery_service = mock_discovery_service
 
-        gen = pytest_runtest_makereport(item)
+        gen = TimingPlugin(item.config._test_categories_state).pytest_runtest_makereport(item, Mock(when='call'))
         next(gen)  # Start the generator
         with contextlib.suppress(StopIteration):
             gen.send(outcome)  # type: ignore[arg-type]  # Send the outcome
@@ -497,6 +550,33 @@ class DescribePytestRuntestMakereport:
         assert report.longrepr is not None
         assert report.outcome == 'failed'
 
+    def it_takes_a_store_timed_tests_duration_from_its_report(self) -> None:
+        """Test that a test timed in the TimingStore gets its report's duration without a timer lookup."""
+        item = Mock()
+        item.nodeid = 'test_example'
+        item.stash = pytest.Stash()
+        item.stash[TIMING_ORDINAL_KEY] = 0
+        item.stash[SIZE_PROFILE_KEY] = SizeProfile(size=TestSize.SMALL, label='[SMALL]')
+        timers = _LookupRecordingTimers()
+        session_state = PluginState(timing_store=TimingStore(1))
+        session_state.timers = timers  # type: ignore[assignment]
+        report = Mock(when='call', duration=0.25, outcome='passed')
+        plugin = TimingPlugin(session_state)
+
+        protocol_gen = plugin.pytest_runtest_protocol(item)
+        next(protocol_gen)
+        makereport_gen = plugin.pytest_runtest_makereport(item, Mock(when='call'))
+        next(makereport_gen)
+        with contextlib.suppress(StopIteration):
+            makereport_gen.send(Mock(get_result=Mock(return_value=report)))  # type: ignore[arg-type]
+        with contextlib.suppress(StopIteration):
+            next(protocol_gen)
+
+        assert item.stash[CALL_DURATION_KEY] == 0.25
+        assert report.outcome == 'passed'
+        assert timers.lookups == []
+        assert session_state.timing_store.duration(0) is not None  # type: ignore[attr-defined]
+
 
 @pytest.mark.small
 class DescribePytestTerminalSummary:
@@ -658,3 +738,48 @@ class DescribeGetNetworkBlocker:
         blocker2 = _get_network_blocker(config)
 
         assert blocker1 is blocker2
+
+
+@pytest.mark.small
+class DescribeGetSizeProfile:
+    """Test the get_size_profile helper function."""
+
+    def it_reads_the_profile_stashed_at_collection(self) -> None:
+        """The stashed profile is returned without asking the discovery service."""
+        profile = SizeProfile(size=TestSize.MEDIUM, timeout=2.0, label='[MEDIUM]')
+        item = Mock()
+        item.stash = pytest.Stash()
+        item.stash[SIZE_PROFILE_KEY] = profile
+        discovery_service = Mock(spec=TestDiscoveryService)
+
+        result = get_size_profile(item, discovery_service)
+
+        assert result is profile
+        discovery_service.get_size_profile.assert_not_called()
+
+    def it_resolves_and_stashes_a_missing_profile(self) -> None:
+        """A profile missing from the stash is resolved once and stashed."""
+        profile = SizeProfile(size=TestSize.SMALL, label='[SMALL]')
+        item = Mock()
+        item.stash = pytest.Stash()
+        discovery_service = Mock(spec=TestDiscoveryService)
+        discovery_service.get_size_profile.return_value = profile
+
+        first = get_size_profile(item, discovery_service)
+        second = get_size_profile(item, discovery_service)
+
+        assert first is profile
+        assert second is profile
+        assert item.stash[SIZE_PROFILE_KEY] is profile
+        discovery_service.get_size_profile.assert_called_once()
+
+    def it_falls_back_to_the_discovery_service_without_a_stash(self) -> None:
+        """Items without a pytest.Stash are resolved on every call."""
+        profile = SizeProfile(size=TestSize.SMALL, label='[SMALL]')
+        item = Mock(spec=['nodeid', 'get_closest_marker'])
+        discovery_service = Mock(spec=TestDiscoveryService)
+        discovery_service.get_size_profile.return_value = profile
+
+        result = get_size_profile(item, discovery_service)
+
+        assert result is profile
@@ -31,7 +31,10 @@ from pytest_test_categories.ports.network import (
     BlockerState,
     EnforcementMode,
 )
-from pytest_test_categories.ports.process import SpawnAttempt
+from pytest_test_categories.ports.process import (
+    ProcessBlockerPort,
+    SpawnAttempt,
+)
 from pytest_test_categories.types import TestSize
 
 
@@ -231,6 +234,10 @@ class DescribeFakeProcessBlocker:
 class DescribeSubprocessPatchingBlocker:
     """Tests for the SubprocessPatchingBlocker production adapter."""
 
+    def it_implements_the_port(self) -> None:
+        """Verify the adapter is registered as a virtual subclass of ProcessBlockerPort."""
+        assert isinstance(SubprocessPatchingBlocker(), ProcessBlockerPort)
+
     def it_starts_in_inactive_state(self) -> None:
         """Verify the blocker initializes in INACTIVE state."""
         blocker = SubprocessPatchingBlocker()
@@ -256,6 +263,7 @@ class DescribeSubprocessPatchingBlocker:
 
         assert blocker.state == BlockerState.INACTIVE
 
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_activate_when_already_active(self) -> None:
         """Verify activate() raises when already ACTIVE."""
         blocker = SubprocessPatchingBlocker()
@@ -267,6 +275,7 @@ class DescribeSubprocessPatchingBlocker:
         finally:
             blocker.reset()
 
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_deactivate_when_inactive(self) -> None:
         """Verify deactivate() raises when already INACTIVE."""
         blocker = SubprocessPatchingBlocker()
@@ -456,6 +465,22 @@ class DescribeSubprocessPatchingBlocker:
         assert subprocess.run is original_run
         assert os.system is original_os_system
 
+    def it_reuses_the_wrapper_classes_across_activations(self) -> None:
+        """Verify the Popen and Process wrapper classes are built once and reused."""
+        blocker = SubprocessPatchingBlocker()
+
+        blocker.activate(TestSize.SMALL, EnforcementMode.STRICT)
+        first_popen = subprocess.Popen
+        first_process = multiprocessing.Process
+        blocker.deactivate()
+        blocker.activate(TestSize.SMALL, EnforcementMode.STRICT)
+        second_popen = subprocess.Popen
+        second_process = multiprocessing.Process
+        blocker.deactivate()
+
+        assert second_popen is first_popen
+        assert second_process is first_process
+
 
 @pytest.mark.small
 class DescribeSubprocessViolationError:
@@ -0,0 +1,116 @@
+"""Tests for collection pruning by test size."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.pruning import (
+    IndexedFile,
+    SizeIndex,
+    is_excluded,
+    parse_sizes,
+)
+from pytest_test_categories.static_index import (
+    CollectionRules,
+    FileIndex,
+)
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SMALL = frozenset({TestSize.SMALL})
+
+
+@pytest.mark.small
+class DescribeParseSizes:
+    """Test parsing the sizes to run."""
+
+    def it_parses_comma_separated_sizes(self) -> None:
+        """Test that sizes are read regardless of spacing and case."""
+        assert parse_sizes('small, Medium') == frozenset({TestSize.SMALL, TestSize.MEDIUM})
+
+    @pytest.mark.parametrize('value', ['', 'small,tiny', ' , '])
+    def it_rejects_unknown_or_missing_sizes(self, value: str) -> None:
+        """Test that an empty list or an unknown size is an error."""
+        with pytest.raises(ValueError, match='--test-categories-sizes must be'):
+            parse_sizes(value)
+
+
+@pytest.mark.small
+class DescribeIsExcluded:
+    """Test deciding whether a file's index proves it can be skipped."""
+
+    def it_excludes_files_with_only_other_sizes(self) -> None:
+        """Test that a file of medium and large tests is excluded from a small run."""
+        found = IndexedFile(FileIndex(Counter({TestSize.MEDIUM: 2, TestSize.LARGE: 1})))
+
+        assert is_excluded(found, SMALL)
+
+    def it_keeps_files_with_a_requested_size(self) -> None:
+        """Test that one small test keeps the file."""
+        found = IndexedFile(FileIndex(Counter({TestSize.MEDIUM: 2, TestSize.SMALL: 1})))
+
+        assert not is_excluded(found, SMALL)
+
+    def it_keeps_files_the_scan_finds_unsized_tests_in(self) -> None:
+        """Test that unsized tests in the scan prove nothing, even once the file was collected."""
+        unsized = FileIndex(Counter({None: 1}))
+        collected = FileIndex(Counter({TestSize.MEDIUM: 1}))
+
+        assert not is_excluded(IndexedFile(unsized), SMALL)
+        assert not is_excluded(IndexedFile(collected, collect_seconds=0.5, scanned=unsized), SMALL)
+
+    def it_requires_the_last_collection_to_agree_with_the_scan(self) -> None:
+        """Test that a file is excluded only when both the scan and the last collection exclude it."""
+        scanned = FileIndex(Counter({TestSize.MEDIUM: 1}))
+
+        assert is_excluded(IndexedFile(FileIndex(Counter({TestSize.MEDIUM: 3})), 0.5, scanned), SMALL)
+        assert not is_excluded(IndexedFile(FileIndex(Counter({TestSize.SMALL: 1})), 0.5, scanned), SMALL)
+
+    def it_keeps_files_without_tests_or_that_did_not_parse(self) -> None:
+        """Test that an empty or unparsable file is collected as usual."""
+        assert not is_excluded(IndexedFile(FileIndex()), SMALL)
+        assert not is_excluded(IndexedFile(FileIndex(error='SyntaxError: bad'), collect_seconds=0.1), SMALL)
+
+
+@pytest.mark.medium
+class DescribeSizeIndex:
+    """Test looking up and recording test files in the size index."""
+
+    def it_scans_files_that_were_never_collected(self, tmp_path: Path) -> None:
+        """Test that a new file is indexed from the static scan."""
+        test_file = tmp_path / 'test_a.py'
+        test_file.write_text('import pytest\n@pytest.mark.large\ndef test_a(): pass\n')
+
+        found = SizeIndex(tmp_path / 'cache', CollectionRules()).lookup(test_file)
+
+        assert found == IndexedFile(FileIndex(Counter({TestSize.LARGE: 1})))
+
+    def it_adds_the_last_collection_until_the_file_changes(self, tmp_path: Path) -> None:
+        """Test that recorded sizes are used alongside the scan across sessions, and dropped once the file is edited."""
+        test_file = tmp_path / 'test_a.py'
+        test_file.write_text('def test_a(): pass\n')
+        index = SizeIndex(tmp_path / 'cache', CollectionRules())
+        index.record(test_file, Counter({TestSize.MEDIUM: 1}), 0.25)
+        index.save()
+
+        recorded = SizeIndex(tmp_path / 'cache', CollectionRules()).lookup(test_file)
+        test_file.write_text('def test_a(): pass\n\n')
+        edited = SizeIndex(tmp_path / 'cache', CollectionRules()).lookup(test_file)
+
+        assert recorded == IndexedFile(
+            FileIndex(Counter({TestSize.MEDIUM: 1})), collect_seconds=0.25, scanned=FileIndex(Counter({None: 1}))
+        )
+        assert edited == IndexedFile(FileIndex(Counter({None: 1})))
+
+    def it_only_treats_matching_python_files_as_test_files(self, tmp_path: Path) -> None:
+        """Test that the python_files patterns decide which files are looked up."""
+        index = SizeIndex(tmp_path, CollectionRules(python_files=('check_*.py',)))
+
+        assert index.is_test_file(tmp_path / 'check_a.py')
+        assert not index.is_test_file(tmp_path / 'test_a.py')
+        assert not index.is_test_file(tmp_path / 'check_a.txt')
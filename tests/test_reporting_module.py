@@ -10,6 +10,7 @@ from pytest_test_categories import (
     TestSize,
     TestSizeReport,
 )
+from pytest_test_categories.nodeids import NodeIdRegistry
 
 
 @pytest.mark.small
@@ -78,6 +79,58 @@ class DescribeTestSizeReport:
 
         assert report.get_total_tests() == 4
 
+    def it_finds_added_tests(self) -> None:
+        """Test that has_test sees only the tests added to the report."""
+        report = TestSizeReport()
+        report.add_test('test1', TestSize.SMALL)
+        report.add_new_tests([('test2', None)])
+        report.registry.add('test3')
+
+        assert report.has_test('test1')
+        assert report.has_test('test2')
+        assert not report.has_test('test3')
+        assert not report.has_test('test4')
+
+    def it_updates_a_test_added_again_in_place(self) -> None:
+        """Test that adding a test again replaces its size and result instead of listing it twice."""
+        report = TestSizeReport()
+        report.add_test('test1', TestSize.SMALL, 0.5, 'failed')
+        report.add_test('test2', TestSize.SMALL)
+        report.add_test('test1', TestSize.MEDIUM, 0.7)
+
+        assert report.get_tests(TestSize.SMALL) == ['test2']
+        assert report.get_tests(TestSize.MEDIUM) == ['test1']
+        assert report.get_duration('test1') == 0.7
+        assert report.get_outcome('test1') == 'passed'
+        assert report.get_total_tests() == 2
+
+    def it_records_results_in_the_columns_of_a_shared_registry(self) -> None:
+        """Test that record_result fills in a test's columns and the views show them."""
+        registry = NodeIdRegistry()
+        registry.add('test0')
+        report = TestSizeReport(registry)
+        report.add_test('test1', TestSize.LARGE)
+        report.record_result('test1', 'skipped', 3.0)
+        report.record_result('test0', 'failed')
+
+        assert report.registry is registry
+        assert report.get_tests(TestSize.LARGE) == ['test1']
+        assert report.test_durations == {'test1': 3.0}
+        assert report.test_outcomes == {'test0': 'failed', 'test1': 'skipped'}
+        assert report.get_duration('test0') is None
+        assert report.get_outcome('test2') is None
+        assert not report.has_test('test0')
+
+    def it_looks_up_the_size_of_a_test(self) -> None:
+        """Test that get_test_size returns the size a test was added with."""
+        report = TestSizeReport()
+        report.add_test('test1', TestSize.MEDIUM)
+        report.add_test('test2', None)
+
+        assert report.get_test_size('test1') == TestSize.MEDIUM
+        assert report.get_test_size('test2') is None
+        assert report.get_test_size('test3') is None
+
     def it_calculates_size_counts_correctly(self) -> None:
         """Test that get_size_counts returns correct counts."""
         report = TestSizeReport()
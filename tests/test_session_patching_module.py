@@ -0,0 +1,264 @@
+"""Test session-scoped installation of the production resource blockers.
+
+In session patch mode each blocker installs its interception wrappers once
+via install() and activate()/deactivate() only switch the current policy
+(test size and enforcement mode). These tests verify that module globals stay
+patched between tests, that wrappers pass through while no test is active,
+and that uninstall() restores the original functions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import concurrent.futures
+import os
+import socket
+import sqlite3
+import subprocess
+import threading
+import time
+
+import pytest
+
+from pytest_test_categories.adapters.database import DatabasePatchingBlocker
+from pytest_test_categories.adapters.filesystem import FilesystemPatchingBlocker
+from pytest_test_categories.adapters.network import SocketPatchingNetworkBlocker
+from pytest_test_categories.adapters.process import SubprocessPatchingBlocker
+from pytest_test_categories.adapters.sleep import SleepPatchingBlocker
+from pytest_test_categories.adapters.threading import ThreadPatchingMonitor
+from pytest_test_categories.exceptions import (
+    NetworkAccessViolationError,
+    SleepViolationError,
+)
+from pytest_test_categories.ports.network import (
+    BlockerState,
+    EnforcementMode,
+)
+from pytest_test_categories.types import (
+    PatchMode,
+    TestSize,
+)
+
+
+@pytest.mark.small
+class DescribePatchMode:
+    """Tests for the PatchMode enum."""
+
+    def it_defines_test_and_session_modes(self) -> None:
+        """Verify both patch modes are available with their ini values."""
+        assert PatchMode('test') == PatchMode.TEST
+        assert PatchMode('session') == PatchMode.SESSION
+
+
+@pytest.mark.small
+class DescribeSessionInstalledNetworkBlocker:
+    """Tests for SocketPatchingNetworkBlocker installed for the whole session."""
+
+    def it_starts_uninstalled(self) -> None:
+        """Verify a new blocker has not installed any wrappers."""
+        blocker = SocketPatchingNetworkBlocker()
+
+        assert blocker.is_installed is False
+
+    def it_keeps_socket_patched_across_activations(self) -> None:
+        """Verify deactivate() leaves the wrapper in place once installed."""
+        original_socket = socket.socket
+        blocker = SocketPatchingNetworkBlocker()
+        blocker.install()
+        try:
+            patched_socket = socket.socket
+            blocker.activate(TestSize.SMALL, EnforcementMode.STRICT)
+            blocker.deactivate()
+
+            assert socket.socket is patched_socket
+            assert socket.socket is not original_socket
+            assert blocker.state == BlockerState.INACTIVE
+        finally:
+            blocker.uninstall()
+
+        assert socket.socket is original_socket
+
+    def it_clears_the_policy_on_deactivate(self) -> None:
+        """Verify the wrapper allows connections once the test is deactivated."""
+        blocker = SocketPatchingNetworkBlocker()
+        blocker.install()
+        try:
+            blocker.activate(TestSize.SMALL, EnforcementMode.STRICT)
+            blocker.deactivate()
+
+            assert blocker.current_test_size is None
+            assert blocker.current_enforcement_mode is None
+            assert blocker._do_check_connection_allowed('example.com', 443) is True
+        finally:
+            blocker.uninstall()
+
+    def it_enforces_the_current_policy_through_the_installed_wrapper(self) -> None:
+        """Verify the installed wrapper reads the policy set by activate()."""
+        blocker = SocketPatchingNetworkBlocker()
+        blocker.install()
+        try:
+            blocker.activate(TestSize.SMALL, EnforcementMode.STRICT)
+            try:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                try:
+                    with pytest.raises(NetworkAccessViolationError):
+                        sock.connect(('example.com', 80))
+                finally:
+                    sock.close()
+            finally:
+                blocker.deactivate()
+        finally:
+            blocker.uninstall()
+
+    def it_installs_only_once(self) -> None:
+        """Verify calling install() twice does not wrap the wrapper."""
+        original_socket = socket.socket
+        blocker = SocketPatchingNetworkBlocker()
+        blocker.install()
+        try:
+            patched_socket = socket.socket
+            blocker.install()
+
+            assert socket.socket is patched_socket
+        finally:
+            blocker.uninstall()
+
+        assert socket.socket is original_socket
+
+    def it_uninstalls_on_reset(self) -> None:
+        """Verify reset() removes session-wide wrappers."""
+        original_socket = socket.socket
+        blocker = SocketPatchingNetworkBlocker()
+        blocker.install()
+
+        blocker.reset()
+
+        assert blocker.is_installed is False
+        assert socket.socket is original_socket
+
+
+@pytest.mark.small
+class DescribeSessionInstalledFilesystemBlocker:
+    """Tests for FilesystemPatchingBlocker installed for the whole session."""
+
+    def it_keeps_open_patched_across_activations(self) -> None:
+        """Verify builtins.open stays wrapped between tests."""
+        original_open = builtins.open
+        original_remove = os.remove
+        blocker = FilesystemPatchingBlocker()
+        blocker.install()
+        try:
+            patched_open = builtins.open
+            blocker.activate(TestSize.SMALL, EnforcementMode.STRICT, frozenset())
+            blocker.deactivate()
+
+            assert builtins.open is patched_open
+            assert builtins.open is not original_open
+            assert blocker.current_test_size is None
+            assert blocker.current_allowed_paths == frozenset()
+        finally:
+            blocker.uninstall()
+
+        assert builtins.open is original_open
+        assert os.remove is original_remove
+
+
+@pytest.mark.small
+class DescribeSessionInstalledProcessBlocker:
+    """Tests for SubprocessPatchingBlocker installed for the whole session."""
+
+    def it_keeps_subprocess_patched_across_activations(self) -> None:
+        """Verify subprocess.Popen stays wrapped between tests."""
+        original_popen = subprocess.Popen
+        original_run = subprocess.run
+        blocker = SubprocessPatchingBlocker()
+        blocker.install()
+        try:
+            patched_popen = subprocess.Popen
+            blocker.activate(TestSize.SMALL, EnforcementMode.STRICT)
+            blocker.deactivate()
+
+            assert subprocess.Popen is patched_popen
+            assert blocker._do_check_spawn_allowed('echo', ()) is True
+        finally:
+            blocker.uninstall()
+
+        assert subprocess.Popen is original_popen
+        assert subprocess.run is original_run
+
+
+@pytest.mark.small
+class DescribeSessionInstalledSleepBlocker:
+    """Tests for SleepPatchingBlocker installed for the whole session."""
+
+    def it_blocks_sleep_only_while_a_small_test_is_active(self) -> None:
+        """Verify the installed wrapper enforces the policy and then passes through."""
+        original_sleep = time.sleep
+        original_asyncio_sleep = asyncio.sleep
+        blocker = SleepPatchingBlocker()
+        blocker.install()
+        try:
+            blocker.activate(TestSize.SMALL, EnforcementMode.STRICT)
+            try:
+                with pytest.raises(SleepViolationError):
+                    time.sleep(0)
+            finally:
+                blocker.deactivate()
+
+            assert blocker._do_check_sleep_allowed('time.sleep', 0) is True
+            assert time.sleep is not original_sleep
+        finally:
+            blocker.uninstall()
+
+        assert time.sleep is original_sleep
+        assert asyncio.sleep is original_asyncio_sleep
+
+
+@pytest.mark.small
+class DescribeSessionInstalledDatabaseBlocker:
+    """Tests for DatabasePatchingBlocker installed for the whole session."""
+
+    def it_keeps_sqlite3_patched_across_activations(self) -> None:
+        """Verify sqlite3.connect stays wrapped between tests."""
+        original_connect = sqlite3.connect
+        blocker = DatabasePatchingBlocker()
+        blocker.install()
+        try:
+            patched_connect = sqlite3.connect
+            blocker.activate(TestSize.SMALL, EnforcementMode.STRICT)
+            blocker.deactivate()
+
+            assert sqlite3.connect is patched_connect
+            assert blocker._do_check_connection_allowed('sqlite3', ':memory:') is True
+        finally:
+            blocker.uninstall()
+
+        assert sqlite3.connect is original_connect
+
+
+@pytest.mark.small
+class DescribeSessionInstalledThreadMonitor:
+    """Tests for ThreadPatchingMonitor installed for the whole session."""
+
+    def it_stops_monitoring_between_tests(self) -> None:
+        """Verify is_monitoring is False once a small test is deactivated."""
+        original_thread = threading.Thread
+        original_executor = concurrent.futures.ThreadPoolExecutor
+        monitor = ThreadPatchingMonitor()
+        monitor.install()
+        try:
+            patched_thread = threading.Thread
+            monitor.activate(TestSize.SMALL, EnforcementMode.WARN)
+
+            assert monitor.is_monitoring is True
+
+            monitor.deactivate()
+
+            assert monitor.is_monitoring is False
+            assert threading.Thread is patched_thread
+        finally:
+            monitor.uninstall()
+
+        assert threading.Thread is original_thread
+        assert concurrent.futures.ThreadPoolExecutor is original_executor
@@ -0,0 +1,143 @@
+"""Unit tests for merging the test size reports of a sharded run."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories import shard_reports
+from pytest_test_categories.distribution.stats import DistributionStats
+from pytest_test_categories.json_report import JsonReport
+from pytest_test_categories.jsonl_report import JsonlReportWriter
+from pytest_test_categories.reporting import TestSizeReport
+from pytest_test_categories.shard_reports import (
+    ShardMerge,
+    iter_report_records,
+)
+from pytest_test_categories.types import TestSize
+from pytest_test_categories.violation_tracking import (
+    ViolationTracker,
+    ViolationType,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_json_shard(path: Path, tests: list[tuple[str, TestSize | None, float]]) -> Path:
+    """Write a shard's --test-size-report=json report, with a network violation in its first test."""
+    report = TestSizeReport()
+    for nodeid, size, duration in tests:
+        report.add_test(nodeid, size, duration, 'passed')
+    tracker = ViolationTracker()
+    tracker.record_violation(ViolationType.NETWORK, tests[0][0], 'socket.connect')
+    json_report = JsonReport.from_test_size_report(report, DistributionStats(), '1.0.0', violation_tracker=tracker)
+    path.write_text(json_report.model_dump_json(indent=2))
+    return path
+
+
+@pytest.mark.medium
+class DescribeIterReportRecords:
+    """Tests for streaming the records of a report."""
+
+    def it_streams_each_test_of_a_json_report_across_chunks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Every test is its own record, even when the report is read a few characters at a time."""
+        monkeypatch.setattr(shard_reports, '_CHUNK_SIZE', 7)
+        path = _write_json_shard(tmp_path / 'shard.json', [('test_a', TestSize.SMALL, 0.25), ('test_b', None, 1.5)])
+
+        records = list(iter_report_records(path))
+
+        assert [field for field, _ in records] == ['version', 'timestamp', 'summary', 'test', 'test', 'budget']
+        assert [value for field, value in records if field == 'test'] == [
+            {
+                'name': 'test_a',
+                'size': 'small',
+                'duration': 0.25,
+                'status': 'passed',
+                'violations': ['hermeticity:network'],
+            },
+            {'name': 'test_b', 'size': 'unsized', 'duration': 1.5, 'status': 'passed', 'violations': []},
+        ]
+
+    def it_rejects_a_file_that_is_not_a_report(self, tmp_path: Path) -> None:
+        """A truncated report is an error naming the file."""
+        path = tmp_path / 'shard.json'
+        path.write_text('{"version": "1.0.0", "tests": [{"name": "test_a"')
+
+        with pytest.raises(ValueError, match=r'shard\.json: not a test size report'):
+            list(iter_report_records(path))
+
+
+@pytest.mark.medium
+class DescribeShardMerge:
+    """Tests for merging shard reports."""
+
+    def it_merges_json_and_jsonl_shards(self, tmp_path: Path) -> None:
+        """The merged report has every shard's tests, violations and hermeticity counts."""
+        json_shard = _write_json_shard(
+            tmp_path / 'shard-1.json', [('test_a', TestSize.SMALL, 2.0), ('test_b', TestSize.MEDIUM, 0.5)]
+        )
+        jsonl_report = TestSizeReport()
+        jsonl_report.add_test('test_c', TestSize.SMALL, 0.1, 'failed')
+        tracker = ViolationTracker()
+        tracker.record_violation(ViolationType.SLEEP, 'test_c', 'time.sleep(1)')
+        writer = JsonlReportWriter(tmp_path / 'shard-2.jsonl.gz')
+        writer.write_summary(jsonl_report, DistributionStats(), '1.1.0', violation_tracker=tracker)
+        writer.close()
+
+        merge = ShardMerge()
+        merge.add_shard(json_shard)
+        merge.add_shard(tmp_path / 'shard-2.jsonl.gz')
+
+        assert merge.shards == 2
+        assert merge.version == '1.1.0'
+        assert merge.report.get_tests(TestSize.SMALL) == ['test_a', 'test_c']
+        assert merge.report.get_outcome('test_c') == 'failed'
+        assert merge.time_violations('timing') == ['test_a']
+        assert merge.violations['test_c'] == ['hermeticity:sleep']
+        assert merge.distribution_stats().counts.small == 2
+        summary = merge.to_json_report().summary
+        assert summary.total_tests == 3
+        assert (summary.violations.timing, summary.violations.hermeticity.total) == (1, 2)
+
+    def it_keeps_the_last_shards_record_of_a_test(self, tmp_path: Path) -> None:
+        """A test rerun in a later shard is counted once, with the later result."""
+        first = _write_json_shard(tmp_path / 'shard-1.json', [('test_a', TestSize.SMALL, 2.0)])
+        second = _write_json_shard(tmp_path / 'shard-2.json', [('test_b', None, 0.1), ('test_a', TestSize.SMALL, 0.2)])
+
+        merge = ShardMerge()
+        merge.add_shard(first)
+        merge.add_shard(second)
+
+        assert merge.report.get_total_tests() == 2
+        assert merge.report.get_duration('test_a') == 0.2
+        assert merge.time_violations('timing') == []
+
+    def it_lists_the_slowest_tests_of_a_size(self, tmp_path: Path) -> None:
+        """The slowest tests come first, and tests of other sizes are left out."""
+        shard = _write_json_shard(
+            tmp_path / 'shard.json',
+            [('test_a', TestSize.SMALL, 0.3), ('test_b', TestSize.SMALL, 0.9), ('test_c', TestSize.MEDIUM, 5.0)],
+        )
+        merge = ShardMerge()
+        merge.add_shard(shard)
+
+        assert merge.slowest(TestSize.SMALL, 1) == [('test_b', 0.9)]
+        assert merge.slowest(TestSize.LARGE, 5) == []
+
+    def it_rejects_a_missing_shard(self, tmp_path: Path) -> None:
+        """A shard that does not exist is a ValueError naming it."""
+        with pytest.raises(ValueError, match=r'missing\.json'):
+            ShardMerge().add_shard(tmp_path / 'missing.json')
+
+    def it_rejects_a_test_record_without_a_size(self, tmp_path: Path) -> None:
+        """A record the plugin could not have written is not silently dropped."""
+        path = tmp_path / 'shard.json'
+        path.write_text(json.dumps({'tests': [{'name': 'test_a', 'size': 'huge'}]}))
+
+        with pytest.raises(ValueError, match='invalid test record'):
+            ShardMerge().add_shard(path)
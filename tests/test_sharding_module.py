@@ -0,0 +1,76 @@
+"""Tests for duration-balanced sharding."""
+
+from __future__ import annotations
+
+import pytest
+
+from pytest_test_categories.sharding import (
+    assign_shards,
+    parse_shard,
+)
+from pytest_test_categories.types import TestSize
+
+
+def _suite() -> tuple[list[str], list[TestSize | None], list[float]]:
+    """Build a suite with its medium and large tests bunched in one directory."""
+    nodeids = [f'tests/unit/test_{i}.py::test [SMALL]' for i in range(60)]
+    sizes: list[TestSize | None] = [TestSize.SMALL] * 60
+    expected = [0.01 * (1 + i % 7) for i in range(60)]
+    nodeids += [f'tests/slow/test_{i}.py::test [MEDIUM]' for i in range(9)]
+    sizes += [TestSize.MEDIUM] * 9
+    expected += [float(10 + i) for i in range(9)]
+    nodeids += [f'tests/slow/test_large_{i}.py::test [LARGE]' for i in range(3)]
+    sizes += [TestSize.LARGE] * 3
+    expected += [120.0] * 3
+    return nodeids, sizes, expected
+
+
+@pytest.mark.small
+class DescribeParseShard:
+    """Test parsing INDEX/COUNT shard specifications."""
+
+    def it_converts_the_index_to_zero_based(self) -> None:
+        """Test that the first of four shards is index 0."""
+        assert parse_shard('1/4') == (0, 4)
+
+    @pytest.mark.parametrize('value', ['0/4', '5/4', '4', 'a/b', '1/0', '-1/4'])
+    def it_rejects_invalid_specifications(self, value: str) -> None:
+        """Test that malformed or out-of-range shards are rejected."""
+        with pytest.raises(ValueError, match='Invalid shard'):
+            parse_shard(value)
+
+
+@pytest.mark.small
+class DescribeAssignShards:
+    """Test packing tests onto shards."""
+
+    def it_balances_expected_runtime(self) -> None:
+        """Test that every shard gets one large test and a similar total runtime."""
+        nodeids, sizes, expected = _suite()
+
+        shards = assign_shards(nodeids, sizes, expected, count=3)
+
+        totals = [sum(e for e, s in zip(expected, shards, strict=True) if s == shard) for shard in range(3)]
+        assert max(totals) - min(totals) < 10.0
+        assert sorted(shards[-3:]) == [0, 1, 2]
+
+    def it_gives_each_shard_a_proportional_share_of_each_size(self) -> None:
+        """Test that small and medium tests are spread evenly."""
+        nodeids, sizes, expected = _suite()
+
+        shards = assign_shards(nodeids, sizes, expected, count=3)
+
+        for size, total in ((TestSize.SMALL, 60), (TestSize.MEDIUM, 9)):
+            counts = [
+                sum(1 for z, s in zip(sizes, shards, strict=True) if z is size and s == shard) for shard in range(3)
+            ]
+            assert counts == [total // 3] * 3
+
+    def it_is_independent_of_collection_order(self) -> None:
+        """Test that two machines collecting in different orders agree."""
+        nodeids, sizes, expected = _suite()
+        shards = dict(zip(nodeids, assign_shards(nodeids, sizes, expected, count=4), strict=True))
+
+        reversed_shards = assign_shards(nodeids[::-1], sizes[::-1], expected[::-1], count=4)
+
+        assert dict(zip(nodeids[::-1], reversed_shards, strict=True)) == shards
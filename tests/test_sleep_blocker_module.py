@@ -33,7 +33,10 @@ from pytest_test_categories.ports.network import (
     BlockerState,
     EnforcementMode,
 )
-from pytest_test_categories.ports.sleep import SleepAttempt
+from pytest_test_categories.ports.sleep import (
+    SleepAttempt,
+    SleepBlockerPort,
+)
 from pytest_test_categories.types import TestSize
 
 
@@ -230,6 +233,10 @@ class DescribeFakeSleepBlocker:
 class DescribeSleepPatchingBlocker:
     """Tests for the SleepPatchingBlocker production adapter."""
 
+    def it_implements_the_port(self) -> None:
+        """Verify the adapter is registered as a virtual subclass of SleepBlockerPort."""
+        assert isinstance(SleepPatchingBlocker(), SleepBlockerPort)
+
     def it_starts_in_inactive_state(self) -> None:
         """Verify the blocker initializes in INACTIVE state."""
         blocker = SleepPatchingBlocker()
@@ -255,6 +262,7 @@ class DescribeSleepPatchingBlocker:
 
         assert blocker.state == BlockerState.INACTIVE
 
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_activate_when_already_active(self) -> None:
         """Verify activate() raises when already ACTIVE."""
         blocker = SleepPatchingBlocker()
@@ -266,6 +274,7 @@ class DescribeSleepPatchingBlocker:
         finally:
             blocker.reset()
 
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_deactivate_when_inactive(self) -> None:
         """Verify deactivate() raises when already INACTIVE."""
         blocker = SleepPatchingBlocker()
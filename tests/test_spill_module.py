@@ -0,0 +1,101 @@
+"""Tests for xdist worker spill files."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.spill import (
+    SpillWriter,
+    merge_spill,
+    read_spill,
+    spill_path,
+)
+from pytest_test_categories.suggestion import (
+    ResourceType,
+    SuggestionCollector,
+)
+from pytest_test_categories.types import TestSize
+from pytest_test_categories.violation_tracking import (
+    ViolationTracker,
+    ViolationType,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.medium
+class DescribeSpillWriter:
+    """Test buffering records and writing them to the spill file."""
+
+    def it_buffers_records_until_the_flush_interval_passes(self, tmp_path: Path) -> None:
+        """Test that records stay in memory until flushed, then are read back in order."""
+        path = spill_path(tmp_path / 'spill', 'gw0')
+        writer = SpillWriter(path, flush_interval=3600.0)
+
+        writer.append({'test': 'test_a'})
+        before_flush = read_spill(path)
+        writer.append({'test': 'test_b'})
+        writer.flush()
+
+        assert before_flush == []
+        assert read_spill(path) == [{'test': 'test_a'}, {'test': 'test_b'}]
+
+    def it_writes_each_record_with_a_zero_interval(self, tmp_path: Path) -> None:
+        """Test that an interval of 0 writes every record as it is appended."""
+        path = spill_path(tmp_path, 'gw1')
+        writer = SpillWriter(path, flush_interval=0.0)
+
+        writer.append({'counts': {'small': 2}})
+
+        assert read_spill(path) == [{'counts': {'small': 2}}]
+
+    def it_skips_a_line_the_worker_died_while_writing(self, tmp_path: Path) -> None:
+        """Test that a partly written last line is left out."""
+        path = tmp_path / 'gw0.jsonl'
+        path.write_text('{"test":"test_a"}\n{"test":"tes', encoding='utf-8')
+
+        assert read_spill(path) == [{'test': 'test_a'}]
+        assert read_spill(tmp_path / 'missing.jsonl') == []
+
+
+@pytest.mark.small
+class DescribeMergeSpill:
+    """Test merging a crashed worker's records into the controller's state."""
+
+    def it_recovers_counts_violations_and_observations(self) -> None:
+        """Test that every kind of record is merged."""
+        tracker = ViolationTracker()
+        collector = SuggestionCollector()
+        records: list[dict[str, object]] = [
+            {'counts': {'small': 3, 'medium': 1}},
+            {'test': 'test_a', 'violations': [['network', 'example.com:443', True]]},
+            {'test': 'test_b', 'size': None, 'duration': 0.5, 'observations': [['sleep', 'time.sleep(0.5)']]},
+        ]
+
+        recovery = merge_spill(records, tracker, collector)
+
+        assert recovery.counts == {'small': 3, 'medium': 1, 'large': 0, 'xlarge': 0}
+        assert recovery.tests == 2
+        assert tracker.get_test_nodeids_by_type(ViolationType.NETWORK) == ['test_a']
+        assert tracker.get_failed_tests() == {'test_a'}
+        assert collector.get_execution_time('test_b') == 0.5
+        assert collector.get_observations('test_b')[0].resource_type == ResourceType.SLEEP
+
+    def it_skips_malformed_entries(self) -> None:
+        """Test that entries of unknown types or the wrong shape are ignored."""
+        tracker = ViolationTracker()
+        collector = SuggestionCollector()
+        records: list[dict[str, object]] = [
+            {'test': 'test_a', 'violations': [['teleport', 'x', False], 'network'], 'size': 'tiny'},
+            {'test': 'test_b', 'size': 'small', 'observations': [['network']]},
+        ]
+
+        recovery = merge_spill(records, tracker, collector)
+
+        assert recovery.counts is None
+        assert tracker.total_violations == 0
+        assert collector.get_current_size('test_b') == TestSize.SMALL
+        assert not collector.has_observations
@@ -0,0 +1,230 @@
+"""Tests for the static size index."""
+
+from __future__ import annotations
+
+import os
+import textwrap
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.static_index import (
+    PARALLEL_THRESHOLD,
+    CollectionRules,
+    StaticIndexCache,
+    build_index,
+    find_test_files,
+    scan_source,
+)
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+RULES = CollectionRules()
+
+
+def _counts(source: str, rules: CollectionRules = RULES) -> dict[TestSize | None, int]:
+    """Scan dedented source and return the non-zero counts."""
+    return {size: count for size, count in scan_source(textwrap.dedent(source), rules).counts.items() if count}
+
+
+@pytest.mark.small
+class DescribeScanSource:
+    """Test resolving test sizes without importing the module."""
+
+    def it_reads_function_markers(self) -> None:
+        """Test that size markers on test functions are counted, with or without calls."""
+        source = """
+            import pytest
+            from pytest import mark
+
+            @pytest.mark.small
+            def test_a(): pass
+
+            @mark.medium(timeout=5)
+            def test_b(): pass
+
+            def test_c(): pass
+
+            def helper(): pass
+        """
+
+        assert _counts(source) == {TestSize.SMALL: 1, TestSize.MEDIUM: 1, None: 1}
+
+    def it_prefers_the_nearest_marker(self) -> None:
+        """Test that function markers beat class markers, which beat the module pytestmark."""
+        source = """
+            import pytest
+            pytestmark = [pytest.mark.large]
+
+            @pytest.mark.medium
+            class TestGroup:
+                @pytest.mark.small
+                def test_small(self): pass
+
+                def test_medium(self): pass
+
+            def test_large(): pass
+        """
+
+        assert _counts(source) == {TestSize.SMALL: 1, TestSize.MEDIUM: 1, TestSize.LARGE: 1}
+
+    def it_resolves_base_classes(self) -> None:
+        """Test that test_bases classes and size-marked local base classes give their size."""
+        source = """
+            import pytest
+            from pytest_test_categories import test_bases
+            from pytest_test_categories.test_bases import SmallTest
+
+            class TestUnit(SmallTest):
+                def test_a(self): pass
+
+            class Integration(test_bases.MediumTest):
+                pytestmark = pytest.mark.medium
+
+            class TestIntegration(Integration):
+                def test_b(self): pass
+        """
+
+        assert _counts(source) == {TestSize.SMALL: 1, TestSize.MEDIUM: 1}
+
+    def it_counts_inherited_and_nested_tests(self) -> None:
+        """Test that methods inherited from local classes and nested test classes are counted."""
+        source = """
+            import pytest
+
+            class Contract:
+                def test_shared(self): pass
+
+            @pytest.mark.small
+            class TestImpl(Contract):
+                def test_own(self): pass
+
+                class TestNested:
+                    def test_inner(self): pass
+        """
+
+        assert _counts(source) == {TestSize.SMALL: 3}
+
+    def it_multiplies_parametrize_fan_out(self) -> None:
+        """Test that literal, range and constant parametrize values are multiplied out."""
+        source = """
+            import pytest
+
+            CASES = {'a': 1, 'b': 2, 'c': 3}
+
+            @pytest.mark.small
+            @pytest.mark.parametrize('x', [1, 2])
+            @pytest.mark.parametrize('y', range(3))
+            def test_grid(x, y): pass
+
+            @pytest.mark.small
+            @pytest.mark.parametrize('case', list(CASES))
+            def test_cases(case): pass
+        """
+
+        assert _counts(source) == {TestSize.SMALL: 9}
+
+    def it_counts_unresolved_fan_out_once(self) -> None:
+        """Test that computed parametrize values count once and make the index approximate."""
+        index = scan_source(
+            'import pytest\n@pytest.mark.parametrize("x", load_cases())\ndef test_a(x): pass\n',
+            RULES,
+        )
+
+        assert index.counts[None] == 1
+        assert index.approximate
+
+    def it_skips_fixtures_and_classes_with_init(self) -> None:
+        """Test that fixtures named like tests and test classes with __init__ are not collected."""
+        source = """
+            import pytest
+
+            @pytest.fixture
+            def test_data(): return 1
+
+            class TestNotCollected:
+                def __init__(self): pass
+
+                def test_a(self): pass
+        """
+
+        assert _counts(source) == {}
+
+    def it_follows_the_collection_rules(self) -> None:
+        """Test that python_classes and python_functions globs decide what is a test."""
+        source = """
+            import pytest
+
+            @pytest.mark.small
+            class DescribeThing:
+                def it_works(self): pass
+
+                def test_ignored(self): pass
+        """
+        rules = CollectionRules(python_classes=('Describe[A-Z]*',), python_functions=('it_*',))
+
+        assert _counts(source, rules) == {TestSize.SMALL: 1}
+
+    def it_reports_syntax_errors(self) -> None:
+        """Test that an unparsable file is indexed with an error instead of raising."""
+        index = scan_source('def test_a(:\n', RULES)
+
+        assert index.error is not None
+        assert not index.counts
+
+
+@pytest.mark.medium
+class DescribeBuildIndex:
+    """Test indexing test files with the cache."""
+
+    def it_finds_test_files_outside_skipped_directories(self, tmp_path: Path) -> None:
+        """Test that only matching files outside norecursedirs are found."""
+        (tmp_path / 'pkg').mkdir()
+        (tmp_path / 'venv').mkdir()
+        for name in ('pkg/test_a.py', 'pkg/b_test.py', 'pkg/helpers.py', 'venv/test_c.py'):
+            (tmp_path / name).write_text('')
+
+        assert find_test_files([tmp_path], RULES) == [tmp_path / 'pkg' / 'b_test.py', tmp_path / 'pkg' / 'test_a.py']
+
+    def it_parses_only_files_whose_content_changed(self, tmp_path: Path) -> None:
+        """Test that cached files are reused, even when touched, and edited files are parsed again."""
+        small, medium = tmp_path / 'test_small.py', tmp_path / 'test_medium.py'
+        small.write_text('import pytest\n@pytest.mark.small\ndef test_a(): pass\n')
+        medium.write_text('import pytest\n@pytest.mark.medium\ndef test_b(): pass\n')
+        cache = StaticIndexCache(tmp_path / 'cache' / 'index.json')
+        build_index([small, medium], RULES, cache, jobs=1)
+
+        os.utime(small, ns=(0, 0))
+        medium.write_text('import pytest\n@pytest.mark.large\ndef test_b(): pass\n')
+        index = build_index([small, medium], RULES, cache, jobs=1)
+
+        assert index.parsed == 1
+        assert index.counts() == {TestSize.SMALL: 1, TestSize.LARGE: 1}
+
+    def it_rebuilds_when_the_collection_rules_change(self, tmp_path: Path) -> None:
+        """Test that a cache built with other rules is not reused."""
+        test_file = tmp_path / 'test_a.py'
+        test_file.write_text('def it_works(): pass\n')
+        cache = StaticIndexCache(tmp_path / 'index.json')
+        build_index([test_file], RULES, cache, jobs=1)
+
+        index = build_index([test_file], CollectionRules(python_functions=('it_',)), cache, jobs=1)
+
+        assert index.parsed == 1
+        assert index.counts() == {None: 1}
+
+    def it_parses_in_a_process_pool(self, tmp_path: Path) -> None:
+        """Test that parsing many files in worker processes gives the same index."""
+        files = []
+        for number in range(PARALLEL_THRESHOLD):
+            test_file = tmp_path / f'test_{number}.py'
+            test_file.write_text(
+                'import pytest\n@pytest.mark.small\n@pytest.mark.parametrize("n", [1, 2])\ndef test_a(n): pass\n'
+            )
+            files.append(test_file)
+
+        index = build_index(files, RULES, jobs=2)
+
+        assert index.counts() == {TestSize.SMALL: 2 * PARALLEL_THRESHOLD}
@@ -9,7 +9,11 @@ from __future__ import annotations
 
 import pytest
 
-from pytest_test_categories.services.test_discovery import TestDiscoveryService
+from pytest_test_categories.services.test_discovery import (
+    UNSIZED_PROFILE,
+    SizeProfile,
+    TestDiscoveryService,
+)
 from pytest_test_categories.types import TestSize
 from tests._fixtures.test_item import FakeTestItem
 from tests._fixtures.warning_system import FakeWarningSystem
@@ -326,3 +330,72 @@ class DescribeGetTimeout:
 
         assert result == 1.0
         assert isinstance(result, float)
+
+
+@pytest.mark.small
+class DescribeGetSizeProfile:
+    """Tests for resolving a test's size profile in one pass."""
+
+    def it_returns_the_unsized_profile_without_a_size_marker(self) -> None:
+        """Return UNSIZED_PROFILE and warn when the test has no size marker."""
+        test_item = FakeTestItem(nodeid='test_module.py::test_function')
+        warning_system = FakeWarningSystem()
+        service = TestDiscoveryService(warning_system=warning_system)
+
+        result = service.get_size_profile(test_item)
+
+        assert result is UNSIZED_PROFILE
+        assert result.label == ''
+        assert len(warning_system.get_warnings()) == 1
+
+    def it_resolves_size_label_and_defaults(self) -> None:
+        """Resolve the size and label with no timeout or external systems opt-in."""
+        test_item = FakeTestItem(
+            nodeid='test_module.py::test_function',
+            markers={'small': FakeMarker('small')},
+        )
+        service = TestDiscoveryService(warning_system=FakeWarningSystem())
+
+        result = service.get_size_profile(test_item)
+
+        assert result == SizeProfile(size=TestSize.SMALL, timeout=None, allow_external_systems=False, label='[SMALL]')
+
+    def it_reads_timeout_and_allow_external_systems_from_the_size_marker(self) -> None:
+        """Read both kwargs from the effective size marker."""
+        medium_marker = FakeMarker('medium', kwargs={'timeout': 2, 'allow_external_systems': True})
+        test_item = FakeTestItem(
+            nodeid='test_module.py::test_function',
+            markers={'medium': medium_marker},
+        )
+        service = TestDiscoveryService(warning_system=FakeWarningSystem())
+
+        result = service.get_size_profile(test_item)
+
+        assert result == SizeProfile(size=TestSize.MEDIUM, timeout=2.0, allow_external_systems=True, label='[MEDIUM]')
+
+    def it_warns_and_ignores_an_invalid_timeout(self) -> None:
+        """Warn about a non-numeric timeout instead of failing collection."""
+        small_marker = FakeMarker('small', kwargs={'timeout': 'fast'})
+        test_item = FakeTestItem(
+            nodeid='test_module.py::test_function',
+            markers={'small': small_marker},
+        )
+        warning_system = FakeWarningSystem()
+        service = TestDiscoveryService(warning_system=warning_system)
+
+        result = service.get_size_profile(test_item)
+
+        assert result.timeout is None
+        assert len(warning_system.get_warnings()) == 1
+        assert "invalid timeout 'fast'" in warning_system.get_warnings()[0][0]
+
+    def it_raises_usage_error_for_multiple_markers(self) -> None:
+        """Raise UsageError like find_test_size when several size markers are present."""
+        test_item = FakeTestItem(
+            nodeid='test_module.py::test_function',
+            markers={'small': FakeMarker('small'), 'large': FakeMarker('large')},
+        )
+        service = TestDiscoveryService(warning_system=FakeWarningSystem())
+
+        with pytest.raises(pytest.UsageError):
+            service.get_size_profile(test_item)
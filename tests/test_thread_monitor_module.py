@@ -26,6 +26,7 @@ from pytest_test_categories.ports.network import (
 )
 from pytest_test_categories.ports.threading import (
     ThreadCreationAttempt,
+    ThreadMonitorPort,
 )
 from pytest_test_categories.types import TestSize
 
@@ -227,6 +228,10 @@ class DescribeFakeThreadMonitor:
 class DescribeThreadPatchingMonitor:
     """Tests for the ThreadPatchingMonitor production adapter."""
 
+    def it_implements_the_port(self) -> None:
+        """Verify the adapter is registered as a virtual subclass of ThreadMonitorPort."""
+        assert isinstance(ThreadPatchingMonitor(), ThreadMonitorPort)
+
     def it_starts_in_inactive_state(self) -> None:
         """Verify the monitor initializes in INACTIVE state."""
         monitor = ThreadPatchingMonitor()
@@ -252,6 +257,7 @@ class DescribeThreadPatchingMonitor:
 
         assert monitor.state == BlockerState.INACTIVE
 
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_activate_when_already_active(self) -> None:
         """Verify activate() raises when already ACTIVE."""
         monitor = ThreadPatchingMonitor()
@@ -263,6 +269,7 @@ class DescribeThreadPatchingMonitor:
         finally:
             monitor.reset()
 
+    @pytest.mark.usefixtures('debug_contracts')
     def it_fails_to_deactivate_when_inactive(self) -> None:
         """Verify deactivate() raises when already INACTIVE."""
         monitor = ThreadPatchingMonitor()
@@ -366,6 +373,25 @@ class DescribeThreadPatchingMonitor:
 
         monitor.deactivate()
 
+    def it_reuses_the_wrapper_classes_across_activations(self) -> None:
+        """Verify the Thread and executor wrapper classes are built once and reused."""
+        import concurrent.futures
+        import threading
+
+        monitor = ThreadPatchingMonitor()
+
+        monitor.activate(TestSize.SMALL, EnforcementMode.WARN)
+        first_thread = threading.Thread
+        first_executor = concurrent.futures.ThreadPoolExecutor
+        monitor.deactivate()
+        monitor.activate(TestSize.SMALL, EnforcementMode.WARN)
+        second_thread = threading.Thread
+        second_executor = concurrent.futures.ThreadPoolExecutor
+        monitor.deactivate()
+
+        assert second_thread is first_thread
+        assert second_executor is first_executor
+
 
 @pytest.mark.small
 class DescribeThreadCreationAttempt:
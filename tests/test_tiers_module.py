@@ -0,0 +1,54 @@
+"""Tests for tiered fail-fast execution."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.tiers import (
+    TierBarrier,
+    tier_of,
+    tiered_order,
+)
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.small
+class DescribeTieredOrder:
+    """Test ordering tests by tier."""
+
+    def it_runs_unsized_tests_with_the_small_tier(self) -> None:
+        """Test that unsized tests are in the first tier."""
+        assert tier_of(None) == tier_of(TestSize.SMALL) == 0
+
+    def it_orders_by_tier_then_by_expected_duration(self) -> None:
+        """Test that cheaper tiers come first, shortest expected first within a tier."""
+        sizes = [TestSize.XLARGE, TestSize.MEDIUM, None, TestSize.MEDIUM, TestSize.SMALL]
+        expected = [900.0, 20.0, 1.0, 5.0, 0.2]
+
+        assert tiered_order(sizes, expected) == [4, 2, 3, 1, 0]
+
+    def it_keeps_collection_order_for_equal_expectations(self) -> None:
+        """Test that tests without history keep their collection order within a tier."""
+        sizes = [TestSize.MEDIUM, TestSize.SMALL, TestSize.MEDIUM, TestSize.SMALL]
+
+        assert tiered_order(sizes, [300.0, 1.0, 300.0, 1.0]) == [1, 3, 0, 2]
+
+
+@pytest.mark.medium
+class DescribeTierBarrier:
+    """Test sharing the failed tier through a file."""
+
+    def it_reads_no_tier_before_a_failure(self, tmp_path: Path) -> None:
+        """Test that a missing barrier file means no tier has failed."""
+        assert TierBarrier(tmp_path / 'failed-tier').read() is None
+
+    def it_reads_the_written_tier(self, tmp_path: Path) -> None:
+        """Test that workers read the tier the controller wrote."""
+        TierBarrier(tmp_path / 'failed-tier').write(1)
+
+        assert TierBarrier(tmp_path / 'failed-tier').read() == 1
@@ -5,12 +5,17 @@ from __future__ import annotations
 from unittest.mock import patch
 
 import pytest
+from icontract import ViolationError
+from pydantic import BaseModel
 
 from pytest_test_categories import (
     TestTimer,
     TimerState,
     WallTimer,
 )
+from pytest_test_categories.contracts import enable_debug_contracts
+from pytest_test_categories.timers import TimingStore
+from pytest_test_categories.types import TimerProtocol
 
 
 @pytest.mark.small
@@ -140,6 +145,90 @@ class DescribeWallTimer:
             assert timer.duration() == 10.0
             timer.reset()
 
-    def it_inherits_from_test_timer(self) -> None:
-        """Test that WallTimer inherits from TestTimer."""
-        assert issubclass(WallTimer, TestTimer)
+    def it_implements_the_timer_interface_without_pydantic(self) -> None:
+        """Test that WallTimer is a TestTimer and satisfies the timer protocol as a slotted plain class."""
+        timer = WallTimer()
+
+        assert isinstance(timer, TimerProtocol)
+        assert isinstance(timer, TestTimer)
+        assert not isinstance(timer, BaseModel)
+        assert not hasattr(timer, '__dict__')
+
+    @pytest.mark.usefixtures('debug_contracts')
+    def it_enforces_stop_precondition_only_with_debug_contracts(self) -> None:
+        """Test that stop() from READY raises only while debug contracts are enabled."""
+        with pytest.raises(ViolationError, match='RUNNING state to stop'):
+            WallTimer().stop()
+
+        enable_debug_contracts(enabled=False)
+        timer = WallTimer()
+        timer.stop()
+
+        assert timer.state == TimerState.STOPPED
+
+
+@pytest.mark.small
+class DescribeTimingStore:
+    """Test the array-backed TimingStore."""
+
+    def it_preallocates_a_slot_per_test(self) -> None:
+        """Test that the store holds the requested number of unstarted slots."""
+        store = TimingStore(3)
+
+        assert len(store) == 3
+        assert all(store.duration(ordinal) is None for ordinal in range(3))
+        assert not store.is_running(0)
+
+    def it_records_durations_from_the_nanosecond_clock(self) -> None:
+        """Test that start/stop record perf_counter_ns values and report seconds."""
+        store = TimingStore(2)
+
+        with patch('time.perf_counter_ns', side_effect=[1_000_000_000, 1_250_000_000]):
+            store.start(1)
+            assert store.is_running(1)
+            store.stop(1)
+
+        assert store.duration(1) == pytest.approx(0.25)
+        assert not store.is_running(1)
+        assert store.duration(0) is None
+
+    def it_returns_the_span_of_a_stopped_test(self) -> None:
+        """Test that span gives the recorded perf_counter_ns values, or None while running."""
+        store = TimingStore(1)
+
+        with patch('time.perf_counter_ns', side_effect=[100, 250]):
+            store.start(0)
+            assert store.span(0) is None
+            store.stop(0)
+
+        assert store.span(0) == (100, 250)
+
+    def it_clears_the_previous_duration_on_restart(self) -> None:
+        """Test that restarting a slot discards its previous end time."""
+        store = TimingStore(1)
+
+        with patch('time.perf_counter_ns', side_effect=[100, 200, 300]):
+            store.start(0)
+            store.stop(0)
+            store.start(0)
+
+        assert store.duration(0) is None
+        assert store.is_running(0)
+
+    def it_grows_without_losing_timestamps(self) -> None:
+        """Test that reserve() only grows the buffers and keeps recorded values."""
+        store = TimingStore(1)
+        with patch('time.perf_counter_ns', side_effect=[100, 600]):
+            store.start(0)
+            store.stop(0)
+
+        store.reserve(4)
+        store.reserve(2)
+
+        assert len(store) == 4
+        assert store.duration(0) == pytest.approx(500e-9)
+        assert store.duration(3) is None
+
+    def it_has_no_instance_dict(self) -> None:
+        """Test that the store is a slotted plain class."""
+        assert not hasattr(TimingStore(), '__dict__')
@@ -12,6 +12,7 @@ from pytest_test_categories.timing import (
     XLARGE_LIMIT,
     TimeLimit,
     get_limit,
+    time_violation,
     validate,
 )
 from pytest_test_categories.types import (
@@ -145,3 +146,19 @@ class DescribeValidate:
             # Test failing case
             with pytest.raises(TimingViolationError):
                 validate(size, 1000.0)  # All limits are <= 900.0
+
+
+@pytest.mark.small
+class DescribeTimeViolation:
+    """Test classifying a duration's time violation without raising."""
+
+    def it_checks_the_size_limit_without_a_baseline(self) -> None:
+        """Test that a duration over the size's limit is a timing violation."""
+        assert time_violation(TestSize.SMALL, 1.5, None) == 'timing'
+        assert time_violation(TestSize.SMALL, 1.0, None) is None
+
+    def it_checks_the_baseline_instead_of_the_limit(self) -> None:
+        """Test that a baseline replaces the limit, and one over the limit is not a violation."""
+        assert time_violation(TestSize.MEDIUM, 0.2, 0.1) == 'baseline'
+        assert time_violation(TestSize.MEDIUM, 0.05, 0.1) is None
+        assert time_violation(TestSize.SMALL, 1.5, 2.0) is None
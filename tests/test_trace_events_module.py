@@ -0,0 +1,87 @@
+"""Unit tests for the Trace Event Format export of test timelines."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_test_categories.trace_events import (
+    TraceRecorder,
+    violation_flag,
+    write_trace,
+)
+from pytest_test_categories.types import TestSize
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _record_test(recorder: TraceRecorder, nodeid: str, start_ns: int, outcome: str = 'passed', flags: int = 0) -> None:
+    """Record a test's phases, each a microsecond long, then the whole test."""
+    for offset, phase in enumerate(('setup', 'call', 'teardown')):
+        phase_flags = flags if phase == 'call' else 0
+        phase_outcome = outcome if phase == 'call' else 'passed'
+        recorder.add_span(nodeid, phase, start_ns + offset * 1_000, 1_000, TestSize.SMALL, phase_outcome, phase_flags)
+    recorder.add_span(nodeid, 'test', start_ns, 3_000, TestSize.SMALL, outcome, flags)
+
+
+@pytest.mark.small
+class DescribeTraceRecorder:
+    """Tests for buffering spans and merging them from workers."""
+
+    def it_records_spans_with_their_labels(self) -> None:
+        """Each span keeps its test, phase, times, size, outcome and violation tags."""
+        recorder = TraceRecorder()
+        recorder.add_span('test_a', 'call', 5_000, 2_000, None, 'failed', violation_flag('timing'))
+        recorder.add_span('test_a', 'teardown', 7_000, -1, TestSize.SMALL, 'error?')
+
+        assert recorder.get_spans() == [
+            ('test_a', 'call', 5_000, 2_000, 'unsized', 'failed', ['timing']),
+            ('test_a', 'teardown', 7_000, 0, 'small', 'unknown', []),
+        ]
+        assert len(recorder.registry) == 1
+
+    def it_merges_a_workers_spans(self) -> None:
+        """A worker's node IDs are added to the registry, and malformed data is skipped."""
+        worker = TraceRecorder()
+        _record_test(worker, 'test_b', 10_000, 'failed', violation_flag('hermeticity:network'))
+        controller = TraceRecorder()
+        controller.add_span('test_a', 'call', 0, 1_000, TestSize.SMALL, 'passed')
+
+        controller.merge(worker.to_dict())
+        controller.merge({**worker.to_dict(), 'flags': b''})
+
+        spans = controller.get_spans()
+        assert len(spans) == 5
+        assert spans[-1] == ('test_b', 'test', 10_000, 3_000, 'small', 'failed', ['hermeticity:network'])
+        assert controller.registry.nodeids == ['test_a', 'test_b']
+
+
+@pytest.mark.medium
+class DescribeWriteTrace:
+    """Tests for writing the trace file."""
+
+    def it_writes_one_track_per_worker_from_the_earliest_span(self, tmp_path: Path) -> None:
+        """Tracks are named and numbered in worker order, and times are microseconds from the first span."""
+        gw10 = TraceRecorder()
+        _record_test(gw10, 'test_"quoted"', 9_000)
+        gw2 = TraceRecorder()
+        _record_test(gw2, 'test_b', 5_000, 'failed', violation_flag('timing'))
+        path = tmp_path / 'traces' / 'trace.json'
+
+        write_trace(path, {'main': TraceRecorder(), 'gw10': gw10, 'gw2': gw2})
+
+        trace = json.loads(path.read_text())
+        threads = {
+            event['tid']: event['args']['name'] for event in trace['traceEvents'] if event['name'] == 'thread_name'
+        }
+        assert threads == {0: 'gw2', 1: 'gw10'}
+        spans = [event for event in trace['traceEvents'] if event['ph'] == 'X']
+        assert len(spans) == 8
+        test_b = next(event for event in spans if event['name'] == 'test_b')
+        assert (test_b['ts'], test_b['dur'], test_b['tid']) == (0.0, 3.0, 0)
+        assert test_b['args'] == {'size': 'small', 'outcome': 'failed', 'violations': ['timing']}
+        call = next(event for event in spans if event['name'] == 'call' and event['tid'] == 1)
+        assert (call['ts'], call['cat'], call['args']['test']) == (5.0, 'call', 'test_"quoted"')
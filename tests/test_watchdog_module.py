@@ -0,0 +1,101 @@
+"""Tests for the preemptive timeout watchdog."""
+
+from __future__ import annotations
+
+import signal
+import threading
+import time
+
+import pytest
+
+from pytest_test_categories.watchdog import (
+    TimeoutWatchdog,
+    WatchdogInterrupt,
+    signal_timer_available,
+)
+
+
+class _TimeoutTestError(Exception):
+    """Error raised by the watchdog in these tests."""
+
+
+def _spin(seconds: float) -> None:
+    """Busy-wait so only the watchdog can end the wait early."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.mark.medium
+class DescribeTimeoutWatchdog:
+    """Test arming, firing and cancelling the watchdog."""
+
+    def it_does_not_fire_when_cancelled_in_time(self) -> None:
+        """Test that a cancelled watchdog leaves the test alone."""
+        watchdog = TimeoutWatchdog()
+
+        watchdog.arm(0.05, lambda: _TimeoutTestError('too slow'))
+        watchdog.cancel()
+        _spin(0.1)
+
+        assert not watchdog.fired
+        assert watchdog.error is None
+
+    @pytest.mark.skipif(not signal_timer_available(), reason='requires signal.setitimer on the main thread')
+    def it_interrupts_the_main_thread_with_the_error(self) -> None:
+        """Test that the signal timer raises the built error at the interrupted frame."""
+        previous_handler = signal.getsignal(signal.SIGALRM)
+        watchdog = TimeoutWatchdog()
+
+        watchdog.arm(0.05, lambda: _TimeoutTestError('too slow'))
+        with pytest.raises(_TimeoutTestError, match='too slow'):
+            _spin(5.0)
+        watchdog.cancel()
+
+        assert watchdog.fired
+        assert watchdog.stack[-1].name == '_spin'
+        assert signal.getsignal(signal.SIGALRM) == previous_handler
+
+    @pytest.mark.skipif(not signal_timer_available(), reason='requires signal.setitimer on the main thread')
+    def it_leaves_a_pending_interval_timer_running(self) -> None:
+        """Test that another caller's SIGALRM timer keeps its handler and remaining time."""
+        alarms: list[int] = []
+        previous_handler = signal.signal(signal.SIGALRM, lambda signum, _frame: alarms.append(signum))
+        try:
+            signal.setitimer(signal.ITIMER_REAL, 0.3)
+            watchdog = TimeoutWatchdog()
+
+            watchdog.arm(0.05, lambda: _TimeoutTestError('too slow'))
+            with pytest.raises(WatchdogInterrupt):
+                _spin(5.0)
+            watchdog.cancel()
+
+            assert watchdog.fired
+            assert 0 < signal.getitimer(signal.ITIMER_REAL)[0] <= 0.3
+            _spin(0.5)
+            assert alarms == [signal.SIGALRM]
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+    def it_interrupts_other_threads_with_watchdog_interrupt(self) -> None:
+        """Test that the watchdog thread raises WatchdogInterrupt in the test's thread."""
+        watchdog = TimeoutWatchdog()
+        raised: list[BaseException] = []
+
+        def run_in_thread() -> None:
+            watchdog.arm(0.05, lambda: _TimeoutTestError('too slow'))
+            try:
+                _spin(5.0)
+            except WatchdogInterrupt as e:
+                raised.append(e)
+            finally:
+                watchdog.cancel()
+
+        thread = threading.Thread(target=run_in_thread)
+        thread.start()
+        thread.join(timeout=10.0)
+
+        assert len(raised) == 1
+        assert isinstance(watchdog.error, _TimeoutTestError)
+        assert watchdog.stack[-1].name == '_spin'
@@ -12,17 +12,30 @@ import pytest
 
 from pytest_test_categories.distribution.stats import TestCounts
 from pytest_test_categories.reporting import TestSizeReport
+from pytest_test_categories.suggestion import (
+    ResourceType,
+    SuggestionCollector,
+)
 from pytest_test_categories.types import TestSize
+from pytest_test_categories.violation_tracking import (
+    ViolationTracker,
+    ViolationType,
+)
 from pytest_test_categories.xdist_compat import (
     WORKEROUTPUT_DISTRIBUTION_KEY,
-    WORKEROUTPUT_REPORT_KEY,
     XDIST_WORKER_ENV,
     deserialize_distribution_counts,
     is_xdist_controller,
     is_xdist_worker,
-    merge_report_data,
+    is_xdist_worker_session,
+    merge_suggestions,
+    merge_test_data,
+    merge_violations,
     serialize_distribution_counts,
-    serialize_report_data,
+    serialize_suggestions,
+    serialize_test_result,
+    serialize_test_size,
+    serialize_violations,
 )
 
 if TYPE_CHECKING:
@@ -45,6 +58,14 @@ class DescribeXdistWorkerDetection:
 
         assert is_xdist_worker() is True
 
+    def it_detects_worker_sessions_by_their_workerinput(self, mocker: MockerFixture) -> None:
+        """Only sessions xdist started on a worker have workerinput, unlike in-process sessions there."""
+        worker_config = mocker.Mock(spec=['workerinput'])
+        inner_config = mocker.Mock(spec=[])
+
+        assert is_xdist_worker_session(worker_config) is True
+        assert is_xdist_worker_session(inner_config) is False
+
 
 @pytest.mark.small
 class DescribeXdistControllerDetection:
@@ -162,189 +183,125 @@ class DescribeDistributionCountsSerialization:
 
 
 @pytest.mark.small
-class DescribeReportDataSerialization:
-    """Tests for report data serialization."""
-
-    def it_serializes_empty_report(self) -> None:
-        """Serializes an empty TestSizeReport."""
-        report = TestSizeReport()
-
-        result = serialize_report_data(report)
-
-        assert result['sized_tests'] == {
-            'small': [],
-            'medium': [],
-            'large': [],
-            'xlarge': [],
-        }
-        assert result['unsized_tests'] == []
-        assert result['test_durations'] == {}
-        assert result['test_outcomes'] == {}
-
-    def it_serializes_report_with_tests(self) -> None:
-        """Serializes a TestSizeReport with test data."""
-        report = TestSizeReport()
-        report.add_test('test_one', TestSize.SMALL, duration=0.1, outcome='passed')
-        report.add_test('test_two', TestSize.MEDIUM, duration=0.5, outcome='failed')
-
-        result = serialize_report_data(report)
-
-        sized_tests = result['sized_tests']
-        assert isinstance(sized_tests, dict)
-        assert 'test_one' in sized_tests['small']
-        assert 'test_two' in sized_tests['medium']
-
-        test_durations = result['test_durations']
-        assert isinstance(test_durations, dict)
-        assert test_durations['test_one'] == 0.1
-
-        test_outcomes = result['test_outcomes']
-        assert isinstance(test_outcomes, dict)
-        assert test_outcomes['test_one'] == 'passed'
-        assert test_outcomes['test_two'] == 'failed'
-
-
-@pytest.mark.small
-class DescribeReportDataMerging:
-    """Tests for report data merging."""
+class DescribeTestDataMerging:
+    """Tests for merging the data workers attach to each test report."""
 
-    def it_merges_sized_tests_from_worker(self) -> None:
-        """Merges sized tests from worker data into target report."""
+    def it_adds_a_test_from_its_setup_report(self) -> None:
+        """Adds the test with its size, or as unsized, when its setup report arrives."""
         target = TestSizeReport()
-        worker_data: dict[str, object] = {
-            'sized_tests': {'small': ['test_a', 'test_b'], 'medium': ['test_c']},
-            'unsized_tests': [],
-            'test_durations': {},
-            'test_outcomes': {},
-        }
 
-        merge_report_data(target, worker_data)
+        merge_test_data(target, 'test_a', serialize_test_size(TestSize.MEDIUM))
+        merge_test_data(target, 'test_b', serialize_test_size(None))
 
-        assert 'test_a' in target.sized_tests[TestSize.SMALL]
-        assert 'test_b' in target.sized_tests[TestSize.SMALL]
-        assert 'test_c' in target.sized_tests[TestSize.MEDIUM]
+        assert target.sized_tests[TestSize.MEDIUM] == ['test_a']
+        assert target.unsized_tests == ['test_b']
 
-    def it_merges_unsized_tests(self) -> None:
-        """Merges unsized tests from worker data."""
+    def it_records_the_result_from_its_call_report(self) -> None:
+        """Records the outcome and duration when the call report arrives."""
         target = TestSizeReport()
-        worker_data: dict[str, object] = {
-            'sized_tests': {},
-            'unsized_tests': ['test_unmarked'],
-            'test_durations': {},
-            'test_outcomes': {},
-        }
+        merge_test_data(target, 'test_a', serialize_test_size(TestSize.SMALL))
 
-        merge_report_data(target, worker_data)
+        merge_test_data(target, 'test_a', serialize_test_result('failed', 0.25))
 
-        assert 'test_unmarked' in target.unsized_tests
+        assert target.test_outcomes['test_a'] == 'failed'
+        assert target.test_durations['test_a'] == 0.25
 
-    def it_merges_durations(self) -> None:
-        """Merges test durations from worker data."""
+    def it_adds_a_rerun_test_once(self) -> None:
+        """Does not add a test again when a rerun sends another setup report."""
         target = TestSizeReport()
-        worker_data: dict[str, object] = {
-            'sized_tests': {},
-            'unsized_tests': [],
-            'test_durations': {'test_a': 0.5, 'test_b': 1.2},
-            'test_outcomes': {},
-        }
 
-        merge_report_data(target, worker_data)
+        merge_test_data(target, 'test_a', serialize_test_size(TestSize.SMALL))
+        merge_test_data(target, 'test_a', serialize_test_size(TestSize.SMALL))
 
-        assert target.test_durations['test_a'] == 0.5
-        assert target.test_durations['test_b'] == 1.2
+        assert target.sized_tests[TestSize.SMALL] == ['test_a']
 
-    def it_merges_outcomes(self) -> None:
-        """Merges test outcomes from worker data."""
+    def it_ignores_malformed_data(self) -> None:
+        """Ignores data that is not a dict or names an unknown size."""
         target = TestSizeReport()
-        worker_data: dict[str, object] = {
-            'sized_tests': {},
-            'unsized_tests': [],
-            'test_durations': {},
-            'test_outcomes': {'test_a': 'passed', 'test_b': 'failed'},
-        }
 
-        merge_report_data(target, worker_data)
+        merge_test_data(target, 'test_a', ['small'])
+        merge_test_data(target, 'test_b', {'size': 'tiny'})
 
-        assert target.test_outcomes['test_a'] == 'passed'
-        assert target.test_outcomes['test_b'] == 'failed'
-
-    def it_avoids_duplicate_tests(self) -> None:
-        """Does not add duplicate tests when merging."""
-        target = TestSizeReport()
-        target.add_test('test_a', TestSize.SMALL)
-
-        worker_data: dict[str, object] = {
-            'sized_tests': {'small': ['test_a', 'test_b']},
-            'unsized_tests': [],
-            'test_durations': {},
-            'test_outcomes': {},
-        }
-
-        merge_report_data(target, worker_data)
-
-        # Should have test_a only once
-        assert target.sized_tests[TestSize.SMALL].count('test_a') == 1
-        assert 'test_b' in target.sized_tests[TestSize.SMALL]
-
-    def it_handles_invalid_size_strings(self) -> None:
-        """Ignores invalid size strings in worker data."""
-        target = TestSizeReport()
-        worker_data: dict[str, object] = {
-            'sized_tests': {'invalid_size': ['test_a'], 'small': ['test_b']},
-            'unsized_tests': [],
-            'test_durations': {},
-            'test_outcomes': {},
-        }
-
-        merge_report_data(target, worker_data)
+        assert target.get_total_tests() == 0
 
-        # test_a with invalid size should be skipped
-        assert 'test_a' not in target.sized_tests[TestSize.SMALL]
-        assert 'test_b' in target.sized_tests[TestSize.SMALL]
 
-    def it_handles_non_list_tests_in_sized_tests(self) -> None:
-        """Skips non-list values in sized_tests dict."""
-        target = TestSizeReport()
+@pytest.mark.small
+class DescribeViolationMerging:
+    """Tests for sending hermeticity violations from workers to the controller."""
+
+    def it_round_trips_violations_with_interned_nodeids_and_details(self) -> None:
+        """Sends each node ID and detail once, and merges every violation back."""
+        worker = ViolationTracker()
+        worker.record_violation(ViolationType.NETWORK, 'test_a', 'connect to example.com:443')
+        worker.record_violation(ViolationType.NETWORK, 'test_b', 'connect to example.com:443', failed=True)
+        worker.record_violation(ViolationType.SLEEP, 'test_a', 'time.sleep(1)')
+        target = ViolationTracker()
+        target.record_violation(ViolationType.NETWORK, 'test_c', 'connect to example.org:80')
+
+        data = serialize_violations(worker)
+        merge_violations(target, data)
+
+        assert data['nodeids'] == ['test_a', 'test_b']
+        assert data['details'] == ['connect to example.com:443', 'time.sleep(1)']
+        assert target.get_test_nodeids_by_type(ViolationType.NETWORK) == ['test_c', 'test_a', 'test_b']
+        assert target.get_test_nodeids_by_type(ViolationType.SLEEP) == ['test_a']
+        assert target.get_failed_tests() == {'test_b'}
+
+    def it_skips_violations_with_invalid_codes(self) -> None:
+        """Ignores violations whose codes are missing from their tables."""
+        target = ViolationTracker()
         worker_data: dict[str, object] = {
-            'sized_tests': {
-                'small': 'not a list',
-                'medium': ['test_b'],
-            },
-            'unsized_tests': [],
-            'test_durations': {},
-            'test_outcomes': {},
+            'nodeids': ['test_a'],
+            'details': ['detail'],
+            'types': [0, 9, 0],
+            'tests': [0, 0, 1],
+            'detail_codes': [0, 0, 0],
         }
 
-        merge_report_data(target, worker_data)
+        merge_violations(target, worker_data)
 
-        # small with non-list value should be skipped
-        assert target.sized_tests[TestSize.SMALL] == []
-        assert 'test_b' in target.sized_tests[TestSize.MEDIUM]
+        assert target.total_violations == 1
 
-    def it_handles_missing_data_keys(self) -> None:
-        """Handles missing keys in worker data gracefully."""
-        target = TestSizeReport()
-        worker_data: dict[str, object] = {}
-
-        merge_report_data(target, worker_data)
 
-        # Should not raise, target should be unchanged
-        assert target.get_total_tests() == 0
-
-    def it_handles_invalid_data_types(self) -> None:
-        """Handles invalid data types gracefully."""
-        target = TestSizeReport()
+@pytest.mark.small
+class DescribeSuggestionMerging:
+    """Tests for sending suggestion observations from workers to the controller."""
+
+    def it_round_trips_observations_durations_and_sizes(self) -> None:
+        """Merges what each worker observed so the controller suggests as a serial run would."""
+        worker = SuggestionCollector()
+        worker.record_current_size('test_a', TestSize.SMALL)
+        worker.record_current_size('test_b', None)
+        worker.record_execution_time('test_a', 0.25)
+        worker.record_observation('test_a', ResourceType.NETWORK, 'example.com:443')
+        target = SuggestionCollector()
+
+        merge_suggestions(target, serialize_suggestions(worker))
+
+        assert target.get_current_size('test_a') == TestSize.SMALL
+        assert target.get_all_test_nodeids() == {'test_a', 'test_b'}
+        assert target.get_execution_time('test_a') == 0.25
+        assert target.get_execution_time('test_b') is None
+        assert target.get_observations('test_a') == worker.get_observations('test_a')
+        assert sorted(target.generate_suggestions(), key=str) == sorted(worker.generate_suggestions(), key=str)
+
+    def it_skips_entries_with_invalid_codes(self) -> None:
+        """Ignores sizes, observations and durations that do not decode."""
+        target = SuggestionCollector()
         worker_data: dict[str, object] = {
-            'sized_tests': 'not a dict',
-            'unsized_tests': 123,
-            'test_durations': ['not', 'a', 'dict'],
-            'test_outcomes': None,
+            'nodeids': ['test_a', 7],
+            'details': [],
+            'sizes': [9, 0],
+            'observed_tests': [0],
+            'resource_types': [0],
+            'detail_codes': [3],
+            'timed_tests': [5],
+            'durations': [1.0],
         }
 
-        merge_report_data(target, worker_data)
+        merge_suggestions(target, worker_data)
 
-        # Should not raise, target should be unchanged
-        assert target.get_total_tests() == 0
+        assert target.get_all_test_nodeids() == set()
 
 
 @pytest.mark.small
@@ -355,10 +312,6 @@ class DescribeWorkerOutputKeys:
         """Has a constant for distribution data key."""
         assert WORKEROUTPUT_DISTRIBUTION_KEY == 'test_categories_distribution'
 
-    def it_has_report_key(self) -> None:
-        """Has a constant for report data key."""
-        assert WORKEROUTPUT_REPORT_KEY == 'test_categories_report'
-
     def it_has_worker_env_var(self) -> None:
         """Has a constant for worker env var name."""
         assert XDIST_WORKER_ENV == 'PYTEST_XDIST_WORKER'
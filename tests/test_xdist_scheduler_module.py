@@ -0,0 +1,123 @@
+"""Tests for the size-aware xdist scheduler."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from pytest_test_categories.duration_history import DurationStats
+from pytest_test_categories.xdist_scheduler import (
+    MAX_SMALL_BATCH,
+    CategoryScheduling,
+    expected_duration,
+)
+
+
+class FakeNode:
+    """Stand-in for an xdist WorkerController that records what it is sent."""
+
+    def __init__(self, gateway_id: str) -> None:
+        """Initialize a node with nothing sent."""
+        self.gateway = SimpleNamespace(id=gateway_id)
+        self.sent: list[list[int]] = []
+        self.shutting_down = False
+
+    def send_runtest_some(self, indices: list[int]) -> None:
+        """Record a batch of test indices."""
+        self.sent.append(list(indices))
+
+    def shutdown(self) -> None:
+        """Record that the node was told to shut down."""
+        self.shutting_down = True
+
+
+def _scheduler(
+    collection: list[str], num_nodes: int = 2, **stats: DurationStats
+) -> tuple[CategoryScheduling, list[FakeNode]]:
+    """Build a scheduler whose nodes have all collected the given node IDs."""
+    config = Mock()
+    config.getvalue.return_value = [f'{num_nodes}*popen']
+    config.getoption.return_value = None
+    scheduler = CategoryScheduling(config, stats=stats)
+    nodes = [FakeNode(f'gw{i}') for i in range(num_nodes)]
+    for node in nodes:
+        scheduler.add_node(node)  # type: ignore[arg-type]
+        scheduler.add_node_collection(node, collection)  # type: ignore[arg-type]
+    return scheduler, nodes
+
+
+@pytest.mark.small
+class DescribeExpectedDuration:
+    """Test estimating how long a test will take."""
+
+    def it_falls_back_to_the_size_limit(self) -> None:
+        """Test that a test without history is expected to take its size's limit."""
+        assert expected_duration('test_a.py::test_one [MEDIUM]', {}) == 300.0
+
+    def it_prefers_the_recorded_average(self) -> None:
+        """Test that history replaces the size limit."""
+        stats = {'test_a.py::test_one [MEDIUM]': DurationStats(run_count=3, ewma=2.5, p50=2.5, p95=2.5)}
+
+        assert expected_duration('test_a.py::test_one [MEDIUM]', stats) == 2.5
+
+
+@pytest.mark.small
+class DescribeCategoryScheduling:
+    """Test dispatching tests longest-expected-first."""
+
+    def it_starts_the_longest_tests_on_different_workers(self) -> None:
+        """Test that the first test each worker gets is one of the longest."""
+        collection = ['t.py::a [SMALL]', 't.py::b [LARGE]', 't.py::c [MEDIUM]', 't.py::d [SMALL]']
+        scheduler, nodes = _scheduler(collection)
+
+        scheduler.schedule()
+
+        assert [node.sent for node in nodes] == [[[1], [0]], [[2], [3]]]
+
+    def it_orders_by_history_when_available(self) -> None:
+        """Test that a test known to be slow goes before tests of a larger size."""
+        collection = ['t.py::a [MEDIUM]', 't.py::b [SMALL]', 't.py::c [SMALL]', 't.py::d [SMALL]']
+        slow = DurationStats(run_count=5, ewma=0.5, p50=0.5, p95=0.5)
+        scheduler, nodes = _scheduler(collection, **{'t.py::a [MEDIUM]': slow})
+
+        scheduler.schedule()
+
+        assert nodes[0].sent[0] == [1]
+
+    def it_batches_small_tests(self) -> None:
+        """Test that small tests are sent many at a time."""
+        collection = [f't.py::test_{i} [SMALL]' for i in range(1000)]
+        scheduler, nodes = _scheduler(collection)
+
+        scheduler.schedule()
+
+        assert len(nodes[0].sent[0]) == MAX_SMALL_BATCH
+
+    def it_tops_up_a_worker_when_a_test_completes(self) -> None:
+        """Test that a worker always has its running test and the next one queued."""
+        collection = [f't.py::test_{i} [LARGE]' for i in range(6)]
+        scheduler, nodes = _scheduler(collection)
+        scheduler.schedule()
+
+        scheduler.mark_test_complete(nodes[0], 0)  # type: ignore[arg-type]
+
+        assert nodes[0].sent == [[0], [2], [4]]
+        assert not scheduler.pending[1:]
+
+    def it_dispatches_one_tier_at_a_time_in_tiered_mode(self) -> None:
+        """Test that small tests go before the longer medium and large tests when tiered."""
+        collection = ['t.py::a [LARGE]', 't.py::b [MEDIUM]', 't.py::c [SMALL]', 't.py::d [SMALL]']
+        config = Mock()
+        config.getvalue.return_value = ['1*popen']
+        config.getoption.return_value = None
+        scheduler = CategoryScheduling(config, tiered=True)
+        node = FakeNode('gw0')
+        scheduler.add_node(node)  # type: ignore[arg-type]
+        scheduler.add_node_collection(node, collection)  # type: ignore[arg-type]
+
+        scheduler.schedule()
+
+        dispatch_order = [index for batch in node.sent for index in batch] + scheduler.pending
+        assert dispatch_order == [2, 3, 1, 0]